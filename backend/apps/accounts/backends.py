@@ -0,0 +1,24 @@
+from django.contrib.auth import backends, get_user_model
+
+from . import hashing
+
+UserModel = get_user_model()
+
+
+class ModelBackend(backends.ModelBackend):
+    """ModelBackend do Django com hash/verificação pelo executor limitado (apps.accounts.hashing)."""
+
+    def authenticate(self, request, username=None, password=None, **kwargs):
+        if username is None:
+            username = kwargs.get(UserModel.USERNAME_FIELD)
+        if username is None or password is None:
+            return None
+        try:
+            user = UserModel._default_manager.get_by_natural_key(username)
+        except UserModel.DoesNotExist:
+            # mesmo custo de um login válido: o tempo de resposta não revela se o usuário existe
+            hashing.make_password(password)
+            return None
+        if hashing.check_password(user, password) and self.user_can_authenticate(user):
+            return user
+        return None
@@ -0,0 +1,42 @@
+"""
+Hashers com custo ajustável por settings (PASSWORD_SCRYPT_*, PASSWORD_ARGON2_*).
+
+Mesmos algoritmos/formatos dos hashers do Django ("scrypt", "argon2"): hashes antigos continuam
+válidos. Como must_update compara os parâmetros gravados no hash com os atuais, mudar o custo
+(ou trocar PASSWORD_HASHER) regrava a senha no próximo login, sem migração.
+"""
+from django.conf import settings
+from django.contrib.auth import hashers
+
+
+class ScryptPasswordHasher(hashers.ScryptPasswordHasher):
+    """scrypt da stdlib (OpenSSL): memória = 128 * N * r bytes por hash."""
+    maxmem = 512 * 1024 * 1024  # teto do OpenSSL (padrão 32 MiB); não é alocado
+
+    @property
+    def work_factor(self):
+        return settings.PASSWORD_SCRYPT_N
+
+    @property
+    def block_size(self):
+        return settings.PASSWORD_SCRYPT_R
+
+    @property
+    def parallelism(self):
+        return settings.PASSWORD_SCRYPT_P
+
+
+class Argon2PasswordHasher(hashers.Argon2PasswordHasher):
+    """argon2id (requer argon2-cffi); memory_cost em KiB."""
+
+    @property
+    def time_cost(self):
+        return settings.PASSWORD_ARGON2_TIME_COST
+
+    @property
+    def memory_cost(self):
+        return settings.PASSWORD_ARGON2_MEMORY_COST
+
+    @property
+    def parallelism(self):
+        return settings.PASSWORD_ARGON2_PARALLELISM
@@ -0,0 +1,109 @@
+"""
+Hash e verificação de senha fora das threads de request, em um executor dedicado e limitado.
+
+- PASSWORD_HASH_WORKERS threads fazem o trabalho (scrypt/PBKDF2/argon2 liberam o GIL); no máximo
+  PASSWORD_HASH_QUEUE pedidos esperam na fila. Com a fila cheia, o request espera até
+  PASSWORD_HASH_WAIT segundos por uma vaga e então recebe 503 + Retry-After (HashingBusy):
+  um pico de cadastro/login não consome todos os workers da aplicação.
+- No executor roda só CPU (sem ORM); a regravação do hash (upgrade de algoritmo/custo) é feita
+  por quem chamou, na própria conexão do request.
+"""
+import asyncio
+import math
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+
+from django.conf import settings
+from django.contrib.auth import hashers
+from rest_framework import status
+from rest_framework.exceptions import APIException
+
+from apps.core.metrics import password_hash_duration_seconds, password_hash_rejected_total
+
+
+class HashingBusy(APIException):
+    status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+    default_detail = "Muitas requisições de login/cadastro no momento. Tente novamente em instantes."
+    default_code = "hashing_busy"
+
+    def __init__(self, wait: float):
+        super().__init__()
+        self.wait = math.ceil(wait)  # o DRF devolve como Retry-After
+
+
+class HashingExecutor:
+    def __init__(self, workers: int = 2, queue_size: int = 16, wait: float = 2.0):
+        self.workers = workers
+        self.wait = wait
+        self._slots = threading.BoundedSemaphore(workers + queue_size)
+        self._pool = None
+        self._pool_lock = threading.Lock()
+
+    def _get_pool(self) -> ThreadPoolExecutor:
+        with self._pool_lock:
+            if self._pool is None:
+                self._pool = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="password-hash")
+            return self._pool
+
+    def submit(self, operation: str, fn, *args) -> Future:
+        if not self._slots.acquire(timeout=self.wait):
+            password_hash_rejected_total.inc(operation=operation)
+            raise HashingBusy(self.wait)
+
+        def timed():
+            started = time.perf_counter()
+            try:
+                return fn(*args)
+            finally:
+                password_hash_duration_seconds.observe(time.perf_counter() - started, operation=operation)
+
+        try:
+            future = self._get_pool().submit(timed)
+        except BaseException:
+            self._slots.release()
+            raise
+        future.add_done_callback(lambda _: self._slots.release())
+        return future
+
+    def run(self, operation: str, fn, *args):
+        return self.submit(operation, fn, *args).result()
+
+    async def arun(self, operation: str, fn, *args):
+        # a espera por vaga bloqueia: fica numa thread para não travar o event loop
+        loop = asyncio.get_running_loop()
+        future = await loop.run_in_executor(None, self.submit, operation, fn, *args)
+        return await asyncio.wrap_future(future)
+
+
+executor = HashingExecutor(
+    workers=getattr(settings, "PASSWORD_HASH_WORKERS", 2),
+    queue_size=getattr(settings, "PASSWORD_HASH_QUEUE", 16),
+    wait=getattr(settings, "PASSWORD_HASH_WAIT", 2.0),
+)
+
+
+def make_password(password: str) -> str:
+    return executor.run("hash", hashers.make_password, password)
+
+
+async def amake_password(password: str) -> str:
+    return await executor.arun("hash", hashers.make_password, password)
+
+
+def _verify(password: str, encoded: str) -> tuple[bool, bool]:
+    upgrade = []
+    valid = hashers.check_password(password, encoded, setter=upgrade.append)
+    return valid, bool(upgrade)
+
+
+def check_password(user, password: str) -> bool:
+    """user.check_password pelo executor; se o hash estiver desatualizado, regrava (1 UPDATE)."""
+    valid, must_update = executor.run("verify", _verify, password, user.password)
+    if valid and must_update:
+        try:
+            user.password = executor.run("hash", hashers.make_password, password)
+        except HashingBusy:
+            return valid  # regrava no próximo login
+        user.save(update_fields=["password"])
+    return valid
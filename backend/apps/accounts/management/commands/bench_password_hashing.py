@@ -0,0 +1,83 @@
+import threading
+import time
+
+from django.conf import settings
+from django.contrib.auth import hashers
+from django.core.management.base import BaseCommand
+from django.utils.module_loading import import_string
+
+from apps.accounts.hashing import HashingBusy, HashingExecutor, _verify
+
+HASHERS = {
+    "pbkdf2": "django.contrib.auth.hashers.PBKDF2PasswordHasher",
+    "scrypt": "apps.accounts.hashers.ScryptPasswordHasher",
+    "argon2": "apps.accounts.hashers.Argon2PasswordHasher",
+}
+
+
+class Command(BaseCommand):
+    help = (
+        "Benchmark de login (sem banco): verificações/s por core de cada hasher e, pelo executor "
+        "limitado, vazão/latência/recusas com N clientes simultâneos."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--seconds", type=float, default=3.0, help="Duração de cada medição.")
+        parser.add_argument("--clients", type=int, default=32, help="Logins simultâneos no teste do executor.")
+        parser.add_argument("--workers", type=int, default=None, help="Padrão: PASSWORD_HASH_WORKERS.")
+        parser.add_argument("--queue", type=int, default=None, help="Padrão: PASSWORD_HASH_QUEUE.")
+        parser.add_argument("--wait", type=float, default=None, help="Padrão: PASSWORD_HASH_WAIT.")
+
+    def handle(self, *args, seconds, clients, workers, queue, wait, **options):
+        password = "correct horse battery staple"
+        for name, path in HASHERS.items():
+            hasher = import_string(path)()
+            try:
+                encoded = hasher.encode(password, hasher.salt())
+            except ValueError as exc:  # argon2-cffi ausente
+                self.stdout.write(f"{name}: indisponível ({exc})")
+                continue
+            count, started = 0, time.perf_counter()
+            while time.perf_counter() - started < seconds:
+                hasher.verify(password, encoded)
+                count += 1
+            elapsed = time.perf_counter() - started
+            params = {k: v for k, v in hasher.safe_summary(encoded).items() if k not in ("salt", "hash")}
+            self.stdout.write(f"{name}: {count / elapsed:.1f} logins/s por core ({elapsed / count * 1000:.1f}ms cada) {params}")
+
+        executor = HashingExecutor(
+            workers=workers or settings.PASSWORD_HASH_WORKERS,
+            queue_size=settings.PASSWORD_HASH_QUEUE if queue is None else queue,
+            wait=settings.PASSWORD_HASH_WAIT if wait is None else wait,
+        )
+        encoded = hashers.make_password(password)
+        latencies, rejected = [], [0]
+        lock = threading.Lock()
+        deadline = time.perf_counter() + seconds
+
+        def client():
+            while time.perf_counter() < deadline:
+                started = time.perf_counter()
+                try:
+                    executor.run("verify", _verify, password, encoded)
+                except HashingBusy:
+                    with lock:
+                        rejected[0] += 1
+                    continue
+                with lock:
+                    latencies.append(time.perf_counter() - started)
+
+        threads = [threading.Thread(target=client) for _ in range(clients)]
+        started = time.perf_counter()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        elapsed = time.perf_counter() - started
+        latencies.sort()
+        pct = lambda p: latencies[min(len(latencies) - 1, int(len(latencies) * p))] * 1000 if latencies else 0
+        self.stdout.write(
+            f"executor ({settings.PASSWORD_HASHERS[0].rsplit('.', 1)[-1]}, {executor.workers} workers, "
+            f"{clients} clientes): {len(latencies) / elapsed:.1f} logins/s, p50 {pct(0.5):.0f}ms, "
+            f"p99 {pct(0.99):.0f}ms, {rejected[0]} recusados (503)"
+        )
@@ -1,6 +1,8 @@
 from django.contrib.auth import get_user_model
 from rest_framework import serializers
 
+from . import hashing
+
 User = get_user_model()
 
 class RegisterSerializer(serializers.ModelSerializer):
@@ -11,11 +13,13 @@ class RegisterSerializer(serializers.ModelSerializer):
         fields = ("id", "username", "email", "password")
 
     def create(self, validated_data):
+        # encoded_password: hash já calculado (cadastro async); senão, hash pelo executor limitado
+        encoded = validated_data.get("encoded_password") or hashing.make_password(validated_data["password"])
         user = User(
             username=validated_data["username"],
             email=validated_data.get("email", ""),
+            password=encoded,
         )
-        user.set_password(validated_data["password"])
         user.save()
         return user
 
@@ -1,12 +1,21 @@
+import json
+
+from asgiref.sync import sync_to_async
+from django.http import HttpResponse
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework import status
 from rest_framework.permissions import AllowAny, IsAuthenticated
 
+from apps.core.throttling import PUBLIC_WRITE_THROTTLES, EndpointTokenBucketThrottle, IPTokenBucketThrottle
+from apps.core.views import AsyncJSONView
+from . import hashing
 from .serializers import RegisterSerializer, MeSerializer
 
 class RegisterAPIView(APIView):
     permission_classes = [AllowAny]
+    throttle_classes = PUBLIC_WRITE_THROTTLES
+    throttle_scope = "register"
 
     def post(self, request):
         s = RegisterSerializer(data=request.data)
@@ -15,6 +24,43 @@ class RegisterAPIView(APIView):
         return Response(MeSerializer(user).data, status=status.HTTP_201_CREATED)
 
 
+class RegisterAsyncView(AsyncJSONView):
+    """
+    POST /api/v1/async/auth/register/  (mesma entrada/saída de RegisterAPIView)
+
+    Para ASGI: o hash roda no executor de senhas e o event loop segue atendendo outros requests.
+    Throttle só por IP/endpoint (cadastro é anônimo; request.user exigiria acesso síncrono à sessão).
+    """
+    http_method_names = ["post", "options"]
+    throttle_classes = [IPTokenBucketThrottle, EndpointTokenBucketThrottle]
+    throttle_scope = "register"
+
+    def unavailable(self, status_code: int, detail: str, wait) -> HttpResponse:
+        response = self.json({"detail": detail}, status=status_code)
+        if wait:
+            response["Retry-After"] = str(wait)
+        return response
+
+    async def post(self, request):
+        for throttle in (throttle_class() for throttle_class in self.throttle_classes):
+            if not throttle.allow_request(request, self):
+                return self.unavailable(429, "Muitas requisições. Tente novamente em instantes.", throttle.wait())
+        try:
+            data = json.loads(request.body or b"{}")
+        except ValueError:
+            return self.json({"detail": "JSON inválido."}, status=400)
+
+        serializer = RegisterSerializer(data=data)
+        if not await sync_to_async(serializer.is_valid)():
+            return self.json(serializer.errors, status=400)
+        try:
+            encoded = await hashing.amake_password(serializer.validated_data["password"])
+        except hashing.HashingBusy as exc:
+            return self.unavailable(exc.status_code, str(exc.detail), exc.wait)
+        user = await sync_to_async(serializer.save)(encoded_password=encoded)
+        return self.json(MeSerializer(user).data, status=201)
+
+
 class MeAPIView(APIView):
     permission_classes = [IsAuthenticated]
 
@@ -0,0 +1,16 @@
+from django.contrib import admin
+from .models import Cart, CartItem
+
+
+class CartItemInline(admin.TabularInline):
+    model = CartItem
+    extra = 0
+    raw_id_fields = ("product", "variant")
+
+
+@admin.register(Cart)
+class CartAdmin(admin.ModelAdmin):
+    list_display = ("id", "user", "created_at", "updated_at", "expires_at")
+    list_select_related = ("user",)
+    raw_id_fields = ("user",)
+    inlines = [CartItemInline]
@@ -0,0 +1,14 @@
+from django.core.management.base import BaseCommand
+
+from apps.cart.services import delete_expired_carts
+
+
+class Command(BaseCommand):
+    help = "Remove carrinhos anônimos expirados (em lotes). Rodar via cron."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=1000)
+
+    def handle(self, *args, batch_size, **options):
+        deleted = delete_expired_carts(batch_size=batch_size)
+        self.stdout.write(f"{deleted} carrinho(s) expirado(s) removido(s).")
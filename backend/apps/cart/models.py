@@ -0,0 +1,65 @@
+import uuid
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import models
+from django.utils import timezone
+
+from apps.catalog.models import Product, ProductVariant
+
+
+def default_expires_at():
+    return timezone.now() + timedelta(days=getattr(settings, "CART_TTL_DAYS", 30))
+
+
+class Cart(models.Model):
+    """
+    Carrinho persistente: anônimo (identificado pelo token, header X-Cart-Token)
+    ou do usuário logado. Carrinhos anônimos são mesclados no login (merge).
+    """
+    token = models.UUIDField(default=uuid.uuid4, unique=True, editable=False)
+    user = models.OneToOneField(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        null=True,
+        blank=True,
+        related_name="cart",
+    )
+
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+    expires_at = models.DateTimeField(default=default_expires_at, db_index=True)
+
+    def touch(self):
+        self.expires_at = default_expires_at()
+        self.save(update_fields=["expires_at", "updated_at"])
+
+    def __str__(self):
+        return f"Cart #{self.id} user={self.user_id or '-'}"
+
+
+class CartItem(models.Model):
+    cart = models.ForeignKey(Cart, on_delete=models.CASCADE, related_name="items")
+    product = models.ForeignKey(Product, on_delete=models.CASCADE, related_name="+")
+    variant = models.ForeignKey(ProductVariant, on_delete=models.CASCADE, null=True, blank=True, related_name="+")
+    qty = models.PositiveIntegerField(default=1)
+
+    # último preço mostrado ao cliente; comparado com o atual na leitura (price_changed)
+    unit_price = models.DecimalField(max_digits=10, decimal_places=2)
+
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        ordering = ["id"]
+        constraints = [
+            # variant NULL não conflita em UNIQUE comum: uma constraint parcial para cada caso
+            models.UniqueConstraint(
+                fields=["cart", "product"], condition=models.Q(variant__isnull=True), name="uniq_cart_line_product",
+            ),
+            models.UniqueConstraint(
+                fields=["cart", "product", "variant"], condition=models.Q(variant__isnull=False), name="uniq_cart_line_variant",
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.product_id}/{self.variant_id or '-'} x{self.qty}"
@@ -0,0 +1,71 @@
+from decimal import Decimal
+
+from rest_framework import serializers
+
+from apps.catalog.models import Product, ProductVariant
+from apps.core.serializers import PlainSerializer, decimal_str
+
+
+class CartItemInputSerializer(serializers.Serializer):
+    productId = serializers.IntegerField(min_value=1)
+    variantId = serializers.IntegerField(min_value=1, required=False, allow_null=True)
+    qty = serializers.IntegerField(min_value=1, max_value=99, default=1)
+
+    def validate(self, attrs):
+        product = Product.objects.filter(id=attrs["productId"], active=True).first()
+        if product is None:
+            raise serializers.ValidationError({"productId": "Produto não encontrado."})
+
+        variant = None
+        variant_id = attrs.get("variantId")
+        if variant_id:
+            variant = ProductVariant.objects.filter(id=variant_id, product=product, active=True).first()
+            if variant is None:
+                raise serializers.ValidationError({"variantId": "Variação inválida."})
+        elif ProductVariant.objects.filter(product=product, active=True).exists():
+            raise serializers.ValidationError({"variantId": "Escolha tamanho/cor."})
+
+        attrs["product"] = product
+        attrs["variant"] = variant
+        return attrs
+
+
+class CartItemQtySerializer(serializers.Serializer):
+    qty = serializers.IntegerField(min_value=1, max_value=99)
+
+
+class CartPlainSerializer(PlainSerializer):
+    """
+    Carrinho já reprecificado: instance = (cart, lines) com lines vindas de services.priced_lines.
+    """
+
+    def to_representation(self, obj) -> dict:
+        cart, lines = obj
+        subtotal = Decimal("0.00")
+        items = []
+        for line in lines:
+            product, variant = line.product, line.variant
+            subtotal += line.unit_price * line.qty
+            items.append({
+                "id": line.id,
+                "productId": product.id,
+                "variantId": variant.id if variant else None,
+                "slug": product.slug,
+                "name": product.name,
+                "sku": variant.sku if variant else "",
+                "size": variant.size if variant else "",
+                "color": variant.color if variant else "",
+                "price": decimal_str(line.unit_price),
+                "previous_price": decimal_str(line.previous_price) if line.price_changed else None,
+                "price_changed": line.price_changed,
+                "qty": line.qty,
+                "available": product.active and (variant is None or (variant.active and variant.stock >= line.qty)),
+            })
+
+        return {
+            "token": str(cart.token) if cart else None,
+            "items": items,
+            "count": sum(i["qty"] for i in items),
+            "subtotal": decimal_str(subtotal),
+            "expires_at": cart.expires_at if cart and cart.user_id is None else None,
+        }
@@ -0,0 +1,145 @@
+import uuid
+
+from django.db import IntegrityError, transaction
+from django.db.models import F
+from django.db.models.functions import Least
+from django.utils import timezone
+
+from .models import Cart, CartItem
+
+MAX_QTY = 99
+
+
+def parse_cart_token(raw: str | None):
+    try:
+        return uuid.UUID(str(raw)) if raw else None
+    except ValueError:
+        return None
+
+
+def find_cart(request) -> Cart | None:
+    """
+    Usuário logado -> carrinho do usuário; senão, carrinho anônimo do header X-Cart-Token.
+    Carrinho anônimo expirado é tratado como inexistente.
+    """
+    user = getattr(request, "user", None)
+    if user is not None and user.is_authenticated:
+        return Cart.objects.filter(user=user).first()
+
+    token = parse_cart_token(request.headers.get("X-Cart-Token"))
+    if token is None:
+        return None
+    return Cart.objects.filter(token=token, user__isnull=True, expires_at__gt=timezone.now()).first()
+
+
+def get_or_create_cart(request) -> Cart:
+    cart = find_cart(request)
+    if cart is not None:
+        return cart
+
+    user = getattr(request, "user", None)
+    if user is not None and user.is_authenticated:
+        cart, _ = Cart.objects.get_or_create(user=user)
+        return cart
+    return Cart.objects.create()
+
+
+def current_price(product, variant):
+    if variant is not None and variant.price is not None:
+        return variant.price
+    return product.price
+
+
+def priced_lines(cart: Cart, *, persist: bool = True) -> list[CartItem]:
+    """
+    Reprecifica todas as linhas numa query só (JOIN em produto e variante).
+    Linhas cujo preço mudou ganham price_changed=True; com persist, o snapshot é atualizado em lote
+    (só nas escritas: GET do carrinho não grava nada e segue avisando até a próxima alteração).
+    """
+    lines = list(cart.items.select_related("product", "variant"))
+
+    changed = []
+    for line in lines:
+        price = current_price(line.product, line.variant)
+        line.price_changed = price != line.unit_price
+        line.previous_price = line.unit_price
+        if line.price_changed:
+            line.unit_price = price
+            changed.append(line)
+
+    if changed and persist:
+        CartItem.objects.bulk_update(changed, ["unit_price"])
+    return lines
+
+
+def add_item(cart: Cart, *, product, variant, qty: int) -> CartItem:
+    """
+    Sem ler antes de gravar: UPDATE atômico qty = min(qty + n, MAX_QTY); sem linha, INSERT.
+    Dois adds simultâneos da mesma linha nova: quem perde na constraint única cai no UPDATE
+    (savepoint), sem IntegrityError para o cliente e sem perder incremento.
+    """
+    price = current_price(product, variant)
+    line = CartItem.objects.filter(cart=cart, product=product, variant=variant)
+    increment = {"qty": Least(F("qty") + qty, MAX_QTY), "unit_price": price}
+    if not line.update(**increment):
+        try:
+            with transaction.atomic():
+                CartItem.objects.create(cart=cart, product=product, variant=variant, qty=min(qty, MAX_QTY), unit_price=price)
+        except IntegrityError:
+            line.update(**increment)
+    cart.touch()
+    return line.get()
+
+
+@transaction.atomic
+def merge_carts(source: Cart, target: Cart) -> int:
+    """
+    Mescla o carrinho anônimo `source` no `target` (do usuário) e apaga o source.
+    Mesma linha (produto+variante) soma quantidades (limite MAX_QTY).
+    Queries fixas, independente do número de linhas: 2 leituras + bulk_update + bulk_create + delete.
+    Retorna o número de linhas mescladas.
+    """
+    if source.pk == target.pk:
+        return 0
+
+    existing = {(i.product_id, i.variant_id): i for i in target.items.all()}
+    source_lines = list(source.items.all())
+
+    to_update, to_create = [], []
+    for line in source_lines:
+        current = existing.get((line.product_id, line.variant_id))
+        if current is not None:
+            current.qty = min(current.qty + line.qty, MAX_QTY)
+            to_update.append(current)
+        else:
+            to_create.append(CartItem(
+                cart=target, product_id=line.product_id, variant_id=line.variant_id,
+                qty=line.qty, unit_price=line.unit_price,
+            ))
+
+    if to_update:
+        CartItem.objects.bulk_update(to_update, ["qty"])
+    source.delete()
+    if to_create:
+        CartItem.objects.bulk_create(to_create)
+    target.touch()
+    return len(source_lines)
+
+
+def delete_expired_carts(*, batch_size: int = 1000, now=None) -> int:
+    """
+    Remove carrinhos anônimos expirados em lotes (itens saem por DELETE ... WHERE cart_id IN, sem carregar linhas).
+    Carrinho de usuário não expira.
+    """
+    now = now or timezone.now()
+    total = 0
+    while True:
+        ids = list(
+            Cart.objects.filter(user__isnull=True, expires_at__lt=now).values_list("id", flat=True)[:batch_size]
+        )
+        if not ids:
+            return total
+        with transaction.atomic():
+            CartItem.objects.filter(cart_id__in=ids).delete()
+            Cart.objects.filter(id__in=ids).delete()
+        total += len(ids)
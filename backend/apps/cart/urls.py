@@ -0,0 +1,9 @@
+from django.urls import path
+from .views import CartAPIView, CartItemsAPIView, CartItemDetailAPIView, CartMergeAPIView
+
+urlpatterns = [
+    path("cart/", CartAPIView.as_view(), name="cart"),
+    path("cart/items/", CartItemsAPIView.as_view(), name="cart-items"),
+    path("cart/items/<int:item_id>/", CartItemDetailAPIView.as_view(), name="cart-item-detail"),
+    path("cart/merge/", CartMergeAPIView.as_view(), name="cart-merge"),
+]
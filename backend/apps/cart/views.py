@@ -0,0 +1,103 @@
+from rest_framework import status
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from apps.core.throttling import PUBLIC_WRITE_THROTTLES
+from .models import Cart
+from .serializers import CartItemInputSerializer, CartItemQtySerializer, CartPlainSerializer
+from .services import parse_cart_token, add_item, find_cart, get_or_create_cart, merge_carts, priced_lines
+
+
+def cart_response(cart, status_code=status.HTTP_200_OK, *, persist: bool = True):
+    lines = priced_lines(cart, persist=persist) if cart else []
+    return Response(CartPlainSerializer((cart, lines)).data, status=status_code)
+
+
+class CartAPIView(APIView):
+    """
+    GET    /api/v1/cart/   carrinho atual (usuário logado ou header X-Cart-Token), reprecificado sem gravar
+    DELETE /api/v1/cart/   esvazia
+    """
+
+    def get(self, request):
+        return cart_response(find_cart(request), persist=False)
+
+    def delete(self, request):
+        cart = find_cart(request)
+        if cart:
+            cart.items.all().delete()
+        return cart_response(cart)
+
+
+class CartItemsAPIView(APIView):
+    """
+    POST /api/v1/cart/items/   {"productId": 1, "variantId": 3, "qty": 1}
+
+    Cria o carrinho se preciso; a resposta traz o token (guardar e mandar em X-Cart-Token).
+    """
+    throttle_classes = PUBLIC_WRITE_THROTTLES
+    throttle_scope = "cart"
+
+    def post(self, request):
+        s = CartItemInputSerializer(data=request.data)
+        s.is_valid(raise_exception=True)
+
+        cart = get_or_create_cart(request)
+        add_item(cart, product=s.validated_data["product"], variant=s.validated_data["variant"], qty=s.validated_data["qty"])
+        return cart_response(cart, status.HTTP_201_CREATED)
+
+
+class CartItemDetailAPIView(APIView):
+    """
+    PATCH  /api/v1/cart/items/<id>/   {"qty": 2}
+    DELETE /api/v1/cart/items/<id>/
+    """
+    throttle_classes = PUBLIC_WRITE_THROTTLES
+    throttle_scope = "cart"
+
+    def get_line(self, request, item_id):
+        cart = find_cart(request)
+        line = cart.items.filter(id=item_id).first() if cart else None
+        return cart, line
+
+    def patch(self, request, item_id: int):
+        cart, line = self.get_line(request, item_id)
+        if line is None:
+            return Response({"detail": "Item não encontrado."}, status=404)
+
+        s = CartItemQtySerializer(data=request.data)
+        s.is_valid(raise_exception=True)
+        line.qty = s.validated_data["qty"]
+        line.save(update_fields=["qty"])
+        cart.touch()
+        return cart_response(cart)
+
+    def delete(self, request, item_id: int):
+        cart, line = self.get_line(request, item_id)
+        if line is None:
+            return Response({"detail": "Item não encontrado."}, status=404)
+
+        line.delete()
+        cart.touch()
+        return cart_response(cart)
+
+
+class CartMergeAPIView(APIView):
+    """
+    POST /api/v1/cart/merge/   (logado, com header X-Cart-Token do carrinho anônimo)
+
+    Mescla o carrinho anônimo no carrinho do usuário, como o claim de pedidos guest.
+    """
+    permission_classes = [IsAuthenticated]
+
+    def post(self, request):
+        token = parse_cart_token(request.headers.get("X-Cart-Token"))
+        source = Cart.objects.filter(token=token, user__isnull=True).first() if token else None
+
+        target, _ = Cart.objects.get_or_create(user=request.user)
+        merged = merge_carts(source, target) if source else 0
+
+        response = cart_response(target)
+        response.data["merged"] = merged
+        return response
@@ -1,5 +1,5 @@
 from django.contrib import admin
-from .models import Category, Brand, Product, ProductImage
+from .models import Category, Brand, Product, ProductImage, ProductVariant
 
 
 class ProductImageInline(admin.TabularInline):
@@ -7,6 +7,12 @@ class ProductImageInline(admin.TabularInline):
     extra = 1
 
 
+class ProductVariantInline(admin.TabularInline):
+    model = ProductVariant
+    extra = 1
+    fields = ("sku", "size", "color", "price", "stock", "active", "sort_order")
+
+
 @admin.register(Category)
 class CategoryAdmin(admin.ModelAdmin):
     list_display = ("name", "slug")
@@ -27,4 +33,4 @@ class ProductAdmin(admin.ModelAdmin):
     list_filter = ("active", "category", "brand")
     search_fields = ("name", "slug")
     prepopulated_fields = {"slug": ("name",)}
-    inlines = [ProductImageInline]
+    inlines = [ProductVariantInline, ProductImageInline]
@@ -0,0 +1,234 @@
+"""
+Sitemap (sitemaps.org) e feed de produtos estilo Google Shopping, gerados em streaming.
+
+- Produtos lidos em blocos por keyset (id > último), memória constante em qualquer tamanho de catálogo.
+- Sitemap dividido por faixas de id (SITEMAP_MAX_URLS ids por arquivo, portanto nunca passa
+  do limite de 50.000 URLs) + sitemap index; tudo em .xml.gz.
+- Incremental: uma query agregada por faixa (qtd, max(updated_at), soma dos ids) decide quais
+  arquivos de sitemap precisam ser regravados; o feed só é regravado se algo mudou.
+- Escrita em arquivo temporário + os.replace.
+"""
+import gzip
+import hashlib
+import json
+import os
+from datetime import datetime, timezone as dt_timezone
+from pathlib import Path
+from xml.sax.saxutils import escape
+
+from django.conf import settings
+from django.db.models import Count, F, Max, Sum
+
+from .models import Product, ProductVariant
+
+SITEMAP_MAX_URLS = 50_000            # limite do protocolo por arquivo
+SITEMAP_MAX_BYTES = 50 * 1024 * 1024  # limite do protocolo (não comprimido)
+SITEMAP_NS = "http://www.sitemaps.org/schemas/sitemap/0.9"
+GOOGLE_NS = "http://base.google.com/ns/1.0"
+
+
+def _iso(value) -> str:
+    return value.astimezone(dt_timezone.utc).strftime("%Y-%m-%dT%H:%M:%S+00:00") if value else ""
+
+
+class _GzipWriter:
+    """Grava texto em .gz de forma incremental, em arquivo temporário trocado no close()."""
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.tmp = path.with_name(path.name + ".tmp")
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._fh = gzip.open(self.tmp, "wt", encoding="utf-8", compresslevel=6)
+        self.bytes = 0
+
+    def write(self, text: str):
+        self.bytes += len(text.encode("utf-8"))
+        self._fh.write(text)
+
+    def close(self):
+        self._fh.close()
+        os.replace(self.tmp, self.path)
+
+
+def iter_product_chunks(queryset, chunk_size: int):
+    """Keyset pagination por id: cada bloco é uma query nova, sem OFFSET e sem acumular memória."""
+    last_id = 0
+    while True:
+        chunk = list(queryset.filter(id__gt=last_id).order_by("id")[:chunk_size])
+        if not chunk:
+            return
+        yield chunk
+        last_id = chunk[-1].id
+
+
+class FeedGenerator:
+    def __init__(self, root=None, *, site_url=None, media_url=None, chunk_size=2000,
+                 max_urls=SITEMAP_MAX_URLS, stdout=None):
+        self.root = Path(root or settings.FEEDS_ROOT)
+        self.site_url = (site_url or settings.SITE_URL).rstrip("/")
+        self.media_url = (settings.CATALOG_SNAPSHOT_MEDIA_BASE if media_url is None else media_url).rstrip("/")
+        self.chunk_size = chunk_size
+        self.max_urls = max_urls
+        self.stdout = stdout
+
+    def log(self, msg: str):
+        if self.stdout:
+            self.stdout.write(msg)
+
+    def product_url(self, slug: str) -> str:
+        return f"{self.site_url}/produto/{slug}"
+
+    def image_url(self, image) -> str:
+        try:
+            url = image.url
+        except ValueError:
+            return ""
+        return f"{self.media_url}{url}" if url.startswith("/") else url
+
+    # ---------- estado incremental ----------
+
+    def _state_path(self) -> Path:
+        return self.root / "feeds-state.json"
+
+    def load_state(self) -> dict:
+        path = self._state_path()
+        return json.loads(path.read_text()) if path.exists() else {}
+
+    def save_state(self, state: dict):
+        tmp = self._state_path().with_name("feeds-state.json.tmp")
+        tmp.write_text(json.dumps(state))
+        os.replace(tmp, self._state_path())
+
+    def bucket_fingerprints(self) -> dict[str, list]:
+        """
+        Uma query agregada: faixa de id -> [qtd, último updated_at, soma dos ids].
+        Variantes, imagens, categoria (<g:product_type>) e marca (<g:brand>) entram via
+        Product.updated_at: apps.catalog.signals e os caminhos em lote tocam o produto quando mudam.
+        """
+        rows = (
+            Product.objects.filter(active=True)
+            .annotate(bucket=F("id") / self.max_urls)
+            .values("bucket")
+            .annotate(n=Count("id"), last=Max("updated_at"), ids=Sum("id"))
+            .order_by("bucket")
+        )
+        return {
+            str(r["bucket"]): [r["n"], r["last"].isoformat() if r["last"] else "", r["ids"]] for r in rows
+        }
+
+    # ---------- sitemap ----------
+
+    def write_sitemap_bucket(self, bucket: int) -> Path:
+        path = self.root / f"sitemap-products-{bucket:05d}.xml.gz"
+        qs = Product.objects.filter(
+            active=True, id__gte=bucket * self.max_urls, id__lt=(bucket + 1) * self.max_urls,
+        ).only("id", "slug", "updated_at", "created_at")
+
+        out = _GzipWriter(path)
+        out.write(f'<?xml version="1.0" encoding="UTF-8"?>\n<urlset xmlns="{SITEMAP_NS}">\n')
+        for chunk in iter_product_chunks(qs, self.chunk_size):
+            for p in chunk:
+                lastmod = _iso(p.updated_at or p.created_at)
+                out.write(
+                    f"<url><loc>{escape(self.product_url(p.slug))}</loc><lastmod>{lastmod}</lastmod></url>\n"
+                )
+        out.write("</urlset>\n")
+        out.close()
+        if out.bytes > SITEMAP_MAX_BYTES:
+            self.log(f"Aviso: {path.name} passou de 50MB; reduza --max-urls.")
+        return path
+
+    def write_sitemap_index(self, buckets):
+        now = _iso(datetime.now(dt_timezone.utc))
+        out = _GzipWriter(self.root / "sitemap.xml.gz")
+        out.write(f'<?xml version="1.0" encoding="UTF-8"?>\n<sitemapindex xmlns="{SITEMAP_NS}">\n')
+        out.write(f"<sitemap><loc>{escape(self.site_url)}/sitemap-static.xml.gz</loc><lastmod>{now}</lastmod></sitemap>\n")
+        for bucket, lastmod in buckets:
+            loc = f"{self.site_url}/sitemap-products-{int(bucket):05d}.xml.gz"
+            out.write(f"<sitemap><loc>{escape(loc)}</loc><lastmod>{lastmod}</lastmod></sitemap>\n")
+        out.write("</sitemapindex>\n")
+        out.close()
+
+        static = _GzipWriter(self.root / "sitemap-static.xml.gz")
+        static.write(f'<?xml version="1.0" encoding="UTF-8"?>\n<urlset xmlns="{SITEMAP_NS}">\n')
+        static.write(f"<url><loc>{escape(self.site_url)}/</loc></url>\n")
+        static.write("</urlset>\n")
+        static.close()
+
+    # ---------- feed ----------
+
+    def write_product_feed(self):
+        qs = (
+            Product.objects.filter(active=True)
+            .select_related("category", "brand")
+            .prefetch_related("images")
+        )
+        out = _GzipWriter(self.root / "products-feed.xml.gz")
+        out.write(
+            f'<?xml version="1.0" encoding="UTF-8"?>\n<rss version="2.0" xmlns:g="{GOOGLE_NS}">\n<channel>\n'
+            f"<title>Catálogo</title><link>{escape(self.site_url)}</link><description>Feed de produtos</description>\n"
+        )
+        total = 0
+        for chunk in iter_product_chunks(qs, self.chunk_size):
+            # disponibilidade de todo o bloco numa query (produtos sem variantes = em estoque)
+            stock = dict(
+                ProductVariant.objects.filter(product_id__in=[p.id for p in chunk], active=True)
+                .values("product_id").annotate(total=Sum("stock")).values_list("product_id", "total")
+            )
+            for p in chunk:
+                images = list(p.images.all())
+                in_stock = stock.get(p.id, 1) > 0
+                parts = [
+                    f"<g:id>{p.id}</g:id>",
+                    f"<title>{escape(p.name)}</title>",
+                    f"<description>{escape(p.description or p.name)}</description>",
+                    f"<link>{escape(self.product_url(p.slug))}</link>",
+                    f"<g:price>{p.price:f} BRL</g:price>",
+                    f"<g:availability>{'in_stock' if in_stock else 'out_of_stock'}</g:availability>",
+                    "<g:condition>new</g:condition>",
+                    f"<g:product_type>{escape(p.category.name)}</g:product_type>",
+                ]
+                if p.brand:
+                    parts.append(f"<g:brand>{escape(p.brand.name)}</g:brand>")
+                if images:
+                    parts.append(f"<g:image_link>{escape(self.image_url(images[0].image))}</g:image_link>")
+                    parts.extend(
+                        f"<g:additional_image_link>{escape(self.image_url(img.image))}</g:additional_image_link>"
+                        for img in images[1:11]
+                    )
+                out.write("<item>" + "".join(parts) + "</item>\n")
+                total += 1
+        out.write("</channel>\n</rss>\n")
+        out.close()
+        return total
+
+    # ---------- orquestração ----------
+
+    def generate(self, *, full: bool = False) -> dict:
+        self.root.mkdir(parents=True, exist_ok=True)
+        state = {} if full else self.load_state()
+        prev_buckets: dict = state.get("buckets", {})
+        buckets = self.bucket_fingerprints()
+
+        changed = [b for b, fp in buckets.items() if prev_buckets.get(b) != fp]
+        removed = [b for b in prev_buckets if b not in buckets]
+
+        for bucket in changed:
+            self.write_sitemap_bucket(int(bucket))
+        for bucket in removed:
+            (self.root / f"sitemap-products-{int(bucket):05d}.xml.gz").unlink(missing_ok=True)
+
+        feed_fp = hashlib.sha256(json.dumps(buckets, sort_keys=True).encode()).hexdigest()
+        feed_items = None
+        if changed or removed or state.get("feed") != feed_fp or not (self.root / "products-feed.xml.gz").exists():
+            self.write_sitemap_index(
+                sorted((b, _iso(datetime.fromisoformat(fp[1])) if fp[1] else "") for b, fp in buckets.items())
+            )
+            feed_items = self.write_product_feed()
+
+        self.save_state({"buckets": buckets, "feed": feed_fp})
+        self.log(
+            f"Sitemaps: {len(changed)} arquivo(s) regravado(s), {len(removed)} removido(s), {len(buckets)} no total. "
+            + (f"Feed: {feed_items} item(ns)." if feed_items is not None else "Feed sem mudanças.")
+        )
+        return {"sitemaps_written": len(changed), "sitemaps_removed": len(removed), "feed_items": feed_items}
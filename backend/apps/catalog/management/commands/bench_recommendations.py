@@ -0,0 +1,54 @@
+import time
+from array import array
+
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.catalog import recommendations
+
+
+class Command(BaseCommand):
+    help = "Benchmark da co-compra (sem banco): linhas sintéticas com popularidade Zipf, NumPy vs Python."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--lines", type=int, default=2_000_000)
+        parser.add_argument("--products", type=int, default=50_000)
+        parser.add_argument("--items-mean", type=float, default=2.2)
+        parser.add_argument("--skew", type=float, default=1.1)
+        parser.add_argument("--k", type=int, default=12)
+        parser.add_argument("--python-lines", type=int, default=200_000, help="Tamanho da amostra no caminho Python (0 = pula).")
+        parser.add_argument("--seed", type=int, default=42)
+
+    def handle(self, *args, lines, products, items_mean, skew, k, python_lines, seed, **options):
+        np = recommendations.np
+        if np is None:
+            raise CommandError("Benchmark precisa de numpy/scipy instalados.")
+        rng = np.random.default_rng(seed)
+        weights = 1 / np.arange(1, products + 1) ** skew
+        product_ids = rng.choice(products, size=lines, p=weights / weights.sum()).astype(np.int64) + 1
+        basket_sizes = rng.geometric(1 / items_mean, size=lines)
+        order_ids = np.repeat(np.arange(len(basket_sizes), dtype=np.int64), basket_sizes)[:lines]
+
+        orders = array("q", order_ids.tobytes())
+        items = array("q", product_ids.tobytes())
+
+        start = time.perf_counter()
+        result = recommendations.cooccurrence_topk(orders, items, k=k, use_numpy=True)
+        elapsed = time.perf_counter() - start
+        self.stdout.write(
+            f"numpy/scipy: {lines} linhas, {len(result)} produtos com vizinhos em {elapsed:.2f}s "
+            f"({lines / elapsed:,.0f} linhas/s)"
+        )
+
+        if python_lines:
+            sample = min(python_lines, lines)
+            start = time.perf_counter()
+            fast = recommendations.cooccurrence_topk(orders[:sample], items[:sample], k=k, use_numpy=True)
+            fast_elapsed = time.perf_counter() - start
+            start = time.perf_counter()
+            slow = recommendations.cooccurrence_topk(orders[:sample], items[:sample], k=k, use_numpy=False)
+            slow_elapsed = time.perf_counter() - start
+            same = {p: [o for o, _ in v] for p, v in fast.items()} == {p: [o for o, _ in v] for p, v in slow.items()}
+            self.stdout.write(
+                f"amostra {sample} linhas: numpy {fast_elapsed:.2f}s, python {slow_elapsed:.2f}s "
+                f"({slow_elapsed / fast_elapsed:.1f}x), resultados iguais: {same}"
+            )
@@ -0,0 +1,34 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from apps.catalog import recommendations
+
+
+class Command(BaseCommand):
+    help = "Recalcula 'comprados juntos' (co-compra, matriz esparsa) e 'similares' por produto. Rodar à noite."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--k", type=int, default=12, help="Vizinhos guardados por produto.")
+        parser.add_argument("--days", type=int, default=365, help="Janela de pedidos (0 = todos).")
+        parser.add_argument("--min-support", type=int, default=2, help="Mínimo de pedidos em comum.")
+        parser.add_argument("--python", action="store_true", help="Força o cálculo sem NumPy/SciPy.")
+
+    def handle(self, *args, k, days, min_support, python, **options):
+        started = time.perf_counter()
+        orders, products = recommendations.load_order_lines(days or None)
+        loaded = time.perf_counter()
+
+        use_numpy = False if python else None
+        together = recommendations.cooccurrence_topk(orders, products, k=k, min_support=min_support, use_numpy=use_numpy)
+        computed = time.perf_counter()
+        similar = recommendations.similar_products(k=k)
+        stored = recommendations.store(together, similar)
+        finished = time.perf_counter()
+
+        engine = "python" if python or recommendations.np is None else "numpy/scipy"
+        self.stdout.write(
+            f"{len(orders)} linha(s) de pedido, {len(together)} produto(s) com co-compra, {stored} linha(s) gravada(s). "
+            f"Tempos ({engine}): leitura {loaded - started:.1f}s, co-compra {computed - loaded:.1f}s, "
+            f"similares+gravação {finished - computed:.1f}s."
+        )
@@ -0,0 +1,18 @@
+from django.core.management.base import BaseCommand
+
+from apps.catalog.feeds import SITEMAP_MAX_URLS, FeedGenerator
+
+
+class Command(BaseCommand):
+    help = "Gera sitemap.xml.gz (com index) e products-feed.xml.gz em streaming, de forma incremental."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--full", action="store_true", help="Ignora o estado anterior e regrava tudo.")
+        parser.add_argument("--root", help="Diretório de saída (padrão: FEEDS_ROOT).")
+        parser.add_argument("--chunk-size", type=int, default=2000)
+        parser.add_argument("--max-urls", type=int, default=SITEMAP_MAX_URLS)
+
+    def handle(self, *args, full, root, chunk_size, max_urls, **options):
+        FeedGenerator(
+            root, chunk_size=chunk_size, max_urls=min(max_urls, SITEMAP_MAX_URLS), stdout=self.stdout,
+        ).generate(full=full)
@@ -0,0 +1,15 @@
+from django.core.management.base import BaseCommand
+
+from apps.catalog.snapshot import CatalogPublisher
+
+
+class Command(BaseCommand):
+    help = "Publica o snapshot estático do catálogo (JSON + gzip/brotli), incremental por updated_at."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--full", action="store_true", help="Ignora a versão anterior e renderiza tudo.")
+        parser.add_argument("--root", help="Diretório de saída (padrão: CATALOG_SNAPSHOT_ROOT).")
+        parser.add_argument("--keep", type=int, default=3, help="Quantas versões manter.")
+
+    def handle(self, *args, full, root, keep, **options):
+        CatalogPublisher(root, keep_versions=keep, stdout=self.stdout).publish(full=full)
@@ -0,0 +1,32 @@
+# Generated by Django 6.0.1 on 2026-10-19 15:02
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('catalog', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ProductVariant',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('sku', models.CharField(max_length=64, unique=True)),
+                ('size', models.CharField(blank=True, default='', max_length=20)),
+                ('color', models.CharField(blank=True, default='', max_length=40)),
+                ('price', models.DecimalField(blank=True, decimal_places=2, max_digits=10, null=True)),
+                ('stock', models.PositiveIntegerField(default=0)),
+                ('active', models.BooleanField(default=True)),
+                ('sort_order', models.PositiveIntegerField(default=0)),
+                ('product', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='variants', to='catalog.product')),
+            ],
+            options={
+                'ordering': ['sort_order', 'id'],
+                'constraints': [models.UniqueConstraint(fields=('product', 'size', 'color'), name='uniq_variant_options')],
+            },
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 6.0.1 on 2026-10-19 16:50
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('catalog', '0003_product_updated_at'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ProductRecommendation',
+            fields=[
+                ('product', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='recommendation', serialize=False, to='catalog.product')),
+                ('bought_together', models.JSONField(blank=True, default=list)),
+                ('similar', models.JSONField(blank=True, default=list)),
+                ('computed_at', models.DateTimeField()),
+            ],
+        ),
+    ]
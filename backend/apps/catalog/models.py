@@ -33,11 +33,43 @@ class Product(models.Model):
     brand = models.ForeignKey(Brand, on_delete=models.PROTECT, related_name="products", blank=True, null=True)
 
     created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True, db_index=True)
 
     def __str__(self) -> str:
         return self.name
 
 
+class ProductVariant(models.Model):
+    """
+    Variação vendável do produto (tamanho/cor), com SKU e estoque próprios.
+    price vazio = usa o preço do produto.
+    """
+    product = models.ForeignKey(Product, on_delete=models.CASCADE, related_name="variants")
+    sku = models.CharField(max_length=64, unique=True)
+
+    size = models.CharField(max_length=20, blank=True, default="")
+    color = models.CharField(max_length=40, blank=True, default="")
+
+    price = models.DecimalField(max_digits=10, decimal_places=2, null=True, blank=True)
+    stock = models.PositiveIntegerField(default=0)
+
+    active = models.BooleanField(default=True)
+    sort_order = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        ordering = ["sort_order", "id"]
+        constraints = [
+            models.UniqueConstraint(fields=["product", "size", "color"], name="uniq_variant_options"),
+        ]
+
+    def effective_price(self):
+        return self.price if self.price is not None else self.product.price
+
+    def __str__(self) -> str:
+        options = " / ".join(v for v in (self.size, self.color) if v)
+        return f"{self.product.name} ({options or self.sku})"
+
+
 class ProductImage(models.Model):
     product = models.ForeignKey(Product, on_delete=models.CASCADE, related_name="images")
     image = models.ImageField(upload_to="products/")
@@ -49,3 +81,17 @@ class ProductImage(models.Model):
 
     def __str__(self) -> str:
         return f"Image {self.id} - {self.product.name}"
+
+
+class ProductRecommendation(models.Model):
+    """
+    Vizinhos pré-calculados pelo job build_recommendations (uma linha por produto, busca por PK).
+    bought_together = [[product_id, score], ...] (co-compra); similar = [product_id, ...].
+    """
+    product = models.OneToOneField(Product, on_delete=models.CASCADE, primary_key=True, related_name="recommendation")
+    bought_together = models.JSONField(default=list, blank=True)
+    similar = models.JSONField(default=list, blank=True)
+    computed_at = models.DateTimeField()
+
+    def __str__(self) -> str:
+        return f"Recomendações de {self.product_id}"
@@ -0,0 +1,183 @@
+"""
+Recomendações "comprados juntos" e "similares", pré-calculadas em lote (job noturno).
+
+Co-compra: matriz esparsa pedidos x produtos (binária) X; C = Xᵀ·X dá quantos pedidos contêm
+cada par. score = C[i,j] / sqrt(n_i * n_j) (cosseno), só pares com suporte >= min_support;
+guarda os top-K vizinhos por produto. NumPy/SciPy são opcionais: sem eles, mesma conta
+em Python puro (contagem de pares por pedido), bem mais lenta em volume.
+
+Similares: mesma categoria, preço mais próximo (janela ordenada por preço), mesma marca primeiro.
+"""
+import math
+from array import array
+from collections import Counter, defaultdict
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.utils import timezone
+
+from apps.orders.models import Order, OrderItem
+from .models import Product, ProductRecommendation
+
+try:
+    import numpy as np
+    from scipy import sparse
+except ImportError:  # estão em requirements.txt; sem eles cai no cálculo em Python puro (lento)
+    np = sparse = None
+
+VERSION_KEY = "catalog:related:version"
+
+
+def load_order_lines(days: int | None = None, chunk_size: int = 50_000) -> tuple[array, array]:
+    """(order_id, product_id) de pedidos não cancelados, em arrays compactos (8 bytes por valor)."""
+    qs = OrderItem.objects.exclude(order__status=Order.Status.CANCELED)
+    if days:
+        qs = qs.filter(order__created_at__gte=timezone.now() - timedelta(days=days))
+    orders, products = array("q"), array("q")
+    for order_id, product_id in qs.values_list("order_id", "product_id").iterator(chunk_size=chunk_size):
+        orders.append(order_id)
+        products.append(product_id)
+    return orders, products
+
+
+def cooccurrence_topk(orders, products, *, k: int = 12, min_support: int = 2, use_numpy: bool | None = None) -> dict:
+    """{product_id: [(vizinho, score), ...]} ordenado por score desc."""
+    if use_numpy is None:
+        use_numpy = np is not None
+    if use_numpy:
+        return _topk_numpy(orders, products, k, min_support)
+    return _topk_python(orders, products, k, min_support)
+
+
+def _topk_numpy(orders, products, k, min_support) -> dict:
+    order_ids = np.frombuffer(orders, dtype=np.int64) if isinstance(orders, array) else np.asarray(orders, dtype=np.int64)
+    product_ids = np.frombuffer(products, dtype=np.int64) if isinstance(products, array) else np.asarray(products, dtype=np.int64)
+    if not len(order_ids):
+        return {}
+    _, rows = np.unique(order_ids, return_inverse=True)
+    columns, cols = np.unique(product_ids, return_inverse=True)
+
+    x = sparse.csr_matrix(
+        (np.ones(len(rows), dtype=np.float64), (rows, cols)), shape=(rows.max() + 1, len(columns)),
+    )
+    x.sum_duplicates()
+    x.data[:] = 1  # mesmo produto 2x no pedido conta uma vez
+    counts = np.asarray(x.sum(axis=0)).ravel()
+
+    c = (x.T @ x).tocsr()
+    c.setdiag(0)
+    c.data[c.data < min_support] = 0
+    c.eliminate_zeros()
+    if not c.nnz:
+        return {}
+
+    row_index = np.repeat(np.arange(c.shape[0]), np.diff(c.indptr))
+    scores = c.data / np.sqrt(counts[row_index] * counts[c.indices])
+
+    result = {}
+    indptr, indices = c.indptr, c.indices
+    for i in np.flatnonzero(np.diff(indptr)):
+        start, end = indptr[i], indptr[i + 1]
+        row_scores = scores[start:end]
+        if end - start > k:
+            # todos os empatados com o k-ésimo entram antes do corte (mesmo resultado do caminho Python)
+            top = np.flatnonzero(row_scores >= np.partition(row_scores, -k)[-k])
+        else:
+            top = np.arange(end - start)
+        # desempate determinístico: score desc, id asc
+        top = top[np.lexsort((columns[indices[start:end][top]], -row_scores[top]))][:k]
+        result[int(columns[i])] = [
+            (int(columns[indices[start + j]]), round(float(row_scores[j]), 4)) for j in top
+        ]
+    return result
+
+
+def _topk_python(orders, products, k, min_support) -> dict:
+    baskets = defaultdict(set)
+    for order_id, product_id in zip(orders, products):
+        baskets[order_id].add(product_id)
+
+    counts = Counter()
+    pairs = defaultdict(Counter)
+    for basket in baskets.values():
+        counts.update(basket)
+        if len(basket) < 2:
+            continue
+        items = sorted(basket)
+        for a_index, a in enumerate(items):
+            for b in items[a_index + 1:]:
+                pairs[a][b] += 1
+                pairs[b][a] += 1
+
+    result = {}
+    for product_id, neighbors in pairs.items():
+        scored = [
+            (other, together / math.sqrt(counts[product_id] * counts[other]))
+            for other, together in neighbors.items()
+            if together >= min_support
+        ]
+        if scored:
+            scored.sort(key=lambda item: (-item[1], item[0]))
+            result[product_id] = [(other, round(score, 4)) for other, score in scored[:k]]
+    return result
+
+
+def similar_products(*, k: int = 12, window: int = 3) -> dict:
+    """{product_id: [ids]}: vizinhos de preço na mesma categoria (janela de window*k), mesma marca primeiro."""
+    by_category = defaultdict(list)
+    for pid, category_id, brand_id, price in (
+        Product.objects.filter(active=True).values_list("id", "category_id", "brand_id", "price").iterator(chunk_size=10_000)
+    ):
+        by_category[category_id].append((float(price), pid, brand_id))
+
+    result = {}
+    span = window * k
+    for items in by_category.values():
+        items.sort()
+        for index, (price, pid, brand_id) in enumerate(items):
+            candidates = items[max(0, index - span): index] + items[index + 1: index + 1 + span]
+            candidates.sort(key=lambda c: (c[2] != brand_id or brand_id is None, abs(math.log((c[0] + 1) / (price + 1))), c[1]))
+            if candidates:
+                result[pid] = [c[1] for c in candidates[:k]]
+    return result
+
+
+def store(bought_together: dict, similar: dict, batch_size: int = 2000) -> int:
+    """Upsert de uma linha por produto; remove linhas de produtos que saíram do resultado."""
+    now = timezone.now()
+    product_ids = set(Product.objects.values_list("id", flat=True))
+    keys = sorted((set(bought_together) | set(similar)) & product_ids)
+    rows = [
+        ProductRecommendation(
+            product_id=pid,
+            bought_together=[[other, score] for other, score in bought_together.get(pid, ()) if other in product_ids],
+            similar=[other for other in similar.get(pid, ()) if other in product_ids],
+            computed_at=now,
+        )
+        for pid in keys
+    ]
+    with transaction.atomic():
+        ProductRecommendation.objects.bulk_create(
+            rows, batch_size=batch_size, update_conflicts=True, unique_fields=["product"],
+            update_fields=["bought_together", "similar", "computed_at"],
+        )
+        ProductRecommendation.objects.filter(computed_at__lt=now).delete()
+    bump_version()
+    return len(rows)
+
+
+def bump_version():
+    try:
+        cache.incr(VERSION_KEY)
+    except ValueError:
+        cache.set(VERSION_KEY, 1, None)
+
+
+def cache_key(slug: str, host: str) -> str:
+    return f"catalog:related:{cache.get(VERSION_KEY, 0)}:{host}:{slug}"
+
+
+def cache_ttl() -> int:
+    return getattr(settings, "RECOMMENDATIONS_CACHE_TTL", 300)
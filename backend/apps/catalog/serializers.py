@@ -1,5 +1,7 @@
 from rest_framework import serializers
+from apps.core.serializers import PlainSerializer, decimal_str, file_url
 from .models import Category, Brand, Product, ProductImage
+from .variants import matrix_for
 
 
 class ProductImageSerializer(serializers.ModelSerializer):
@@ -24,6 +26,7 @@ class ProductListSerializer(serializers.ModelSerializer):
     category = CategorySerializer()
     brand = BrandSerializer()
     images = ProductImageSerializer(many=True)
+    variant_matrix = serializers.SerializerMethodField()
 
     class Meta:
         model = Product
@@ -35,13 +38,18 @@ class ProductListSerializer(serializers.ModelSerializer):
             "category",
             "brand",
             "images",
+            "variant_matrix",
         )
 
+    def get_variant_matrix(self, obj):
+        return matrix_for(obj, self.context)
+
 
 class ProductDetailSerializer(serializers.ModelSerializer):
     category = CategorySerializer()
     brand = BrandSerializer()
     images = ProductImageSerializer(many=True)
+    variant_matrix = serializers.SerializerMethodField()
 
     class Meta:
         model = Product
@@ -54,5 +62,53 @@ class ProductDetailSerializer(serializers.ModelSerializer):
             "category",
             "brand",
             "images",
+            "variant_matrix",
             "created_at",
         )
+
+    def get_variant_matrix(self, obj):
+        return matrix_for(obj, self.context)
+
+
+class ProductListPlainSerializer(PlainSerializer):
+    """
+    Mesma saída do ProductListSerializer, sem overhead por campo do DRF.
+    Espera queryset com category/brand/images já carregados.
+    """
+
+    def to_representation(self, obj) -> dict:
+        request = self.request
+        category = obj.category
+        brand = obj.brand
+        return {
+            "id": obj.id,
+            "name": obj.name,
+            "slug": obj.slug,
+            "price": decimal_str(obj.price),
+            "category": {"id": category.id, "name": category.name, "slug": category.slug},
+            "brand": {"id": brand.id, "name": brand.name, "slug": brand.slug} if brand else None,
+            "images": [
+                {"id": img.id, "image": file_url(img.image, request), "alt_text": img.alt_text}
+                for img in obj.images.all()
+            ],
+            "variant_matrix": matrix_for(obj, self.context),
+        }
+
+
+class ProductDetailPlainSerializer(ProductListPlainSerializer):
+    """Mesma saída do ProductDetailSerializer."""
+
+    def to_representation(self, obj) -> dict:
+        data = super().to_representation(obj)
+        return {
+            "id": data["id"],
+            "name": data["name"],
+            "slug": data["slug"],
+            "description": obj.description,
+            "price": data["price"],
+            "category": data["category"],
+            "brand": data["brand"],
+            "images": data["images"],
+            "variant_matrix": data["variant_matrix"],
+            "created_at": obj.created_at,
+        }
@@ -0,0 +1,33 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from django.utils import timezone
+
+from .models import Brand, Category, Product, ProductImage, ProductVariant
+
+# Snapshot (apps.catalog.snapshot) e feeds (apps.catalog.feeds) comparam só Product.updated_at, mas
+# publicam também variantes, imagens, categoria e marca: mudar qualquer um deles toca o produto.
+# Caminhos em lote (importador, recebimento de compra, synthetic) usam .update()/bulk_*, sem sinal,
+# e tocam o produto por conta própria quando precisam.
+
+
+@receiver(post_save, sender=ProductVariant, dispatch_uid="catalog_touch_product_on_variant_save")
+@receiver(post_delete, sender=ProductVariant, dispatch_uid="catalog_touch_product_on_variant_delete")
+@receiver(post_save, sender=ProductImage, dispatch_uid="catalog_touch_product_on_image_save")
+@receiver(post_delete, sender=ProductImage, dispatch_uid="catalog_touch_product_on_image_delete")
+def product_part_changed(sender, instance, **kwargs):
+    """Variante (preço/estoque/ativa) ou imagem (arquivo/alt/ordem)."""
+    Product.objects.filter(id=instance.product_id).update(updated_at=timezone.now())
+
+
+@receiver(post_save, sender=Category, dispatch_uid="catalog_touch_products_on_category_save")
+def category_changed(sender, instance, created, **kwargs):
+    """Nome/slug da categoria vão em cada produto publicado. Delete é PROTECT: não há o que tocar."""
+    if not created:
+        Product.objects.filter(category_id=instance.id).update(updated_at=timezone.now())
+
+
+@receiver(post_save, sender=Brand, dispatch_uid="catalog_touch_products_on_brand_save")
+def brand_changed(sender, instance, created, **kwargs):
+    """Nome da marca vai no produto publicado (e em <g:brand> nos feeds). Delete é PROTECT."""
+    if not created:
+        Product.objects.filter(brand_id=instance.id).update(updated_at=timezone.now())
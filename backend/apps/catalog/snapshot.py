@@ -0,0 +1,229 @@
+"""
+Publicador de snapshot estático do catálogo (para CDN / hosting estático).
+
+Layout de cada versão (imutável depois de publicada):
+    <root>/v/<versão>/index/page-0001.json[.gz|.br]   listagem paginada por cursor (id crescente)
+    <root>/v/<versão>/products/<slug>.json[.gz|.br]    detalhe do produto
+    <root>/v/<versão>/manifest.json                     estado usado pelo build incremental
+    <root>/current.json                                 ponteiro {"version": ..., "base": "v/<versão>/"}
+    <root>/current -> v/<versão>                        mesmo ponteiro como symlink (nginx)
+
+Incremental: só renderiza produtos com updated_at diferente do manifest anterior
+e páginas cujo conjunto de (id, updated_at) mudou (variante, imagem, categoria e marca também tocam o
+updated_at do produto: apps.catalog.signals e os caminhos em lote); o resto vira hard link da versão anterior.
+O ponteiro é trocado com os.replace (atômico): leitores veem a versão antiga ou a nova, nunca metade.
+"""
+import gzip
+import hashlib
+import json
+import os
+import shutil
+from datetime import datetime, timezone as dt_timezone
+from pathlib import Path
+
+from django.conf import settings
+
+from apps.core.renderers import dumps
+from .models import Product
+from .serializers import ProductDetailPlainSerializer, ProductListPlainSerializer
+from .variants import variant_matrices
+
+try:
+    import brotli
+except ImportError:  # brotli é opcional: sem ele só .json e .json.gz
+    brotli = None
+
+
+class _AbsoluteURL:
+    """Faz o papel do request em file_url(): prefixa as URLs de mídia com o host público."""
+
+    def __init__(self, base: str):
+        self.base = base.rstrip("/")
+
+    def build_absolute_uri(self, url: str) -> str:
+        return f"{self.base}{url}" if self.base and url.startswith("/") else url
+
+
+def _write_atomic(path: Path, data: bytes):
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_bytes(data)
+    os.replace(tmp, path)
+
+
+def _write_variants(path: Path, data: bytes):
+    """Grava .json, .json.gz e (se houver brotli) .json.br."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    _write_atomic(path, data)
+    _write_atomic(path.with_name(path.name + ".gz"), gzip.compress(data, compresslevel=9, mtime=0))
+    if brotli is not None:
+        _write_atomic(path.with_name(path.name + ".br"), brotli.compress(data, quality=11))
+
+
+def _link_variants(src: Path, dst: Path) -> bool:
+    """Reaproveita os arquivos da versão anterior (hard link; cópia se o FS não suportar)."""
+    if not src.exists():
+        return False
+    dst.parent.mkdir(parents=True, exist_ok=True)
+    for suffix in ("", ".gz", ".br"):
+        s = src.with_name(src.name + suffix)
+        if s.exists():
+            d = dst.with_name(dst.name + suffix)
+            try:
+                os.link(s, d)
+            except OSError:
+                shutil.copy2(s, d)
+    return True
+
+
+def _stamp(value) -> str:
+    return value.isoformat() if value else ""
+
+
+class CatalogPublisher:
+    def __init__(self, root=None, *, page_size=None, media_base=None, keep_versions=3, stdout=None):
+        self.root = Path(root or settings.CATALOG_SNAPSHOT_ROOT)
+        self.page_size = page_size or settings.CATALOG_SNAPSHOT_PAGE_SIZE
+        self.media_base = settings.CATALOG_SNAPSHOT_MEDIA_BASE if media_base is None else media_base
+        self.keep_versions = keep_versions
+        self.stdout = stdout
+
+    def log(self, msg: str):
+        if self.stdout:
+            self.stdout.write(msg)
+
+    # ---------- estado ----------
+
+    def current_version(self) -> str | None:
+        pointer = self.root / "current.json"
+        if not pointer.exists():
+            return None
+        return json.loads(pointer.read_text()).get("version")
+
+    def load_manifest(self, version: str | None) -> dict:
+        if version:
+            path = self.root / "v" / version / "manifest.json"
+            if path.exists():
+                return json.loads(path.read_text())
+        return {"products": {}, "pages": []}
+
+    # ---------- render ----------
+
+    def _queryset(self):
+        return Product.objects.filter(active=True).select_related("category", "brand").prefetch_related("images")
+
+    def _render_products(self, ids) -> dict[int, Product]:
+        products = {}
+        ids = list(ids)
+        for start in range(0, len(ids), 500):
+            chunk = list(self._queryset().filter(id__in=ids[start:start + 500]))
+            products.update({p.id: p for p in chunk})
+        return products
+
+    def _context(self, products) -> dict:
+        return {
+            "request": _AbsoluteURL(self.media_base),
+            "variant_matrices": variant_matrices([p.id for p in products]),
+        }
+
+    # ---------- publish ----------
+
+    def publish(self, *, full: bool = False) -> dict:
+        previous_version = self.current_version()
+        previous = self.load_manifest(None if full else previous_version)
+        prev_products: dict = previous["products"]
+        prev_pages = {p["name"]: p["fingerprint"] for p in previous["pages"]}
+
+        # estado atual: só (id, slug, updated_at) — leve mesmo com catálogo grande
+        rows = list(Product.objects.filter(active=True).order_by("id").values_list("id", "slug", "updated_at"))
+        current = {slug: {"id": pid, "updated_at": _stamp(ts)} for pid, slug, ts in rows}
+
+        changed_slugs = [slug for slug, meta in current.items() if prev_products.get(slug) != meta]
+        removed_slugs = [slug for slug in prev_products if slug not in current]
+
+        pages = []
+        for n, start in enumerate(range(0, len(rows), self.page_size), start=1):
+            chunk = rows[start:start + self.page_size]
+            fingerprint = hashlib.sha256(
+                "|".join(f"{pid}:{_stamp(ts)}" for pid, _, ts in chunk).encode()
+            ).hexdigest()[:16]
+            pages.append({"name": f"page-{n:04d}.json", "fingerprint": fingerprint, "ids": [r[0] for r in chunk]})
+        if not pages:
+            pages.append({"name": "page-0001.json", "fingerprint": "empty", "ids": []})
+
+        changed_pages = [p for p in pages if prev_pages.get(p["name"]) != p["fingerprint"]]
+        if previous_version and not full and not changed_slugs and not removed_slugs and not changed_pages \
+                and len(pages) == len(prev_pages):
+            self.log("Nada mudou; versão atual mantida.")
+            return {"version": previous_version, "products": 0, "pages": 0, "removed": 0}
+
+        version = datetime.now(dt_timezone.utc).strftime("%Y%m%dT%H%M%S%fZ")
+        out = self.root / "v" / version
+        prev_dir = self.root / "v" / previous_version if previous_version else None
+
+        # produtos
+        slug_to_id = {slug: meta["id"] for slug, meta in current.items()}
+        to_render = set(changed_slugs)
+        if prev_dir is not None and not full:
+            for slug in current:
+                if slug not in to_render and not _link_variants(prev_dir / "products" / f"{slug}.json", out / "products" / f"{slug}.json"):
+                    to_render.add(slug)  # arquivo sumiu da versão anterior: renderiza de novo
+
+        render_ids = [slug_to_id[s] for s in to_render]
+        rendered = 0
+        for start in range(0, len(render_ids), 500):
+            products = list(self._render_products(render_ids[start:start + 500]).values())
+            context = self._context(products)
+            for product in products:
+                data = ProductDetailPlainSerializer(product, context=context).data
+                _write_variants(out / "products" / f"{product.slug}.json", dumps(data))
+                rendered += 1
+
+        # páginas do índice
+        changed_names = {p["name"] for p in changed_pages}
+        for i, page in enumerate(pages):
+            path = out / "index" / page["name"]
+            if prev_dir is not None and not full and page["name"] not in changed_names \
+                    and _link_variants(prev_dir / "index" / page["name"], path):
+                continue
+            products_by_id = self._render_products(page["ids"])
+            products = [products_by_id[pid] for pid in page["ids"] if pid in products_by_id]
+            results = ProductListPlainSerializer(products, many=True, context=self._context(products)).data
+            next_name = pages[i + 1]["name"] if i + 1 < len(pages) else None
+            _write_variants(path, dumps({"results": results, "next": next_name, "count": len(rows)}))
+
+        manifest = {
+            "version": version,
+            "generated_at": datetime.now(dt_timezone.utc).isoformat(),
+            "products": current,
+            "pages": [{"name": p["name"], "fingerprint": p["fingerprint"]} for p in pages],
+        }
+        _write_atomic(out / "manifest.json", json.dumps(manifest).encode())
+
+        self.flip(version)
+        self.prune()
+
+        self.log(
+            f"Versão {version}: {rendered} produto(s) renderizado(s), {len(changed_pages)} página(s), "
+            f"{len(removed_slugs)} removido(s)."
+        )
+        return {"version": version, "products": rendered, "pages": len(changed_pages), "removed": len(removed_slugs)}
+
+    def flip(self, version: str):
+        """Troca atômica do ponteiro (arquivo JSON + symlink)."""
+        self.root.mkdir(parents=True, exist_ok=True)
+        _write_atomic(self.root / "current.json", json.dumps({"version": version, "base": f"v/{version}/"}).encode())
+
+        tmp_link = self.root / "current.tmp"
+        if tmp_link.is_symlink() or tmp_link.exists():
+            tmp_link.unlink()
+        try:
+            os.symlink(Path("v") / version, tmp_link)
+            os.replace(tmp_link, self.root / "current")
+        except OSError:
+            pass  # FS sem symlink: current.json basta
+
+    def prune(self):
+        versions_dir = self.root / "v"
+        versions = sorted(p.name for p in versions_dir.iterdir() if p.is_dir())
+        for name in versions[:-self.keep_versions]:
+            shutil.rmtree(versions_dir / name, ignore_errors=True)
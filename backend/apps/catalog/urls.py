@@ -1,7 +1,8 @@
 from django.urls import path
-from .views import ProductListAPIView, ProductDetailAPIView
+from .views import ProductListAPIView, ProductDetailAPIView, ProductRelatedAPIView
 
 urlpatterns = [
     path("products/", ProductListAPIView.as_view(), name="product-list"),
     path("products/<slug:slug>/", ProductDetailAPIView.as_view(), name="product-detail"),
+    path("products/<slug:slug>/related/", ProductRelatedAPIView.as_view(), name="product-related"),
 ]
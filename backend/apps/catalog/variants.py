@@ -0,0 +1,85 @@
+"""
+Matriz de variantes (tamanho x cor) por produto, montada a partir de UMA query
+para todos os produtos da página, em vez de uma consulta por variante/produto.
+"""
+from collections import defaultdict
+
+from apps.core.serializers import decimal_str
+from .models import ProductVariant
+
+VARIANT_FIELDS = ("id", "product_id", "sku", "size", "color", "price", "stock", "product__price")
+
+
+def variant_rows(product_ids):
+    """Queryset de valores das variantes ativas (sync: list(...); async: [r async for r in ...])."""
+    return (
+        ProductVariant.objects.filter(product_id__in=product_ids, active=True)
+        .order_by("product_id", "sort_order", "id")
+        .values_list(*VARIANT_FIELDS)
+    )
+
+
+def build_matrices(rows) -> dict:
+    """
+    rows -> {product_id: matriz}. Produtos sem variantes ativas não aparecem no dict.
+
+    matriz = {
+        "sizes": [...], "colors": [...],      # na ordem de sort_order
+        "variants": [{id, sku, size, color, price, stock, available}, ...],
+        "in_stock": bool, "price_min": "…", "price_max": "…",
+    }
+    """
+    grouped = defaultdict(list)
+    for row in rows:
+        grouped[row[1]].append(row)
+
+    matrices = {}
+    for product_id, product_rows in grouped.items():
+        sizes, colors, variants, prices = {}, {}, [], []
+        in_stock = False
+        for vid, _pid, sku, size, color, price, stock, product_price in product_rows:
+            effective = price if price is not None else product_price
+            available = stock > 0
+            in_stock = in_stock or available
+            prices.append(effective)
+            if size:
+                sizes[size] = None
+            if color:
+                colors[color] = None
+            variants.append({
+                "id": vid,
+                "sku": sku,
+                "size": size,
+                "color": color,
+                "price": decimal_str(effective),
+                "stock": stock,
+                "available": available,
+            })
+        matrices[product_id] = {
+            "sizes": list(sizes),
+            "colors": list(colors),
+            "variants": variants,
+            "in_stock": in_stock,
+            "price_min": decimal_str(min(prices)),
+            "price_max": decimal_str(max(prices)),
+        }
+    return matrices
+
+
+def variant_matrices(product_ids) -> dict:
+    return build_matrices(variant_rows(product_ids))
+
+
+async def avariant_matrices(product_ids) -> dict:
+    return build_matrices([row async for row in variant_rows(product_ids)])
+
+
+def matrix_for(obj, context) -> dict | None:
+    """
+    Matriz do produto a partir do contexto do serializer ("variant_matrices", montado pela view);
+    sem contexto, faz a query só deste produto.
+    """
+    matrices = context.get("variant_matrices")
+    if matrices is None:
+        matrices = variant_matrices([obj.id])
+    return matrices.get(obj.id)
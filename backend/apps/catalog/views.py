@@ -1,14 +1,102 @@
+from django.core.cache import cache
+from django.http import Http404
 from rest_framework import generics
-from .models import Product
-from .serializers import ProductListSerializer, ProductDetailSerializer
+from rest_framework.response import Response
+from rest_framework.views import APIView
+from apps.core.views import AsyncJSONView
+from .models import Product, ProductRecommendation
+from .recommendations import cache_key, cache_ttl
+from .serializers import ProductListPlainSerializer, ProductDetailSerializer, ProductDetailPlainSerializer
+from .variants import avariant_matrices, variant_matrices
 
 
 class ProductListAPIView(generics.ListAPIView):
-    queryset = Product.objects.filter(active=True).prefetch_related("images", "category", "brand")
-    serializer_class = ProductListSerializer
+    queryset = Product.objects.filter(active=True).select_related("category", "brand").prefetch_related("images")
+    serializer_class = ProductListPlainSerializer
+
+    def list(self, request, *args, **kwargs):
+        queryset = self.filter_queryset(self.get_queryset())
+        page = self.paginate_queryset(queryset)
+        products = list(page if page is not None else queryset)
+
+        # matriz de variantes de todos os produtos numa query só
+        context = self.get_serializer_context()
+        context["variant_matrices"] = variant_matrices([p.id for p in products])
+        data = self.get_serializer(products, many=True, context=context).data
+
+        if page is not None:
+            return self.get_paginated_response(data)
+        return Response(data)
 
 
 class ProductDetailAPIView(generics.RetrieveAPIView):
     queryset = Product.objects.filter(active=True).prefetch_related("images", "category", "brand")
     serializer_class = ProductDetailSerializer
     lookup_field = "slug"
+
+
+class ProductRelatedAPIView(APIView):
+    """
+    GET /api/v1/products/<slug>/related/
+    {"bought_together": [produto...], "similar": [produto...]} (mesmo formato da listagem)
+
+    Vizinhos vêm pré-calculados (build_recommendations); a resposta inteira fica em cache
+    até o próximo job (versão) ou RECOMMENDATIONS_CACHE_TTL.
+    """
+    def get(self, request, slug):
+        key = cache_key(slug, request.get_host())
+        data = cache.get(key)
+        if data is None:
+            data = self.build(request, slug)
+            cache.set(key, data, cache_ttl())
+        return Response(data)
+
+    def build(self, request, slug) -> dict:
+        row = (
+            ProductRecommendation.objects.filter(product__slug=slug, product__active=True)
+            .values_list("bought_together", "similar").first()
+        )
+        if row is None:
+            if not Product.objects.filter(slug=slug, active=True).exists():
+                raise Http404
+            return {"bought_together": [], "similar": []}
+
+        together_ids = [pid for pid, _score in row[0]]
+        similar_ids = [pid for pid in row[1] if pid not in set(together_ids)]
+        products = {
+            p.id: p
+            for p in Product.objects.filter(id__in=together_ids + similar_ids, active=True)
+            .select_related("category", "brand").prefetch_related("images")
+        }
+        context = {"request": request, "variant_matrices": variant_matrices(list(products))}
+
+        def serialize(ids):
+            return ProductListPlainSerializer([products[i] for i in ids if i in products], many=True, context=context).data
+
+        return {"bought_together": serialize(together_ids), "similar": serialize(similar_ids)}
+
+
+class ProductListAsyncView(AsyncJSONView):
+    """
+    GET /api/v1/async/products/  (mesma saída de ProductListAPIView)
+    """
+
+    async def get(self, request):
+        qs = Product.objects.filter(active=True).select_related("category", "brand").prefetch_related("images")
+        products = [p async for p in qs]
+        context = {"request": request, "variant_matrices": await avariant_matrices([p.id for p in products])}
+        return self.json(ProductListPlainSerializer(products, many=True, context=context).data)
+
+
+class ProductDetailAsyncView(AsyncJSONView):
+    """
+    GET /api/v1/async/products/<slug>/  (mesma saída de ProductDetailAPIView)
+    """
+
+    async def get(self, request, slug):
+        qs = Product.objects.filter(active=True, slug=slug).select_related("category", "brand").prefetch_related("images")
+        products = [p async for p in qs]
+        if not products:
+            return self.not_found()
+        context = {"request": request, "variant_matrices": await avariant_matrices([products[0].id])}
+        return self.json(ProductDetailPlainSerializer(products[0], context=context).data)
@@ -0,0 +1,73 @@
+"""
+Base para admins de tabelas grandes (pedidos, pagamentos, eventos).
+
+- Contagem estimada: no PostgreSQL usa pg_class.reltuples (sem filtro) ou a estimativa do
+  EXPLAIN (com filtro) e só faz COUNT(*) quando a estimativa é pequena. Outros bancos: COUNT(*).
+- show_full_result_count = False: sem o segundo COUNT(*) da tabela inteira ao filtrar.
+- Busca só por igualdade exata nos campos de search_fields (todos indexados); campos
+  inteiros são ignorados quando o termo não é numérico. Nada de LIKE '%termo%'.
+"""
+import json
+
+from django.contrib import admin
+from django.contrib.admin.utils import get_fields_from_path
+from django.core.paginator import Paginator
+from django.db import connections, models
+from django.db.models import Q
+from django.utils.functional import cached_property
+
+EXACT_COUNT_BELOW = 10_000
+
+
+def estimate_count(queryset) -> int | None:
+    """Estimativa de linhas do queryset (PostgreSQL); None quando não há estimativa barata."""
+    connection = connections[queryset.db]
+    if connection.vendor != "postgresql":
+        return None
+    with connection.cursor() as cursor:
+        if not queryset.query.where:
+            cursor.execute(
+                "SELECT reltuples::bigint FROM pg_class WHERE oid = %s::regclass",
+                [queryset.model._meta.db_table],
+            )
+            row = cursor.fetchone()
+            return row[0] if row and row[0] >= 0 else None  # -1 = tabela nunca analisada
+        sql, params = queryset.query.sql_with_params()
+        cursor.execute(f"EXPLAIN (FORMAT JSON) {sql}", params)
+        plan = cursor.fetchone()[0]
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+        return int(plan[0]["Plan"]["Plan Rows"])
+
+
+class EstimatedCountPaginator(Paginator):
+    @cached_property
+    def count(self):
+        estimate = estimate_count(self.object_list)
+        if estimate is None or estimate < EXACT_COUNT_BELOW:
+            return super().count
+        return estimate
+
+
+class LargeTableAdmin(admin.ModelAdmin):
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+    list_per_page = 50
+
+    def get_search_results(self, request, queryset, search_term):
+        term = search_term.strip()
+        if not term:
+            return queryset, False
+
+        condition = Q()
+        for name in self.get_search_fields(request):
+            field = get_fields_from_path(self.model, name)[-1]
+            if isinstance(field, models.ForeignKey):
+                field = field.target_field
+            if isinstance(field, (models.IntegerField, models.AutoField)):
+                if not term.isdigit():
+                    continue
+                condition |= Q(**{name: int(term)})
+            else:
+                condition |= Q(**{name: term})
+        return (queryset.filter(condition) if condition else queryset.none()), False
@@ -0,0 +1,11 @@
+from django.apps import AppConfig
+
+class CoreConfig(AppConfig):
+    default_auto_field = "django.db.models.BigAutoField"
+    name = "apps.core"
+
+    def ready(self):
+        from django.db.backends.signals import connection_created
+        from .tracing import install_db_wrapper
+
+        connection_created.connect(install_db_wrapper, dispatch_uid="core_tracing_db_wrapper")
@@ -0,0 +1,16 @@
+from django.urls import path
+from django.views.decorators.csrf import csrf_exempt
+
+from apps.accounts.views import RegisterAsyncView
+from apps.catalog.views import ProductListAsyncView, ProductDetailAsyncView
+from apps.orders.views import OrderDetailAsyncView
+from apps.payments.views import PaymentDetailAsyncView
+
+# Rotas async-nativas (ASGI). Mesmas respostas das rotas equivalentes em /api/v1/.
+urlpatterns = [
+    path("products/", ProductListAsyncView.as_view(), name="product-list-async"),
+    path("products/<slug:slug>/", ProductDetailAsyncView.as_view(), name="product-detail-async"),
+    path("orders/<int:pk>/", OrderDetailAsyncView.as_view(), name="order-detail-async"),
+    path("payments/<int:pk>/", PaymentDetailAsyncView.as_view(), name="payment-detail-async"),
+    path("auth/register/", csrf_exempt(RegisterAsyncView.as_view()), name="auth-register-async"),
+]
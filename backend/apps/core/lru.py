@@ -0,0 +1,33 @@
+"""LRU em memória limitado por bytes (QR do Pix, páginas de etiquetas). Seguro entre threads."""
+import threading
+from collections import OrderedDict
+
+
+class ByteLRU:
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self._data: OrderedDict[str, bytes] = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> bytes | None:
+        with self._lock:
+            value = self._data.get(key)
+            if value is not None:
+                self._data.move_to_end(key)
+            return value
+
+    def put(self, key: str, value: bytes):
+        with self._lock:
+            if key in self._data:
+                return
+            self._data[key] = value
+            self._size += len(value)
+            while self._size > self.max_bytes and self._data:
+                _, evicted = self._data.popitem(last=False)
+                self._size -= len(evicted)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+            self._size = 0
@@ -0,0 +1,127 @@
+import asyncio
+import statistics
+import time
+from pathlib import Path
+from urllib.parse import urlsplit
+
+from django.core.management.base import BaseCommand, CommandError
+
+
+def _rss_kb(pid: int) -> int | None:
+    """RSS do processo (Linux, /proc); None se indisponível."""
+    try:
+        for line in Path(f"/proc/{pid}/status").read_text().splitlines():
+            if line.startswith("VmRSS:"):
+                return int(line.split()[1])
+    except OSError:
+        return None
+    return None
+
+
+async def _read_response(reader: asyncio.StreamReader) -> int:
+    status_line = await reader.readline()
+    if not status_line:
+        raise ConnectionError("conexão fechada pelo servidor")
+    status = int(status_line.split()[1])
+
+    length = 0
+    chunked = False
+    while True:
+        line = await reader.readline()
+        if line in (b"\r\n", b""):
+            break
+        name, _, value = line.decode("latin-1").partition(":")
+        name = name.strip().lower()
+        if name == "content-length":
+            length = int(value.strip())
+        elif name == "transfer-encoding" and "chunked" in value.lower():
+            chunked = True
+
+    if chunked:
+        while True:
+            size = int((await reader.readline()).strip(), 16)
+            await reader.readexactly(size + 2)
+            if size == 0:
+                break
+    elif length:
+        await reader.readexactly(length)
+    return status
+
+
+async def _worker(host, port, request: bytes, deadline_count, latencies, errors):
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        while deadline_count[0] > 0:
+            deadline_count[0] -= 1
+            start = time.perf_counter()
+            writer.write(request)
+            try:
+                status = await _read_response(reader)
+            except (ConnectionError, asyncio.IncompleteReadError):
+                errors.append("conn")
+                writer.close()
+                reader, writer = await asyncio.open_connection(host, port)
+                continue
+            latencies.append(time.perf_counter() - start)
+            if status >= 400:
+                errors.append(status)
+    finally:
+        writer.close()
+
+
+class Command(BaseCommand):
+    help = (
+        "Gera carga HTTP (keep-alive, N conexões concorrentes) contra um servidor já rodando. "
+        "Ex.: compare /api/v1/products/ (DRF) e /api/v1/async/products/ sob uvicorn, "
+        "e /api/v1/products/ sob gunicorn (WSGI). --pid mede a RSS do servidor."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("urls", nargs="+")
+        parser.add_argument("--concurrency", type=int, default=200)
+        parser.add_argument("--requests", type=int, default=5000)
+        parser.add_argument("--pid", type=int, help="PID do servidor para amostrar RSS (Linux).")
+
+    def handle(self, *args, urls, concurrency, requests, pid, **options):
+        for url in urls:
+            parts = urlsplit(url)
+            if parts.scheme != "http":
+                raise CommandError("Somente http:// é suportado.")
+            self.run_one(parts, concurrency, requests, pid)
+
+    def run_one(self, parts, concurrency, total, pid):
+        host, port = parts.hostname, parts.port or 80
+        path = parts.path + (f"?{parts.query}" if parts.query else "")
+        request = (
+            f"GET {path} HTTP/1.1\r\nHost: {parts.netloc}\r\nAccept: application/json\r\n"
+            f"Connection: keep-alive\r\n\r\n"
+        ).encode("latin-1")
+
+        latencies: list[float] = []
+        errors: list = []
+        remaining = [total]
+        rss_before = _rss_kb(pid) if pid else None
+
+        async def main():
+            await asyncio.gather(*[
+                _worker(host, port, request, remaining, latencies, errors) for _ in range(concurrency)
+            ])
+
+        start = time.perf_counter()
+        asyncio.run(main())
+        elapsed = time.perf_counter() - start
+        rss_after = _rss_kb(pid) if pid else None
+
+        latencies.sort()
+        ms = [x * 1000 for x in latencies] or [0.0]
+        p = lambda q: ms[min(len(ms) - 1, int(len(ms) * q))]  # noqa: E731
+
+        self.stdout.write(f"{parts.geturl()}")
+        self.stdout.write(
+            f"  {len(latencies) / elapsed:,.0f} req/s  ({len(latencies)} ok, {len(errors)} erros, c={concurrency})"
+        )
+        self.stdout.write(
+            f"  latência ms: média {statistics.fmean(ms):.1f}  p50 {p(0.50):.1f}  p95 {p(0.95):.1f}  p99 {p(0.99):.1f}"
+        )
+        if rss_before is not None and rss_after is not None:
+            self.stdout.write(f"  RSS servidor: {rss_before / 1024:.1f} MiB -> {rss_after / 1024:.1f} MiB")
@@ -0,0 +1,78 @@
+import time
+from decimal import Decimal
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+from rest_framework.renderers import JSONRenderer
+
+from apps.catalog.models import Brand, Category, Product, ProductImage
+from apps.catalog.serializers import ProductListPlainSerializer, ProductListSerializer
+from apps.core.renderers import ORJSONRenderer
+from apps.orders.models import Order, OrderItem
+from apps.orders.serializers import OrderPlainSerializer, OrderSerializer
+
+
+def _fake_products(n: int) -> list[Product]:
+    category = Category(id=1, name="Capacetes", slug="capacetes")
+    brand = Brand(id=1, name="Marca", slug="marca")
+    products = []
+    for i in range(1, n + 1):
+        p = Product(
+            id=i, name=f"Capacete {i}", slug=f"capacete-{i}", price=Decimal("499.90"),
+            category=category, brand=brand,
+        )
+        p._prefetched_objects_cache = {
+            "images": [ProductImage(id=i * 10 + k, product=p, image=f"products/{i}_{k}.png") for k in range(2)]
+        }
+        products.append(p)
+    return products
+
+
+def _fake_orders(n: int) -> list[Order]:
+    now = timezone.now()
+    orders = []
+    for i in range(1, n + 1):
+        o = Order(
+            id=i, full_name="Cliente Teste", email="cliente@example.com",
+            subtotal=Decimal("999.80"), shipping_price=Decimal("29.90"), total=Decimal("1029.70"),
+            shipping_method="pac", shipping_days=6, shipping_zip="01001-000", shipping_street="Rua A",
+            shipping_number="10", shipping_district="Centro", shipping_city="São Paulo", shipping_state="SP",
+            created_at=now,
+        )
+        o._prefetched_objects_cache = {
+            "items": [OrderItem(id=i * 10 + k, order=o, product_id=k + 1, name="Capacete", price=Decimal("499.90"), qty=1) for k in range(2)]
+        }
+        orders.append(o)
+    return orders
+
+
+class Command(BaseCommand):
+    help = "Microbenchmark: serializers DRF + JSONRenderer vs Plain + ORJSONRenderer (payload de N linhas)."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--rows", type=int, default=1000)
+        parser.add_argument("--repeat", type=int, default=20)
+
+    def handle(self, *args, rows, repeat, **options):
+        cases = [
+            ("products", _fake_products(rows), ProductListSerializer, ProductListPlainSerializer),
+            ("orders", _fake_orders(rows), OrderSerializer, OrderPlainSerializer),
+        ]
+        combos = [
+            ("drf+json", 0, JSONRenderer()),
+            ("plain+json", 1, JSONRenderer()),
+            ("drf+orjson", 0, ORJSONRenderer()),
+            ("plain+orjson", 1, ORJSONRenderer()),
+        ]
+
+        for label, objs, *serializer_classes in cases:
+            self.stdout.write(f"{label} ({rows} linhas x {repeat}):")
+            for name, idx, renderer in combos:
+                serializer_class = serializer_classes[idx]
+                start = time.perf_counter()
+                for _ in range(repeat):
+                    renderer.render(serializer_class(objs, many=True, context={"variant_matrices": {}}).data)
+                elapsed = time.perf_counter() - start
+                self.stdout.write(
+                    f"  {name:<14} {elapsed / repeat * 1000:8.2f} ms/payload  {rows * repeat / elapsed:12,.0f} linhas/s"
+                )
@@ -0,0 +1,48 @@
+import time
+
+from django.contrib.auth.models import AnonymousUser
+from django.core.management.base import BaseCommand
+from django.test import RequestFactory
+from rest_framework.request import Request
+
+from apps.core.throttling import PUBLIC_WRITE_THROTTLES, LocalBucketStore
+
+
+class _View:
+    throttle_scope = "checkout"
+
+
+class Command(BaseCommand):
+    help = "Mede o overhead dos throttles token bucket por request (allow_request de todos os escopos)."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--iterations", type=int, default=100_000)
+        parser.add_argument("--clients", type=int, default=10_000, help="IPs distintos simulados.")
+
+    def handle(self, *args, iterations, clients, **options):
+        store = LocalBucketStore(max_keys=clients * 2)
+        throttles = [cls() for cls in PUBLIC_WRITE_THROTTLES]
+        for t in throttles:
+            t.store = store
+
+        factory = RequestFactory()
+        requests = [
+            Request(factory.post("/api/v1/checkout/", REMOTE_ADDR=f"10.{i >> 16 & 255}.{i >> 8 & 255}.{i & 255}"))
+            for i in range(clients)
+        ]
+        for r in requests:
+            r.user = AnonymousUser()
+        view = _View()
+
+        start = time.perf_counter()
+        for i in range(iterations):
+            request = requests[i % clients]
+            for t in throttles:
+                t.allow_request(request, view)
+        elapsed = time.perf_counter() - start
+
+        per_request_us = elapsed / iterations * 1_000_000
+        self.stdout.write(
+            f"{iterations:,} requests, {clients:,} clientes, {len(throttles)} throttles: "
+            f"{per_request_us:.2f} µs/request ({per_request_us / 1000:.4f} ms)"
+        )
@@ -0,0 +1,51 @@
+from datetime import datetime, timezone as dt_timezone
+
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.core.synthetic import SCALES, SyntheticDataGenerator, config_for
+
+
+class Command(BaseCommand):
+    help = (
+        "Gera dados sintéticos (catálogo, usuários, pedidos, pagamentos, eventos) em lotes, "
+        "com seed determinística. Ex.: generate_synthetic_data --scale large --seed 7"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--scale", choices=sorted(SCALES), default="medium")
+        parser.add_argument("--seed", type=int)
+        parser.add_argument("--until", help="Data final (YYYY-MM-DD) das datas geradas; padrão: hoje.")
+        parser.add_argument("--reset", action="store_true", help="Remove antes os dados sintéticos com o mesmo prefixo.")
+        for name, kind in (
+            ("categories", int), ("brands", int), ("products", int), ("variants-per-product", int),
+            ("images-per-product", int), ("users", int), ("orders", int), ("items-mean", float),
+            ("popularity-skew", float), ("registered-ratio", float), ("days", int), ("recency", float),
+            ("events-per-payment", int), ("prefix", str), ("batch-size", int),
+        ):
+            parser.add_argument(f"--{name}", type=kind)
+
+    def handle(self, *args, scale, until, reset, **options):
+        overrides = {
+            name: options.get(name)
+            for name in (
+                "seed", "categories", "brands", "products", "variants_per_product", "images_per_product",
+                "users", "orders", "items_mean", "popularity_skew", "registered_ratio", "days", "recency",
+                "events_per_payment", "prefix", "batch_size",
+            )
+        }
+        config = config_for(scale, **overrides)
+        if config.variants_per_product > 6:
+            raise CommandError("--variants-per-product vai até 6 (PP..XG).")
+
+        until_dt = None
+        if until:
+            try:
+                until_dt = datetime.strptime(until, "%Y-%m-%d").replace(tzinfo=dt_timezone.utc)
+            except ValueError:
+                raise CommandError("--until deve ser YYYY-MM-DD.")
+
+        generator = SyntheticDataGenerator(config, until=until_dt, stdout=self.stdout)
+        if reset:
+            generator.reset()
+        counts = generator.run()
+        self.stdout.write(", ".join(f"{k}={v}" for k, v in counts.items()))
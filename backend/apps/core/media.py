@@ -0,0 +1,188 @@
+"""
+Serviço de mídia em produção (substitui o static() que só existia com DEBUG).
+
+Ordem: autorização (só pelo caminho, sem abrir o arquivo) -> os.stat -> GET condicional (304)
+-> offload para o servidor web (X-Accel-Redirect do nginx / X-Sendfile do Apache)
+-> fallback FileResponse: sem Range vira wsgi.file_wrapper (sendfile no gunicorn);
+   com Range responde 206 limitado ao intervalo (também via sendfile: offset + Content-Length).
+
+ETag forte a partir de (tamanho, mtime) e Cache-Control immutable para nomes com hash
+(ex.: capa.3f2a9c1b.webp); os demais usam MEDIA_CACHE_MAX_AGE.
+"""
+import mimetypes
+import os
+import re
+import stat
+from pathlib import Path
+from urllib.parse import quote
+
+from django.conf import settings
+from django.core.exceptions import SuspiciousFileOperation
+from django.http import FileResponse, Http404, HttpResponse, HttpResponseNotModified
+from django.utils._os import safe_join
+from django.utils.http import http_date, parse_http_date_safe
+from django.views import View
+
+HASHED_NAME = re.compile(r"\.[0-9a-f]{8,64}\.[A-Za-z0-9]+$")
+RANGE_HEADER = re.compile(r"^bytes=(\d*)-(\d*)$")
+IMMUTABLE = "public, max-age=31536000, immutable"
+
+
+def is_private(path: str) -> bool:
+    return any(path.startswith(prefix) for prefix in getattr(settings, "MEDIA_PRIVATE_PREFIXES", ()))
+
+
+def can_access(request, path: str) -> bool:
+    """Mídia pública é livre; prefixos privados exigem staff (ponto único para regras futuras)."""
+    if not is_private(path):
+        return True
+    user = getattr(request, "user", None)
+    return bool(user and user.is_authenticated and user.is_staff)
+
+
+def etag_for(st: os.stat_result) -> str:
+    return f'"{st.st_size:x}-{st.st_mtime_ns:x}"'
+
+
+def cache_control(path: str) -> str:
+    if is_private(path):
+        return "private, no-cache"
+    if HASHED_NAME.search(path):
+        return IMMUTABLE
+    return f"public, max-age={getattr(settings, 'MEDIA_CACHE_MAX_AGE', 3600)}"
+
+
+def parse_range(header: str, size: int):
+    """
+    Um único intervalo "bytes=a-b" -> (início, fim) inclusivo.
+    None = ignorar o Range (ausente/múltiplo/malformado -> 200); "invalid" = 416.
+    """
+    match = RANGE_HEADER.match(header.strip()) if header else None
+    if not match:
+        return None
+    first, last = match.groups()
+    if not first and not last:
+        return None
+    if not first:  # sufixo: últimos N bytes
+        length = int(last)
+        if length == 0:
+            return "invalid"
+        return max(size - length, 0), size - 1
+    start = int(first)
+    end = min(int(last), size - 1) if last else size - 1
+    if start >= size or end < start:
+        return "invalid"
+    return start, end
+
+
+class _RangeFile:
+    """
+    Arquivo limitado a [início, início+tamanho): read() para servidores sem sendfile;
+    fileno()/tell() + Content-Length para o sendfile do gunicorn mandar só o intervalo.
+    """
+
+    def __init__(self, fh, start: int, length: int):
+        fh.seek(start)
+        self._fh = fh
+        self._remaining = length
+        self.name = fh.name
+
+    def read(self, size: int = -1) -> bytes:
+        if self._remaining <= 0:
+            return b""
+        size = self._remaining if size is None or size < 0 else min(size, self._remaining)
+        data = self._fh.read(size)
+        self._remaining -= len(data)
+        return data
+
+    def fileno(self) -> int:
+        return self._fh.fileno()
+
+    def tell(self) -> int:
+        return self._fh.tell()
+
+    def close(self):
+        self._fh.close()
+
+
+class MediaView(View):
+    """GET/HEAD /media/<path>"""
+    http_method_names = ["get", "head"]
+
+    def get(self, request, path: str):
+        try:
+            full_path = Path(safe_join(settings.MEDIA_ROOT, path))
+        except SuspiciousFileOperation:
+            raise Http404
+        # caminho normalizado ("a/../private/x" -> "private/x") antes de checar prefixos privados
+        path = full_path.relative_to(os.path.abspath(settings.MEDIA_ROOT)).as_posix()
+        if not can_access(request, path):
+            # 404 e não 403: não revela quais arquivos privados existem
+            raise Http404
+
+        try:
+            st = full_path.stat()
+        except OSError:
+            raise Http404
+        if not stat.S_ISREG(st.st_mode):
+            raise Http404
+
+        etag = etag_for(st)
+        headers = {
+            "ETag": etag,
+            "Last-Modified": http_date(st.st_mtime),
+            "Cache-Control": cache_control(path),
+            "Accept-Ranges": "bytes",
+        }
+        if self._not_modified(request, etag, st.st_mtime):
+            response = HttpResponseNotModified()
+            for name in ("ETag", "Last-Modified", "Cache-Control"):
+                response[name] = headers[name]
+            return response
+
+        content_type = mimetypes.guess_type(full_path.name)[0] or "application/octet-stream"
+
+        backend = getattr(settings, "MEDIA_SENDFILE_BACKEND", "")
+        if backend and request.method == "GET":
+            # o servidor web cuida de Range/sendfile; o Python só autoriza
+            # header vai em latin-1 e os nomes no disco são UTF-8 ("às"): percent-encoded, o servidor decodifica
+            response = HttpResponse(content_type=content_type, headers=headers)
+            if backend == "nginx":
+                response["X-Accel-Redirect"] = quote(settings.MEDIA_ACCEL_PREFIX.rstrip("/") + "/" + path)
+            else:
+                response["X-Sendfile"] = quote(str(full_path))
+            return response
+
+        byte_range = None
+        if_range = request.headers.get("If-Range")
+        if not if_range or if_range == etag:
+            byte_range = parse_range(request.headers.get("Range", ""), st.st_size)
+        if byte_range == "invalid":
+            return HttpResponse(status=416, headers={"Content-Range": f"bytes */{st.st_size}"})
+
+        if request.method == "HEAD":
+            headers["Content-Length"] = str(st.st_size)
+            return HttpResponse(content_type=content_type, headers=headers)
+
+        fh = open(full_path, "rb")
+        if byte_range is None:
+            response = FileResponse(fh, content_type=content_type)
+        else:
+            start, end = byte_range
+            length = end - start + 1
+            response = FileResponse(_RangeFile(fh, start, length), content_type=content_type, status=206)
+            response["Content-Length"] = str(length)
+            response["Content-Range"] = f"bytes {start}-{end}/{st.st_size}"
+        for name, value in headers.items():
+            response[name] = value
+        return response
+
+    head = get
+
+    @staticmethod
+    def _not_modified(request, etag: str, mtime: float) -> bool:
+        if_none_match = request.headers.get("If-None-Match")
+        if if_none_match is not None:
+            return if_none_match.strip() == "*" or etag in [t.strip() for t in if_none_match.split(",")]
+        since = parse_http_date_safe(request.headers.get("If-Modified-Since", ""))
+        return since is not None and int(mtime) <= since
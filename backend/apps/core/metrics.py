@@ -0,0 +1,135 @@
+"""
+Métricas em memória do processo no formato texto do Prometheus (sem dependência externa).
+Cada worker expõe os próprios números em /metrics; agregue no Prometheus (sum by ...).
+"""
+import threading
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(names, values, extra: str = "") -> str:
+    parts = [f'{n}="{_escape(v)}"' for n, v in zip(names, values)]
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+class Counter:
+    kind = "counter"
+
+    def __init__(self, name: str, help: str, labelnames=()):
+        self.name = name
+        self.help = help
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+        self._values: dict[tuple, float] = {}
+
+    def inc(self, amount: float = 1.0, **labels):
+        key = tuple(labels[n] for n in self.labelnames)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def samples(self):
+        with self._lock:
+            items = list(self._values.items())
+        for key, value in items:
+            yield f"{self.name}{_labels(self.labelnames, key)} {value:g}"
+
+
+class Histogram:
+    kind = "histogram"
+
+    def __init__(self, name: str, help: str, labelnames=(), buckets=DEFAULT_BUCKETS):
+        self.name = name
+        self.help = help
+        self.labelnames = tuple(labelnames)
+        self.buckets = tuple(sorted(buckets))
+        self._lock = threading.Lock()
+        self._values: dict[tuple, list] = {}  # key -> [contagens por bucket..., soma, total]
+
+    def observe(self, value: float, **labels):
+        key = tuple(labels[n] for n in self.labelnames)
+        n = len(self.buckets)
+        with self._lock:
+            row = self._values.get(key)
+            if row is None:
+                row = self._values[key] = [0] * n + [0.0, 0]
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    row[i] += 1
+                    break
+            row[n] += value
+            row[n + 1] += 1
+
+    def samples(self):
+        with self._lock:
+            items = [(k, list(v)) for k, v in self._values.items()]
+        n = len(self.buckets)
+        for key, row in items:
+            cumulative = 0
+            for i, bound in enumerate(self.buckets):
+                cumulative += row[i]
+                le = 'le="%g"' % bound
+                yield f"{self.name}_bucket{_labels(self.labelnames, key, le)} {cumulative}"
+            le = 'le="+Inf"'
+            yield f"{self.name}_bucket{_labels(self.labelnames, key, le)} {row[n + 1]}"
+            yield f"{self.name}_sum{_labels(self.labelnames, key)} {row[n]:g}"
+            yield f"{self.name}_count{_labels(self.labelnames, key)} {row[n + 1]}"
+
+
+class Registry:
+    def __init__(self):
+        self._metrics = []
+
+    def register(self, metric):
+        self._metrics.append(metric)
+        return metric
+
+    def render(self) -> str:
+        lines = []
+        for m in self._metrics:
+            lines.append(f"# HELP {m.name} {m.help}")
+            lines.append(f"# TYPE {m.name} {m.kind}")
+            lines.extend(m.samples())
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = Registry()
+
+http_requests_total = REGISTRY.register(Counter(
+    "http_requests_total", "Requests HTTP por rota, método e status.", ("route", "method", "status"),
+))
+http_request_duration_seconds = REGISTRY.register(Histogram(
+    "http_request_duration_seconds", "Latência dos requests HTTP por rota (URL name).", ("route", "method"),
+))
+http_request_db_seconds = REGISTRY.register(Histogram(
+    "http_request_db_seconds", "Tempo de banco por request, por rota.", ("route",),
+))
+payment_provider_call_duration_seconds = REGISTRY.register(Histogram(
+    "payment_provider_call_duration_seconds", "Latência das chamadas aos provedores de pagamento.",
+    ("provider", "operation", "outcome"),
+))
+risk_evaluation_duration_seconds = REGISTRY.register(Histogram(
+    "risk_evaluation_duration_seconds", "Tempo da análise de risco no pagamento, por decisão.", ("action",),
+    buckets=(0.0001, 0.00025, 0.0005, 0.001, 0.002, 0.005, 0.01, 0.05),
+))
+risk_decisions_dropped_total = REGISTRY.register(Counter(
+    "risk_decisions_dropped_total", "Decisões de risco descartadas (buffer de gravação cheio).",
+))
+password_hash_duration_seconds = REGISTRY.register(Histogram(
+    "password_hash_duration_seconds", "Tempo de hash/verificação de senha no executor dedicado.", ("operation",),
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5),
+))
+password_hash_rejected_total = REGISTRY.register(Counter(
+    "password_hash_rejected_total", "Hashes de senha recusados com 503 (executor lotado).", ("operation",),
+))
+orders_ingest_batch_seconds = REGISTRY.register(Histogram(
+    "orders_ingest_batch_seconds", "Tempo de gravação de um lote da ingestão de pedidos (uma transação).",
+))
+orders_ingest_fallback_total = REGISTRY.register(Counter(
+    "orders_ingest_fallback_total", "Checkouts que saíram da ingestão em lote para o caminho normal.", ("reason",),
+))
@@ -0,0 +1,72 @@
+import logging
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+
+from . import metrics
+from .renderers import dumps
+from .tracing import end_trace, start_trace
+
+logger = logging.getLogger("apps.request")
+
+
+class RequestTimingMiddleware:
+    """
+    Mede cada request: header Server-Timing (db / ser / http / total), log estruturado (JSON)
+    e histogramas por URL name em /metrics. Deve ser o primeiro da lista de MIDDLEWARE.
+    """
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.async_mode = iscoroutinefunction(get_response)
+        if self.async_mode:
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if self.async_mode:
+            return self.__acall__(request)
+
+        trace, token = start_trace()
+        try:
+            response = self.get_response(request)
+        finally:
+            end_trace(token)
+        return self.finish(request, response, trace)
+
+    async def __acall__(self, request):
+        trace, token = start_trace()
+        try:
+            response = await self.get_response(request)
+        finally:
+            end_trace(token)
+        return self.finish(request, response, trace)
+
+    def finish(self, request, response, trace):
+        total_ms = trace.elapsed_ms()
+        match = getattr(request, "resolver_match", None)
+        # rota não resolvida (404) agrupada para não explodir a cardinalidade
+        route = match.view_name if match else "unmatched"
+
+        metrics.http_requests_total.inc(route=route, method=request.method, status=response.status_code)
+        metrics.http_request_duration_seconds.observe(total_ms / 1000, route=route, method=request.method)
+        metrics.http_request_db_seconds.observe(trace.db_ms / 1000, route=route)
+
+        if getattr(settings, "SERVER_TIMING_HEADER", False):
+            response["Server-Timing"] = trace.server_timing(total_ms)
+
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(dumps({
+                "method": request.method,
+                "path": request.path,
+                "route": route,
+                "status": response.status_code,
+                "duration_ms": round(total_ms, 2),
+                "db_ms": round(trace.db_ms, 2),
+                "db_count": trace.db_count,
+                "serialize_ms": round(trace.serialize_ms, 2),
+                "http_ms": round(trace.http_ms, 2),
+                "http_count": trace.http_count,
+            }).decode("utf-8"))
+        return response
@@ -0,0 +1,22 @@
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import JSONParser
+
+try:
+    import orjson
+except ImportError:  # está em requirements.txt; sem ele cai no parser do DRF
+    orjson = None
+
+
+class ORJSONParser(JSONParser):
+    """
+    JSONParser usando orjson. Sem orjson instalado, cai no JSONParser padrão do DRF.
+    """
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        if orjson is None:
+            return super().parse(stream, media_type, parser_context)
+
+        try:
+            return orjson.loads(stream.read() if stream is not None else b"")
+        except orjson.JSONDecodeError as exc:
+            raise ParseError(f"JSON parse error - {exc}")
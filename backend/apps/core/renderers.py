@@ -0,0 +1,72 @@
+import json
+from decimal import Decimal
+
+from rest_framework.renderers import BaseRenderer, JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+from .tracing import span
+
+try:
+    import orjson
+except ImportError:  # está em requirements.txt; sem ele cai no json da stdlib
+    orjson = None
+
+
+_drf_encoder = JSONEncoder()
+
+
+def _orjson_default(obj):
+    # Decimal como string (igual COERCE_DECIMAL_TO_STRING); resto delega ao encoder do DRF
+    if isinstance(obj, Decimal):
+        return f"{obj:f}"
+    return _drf_encoder.default(obj)
+
+
+def dumps(data, *, indent: bool = False) -> bytes:
+    if orjson is None:
+        return json.dumps(
+            data, cls=JSONEncoder, ensure_ascii=False, separators=(",", ":"), indent=2 if indent else None
+        ).encode("utf-8")
+
+    option = orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS
+    if indent:
+        option |= orjson.OPT_INDENT_2
+    return orjson.dumps(data, default=_orjson_default, option=option)
+
+
+class ORJSONRenderer(JSONRenderer):
+    """
+    JSONRenderer usando orjson (Decimal/datetime/UUID sem passar pelo json da stdlib).
+    Sem orjson instalado, cai no JSONRenderer padrão do DRF.
+    """
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        with span("serialize"):
+            if orjson is None:
+                return super().render(data, accepted_media_type, renderer_context)
+            if data is None:
+                return b""
+
+            renderer_context = renderer_context or {}
+            indent = self.get_indent(accepted_media_type or "", renderer_context)
+            return dumps(data, indent=bool(indent))
+
+
+class NDJSONRenderer(BaseRenderer):
+    """
+    Newline-delimited JSON: um objeto por linha.
+    Listas viram uma linha por elemento; qualquer outro payload (ex.: erro) vira uma linha só.
+    """
+    media_type = "application/x-ndjson"
+    format = "ndjson"
+    charset = "utf-8"
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+        rows = data if isinstance(data, list) else [data]
+        return b"".join(self.render_line(row) for row in rows)
+
+    @staticmethod
+    def render_line(row) -> bytes:
+        return dumps(row) + b"\n"
@@ -0,0 +1,55 @@
+from decimal import Decimal
+
+from .tracing import span
+
+
+def decimal_str(value) -> str | None:
+    """Mesma saída do DecimalField do DRF (COERCE_DECIMAL_TO_STRING) para valores já quantizados."""
+    if value is None:
+        return None
+    if not isinstance(value, Decimal):
+        value = Decimal(str(value))
+    return f"{value:f}"
+
+
+def file_url(value, request=None) -> str | None:
+    """Mesma saída do FileField/ImageField do DRF (URL absoluta quando há request)."""
+    if not value:
+        return None
+    try:
+        url = value.url
+    except (AttributeError, ValueError):
+        return None
+    if request is not None:
+        return request.build_absolute_uri(url)
+    return url
+
+
+class PlainSerializer:
+    """
+    Serializer somente leitura, sem Field/validação do DRF: monta dicts direto dos atributos.
+    Compatível com generics (get_serializer(..., many=True).data).
+    Datetimes saem como objetos; os renderers (ORJSONRenderer / JSONRenderer) cuidam do ISO 8601.
+    """
+
+    def __init__(self, instance=None, data=None, many=False, context=None, **kwargs):
+        self.instance = instance
+        self.many = many
+        self.context = context or {}
+
+    @property
+    def request(self):
+        return self.context.get("request")
+
+    @property
+    def data(self):
+        if self.instance is None:
+            return [] if self.many else {}
+        with span("serialize"):
+            if self.many:
+                to_representation = self.to_representation
+                return [to_representation(obj) for obj in self.instance]
+            return self.to_representation(self.instance)
+
+    def to_representation(self, obj) -> dict:
+        raise NotImplementedError
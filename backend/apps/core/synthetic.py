@@ -0,0 +1,315 @@
+"""
+Gerador de dados sintéticos para testes de escala e benchmarks.
+
+Determinístico: mesma seed + mesmo --until = mesmos dados. Tudo via bulk_create em lotes,
+um lote por transação, sem carregar a tabela inteira em memória (pedidos são gerados lote a lote).
+Linhas sintéticas usam o prefixo (padrão "syn") em slugs/SKUs/usernames e o domínio
+@synthetic.test nos e-mails, para poderem ser removidas com --reset.
+"""
+import math
+import random
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, replace
+from datetime import datetime, timedelta, timezone as dt_timezone
+from decimal import Decimal
+from pathlib import Path
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
+from django.db import connection, transaction
+
+from apps.catalog.models import Brand, Category, Product, ProductImage, ProductVariant
+from apps.orders.models import Order, OrderItem
+from apps.payments.events import store_payloads
+from apps.payments.models import Payment, PaymentEvent
+
+EMAIL_DOMAIN = "synthetic.test"
+SIZES = ["PP", "P", "M", "G", "GG", "XG"]
+COLORS = ["Preto", "Branco", "Vermelho", "Azul", "Cinza"]
+CITIES = [("São Paulo", "SP", "01001-000"), ("Rio de Janeiro", "RJ", "20010-000"),
+          ("Belo Horizonte", "MG", "30110-000"), ("Curitiba", "PR", "80010-000"),
+          ("Porto Alegre", "RS", "90010-000"), ("Salvador", "BA", "40010-000")]
+SHIPPING = [("pac", Decimal("29.90"), 7), ("sedex", Decimal("49.90"), 3)]
+# (status do pedido, status do pagamento, peso)
+ORDER_STATUSES = [
+    (Order.Status.PAID, Payment.Status.PAID, 40),
+    (Order.Status.DELIVERED, Payment.Status.PAID, 25),
+    (Order.Status.SHIPPED, Payment.Status.PAID, 8),
+    (Order.Status.PACKING, Payment.Status.PAID, 4),
+    (Order.Status.AWAITING_PAYMENT, Payment.Status.PENDING, 15),
+    (Order.Status.CANCELED, Payment.Status.FAILED, 8),
+]
+
+
+@dataclass(frozen=True)
+class SyntheticConfig:
+    categories: int = 12
+    brands: int = 30
+    products: int = 2_000
+    variants_per_product: int = 3
+    images_per_product: int = 2
+    users: int = 5_000
+    orders: int = 20_000
+    items_mean: float = 2.2        # itens por pedido (média; distribuição geométrica)
+    popularity_skew: float = 1.1   # expoente Zipf da popularidade dos produtos
+    registered_ratio: float = 0.6  # fração de pedidos com usuário
+    days: int = 365                # janela de created_at dos pedidos
+    recency: float = 1.5           # >1 concentra pedidos nos dias mais recentes
+    events_per_payment: int = 2
+    seed: int = 42
+    prefix: str = "syn"
+    batch_size: int = 5_000
+
+
+SCALES = {
+    "small": SyntheticConfig(products=500, users=1_000, orders=5_000),
+    "medium": SyntheticConfig(),
+    "large": SyntheticConfig(products=50_000, users=200_000, orders=1_000_000, batch_size=10_000),
+    "xlarge": SyntheticConfig(
+        categories=40, brands=200, products=200_000, users=1_000_000, orders=5_000_000, batch_size=20_000,
+    ),
+}
+
+
+def config_for(scale: str, **overrides) -> SyntheticConfig:
+    return replace(SCALES[scale], **{k: v for k, v in overrides.items() if v is not None})
+
+
+@contextmanager
+def explicit_timestamps(*fields):
+    """Desliga auto_now/auto_now_add durante o bulk_create para espalhar as datas no tempo."""
+    saved = [(f, f.auto_now, f.auto_now_add) for f in fields]
+    for f in fields:
+        f.auto_now = f.auto_now_add = False
+    try:
+        yield
+    finally:
+        for f, auto_now, auto_now_add in saved:
+            f.auto_now, f.auto_now_add = auto_now, auto_now_add
+
+
+def _field(model, name):
+    return model._meta.get_field(name)
+
+
+class SyntheticDataGenerator:
+    def __init__(self, config: SyntheticConfig, *, until: datetime | None = None, stdout=None):
+        self.config = config
+        self.rng = random.Random(config.seed)
+        self.until = until or datetime.now(dt_timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0)
+        self.stdout = stdout
+        self.counts: dict[str, int] = {}
+
+    def log(self, msg: str):
+        if self.stdout:
+            self.stdout.write(msg)
+
+    def _bulk(self, model, objs):
+        model.objects.bulk_create(objs, batch_size=self.config.batch_size)
+        self.counts[model.__name__] = self.counts.get(model.__name__, 0) + len(objs)
+
+    # ---------- limpeza ----------
+
+    def reset(self):
+        prefix = self.config.prefix
+        Order.objects.filter(email__endswith=f"@{EMAIL_DOMAIN}").delete()
+        Product.objects.filter(slug__startswith=f"{prefix}-").delete()
+        Category.objects.filter(slug__startswith=f"{prefix}-").delete()
+        Brand.objects.filter(slug__startswith=f"{prefix}-").delete()
+        get_user_model().objects.filter(username__startswith=f"{prefix}-").delete()
+
+    # ---------- catálogo ----------
+
+    def _placeholder_images(self) -> list[str]:
+        """Poucos JPEGs reais reutilizados por todos os produtos (o storage não cresce com a escala)."""
+        from PIL import Image
+
+        names = []
+        folder = Path(settings.MEDIA_ROOT) / "products" / "synthetic"
+        folder.mkdir(parents=True, exist_ok=True)
+        for k in range(8):
+            name = f"products/synthetic/placeholder-{k}.jpg"
+            path = Path(settings.MEDIA_ROOT) / name
+            if not path.exists():
+                color = (40 + k * 25, 80 + k * 15, 160 - k * 10)
+                Image.new("RGB", (600, 600), color).save(path, "JPEG", quality=70)
+            names.append(name)
+        return names
+
+    def _price(self) -> Decimal:
+        value = self.rng.lognormvariate(math.log(450), 0.55)
+        return Decimal(int(min(max(value, 99), 4999))) + Decimal("0.90")
+
+    def generate_catalog(self):
+        c, rng, prefix = self.config, self.rng, self.config.prefix
+        with transaction.atomic():
+            categories = [Category(name=f"Categoria {i}", slug=f"{prefix}-categoria-{i}") for i in range(1, c.categories + 1)]
+            self._bulk(Category, categories)
+            brands = [Brand(name=f"{prefix.upper()} Marca {i}", slug=f"{prefix}-marca-{i}") for i in range(1, c.brands + 1)]
+            self._bulk(Brand, brands)
+
+        images = self._placeholder_images() if c.images_per_product else []
+        start = self.until - timedelta(days=c.days * 2)
+        self.products: list[tuple[int, str, Decimal, list]] = []  # (id, nome, preço, [(variant_id, sku)])
+
+        with explicit_timestamps(_field(Product, "created_at"), _field(Product, "updated_at")):
+            for offset in range(0, c.products, c.batch_size):
+                n = min(c.batch_size, c.products - offset)
+                batch = []
+                for i in range(offset + 1, offset + n + 1):
+                    created = start + timedelta(seconds=rng.randrange(c.days * 2 * 86400))
+                    batch.append(Product(
+                        name=f"Capacete {prefix.upper()} {i}", slug=f"{prefix}-capacete-{i}",
+                        description="Produto sintético para teste de carga.", price=self._price(),
+                        active=rng.random() > 0.03,
+                        category=rng.choice(categories), brand=rng.choice(brands) if rng.random() > 0.1 else None,
+                        created_at=created, updated_at=created,
+                    ))
+                with transaction.atomic():
+                    self._bulk(Product, batch)
+                    variants, product_images = [], []
+                    for p in batch:
+                        sizes = SIZES[: c.variants_per_product]
+                        color = rng.choice(COLORS)
+                        for order, size in enumerate(sizes):
+                            variants.append(ProductVariant(
+                                product_id=p.id, sku=f"{prefix}-{p.id}-{size}", size=size, color=color,
+                                stock=rng.choice([0, 2, 5, 10, 25, 50]), sort_order=order,
+                            ))
+                        for k in range(c.images_per_product):
+                            product_images.append(ProductImage(
+                                product_id=p.id, image=images[(p.id + k) % len(images)],
+                                alt_text=p.name, sort_order=k,
+                            ))
+                    self._bulk(ProductVariant, variants)
+                    self._bulk(ProductImage, product_images)
+
+                by_product: dict[int, list] = {}
+                for v in variants:
+                    by_product.setdefault(v.product_id, []).append((v.id, v.sku))
+                self.products.extend((p.id, p.name, p.price, by_product.get(p.id, [])) for p in batch)
+            self.log(f"Catálogo: {c.products} produtos.")
+
+    # ---------- usuários ----------
+
+    def generate_users(self):
+        c, prefix = self.config, self.config.prefix
+        User = get_user_model()
+        password = make_password("senha-sintetica")  # um hash só: hashear por usuário levaria horas
+        self.users: list[tuple[int, str, str]] = []
+        for offset in range(0, c.users, c.batch_size):
+            n = min(c.batch_size, c.users - offset)
+            batch = [
+                User(
+                    username=f"{prefix}-user-{i}", email=f"{prefix}-user-{i}@{EMAIL_DOMAIN}",
+                    first_name="Cliente", last_name=str(i), password=password,
+                )
+                for i in range(offset + 1, offset + n + 1)
+            ]
+            with transaction.atomic():
+                self._bulk(User, batch)
+            self.users.extend((u.id, u.email, f"{u.first_name} {u.last_name}") for u in batch)
+        self.log(f"Usuários: {c.users}.")
+
+    # ---------- pedidos ----------
+
+    def generate_orders(self):
+        c, rng = self.config, self.rng
+        if not self.products:
+            return
+        weights = [1 / (rank ** c.popularity_skew) for rank in range(1, len(self.products) + 1)]
+        popularity = self.products[:]
+        rng.shuffle(popularity)
+        cum_weights = []
+        total = 0.0
+        for w in weights:
+            total += w
+            cum_weights.append(total)
+        status_choices = [(o, p) for o, p, _ in ORDER_STATUSES]
+        status_weights = [w for _, _, w in ORDER_STATUSES]
+        geometric_p = 1 / max(c.items_mean, 1.0)
+
+        fields = [_field(Order, "created_at"), _field(Order, "updated_at"),
+                  _field(Payment, "created_at"), _field(Payment, "updated_at")]
+        with explicit_timestamps(*fields):
+            for offset in range(0, c.orders, c.batch_size):
+                n = min(c.batch_size, c.orders - offset)
+                orders, lines, statuses = [], [], []
+                for _ in range(n):
+                    n_items = 1
+                    while n_items < 10 and rng.random() > geometric_p:
+                        n_items += 1
+                    picked = rng.choices(popularity, cum_weights=cum_weights, k=n_items)
+                    order_lines = []
+                    subtotal = Decimal("0.00")
+                    for product_id, name, price, variants in picked:
+                        qty = rng.choices((1, 2, 3), weights=(90, 8, 2))[0]
+                        variant_id, sku = rng.choice(variants) if variants else (None, "")
+                        order_lines.append((product_id, variant_id, sku, name, price, qty))
+                        subtotal += price * qty
+
+                    method, shipping_price, shipping_days = rng.choice(SHIPPING)
+                    city, state, zip_code = rng.choice(CITIES)
+                    if self.users and rng.random() < c.registered_ratio:
+                        user_id, email, full_name = rng.choice(self.users)
+                    else:
+                        guest = rng.randrange(1, 10 * max(c.orders, 1))
+                        user_id, email, full_name = None, f"guest-{guest}@{EMAIL_DOMAIN}", f"Convidado {guest}"
+                    created = self.until - timedelta(seconds=int(c.days * 86400 * rng.random() ** c.recency))
+                    order_status, payment_status = rng.choices(status_choices, weights=status_weights)[0]
+                    orders.append(Order(
+                        user_id=user_id, full_name=full_name, email=email, phone="11999990000",
+                        subtotal=subtotal, shipping_price=shipping_price, total=subtotal + shipping_price,
+                        shipping_name=full_name, shipping_zip=zip_code, shipping_street="Rua Sintética",
+                        shipping_number=str(rng.randrange(1, 3000)), shipping_district="Centro",
+                        shipping_city=city, shipping_state=state, shipping_method=method,
+                        shipping_days=shipping_days, status=order_status,
+                        created_at=created, updated_at=created,
+                    ))
+                    lines.append(order_lines)
+                    statuses.append(payment_status)
+
+                with transaction.atomic():
+                    self._bulk(Order, orders)
+                    items, payments = [], []
+                    for order, order_lines, payment_status in zip(orders, lines, statuses):
+                        items.extend(
+                            OrderItem(order_id=order.id, product_id=pid, variant_id=vid, sku=sku, name=name, price=price, qty=qty)
+                            for pid, vid, sku, name, price, qty in order_lines
+                        )
+                        payments.append(Payment(
+                            order_id=order.id, method=rng.choice(Payment.Method.values), status=payment_status,
+                            amount=order.total, provider_payment_id=f"{c.prefix}-pay-{order.id}",
+                            idempotency_key=f"{c.prefix}-{order.id}",
+                            created_at=order.created_at, updated_at=order.created_at,
+                        ))
+                    self._bulk(OrderItem, items)
+                    self._bulk(Payment, payments)
+                    events, payloads = [], []
+                    for payment in payments:
+                        kinds = ["payment.created", f"payment.{payment.status}"][: c.events_per_payment]
+                        for k, kind in enumerate(kinds):
+                            events.append(PaymentEvent(
+                                payment_id=payment.id, event_type=kind,
+                                provider_event_id=f"{c.prefix}-evt-{payment.id}-{k}",
+                                received_at=payment.created_at + timedelta(minutes=k * 5),
+                            ))
+                            payloads.append({"id": payment.provider_payment_id, "action": kind, "status": payment.status})
+                    for event, payload_id in zip(events, store_payloads(payloads)):
+                        event.payload_id = payload_id
+                    self._bulk(PaymentEvent, events)
+                self.log(f"Pedidos: {offset + n}/{c.orders}")
+
+    def run(self) -> dict[str, int]:
+        started = time.perf_counter()
+        if connection.vendor == "sqlite":
+            # só acelera a carga: sem fsync por transação nesta conexão
+            with connection.cursor() as cursor:
+                cursor.execute("PRAGMA synchronous = OFF")
+        self.generate_catalog()
+        self.generate_users()
+        self.generate_orders()
+        self.counts["seconds"] = round(time.perf_counter() - started, 1)
+        return self.counts
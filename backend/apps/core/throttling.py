@@ -0,0 +1,152 @@
+"""
+Throttles token bucket para endpoints públicos de escrita (checkout, pagamento, cadastro).
+
+Cada view define `throttle_scope`; as taxas ficam em REST_FRAMEWORK["DEFAULT_THROTTLE_RATES"]
+com sufixo por escopo de cliente: "<scope>_ip", "<scope>_user", "<scope>_endpoint".
+Chave sem taxa configurada = throttle desligado para aquele escopo.
+
+Formato da taxa igual ao do DRF ("10/min"): capacidade (burst) = 10, reposição = 10 por minuto.
+
+O DRF avalia todos os throttles mesmo depois de um negar. Request já negado por um bucket não
+consome os seguintes: em PUBLIC_WRITE_THROTTLES os buckets vão do mais estreito (IP) ao global,
+e um cliente barrado no próprio bucket não gasta o teto do endpoint dos outros.
+
+IP do cliente: REMOTE_ADDR, ou X-Forwarded-For só com NUM_PROXIES (proxies confiáveis na frente).
+"""
+import math
+import threading
+import time
+from collections import OrderedDict
+
+from django.conf import settings
+from rest_framework.settings import api_settings
+from rest_framework.throttling import BaseThrottle
+
+
+_PERIODS = {"s": 1, "m": 60, "h": 3600, "d": 86400}
+
+
+def parse_rate(rate: str) -> tuple[int, float]:
+    """'10/min' -> (10, 60.0)"""
+    num, period = rate.split("/")
+    return int(num), float(_PERIODS[period.strip()[0]])
+
+
+class LocalBucketStore:
+    """
+    Buckets em memória do processo, protegidos por lock (operação atômica por chave).
+    LRU limitado: chaves antigas são descartadas (bucket volta cheio, o que só afrouxa o limite).
+    Para vários processos/hosts, troque por um store compartilhado com a mesma interface.
+    """
+
+    def __init__(self, max_keys: int = 100_000, timer=time.monotonic):
+        self.max_keys = max_keys
+        self.timer = timer
+        self._lock = threading.Lock()
+        self._buckets: OrderedDict[str, list[float]] = OrderedDict()  # key -> [tokens, atualizado_em]
+
+    def consume(self, key: str, capacity: int, period: float, cost: float = 1.0) -> float:
+        """
+        Tenta consumir `cost` tokens. Retorna 0.0 se permitido;
+        senão, segundos até haver tokens suficientes.
+        """
+        refill_per_sec = capacity / period
+        now = self.timer()
+
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                bucket = [float(capacity), now]
+                self._buckets[key] = bucket
+                if len(self._buckets) > self.max_keys:
+                    self._buckets.popitem(last=False)
+            else:
+                self._buckets.move_to_end(key)
+                bucket[0] = min(float(capacity), bucket[0] + (now - bucket[1]) * refill_per_sec)
+                bucket[1] = now
+
+            if bucket[0] >= cost:
+                bucket[0] -= cost
+                return 0.0
+            return (cost - bucket[0]) / refill_per_sec
+
+    def clear(self):
+        with self._lock:
+            self._buckets.clear()
+
+
+store = LocalBucketStore(max_keys=getattr(settings, "THROTTLE_MAX_KEYS", 100_000))
+
+
+class TokenBucketThrottle(BaseThrottle):
+    """
+    Base: subclasses definem `client_scope` e `get_ident_key`.
+    """
+    client_scope = ""
+    store = store
+
+    def __init__(self):
+        self._wait = None
+
+    def get_rate(self, view) -> str | None:
+        scope = getattr(view, "throttle_scope", None)
+        if not scope:
+            return None
+        return api_settings.DEFAULT_THROTTLE_RATES.get(f"{scope}_{self.client_scope}")
+
+    def get_ident_key(self, request) -> str | None:
+        raise NotImplementedError
+
+    def allow_request(self, request, view):
+        if getattr(request, "_token_bucket_denied", False):
+            return True  # já negado por um bucket anterior: não consome este
+        rate = self.get_rate(view)
+        if not rate:
+            return True
+
+        ident = self.get_ident_key(request)
+        if ident is None:
+            return True
+
+        capacity, period = parse_rate(rate)
+        key = f"{view.throttle_scope}:{self.client_scope}:{ident}"
+        wait = self.store.consume(key, capacity, period)
+        if wait:
+            self._wait = wait
+            request._token_bucket_denied = True
+            return False
+        return True
+
+    def wait(self):
+        # Retry-After é inteiro (DRF formata com %d): arredonda pra cima
+        return math.ceil(self._wait) if self._wait else None
+
+
+class IPTokenBucketThrottle(TokenBucketThrottle):
+    """Por IP do cliente (get_ident do DRF: REMOTE_ADDR, ou X-Forwarded-For conforme NUM_PROXIES)."""
+    client_scope = "ip"
+
+    def get_ident_key(self, request):
+        return self.get_ident(request)
+
+
+class UserTokenBucketThrottle(TokenBucketThrottle):
+    """Por usuário autenticado; anônimos ficam só com o limite por IP."""
+    client_scope = "user"
+
+    def get_ident_key(self, request):
+        user = getattr(request, "user", None)
+        if user is None or not user.is_authenticated:
+            return None
+        return str(user.pk)
+
+
+class EndpointTokenBucketThrottle(TokenBucketThrottle):
+    """Teto global do endpoint (todos os clientes), protege o banco contra flood distribuído."""
+    client_scope = "endpoint"
+
+    def get_ident_key(self, request):
+        return "*"
+
+
+PUBLIC_WRITE_THROTTLES = [IPTokenBucketThrottle, UserTokenBucketThrottle, EndpointTokenBucketThrottle]
@@ -0,0 +1,85 @@
+"""
+Trace por request: tempo/contagem de queries, serialização e HTTP de saída.
+O trace vive num ContextVar, então vale também dentro de sync_to_async (views async).
+"""
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+
+
+@dataclass
+class RequestTrace:
+    started_at: float = field(default_factory=time.perf_counter)
+    db_ms: float = 0.0
+    db_count: int = 0
+    serialize_ms: float = 0.0
+    http_ms: float = 0.0
+    http_count: int = 0
+
+    def elapsed_ms(self) -> float:
+        return (time.perf_counter() - self.started_at) * 1000
+
+    def server_timing(self, total_ms: float) -> str:
+        return ", ".join([
+            f'db;dur={self.db_ms:.1f};desc="{self.db_count} queries"',
+            f"ser;dur={self.serialize_ms:.1f}",
+            f'http;dur={self.http_ms:.1f};desc="{self.http_count} calls"',
+            f"total;dur={total_ms:.1f}",
+        ])
+
+
+_current: ContextVar[RequestTrace | None] = ContextVar("request_trace", default=None)
+
+
+def current_trace() -> RequestTrace | None:
+    return _current.get()
+
+
+def start_trace():
+    """Retorna (trace, token); use _current.reset(token) no fim via end_trace."""
+    trace = RequestTrace()
+    return trace, _current.set(trace)
+
+
+def end_trace(token):
+    _current.reset(token)
+
+
+@contextmanager
+def span(kind: str):
+    """
+    Soma o tempo do bloco no trace atual. kind: "serialize" ou "http".
+    Fora de um request (shell, commands) não faz nada além de medir.
+    """
+    trace = _current.get()
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        if trace is not None:
+            elapsed = (time.perf_counter() - start) * 1000
+            if kind == "http":
+                trace.http_ms += elapsed
+                trace.http_count += 1
+            elif kind == "serialize":
+                trace.serialize_ms += elapsed
+
+
+def db_execute_wrapper(execute, sql, params, many, context):
+    trace = _current.get()
+    if trace is None:
+        return execute(sql, params, many, context)
+
+    start = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        trace.db_ms += (time.perf_counter() - start) * 1000
+        trace.db_count += 1
+
+
+def install_db_wrapper(sender, connection, **kwargs):
+    """Handler de connection_created: instrumenta toda conexão (inclusive as de threads do sync_to_async)."""
+    if db_execute_wrapper not in connection.execute_wrappers:
+        connection.execute_wrappers.append(db_execute_wrapper)
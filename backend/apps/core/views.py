@@ -0,0 +1,39 @@
+from django.conf import settings
+from django.http import Http404, HttpResponse
+from django.utils.crypto import constant_time_compare
+from django.views import View
+
+from .metrics import REGISTRY
+from .renderers import dumps
+
+
+class AsyncJSONView(View):
+    """
+    Base para leituras async-nativas (ASGI): ORM async + plain serializers, sem o APIView do DRF
+    (que é síncrono e, sob ASGI, passa por sync_to_async a cada request).
+    Sem autenticação: use só para endpoints públicos (leituras e o cadastro async).
+    """
+    http_method_names = ["get", "head", "options"]
+
+    def json(self, data, status: int = 200) -> HttpResponse:
+        return HttpResponse(dumps(data), status=status, content_type="application/json")
+
+    def not_found(self) -> HttpResponse:
+        return self.json({"detail": "Não encontrado."}, status=404)
+
+
+class MetricsView(View):
+    """
+    GET /metrics  (formato texto do Prometheus)
+    Exige Authorization: Bearer <METRICS_TOKEN>; sem token configurado, o endpoint não existe (404).
+    """
+    http_method_names = ["get"]
+
+    def get(self, request):
+        token = getattr(settings, "METRICS_TOKEN", "")
+        if not token:
+            raise Http404
+        auth = request.headers.get("Authorization", "")
+        if not constant_time_compare(auth, f"Bearer {token}"):
+            return HttpResponse(status=401)
+        return HttpResponse(REGISTRY.render(), content_type="text/plain; version=0.0.4; charset=utf-8")
@@ -0,0 +1,53 @@
+from django.contrib import admin, messages
+
+from .models import PurchaseOrder, PurchaseOrderLine, SkuForecast
+
+
+@admin.register(SkuForecast)
+class SkuForecastAdmin(admin.ModelAdmin):
+    """Somente leitura: recalculado por manage.py compute_replenishment."""
+    list_display = (
+        "variant", "velocity", "seasonal_factor", "lead_time_days", "safety_stock", "reorder_point",
+        "on_hand", "on_order", "suggested_qty", "computed_at",
+    )
+    list_select_related = ("variant__product",)
+    search_fields = ("variant__sku",)
+    ordering = ("-suggested_qty",)
+
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
+
+
+class PurchaseOrderLineInline(admin.TabularInline):
+    model = PurchaseOrderLine
+    extra = 0
+    raw_id_fields = ("variant",)
+    fields = ("variant", "qty", "unit_cost", "on_hand", "reorder_point")
+    readonly_fields = ("on_hand", "reorder_point")
+
+
+@admin.register(PurchaseOrder)
+class PurchaseOrderAdmin(admin.ModelAdmin):
+    list_display = ("id", "supplier", "status", "total_units", "total_cost", "created_at", "sent_at", "received_at")
+    list_filter = ("status", "supplier")
+    list_select_related = ("supplier",)
+    readonly_fields = ("total_units", "total_cost", "created_at", "sent_at", "received_at")
+    inlines = [PurchaseOrderLineInline]
+    actions = ["mark_sent", "receive"]
+
+    @admin.action(description="Marcar como enviado ao fornecedor")
+    def mark_sent(self, request, queryset):
+        count = 0
+        for order in queryset.filter(status=PurchaseOrder.Status.DRAFT):
+            order.mark_sent()
+            count += 1
+        self.message_user(request, f"{count} pedido(s) de compra enviado(s).")
+
+    @admin.action(description="Receber (somar ao estoque)")
+    def receive(self, request, queryset):
+        received = sum(order.receive() for order in queryset)
+        level = messages.SUCCESS if received else messages.WARNING
+        self.message_user(request, f"{received} pedido(s) de compra recebido(s).", level)
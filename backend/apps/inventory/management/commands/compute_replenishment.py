@@ -0,0 +1,29 @@
+from django.core.management.base import BaseCommand
+
+from apps.inventory.replenishment import Replenishment, ReplenishmentConfig
+
+
+class Command(BaseCommand):
+    help = (
+        "Recalcula velocidade, sazonalidade e ponto de pedido de todos os SKUs e gera os rascunhos "
+        "de pedido de compra por fornecedor. Rodar à noite."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--weeks", type=int, help="Semanas de histórico (padrão: REPLENISHMENT_HISTORY_WEEKS).")
+        parser.add_argument("--service-level", type=float, help="Nível de serviço (0-1) do estoque de segurança.")
+        parser.add_argument("--review-days", type=int, help="Dias entre compras (período de revisão).")
+        parser.add_argument("--dry-run", action="store_true", help="Só calcula; não grava previsões nem pedidos.")
+
+    def handle(self, *args, weeks, service_level, review_days, dry_run, **options):
+        config = ReplenishmentConfig.from_settings(
+            history_weeks=weeks, service_level=service_level, review_days=review_days,
+        )
+        result = Replenishment(config).run(dry_run=dry_run)
+        timings = ", ".join(f"{name} {seconds:.1f}s" for name, seconds in result.timings.items())
+        self.stdout.write(
+            f"{result.skus} SKU(s) com venda em {config.history_weeks} semana(s); {result.suggestions} com compra "
+            f"sugerida ({result.without_supplier} sem fornecedor). {result.purchase_orders} pedido(s) de compra, "
+            f"{result.units} unidade(s). Tempos: {timings}."
+            + (" (dry-run)" if dry_run else "")
+        )
@@ -0,0 +1,71 @@
+# Generated by Django 6.0.1 on 2026-10-19 16:20
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ('catalog', '0004_productrecommendation'),
+        ('suppliers', '0002_supplier_items'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SkuForecast',
+            fields=[
+                ('variant', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='forecast', serialize=False, to='catalog.productvariant')),
+                ('velocity', models.FloatField(default=0)),
+                ('seasonal_factor', models.FloatField(default=1)),
+                ('demand_std', models.FloatField(default=0)),
+                ('lead_time_days', models.PositiveSmallIntegerField(default=0)),
+                ('safety_stock', models.PositiveIntegerField(default=0)),
+                ('reorder_point', models.PositiveIntegerField(default=0)),
+                ('order_up_to', models.PositiveIntegerField(default=0)),
+                ('on_hand', models.PositiveIntegerField(default=0)),
+                ('on_order', models.PositiveIntegerField(default=0)),
+                ('suggested_qty', models.PositiveIntegerField(default=0)),
+                ('computed_at', models.DateTimeField()),
+            ],
+        ),
+        migrations.CreateModel(
+            name='PurchaseOrder',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('status', models.CharField(choices=[('draft', 'Sugestão'), ('sent', 'Enviado'), ('received', 'Recebido'), ('canceled', 'Cancelado')], default='draft', max_length=20)),
+                ('total_units', models.PositiveIntegerField(default=0)),
+                ('total_cost', models.DecimalField(blank=True, decimal_places=2, max_digits=12, null=True)),
+                ('notes', models.TextField(blank=True, default='')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('sent_at', models.DateTimeField(blank=True, null=True)),
+                ('received_at', models.DateTimeField(blank=True, null=True)),
+                ('supplier', models.ForeignKey(on_delete=django.db.models.deletion.PROTECT, related_name='purchase_orders', to='suppliers.supplier')),
+            ],
+            options={
+                'ordering': ['-created_at'],
+            },
+        ),
+        migrations.CreateModel(
+            name='PurchaseOrderLine',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('qty', models.PositiveIntegerField()),
+                ('unit_cost', models.DecimalField(blank=True, decimal_places=2, max_digits=10, null=True)),
+                ('on_hand', models.PositiveIntegerField(default=0)),
+                ('reorder_point', models.PositiveIntegerField(default=0)),
+                ('purchase_order', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='lines', to='inventory.purchaseorder')),
+                ('variant', models.ForeignKey(on_delete=django.db.models.deletion.PROTECT, related_name='purchase_lines', to='catalog.productvariant')),
+            ],
+        ),
+        migrations.AddIndex(
+            model_name='purchaseorder',
+            index=models.Index(fields=['status', 'supplier'], name='purchaseorder_status_idx'),
+        ),
+        migrations.AddConstraint(
+            model_name='purchaseorderline',
+            constraint=models.UniqueConstraint(fields=('purchase_order', 'variant'), name='uniq_purchase_line_variant'),
+        ),
+    ]
@@ -0,0 +1,105 @@
+from django.db import models, transaction
+from django.db.models import F
+from django.utils import timezone
+
+from apps.catalog.models import Product, ProductVariant
+from apps.suppliers.models import Supplier
+
+
+class SkuForecast(models.Model):
+    """
+    Resultado do último recálculo de reposição (manage.py compute_replenishment), uma linha por SKU
+    com venda no histórico. Quantidades em unidades; velocity em unidades/dia (sem sazonalidade).
+    """
+    variant = models.OneToOneField(
+        ProductVariant, on_delete=models.CASCADE, primary_key=True, related_name="forecast",
+    )
+    velocity = models.FloatField(default=0)
+    seasonal_factor = models.FloatField(default=1)   # fator do mês do prazo de entrega
+    demand_std = models.FloatField(default=0)        # desvio padrão da demanda diária
+    lead_time_days = models.PositiveSmallIntegerField(default=0)
+
+    safety_stock = models.PositiveIntegerField(default=0)
+    reorder_point = models.PositiveIntegerField(default=0)
+    order_up_to = models.PositiveIntegerField(default=0)
+    on_hand = models.PositiveIntegerField(default=0)
+    on_order = models.PositiveIntegerField(default=0)  # compras enviadas e ainda não recebidas
+    suggested_qty = models.PositiveIntegerField(default=0)
+
+    computed_at = models.DateTimeField()
+
+    def __str__(self) -> str:
+        return f"{self.variant_id}: ponto {self.reorder_point}, sugerido {self.suggested_qty}"
+
+
+class PurchaseOrder(models.Model):
+    """
+    Pedido de compra ao fornecedor. Os rascunhos são gerados (e substituídos) a cada recálculo;
+    enviado = conta como estoque a caminho; recebido = já somado ao estoque das variantes.
+    """
+    class Status(models.TextChoices):
+        DRAFT = "draft", "Sugestão"
+        SENT = "sent", "Enviado"
+        RECEIVED = "received", "Recebido"
+        CANCELED = "canceled", "Cancelado"
+
+    supplier = models.ForeignKey(Supplier, on_delete=models.PROTECT, related_name="purchase_orders")
+    status = models.CharField(max_length=20, choices=Status.choices, default=Status.DRAFT)
+    total_units = models.PositiveIntegerField(default=0)
+    total_cost = models.DecimalField(max_digits=12, decimal_places=2, null=True, blank=True)
+    notes = models.TextField(blank=True, default="")
+
+    created_at = models.DateTimeField(auto_now_add=True)
+    sent_at = models.DateTimeField(null=True, blank=True)
+    received_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        ordering = ["-created_at"]
+        indexes = [
+            models.Index(fields=["status", "supplier"], name="purchaseorder_status_idx"),
+        ]
+
+    def mark_sent(self):
+        self.status = self.Status.SENT
+        self.sent_at = timezone.now()
+        self.save(update_fields=["status", "sent_at"])
+
+    def receive(self) -> bool:
+        """Soma as quantidades ao estoque das variantes; só uma vez por pedido enviado."""
+        with transaction.atomic():
+            locked = PurchaseOrder.objects.select_for_update().get(pk=self.pk)
+            if locked.status != self.Status.SENT:
+                return False
+            now = timezone.now()
+            product_ids = set()
+            for variant_id, product_id, qty in self.lines.values_list("variant_id", "variant__product_id", "qty"):
+                ProductVariant.objects.filter(pk=variant_id).update(stock=F("stock") + qty)
+                product_ids.add(product_id)
+            # estoque mudou = produto mudou para snapshot/feeds incrementais
+            Product.objects.filter(id__in=product_ids).update(updated_at=now)
+            self.status = self.Status.RECEIVED
+            self.received_at = now
+            self.save(update_fields=["status", "received_at"])
+        return True
+
+    def __str__(self) -> str:
+        return f"Compra #{self.id} - {self.supplier} - {self.status}"
+
+
+class PurchaseOrderLine(models.Model):
+    purchase_order = models.ForeignKey(PurchaseOrder, on_delete=models.CASCADE, related_name="lines")
+    variant = models.ForeignKey(ProductVariant, on_delete=models.PROTECT, related_name="purchase_lines")
+    qty = models.PositiveIntegerField()
+    unit_cost = models.DecimalField(max_digits=10, decimal_places=2, null=True, blank=True)
+
+    # retrato do cálculo que gerou a sugestão
+    on_hand = models.PositiveIntegerField(default=0)
+    reorder_point = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["purchase_order", "variant"], name="uniq_purchase_line_variant"),
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.variant_id} x{self.qty}"
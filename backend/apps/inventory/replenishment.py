@@ -0,0 +1,346 @@
+"""
+Reposição: velocidade de venda, sazonalidade e ponto de pedido por SKU, calculados em lote.
+
+O catálogo inteiro é processado de uma vez com NumPy. Não há loop de ORM por produto.
+
+1. Uma query agrega OrderItem por (variante, dia) nos pedidos pagos da janela. O resultado
+   vira a matriz W[sku, semana] de unidades vendidas (bincount).
+2. Sazonalidade: índice por mês do ano de cada categoria (média semanal no mês / média geral).
+   Exige pelo menos 1 ano de histórico; categoria com pouco volume usa o índice do catálogo.
+3. Velocidade: média exponencial (meia-vida em semanas) da demanda dessazonalizada, contada a
+   partir da primeira venda do SKU. σ diário = desvio padrão semanal / √7, com piso de Poisson
+   para itens de giro lento.
+4. Ponto de pedido = demanda no prazo de entrega × fator sazonal + estoque de segurança
+   (z do nível de serviço × σ × √prazo). Nível máximo = ponto + demanda do período de revisão.
+   Quando a posição (estoque + compras enviadas) está no ponto ou abaixo, sugere comprar até o
+   nível máximo, arredondando para o múltiplo de compra do fornecedor.
+5. Grava SkuForecast (upsert) e troca os rascunhos de PurchaseOrder (um por fornecedor).
+"""
+import math
+import time
+from array import array
+from dataclasses import dataclass, field, fields
+from datetime import datetime, timedelta
+from decimal import Decimal
+from statistics import NormalDist
+
+import numpy as np
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Sum
+from django.db.models.functions import TruncDate
+from django.utils import timezone
+
+from apps.catalog.models import ProductVariant
+from apps.orders.models import SOLD_STATUSES, OrderItem
+from apps.suppliers.models import SupplierItem
+from .models import PurchaseOrder, PurchaseOrderLine, SkuForecast
+
+MIN_SEASONAL_WEEKS = 52       # menos que 1 ano: sem sazonalidade (fator 1)
+MIN_CATEGORY_UNITS = 200      # abaixo disso a categoria usa o índice do catálogo
+SEASONAL_CLIP = (0.5, 2.0)
+MIN_HORIZON_DEMAND = 0.5      # SKU parado (demanda esperada < meia unidade) não gera compra
+
+
+@dataclass
+class ReplenishmentConfig:
+    history_weeks: int = 104
+    half_life_weeks: float = 8
+    service_level: float = 0.95
+    review_days: int = 7
+    default_lead_time: int = 7   # SKU sem fornecedor cadastrado
+
+    @classmethod
+    def from_settings(cls, **overrides) -> "ReplenishmentConfig":
+        values = {
+            f.name: getattr(settings, f"REPLENISHMENT_{f.name.upper()}", f.default) for f in fields(cls)
+        }
+        values.update({name: value for name, value in overrides.items() if value is not None})
+        return cls(**values)
+
+
+@dataclass
+class ReplenishmentResult:
+    skus: int = 0
+    suggestions: int = 0
+    without_supplier: int = 0
+    purchase_orders: int = 0
+    units: int = 0
+    timings: dict = field(default_factory=dict)
+
+
+@dataclass
+class WeeklyDemand:
+    start: datetime            # início da semana 0 (meia-noite, timezone atual)
+    variant_ids: np.ndarray    # (n,) ordenado
+    units: np.ndarray          # (n, semanas)
+
+    @property
+    def week_months(self) -> np.ndarray:
+        """Mês (0-11) do meio de cada semana."""
+        return np.array([
+            (self.start + timedelta(days=7 * week + 3)).month - 1 for week in range(self.units.shape[1])
+        ])
+
+
+def load_weekly_demand(weeks: int, *, until: datetime | None = None, chunk_size: int = 50_000) -> WeeklyDemand:
+    """Unidades vendidas por variante e semana nas `weeks` semanas completas antes de `until` (hoje)."""
+    if until is None:
+        until = timezone.localtime().replace(hour=0, minute=0, second=0, microsecond=0)
+    start = until - timedelta(days=7 * weeks)
+
+    qs = (
+        OrderItem.objects
+        .filter(
+            variant_id__isnull=False, order__status__in=SOLD_STATUSES,
+            order__created_at__gte=start, order__created_at__lt=until,
+        )
+        .annotate(day=TruncDate("order__created_at"))
+        .values("variant_id", "day")
+        .annotate(units=Sum("qty"))
+        .values_list("variant_id", "day", "units")
+        .order_by()
+    )
+    variants, offsets, units = array("q"), array("q"), array("q")
+    first_day = start.date()
+    for variant_id, day, qty in qs.iterator(chunk_size=chunk_size):
+        variants.append(variant_id)
+        offsets.append((day - first_day).days)
+        units.append(qty)
+
+    variant_ids, rows = np.unique(np.frombuffer(variants, dtype=np.int64), return_inverse=True)
+    week = np.frombuffer(offsets, dtype=np.int64) // 7
+    matrix = np.bincount(
+        rows * weeks + week, weights=np.frombuffer(units, dtype=np.int64), minlength=len(variant_ids) * weeks,
+    ).reshape(len(variant_ids), weeks)
+    return WeeklyDemand(start=start, variant_ids=variant_ids, units=matrix)
+
+
+def monthly_index(totals: np.ndarray, week_months: np.ndarray) -> np.ndarray:
+    """(grupos, semanas) de demanda -> (grupos, 12): média semanal do mês / média geral (1 sem dado)."""
+    month_sum = np.zeros((12, totals.shape[0]))
+    np.add.at(month_sum, week_months, totals.T)
+    weeks_in_month = np.bincount(week_months, minlength=12)
+    month_mean = month_sum.T / np.maximum(weeks_in_month, 1)
+    overall = totals.mean(axis=1, keepdims=True)
+    index = np.divide(month_mean, overall, out=np.ones_like(month_mean), where=overall > 0)
+    index[:, weeks_in_month == 0] = 1
+    return np.clip(index, *SEASONAL_CLIP)
+
+
+def seasonal_factors(demand: WeeklyDemand, category_rows: np.ndarray, n_categories: int) -> np.ndarray:
+    """(n, 12) fator sazonal de cada SKU, herdado da categoria (ou do catálogo)."""
+    n, weeks = demand.units.shape
+    if weeks < MIN_SEASONAL_WEEKS or not n:
+        return np.ones((n, 12))
+    week_months = demand.week_months
+    by_category = np.zeros((n_categories, weeks))
+    np.add.at(by_category, category_rows, demand.units)
+    catalog = monthly_index(demand.units.sum(axis=0, keepdims=True), week_months)
+    index = monthly_index(by_category, week_months)
+    index[by_category.sum(axis=1) < MIN_CATEGORY_UNITS] = catalog[0]
+    return index[category_rows]
+
+
+def velocity_and_std(units: np.ndarray, season: np.ndarray, week_months: np.ndarray, half_life: float):
+    """Velocidade (un/dia, dessazonalizada) e desvio padrão diário, a partir da 1ª venda de cada SKU."""
+    n, weeks = units.shape
+    deseasonalized = units / season[:, week_months]
+
+    sold = units > 0
+    first = np.where(sold.any(axis=1), sold.argmax(axis=1), weeks)
+    active = np.arange(weeks)[None, :] >= first[:, None]
+
+    decay = 0.5 ** ((weeks - 1 - np.arange(weeks)) / half_life)
+    weights = active * decay[None, :]
+    weight_sum = weights.sum(axis=1)
+    level = np.divide((deseasonalized * weights).sum(axis=1), weight_sum, out=np.zeros(n), where=weight_sum > 0)
+
+    observed = active.sum(axis=1)
+    mean = np.divide((deseasonalized * active).sum(axis=1), observed, out=np.zeros(n), where=observed > 0)
+    variance = ((deseasonalized - mean[:, None]) ** 2 * active).sum(axis=1) / np.maximum(observed - 1, 1)
+    # piso de Poisson: SKU novo ou de giro lento tem poucas semanas para estimar a variância
+    std_week = np.maximum(np.sqrt(variance), np.sqrt(level))
+    return level / 7, std_week / math.sqrt(7)
+
+
+def _columns(rows, count: int) -> list[np.ndarray]:
+    columns = [array("q") for _ in range(count)]
+    for row in rows:
+        for column, value in zip(columns, row):
+            column.append(value)
+    return [np.frombuffer(column, dtype=np.int64) for column in columns]
+
+
+def _align(ids: np.ndarray, keys: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Posição de cada key em ids (ordenado) e máscara das que existem."""
+    if not len(ids):
+        return np.zeros(len(keys), dtype=np.int64), np.zeros(len(keys), dtype=bool)
+    position = np.searchsorted(ids, keys).clip(max=len(ids) - 1)
+    return position, ids[position] == keys
+
+
+class Replenishment:
+    def __init__(self, config: ReplenishmentConfig | None = None, *, today: datetime | None = None):
+        self.config = config or ReplenishmentConfig.from_settings()
+        self.today = today or timezone.localtime().replace(hour=0, minute=0, second=0, microsecond=0)
+        self.result = ReplenishmentResult()
+
+    def _timed(self, name: str, started: float) -> float:
+        now = time.perf_counter()
+        self.result.timings[name] = round(now - started, 3)
+        return now
+
+    def run(self, *, dry_run: bool = False) -> ReplenishmentResult:
+        c = self.config
+        started = time.perf_counter()
+        demand = load_weekly_demand(c.history_weeks, until=self.today)
+        started = self._timed("demanda", started)
+
+        plan = self.compute(demand)
+        started = self._timed("calculo", started)
+        if not dry_run:
+            self.store(plan)
+            self._timed("gravacao", started)
+        return self.result
+
+    # ---------- cálculo (vetorizado) ----------
+
+    def compute(self, demand: WeeklyDemand) -> dict:
+        c = self.config
+        variant_ids, stock, category, active = _columns(
+            ProductVariant.objects.order_by("id")
+            .values_list("id", "stock", "product__category_id", "active")
+            .filter(product__active=True).iterator(chunk_size=50_000),
+            4,
+        )
+        # só SKUs ativos e com venda na janela
+        position, found = _align(demand.variant_ids, variant_ids)
+        keep = found & (active == 1)
+        ids, rows = variant_ids[keep], position[keep]
+        units, stock, category = demand.units[rows], stock[keep], category[keep]
+        n = len(ids)
+
+        categories, category_rows = np.unique(category, return_inverse=True)
+        season = seasonal_factors(WeeklyDemand(demand.start, ids, units), category_rows, len(categories))
+        velocity, std = velocity_and_std(units, season, demand.week_months, c.half_life_weeks)
+
+        supplier = np.full(n, -1, dtype=np.int64)
+        lead = np.full(n, c.default_lead_time, dtype=np.int64)
+        pack = np.ones(n, dtype=np.int64)
+        min_qty = np.ones(n, dtype=np.int64)
+        costs = {}
+        items = SupplierItem.objects.filter(supplier__active=True).values_list(
+            "variant_id", "supplier_id", "lead_time_days", "supplier__lead_time_days", "pack_size", "min_order_qty", "cost",
+        )
+        item_rows = []
+        for variant_id, supplier_id, item_lead, supplier_lead, item_pack, item_min, cost in items.iterator(chunk_size=50_000):
+            item_rows.append((variant_id, supplier_id, item_lead or supplier_lead, item_pack or 1, item_min or 1))
+            if cost is not None:
+                costs[variant_id] = cost
+        if item_rows:
+            item_ids, item_supplier, item_lead, item_pack, item_min = _columns(item_rows, 5)
+            at, hit = _align(ids, item_ids)
+            at = at[hit]
+            supplier[at], pack[at], min_qty[at] = item_supplier[hit], item_pack[hit], item_min[hit]
+            lead[at] = np.where(item_lead[hit] > 0, item_lead[hit], c.default_lead_time)
+
+        on_order = np.zeros(n, dtype=np.int64)
+        open_lines = (
+            PurchaseOrderLine.objects.filter(purchase_order__status=PurchaseOrder.Status.SENT)
+            .values("variant_id").annotate(units=Sum("qty")).values_list("variant_id", "units").order_by()
+        )
+        open_ids, open_units = _columns(open_lines.iterator(), 2)
+        at, hit = _align(ids, open_ids)
+        np.add.at(on_order, at[hit], open_units[hit])
+
+        # fator sazonal no meio do prazo de entrega e no meio do período de revisão
+        horizon = int(lead.max(initial=0)) + c.review_days + 1
+        month_at = np.array([(self.today + timedelta(days=d)).month - 1 for d in range(horizon)])
+        sku = np.arange(n)
+        season_lead = season[sku, month_at[lead // 2]]
+        season_review = season[sku, month_at[lead + c.review_days // 2]]
+
+        z = NormalDist().inv_cdf(c.service_level)
+        lead_demand = velocity * lead * season_lead
+        safety = z * std * np.sqrt(lead) * season_lead
+        review_demand = velocity * c.review_days * season_review
+        reorder_point = np.ceil(lead_demand + safety).astype(np.int64)
+        order_up_to = np.ceil(lead_demand + safety + review_demand).astype(np.int64)
+
+        inventory_position = stock + on_order
+        needed = np.where(
+            (inventory_position <= reorder_point) & (lead_demand + review_demand >= MIN_HORIZON_DEMAND),
+            order_up_to - inventory_position, 0,
+        ).clip(min=0)
+        suggested = np.where(needed > 0, np.maximum(-(-needed // pack) * pack, min_qty), 0)
+
+        self.result.skus = n
+        self.result.suggestions = int((suggested > 0).sum())
+        self.result.without_supplier = int(((suggested > 0) & (supplier < 0)).sum())
+        return {
+            "ids": ids, "velocity": velocity, "season": season_lead, "std": std, "lead": lead,
+            "safety": np.ceil(safety).astype(np.int64), "reorder_point": reorder_point, "order_up_to": order_up_to,
+            "on_hand": stock, "on_order": on_order, "suggested": suggested, "supplier": supplier, "costs": costs,
+        }
+
+    # ---------- gravação ----------
+
+    def store(self, plan: dict, batch_size: int = 2000):
+        now = timezone.now()
+        columns = [
+            plan[name].tolist() for name in (
+                "ids", "velocity", "season", "std", "lead", "safety", "reorder_point", "order_up_to",
+                "on_hand", "on_order", "suggested",
+            )
+        ]
+        forecasts = [
+            SkuForecast(
+                variant_id=vid, velocity=round(vel, 4), seasonal_factor=round(season, 3), demand_std=round(std, 4),
+                lead_time_days=lead, safety_stock=safety, reorder_point=rop, order_up_to=top,
+                on_hand=on_hand, on_order=on_order, suggested_qty=qty, computed_at=now,
+            )
+            for vid, vel, season, std, lead, safety, rop, top, on_hand, on_order, qty in zip(*columns)
+        ]
+
+        by_supplier: dict[int, list[PurchaseOrderLine]] = {}
+        ids, suggested, supplier = plan["ids"], plan["suggested"], plan["supplier"]
+        for index in np.flatnonzero((suggested > 0) & (supplier >= 0)).tolist():
+            vid = int(ids[index])
+            by_supplier.setdefault(int(supplier[index]), []).append(PurchaseOrderLine(
+                variant_id=vid, qty=int(suggested[index]), unit_cost=plan["costs"].get(vid),
+                on_hand=int(plan["on_hand"][index]), reorder_point=int(plan["reorder_point"][index]),
+            ))
+
+        with transaction.atomic():
+            SkuForecast.objects.bulk_create(
+                forecasts, batch_size=batch_size, update_conflicts=True, unique_fields=["variant"],
+                update_fields=[
+                    "velocity", "seasonal_factor", "demand_std", "lead_time_days", "safety_stock",
+                    "reorder_point", "order_up_to", "on_hand", "on_order", "suggested_qty", "computed_at",
+                ],
+            )
+            SkuForecast.objects.filter(computed_at__lt=now).delete()
+
+            # sugestões anteriores ainda não enviadas são substituídas pelas novas
+            PurchaseOrder.objects.filter(status=PurchaseOrder.Status.DRAFT).delete()
+            orders = []
+            for supplier_id, lines in sorted(by_supplier.items()):
+                known = [line.unit_cost * line.qty for line in lines if line.unit_cost is not None]
+                orders.append(PurchaseOrder(
+                    supplier_id=supplier_id,
+                    total_units=sum(line.qty for line in lines),
+                    total_cost=sum(known, Decimal("0.00")) if known else None,
+                    notes=f"Sugestão automática de {timezone.localdate(now):%d/%m/%Y}"
+                          + ("" if len(known) == len(lines) else " (custo incompleto)"),
+                ))
+            PurchaseOrder.objects.bulk_create(orders, batch_size=batch_size)
+            all_lines = []
+            for order, (_, lines) in zip(orders, sorted(by_supplier.items())):
+                for line in lines:
+                    line.purchase_order = order
+                all_lines.extend(lines)
+            PurchaseOrderLine.objects.bulk_create(all_lines, batch_size=batch_size)
+
+        self.result.purchase_orders = len(orders)
+        self.result.units = sum(order.total_units for order in orders)
@@ -0,0 +1,24 @@
+from django.contrib import admin
+from django.utils import timezone
+
+from apps.core.admin import LargeTableAdmin
+from .models import EmailNotification
+
+
+@admin.register(EmailNotification)
+class EmailNotificationAdmin(LargeTableAdmin):
+    list_display = ("id", "kind", "order_id", "to_email", "status", "attempts", "next_attempt_at", "sent_at")
+    list_filter = ("status", "kind")
+    date_hierarchy = "created_at"
+    ordering = ("-id",)
+    search_fields = ("order_id", "to_email")
+    search_help_text = "Busca exata por nº do pedido ou e-mail."
+    raw_id_fields = ("order",)
+    actions = ["retry_now"]
+
+    @admin.action(description="Reenviar agora")
+    def retry_now(self, request, queryset):
+        updated = queryset.exclude(status=EmailNotification.Status.SENT).update(
+            status=EmailNotification.Status.PENDING, next_attempt_at=timezone.now(), attempts=0,
+        )
+        self.message_user(request, f"{updated} notificação(ões) reagendada(s).")
@@ -0,0 +1,57 @@
+import signal
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
+
+from apps.notifications.services import Sender, claim_batch
+
+
+class Command(BaseCommand):
+    help = (
+        "Worker de e-mails: N threads, cada uma com sua conexão SMTP, enviando a fila em lotes. "
+        "Use --once para esvaziar a fila e sair (cron) ou deixe rodando (systemd/supervisor)."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--workers", type=int, default=2)
+        parser.add_argument("--batch-size", type=int, default=50)
+        parser.add_argument("--poll", type=float, default=2.0, help="Segundos de espera com a fila vazia.")
+        parser.add_argument("--once", action="store_true")
+
+    def handle(self, *args, workers, batch_size, poll, once, **options):
+        self.stop = threading.Event()
+        if threading.current_thread() is threading.main_thread():
+            signal.signal(signal.SIGTERM, lambda *_: self.stop.set())
+            signal.signal(signal.SIGINT, lambda *_: self.stop.set())
+
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="notify") as pool:
+            results = list(pool.map(lambda _: self.work(batch_size, poll, once), range(workers)))
+
+        sent = sum(r[0] for r in results)
+        failed = sum(r[1] for r in results)
+        self.stdout.write(f"{sent} e-mail(s) enviado(s), {failed} falha(s) (reagendadas ou definitivas).")
+
+    def work(self, batch_size: int, poll: float, once: bool) -> tuple[int, int]:
+        sender = Sender()
+        sent = failed = 0
+        try:
+            while not self.stop.is_set():
+                batch = claim_batch(batch_size)
+                if not batch:
+                    if once:
+                        break
+                    sender.close()  # não segura conexão SMTP ociosa
+                    self.stop.wait(poll)
+                    continue
+                ok, err = sender.process(batch)
+                sent += ok
+                failed += err
+                if once and err and not ok:
+                    break  # SMTP fora do ar: não gira em falso até o fim do backoff
+        finally:
+            sender.close()
+            close_old_connections()
+        return sent, failed
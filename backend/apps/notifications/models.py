@@ -0,0 +1,50 @@
+from django.db import models
+from django.utils import timezone
+
+from apps.orders.models import Order
+
+
+class EmailNotification(models.Model):
+    """
+    Outbox de e-mails: gravado na mesma transação da mudança de estado (signals)
+    e enviado depois pelo worker (manage.py send_notifications), fora do request.
+    """
+    class Kind(models.TextChoices):
+        ORDER_CREATED = "order_created", "Pedido recebido"
+        PIX_CREATED = "pix_created", "Pix gerado"
+        PAYMENT_PAID = "payment_paid", "Pagamento aprovado"
+        ORDER_SHIPPED = "order_shipped", "Pedido enviado"
+
+    class Status(models.TextChoices):
+        PENDING = "pending", "Pendente"
+        SENDING = "sending", "Enviando"
+        SENT = "sent", "Enviado"
+        FAILED = "failed", "Falhou"
+
+    kind = models.CharField(max_length=30, choices=Kind.choices)
+    order = models.ForeignKey(Order, on_delete=models.CASCADE, related_name="notifications")
+    to_email = models.EmailField()
+    context = models.JSONField(default=dict, blank=True)
+
+    status = models.CharField(max_length=20, choices=Status.choices, default=Status.PENDING)
+    attempts = models.PositiveSmallIntegerField(default=0)
+    next_attempt_at = models.DateTimeField(default=timezone.now)
+    # lote que reivindicou a linha e até quando (worker que morreu libera a linha depois disso)
+    claim_token = models.CharField(max_length=32, blank=True, default="")
+    locked_until = models.DateTimeField(null=True, blank=True)
+    last_error = models.TextField(blank=True, default="")
+
+    created_at = models.DateTimeField(auto_now_add=True)
+    sent_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["status", "next_attempt_at"], name="notification_queue_idx"),
+        ]
+        constraints = [
+            # mesmo evento do mesmo pedido = um e-mail (signals podem disparar mais de uma vez)
+            models.UniqueConstraint(fields=["order", "kind"], name="uniq_notification_order_kind"),
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.kind} order={self.order_id} {self.status}"
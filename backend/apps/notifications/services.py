@@ -0,0 +1,181 @@
+"""
+Fila de e-mails transacionais (outbox em EmailNotification).
+
+enqueue() só grava a linha (rápido, dentro da transação de quem chamou).
+O worker reivindica lotes com UPDATE condicional (funciona em SQLite e PostgreSQL),
+renderiza com templates compilados em cache e envia numa conexão SMTP reaproveitada
+entre mensagens e lotes. Falha = retry com backoff exponencial + jitter até NOTIFICATIONS_MAX_ATTEMPTS.
+"""
+import logging
+import random
+import smtplib
+import uuid
+from datetime import timedelta
+from functools import lru_cache
+
+from django.conf import settings
+from django.core.mail import EmailMultiAlternatives, get_connection
+from django.db.models import Q
+from django.template.loader import get_template
+from django.utils import timezone
+
+from .models import EmailNotification
+
+logger = logging.getLogger(__name__)
+
+SUBJECTS = {
+    EmailNotification.Kind.ORDER_CREATED: "Recebemos seu pedido #{order_id}",
+    EmailNotification.Kind.PIX_CREATED: "Pix do pedido #{order_id}",
+    EmailNotification.Kind.PAYMENT_PAID: "Pagamento aprovado - pedido #{order_id}",
+    EmailNotification.Kind.ORDER_SHIPPED: "Seu pedido #{order_id} foi enviado",
+}
+CONNECTION_ERRORS = (smtplib.SMTPServerDisconnected, smtplib.SMTPConnectError, ConnectionError, TimeoutError)
+
+
+def order_context(order) -> dict:
+    return {
+        "order_id": order.id,
+        "full_name": order.full_name,
+        "total": str(order.total),
+        "shipping_method": order.shipping_method,
+        "shipping_days": order.shipping_days,
+    }
+
+
+def enqueue(order, kind: str, **extra) -> None:
+    """Idempotente: o par (pedido, tipo) só entra uma vez na fila."""
+    if not order.email:
+        return
+    EmailNotification.objects.bulk_create(
+        [EmailNotification(order=order, kind=kind, to_email=order.email, context={**order_context(order), **extra})],
+        ignore_conflicts=True,
+    )
+
+
+def enqueue_many(orders, kind: str) -> None:
+    """enqueue() de vários pedidos num INSERT só (lotes da ingestão de pedidos)."""
+    EmailNotification.objects.bulk_create(
+        [
+            EmailNotification(order=order, kind=kind, to_email=order.email, context=order_context(order))
+            for order in orders if order.email
+        ],
+        ignore_conflicts=True,
+    )
+
+
+# ---------- renderização ----------
+
+@lru_cache(maxsize=None)
+def _templates(kind: str):
+    """Template compilado uma vez por processo (o loader do Django recompila com DEBUG=True)."""
+    return get_template(f"notifications/{kind}.txt"), get_template(f"notifications/{kind}.html")
+
+
+def render(notification: EmailNotification) -> EmailMultiAlternatives:
+    text_tpl, html_tpl = _templates(notification.kind)
+    context = {**notification.context, "site_url": settings.SITE_URL.rstrip("/")}
+    message = EmailMultiAlternatives(
+        subject=SUBJECTS[notification.kind].format(**notification.context),
+        body=text_tpl.render(context),
+        from_email=settings.DEFAULT_FROM_EMAIL,
+        to=[notification.to_email],
+    )
+    message.attach_alternative(html_tpl.render(context), "text/html")
+    return message
+
+
+# ---------- fila ----------
+
+def claim_batch(batch_size: int) -> list[EmailNotification]:
+    now = timezone.now()
+    token = uuid.uuid4().hex
+    ready = Q(status=EmailNotification.Status.PENDING, next_attempt_at__lte=now) | Q(
+        status=EmailNotification.Status.SENDING, locked_until__lt=now,
+    )
+    ids = list(EmailNotification.objects.filter(ready).order_by("id").values_list("id", flat=True)[:batch_size])
+    if not ids:
+        return []
+    # UPDATE condicional: se outro worker pegou a linha antes, ela não entra neste lote
+    EmailNotification.objects.filter(ready, id__in=ids).update(
+        status=EmailNotification.Status.SENDING,
+        claim_token=token,
+        locked_until=now + timedelta(seconds=settings.NOTIFICATIONS_LOCK_SECONDS),
+    )
+    return list(EmailNotification.objects.filter(claim_token=token, status=EmailNotification.Status.SENDING))
+
+
+def backoff_seconds(attempts: int) -> float:
+    base = settings.NOTIFICATIONS_BACKOFF_BASE
+    delay = min(base * (2 ** (attempts - 1)), settings.NOTIFICATIONS_BACKOFF_MAX)
+    return delay * random.uniform(0.8, 1.2)
+
+
+class Sender:
+    """Uma conexão SMTP por worker, aberta sob demanda e reaproveitada entre lotes."""
+
+    def __init__(self, connection=None):
+        self.connection = connection or get_connection(fail_silently=False)
+        self._open = False
+
+    def _ensure_open(self):
+        if not self._open:
+            self.connection.open()
+            self._open = True
+
+    def _reset(self):
+        try:
+            self.connection.close()
+        except Exception:
+            pass
+        self._open = False
+
+    def close(self):
+        if self._open:
+            self._reset()
+
+    def send(self, message) -> None:
+        self._ensure_open()
+        try:
+            self.connection.send_messages([message])
+        except CONNECTION_ERRORS:
+            # servidor derrubou a conexão ociosa: reabre e tenta uma vez
+            self._reset()
+            self._ensure_open()
+            self.connection.send_messages([message])
+
+    def process(self, batch: list[EmailNotification]) -> tuple[int, int]:
+        sent, failed = [], []
+        now = timezone.now()
+        for notification in batch:
+            try:
+                self.send(render(notification))
+            except Exception as exc:
+                notification.attempts += 1
+                notification.last_error = f"{type(exc).__name__}: {exc}"[:2000]
+                if notification.attempts >= settings.NOTIFICATIONS_MAX_ATTEMPTS:
+                    notification.status = EmailNotification.Status.FAILED
+                    logger.error("notificação %s falhou definitivamente: %s", notification.id, notification.last_error)
+                else:
+                    notification.status = EmailNotification.Status.PENDING
+                    notification.next_attempt_at = now + timedelta(seconds=backoff_seconds(notification.attempts))
+                if isinstance(exc, CONNECTION_ERRORS):
+                    self._reset()
+                failed.append(notification)
+            else:
+                notification.status = EmailNotification.Status.SENT
+                notification.sent_at = timezone.now()
+                notification.attempts += 1
+                notification.last_error = ""
+                sent.append(notification)
+            notification.claim_token = ""
+            notification.locked_until = None
+
+        if sent:
+            EmailNotification.objects.bulk_update(
+                sent, ["status", "sent_at", "attempts", "last_error", "claim_token", "locked_until"],
+            )
+        if failed:
+            EmailNotification.objects.bulk_update(
+                failed, ["status", "attempts", "last_error", "next_attempt_at", "claim_token", "locked_until"],
+            )
+        return len(sent), len(failed)
@@ -0,0 +1,56 @@
+"""
+Enfileira e-mails nas mudanças de estado de Order/Payment.
+O estado carregado do banco fica em _initial_* (post_init), então detectar a transição não custa query.
+"""
+from django.db import transaction
+from django.db.models.signals import post_init, post_save
+from django.dispatch import receiver
+
+from apps.orders.models import Order
+from apps.orders.signals import orders_ingested
+from apps.payments.models import Payment
+from .models import EmailNotification
+from .services import enqueue, enqueue_many
+
+ORDER_STATUS_EMAILS = {
+    Order.Status.PAID: EmailNotification.Kind.PAYMENT_PAID,
+    Order.Status.SHIPPED: EmailNotification.Kind.ORDER_SHIPPED,
+}
+
+
+@receiver(post_init, sender=Order, dispatch_uid="notifications_order_init")
+def remember_order_status(sender, instance, **kwargs):
+    instance._initial_status = instance.__dict__.get("status")
+
+
+@receiver(post_save, sender=Order, dispatch_uid="notifications_order_saved")
+def order_saved(sender, instance, created, **kwargs):
+    if created:
+        # o checkout cria o pedido antes dos itens/totais: enfileira no commit com os valores finais
+        transaction.on_commit(lambda: enqueue(instance, EmailNotification.Kind.ORDER_CREATED))
+    elif instance.status != instance._initial_status and instance.status in ORDER_STATUS_EMAILS:
+        enqueue(instance, ORDER_STATUS_EMAILS[instance.status])
+    instance._initial_status = instance.status
+
+
+@receiver(orders_ingested, sender=Order, dispatch_uid="notifications_orders_ingested")
+def orders_ingested_emails(sender, orders, **kwargs):
+    # lote já com itens e totais finais, dentro da transação do lote
+    enqueue_many(orders, EmailNotification.Kind.ORDER_CREATED)
+
+
+@receiver(post_init, sender=Payment, dispatch_uid="notifications_payment_init")
+def remember_payment_qr(sender, instance, **kwargs):
+    instance._initial_qr = instance.__dict__.get("pix_qr_code")
+
+
+@receiver(post_save, sender=Payment, dispatch_uid="notifications_payment_saved")
+def payment_saved(sender, instance, **kwargs):
+    if instance.method == Payment.Method.PIX and instance.pix_qr_code and not instance._initial_qr:
+        enqueue(
+            instance.order,
+            EmailNotification.Kind.PIX_CREATED,
+            pix_qr_code=instance.pix_qr_code,
+            pix_expires_at=instance.pix_expires_at.isoformat() if instance.pix_expires_at else "",
+        )
+    instance._initial_qr = instance.pix_qr_code
@@ -0,0 +1,51 @@
+from django.contrib import admin
+
+from apps.core.admin import LargeTableAdmin
+from .models import CustomerSummary, Order, OrderItem
+
+
+class OrderItemInline(admin.TabularInline):
+    model = OrderItem
+    extra = 0
+    fields = ("product_id", "variant_id", "sku", "name", "price", "qty")
+
+
+@admin.register(Order)
+class OrderAdmin(LargeTableAdmin):
+    list_display = ("id", "full_name", "email", "status", "total", "coupon_code", "created_at")
+    list_filter = ("status",)
+    date_hierarchy = "created_at"
+    ordering = ("-id",)
+    search_fields = ("id", "email", "coupon_code")
+    search_help_text = "Busca exata por nº do pedido, e-mail ou cupom."
+    raw_id_fields = ("user",)
+    readonly_fields = ("created_at", "updated_at")
+    inlines = [OrderItemInline]
+
+
+@admin.register(OrderItem)
+class OrderItemAdmin(LargeTableAdmin):
+    # order_id em vez de order: o changelist não precisa de JOIN nem de Order.__str__
+    list_display = ("id", "order_id", "product_id", "variant_id", "sku", "name", "price", "qty")
+    ordering = ("-id",)
+    search_fields = ("order_id", "product_id", "sku")
+    search_help_text = "Busca exata por nº do pedido, id do produto ou SKU."
+    raw_id_fields = ("order",)
+
+
+@admin.register(CustomerSummary)
+class CustomerSummaryAdmin(LargeTableAdmin):
+    """Somente leitura: mantido pelos pedidos; manage.py rebuild_customer_summaries corrige."""
+    list_display = (
+        "id", "user_id", "email", "order_count", "paid_count", "lifetime_spend",
+        "first_order_at", "last_order_at", "preferred_state",
+    )
+    ordering = ("-id",)
+    search_fields = ("user_id", "email")
+    search_help_text = "Busca exata por id do usuário ou e-mail (guest)."
+
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
@@ -0,0 +1,212 @@
+"""
+Resumo por cliente (CustomerSummary), mantido incrementalmente.
+
+Chave: pedido com usuário -> linha do usuário; guest -> linha do e-mail normalizado.
+Cada evento aplica só o delta na linha do cliente (nada de varrer os pedidos dele):
+- criação do pedido: +1 pedido, datas, UF de entrega (e gasto, se já nasce pago);
+- mudança de status para dentro/fora de SOLD_STATUSES: ± pedido pago e ± total;
+- claim de pedidos guest: a linha do e-mail é somada à do usuário;
+- lote da ingestão em lote (sinal orders_ingested): os mesmos deltas, uma linha por cliente.
+
+Caminhos que não passam por save() (bulk_create, queryset.update, exclusão de usuário)
+não atualizam o resumo: manage.py rebuild_customer_summaries recalcula e corrige.
+"""
+from decimal import Decimal
+
+from django.db import transaction
+from django.db.models import Count, DecimalField, Max, Min, Q, Sum, Value
+from django.db.models.functions import Coalesce, Lower, Trim
+
+from .models import SOLD_STATUSES, CustomerSummary, Order
+
+
+def normalize_email(email: str) -> str:
+    return (email or "").strip().lower()
+
+
+def preferred_state(state_counts: dict) -> str:
+    """UF com mais pedidos; empate -> ordem alfabética (mesma regra no rebuild)."""
+    if not state_counts:
+        return ""
+    return min(state_counts.items(), key=lambda item: (-item[1], item[0]))[0]
+
+
+def _summary_key(order: Order) -> dict:
+    if order.user_id:
+        return {"user_id": order.user_id}
+    return {"user__isnull": True, "email": normalize_email(order.email)}
+
+
+def _locked_summary(key: dict) -> CustomerSummary:
+    defaults = {} if "user_id" in key else {"email": key["email"]}
+    summary, _ = CustomerSummary.objects.select_for_update().get_or_create(**key, defaults=defaults)
+    return summary
+
+
+def _apply(summary: CustomerSummary, *, orders=0, sold=0, spend=Decimal("0.00"), first=None, last=None, states=None):
+    summary.order_count += orders
+    summary.paid_count += sold
+    summary.lifetime_spend += spend
+    if first and (summary.first_order_at is None or first < summary.first_order_at):
+        summary.first_order_at = first
+    if last and (summary.last_order_at is None or last > summary.last_order_at):
+        summary.last_order_at = last
+    if states:
+        counts = dict(summary.state_counts)
+        for state, count in states.items():
+            counts[state] = counts.get(state, 0) + count
+        summary.state_counts = counts
+        summary.preferred_state = preferred_state(counts)
+
+
+def order_created(order: Order):
+    sold = order.status in SOLD_STATUSES
+    with transaction.atomic():
+        summary = _locked_summary(_summary_key(order))
+        _apply(
+            summary, orders=1, sold=int(sold), spend=order.total if sold else Decimal("0.00"),
+            first=order.created_at, last=order.created_at,
+            states={order.shipping_state: 1} if order.shipping_state else None,
+        )
+        summary.save()
+
+
+def orders_created(orders: list[Order]):
+    """Lote de pedidos novos (ingestão em lote): uma atualização por cliente, não por pedido."""
+    grouped: dict[tuple, dict] = {}
+    for order in orders:
+        key = _summary_key(order)
+        acc = grouped.setdefault(tuple(sorted(key.items())), {
+            "key": key, "orders": 0, "sold": 0, "spend": Decimal("0.00"), "first": None, "last": None, "states": {},
+        })
+        sold = order.status in SOLD_STATUSES
+        acc["orders"] += 1
+        acc["sold"] += int(sold)
+        acc["spend"] += order.total if sold else Decimal("0.00")
+        acc["first"] = min(filter(None, (acc["first"], order.created_at)), default=None)
+        acc["last"] = max(filter(None, (acc["last"], order.created_at)), default=None)
+        if order.shipping_state:
+            acc["states"][order.shipping_state] = acc["states"].get(order.shipping_state, 0) + 1
+    with transaction.atomic():
+        for acc in grouped.values():
+            summary = _locked_summary(acc["key"])
+            _apply(
+                summary, orders=acc["orders"], sold=acc["sold"], spend=acc["spend"],
+                first=acc["first"], last=acc["last"], states=acc["states"] or None,
+            )
+            summary.save()
+
+
+def order_status_changed(order: Order, previous_status: str):
+    was_sold, is_sold = previous_status in SOLD_STATUSES, order.status in SOLD_STATUSES
+    if was_sold == is_sold:
+        return
+    sign = 1 if is_sold else -1
+    with transaction.atomic():
+        summary = _locked_summary(_summary_key(order))
+        _apply(summary, sold=sign, spend=sign * order.total)
+        summary.save()
+
+
+def merge_guest_summary(user, email: str):
+    """Claim: soma a linha guest do e-mail na linha do usuário e remove a linha guest."""
+    with transaction.atomic():
+        guest = CustomerSummary.objects.select_for_update().filter(
+            user__isnull=True, email=normalize_email(email),
+        ).first()
+        if guest is None:
+            return
+        summary = _locked_summary({"user_id": user.pk})
+        _apply(
+            summary, orders=guest.order_count, sold=guest.paid_count, spend=guest.lifetime_spend,
+            first=guest.first_order_at, last=guest.last_order_at, states=guest.state_counts,
+        )
+        summary.save()
+        guest.delete()
+
+
+# ---------- rebuild / conferência ----------
+
+SUMMARY_FIELDS = ("order_count", "paid_count", "lifetime_spend", "first_order_at", "last_order_at", "state_counts")
+
+
+def compute_summaries() -> dict:
+    """{("user", id) | ("email", e-mail): {campo: valor}} calculado direto dos pedidos (4 GROUP BY)."""
+    sold = Q(status__in=SOLD_STATUSES)
+    aggregates = {
+        "order_count": Count("id"),
+        "paid_count": Count("id", filter=sold),
+        "lifetime_spend": Coalesce(
+            Sum("total", filter=sold), Value(Decimal("0.00")), output_field=DecimalField(max_digits=12, decimal_places=2),
+        ),
+        "first_order_at": Min("created_at"),
+        "last_order_at": Max("created_at"),
+    }
+    users = Order.objects.filter(user__isnull=False)
+    guests = Order.objects.filter(user__isnull=True).annotate(key=Lower(Trim("email")))
+
+    result = {}
+    for kind, qs in (("user", users.values("user_id")), ("email", guests.values("key"))):
+        for row in qs.annotate(**aggregates).order_by().iterator(chunk_size=10_000):
+            key = row.pop("user_id" if kind == "user" else "key")
+            result[(kind, key)] = {**row, "state_counts": {}}
+
+    by_state = [
+        ("user", users.exclude(shipping_state="").values_list("user_id", "shipping_state")),
+        ("email", guests.exclude(shipping_state="").values_list("key", "shipping_state")),
+    ]
+    for kind, qs in by_state:
+        for key, state, count in qs.annotate(n=Count("id")).order_by().iterator(chunk_size=10_000):
+            result[(kind, key)]["state_counts"][state] = count
+    return result
+
+
+def summary_key(summary: CustomerSummary) -> tuple:
+    return ("user", summary.user_id) if summary.user_id else ("email", summary.email)
+
+
+def rebuild_summaries(*, fix: bool = True, batch_size: int = 2000) -> dict:
+    """
+    Compara a tabela com o cálculo a partir dos pedidos. fix=True apaga as linhas divergentes/sobrando
+    e recria as corretas (linhas certas não são tocadas). Retorna contagens e amostras das diferenças.
+    """
+    expected = compute_summaries()
+    wrong_ids, missing, samples = [], set(expected), []
+    stats = {"customers": len(expected), "ok": 0, "wrong": 0, "missing": 0, "extra": 0}
+
+    for summary in CustomerSummary.objects.only("id", "user_id", "email", *SUMMARY_FIELDS).iterator(chunk_size=10_000):
+        key = summary_key(summary)
+        values = expected.get(key)
+        if values is None:
+            stats["extra"] += 1
+            wrong_ids.append(summary.id)
+            continue
+        missing.discard(key)
+        diff = {
+            name: (getattr(summary, name), values[name])
+            for name in SUMMARY_FIELDS if getattr(summary, name) != values[name]
+        }
+        if diff:
+            stats["wrong"] += 1
+            wrong_ids.append(summary.id)
+            missing.add(key)
+            if len(samples) < 20:
+                samples.append((key, diff))
+        else:
+            stats["ok"] += 1
+    stats["missing"] = len(missing) - stats["wrong"]
+
+    if fix and (wrong_ids or missing):
+        rows = []
+        for kind, key in missing:
+            values = expected[(kind, key)]
+            rows.append(CustomerSummary(
+                user_id=key if kind == "user" else None, email=key if kind == "email" else "",
+                preferred_state=preferred_state(values["state_counts"]), **values,
+            ))
+        with transaction.atomic():
+            for start in range(0, len(wrong_ids), batch_size):
+                CustomerSummary.objects.filter(id__in=wrong_ids[start:start + batch_size]).delete()
+            CustomerSummary.objects.bulk_create(rows, batch_size=batch_size)
+    stats["samples"] = samples
+    return stats
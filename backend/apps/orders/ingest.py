@@ -0,0 +1,481 @@
+"""
+Ingestão de pedidos em alto volume (opt-in: ORDERS_INGEST_ENABLED), para picos como flash sales.
+
+No caminho normal cada checkout é uma transação própria (um commit/fsync por pedido). Aqui o checkout:
+1. valida e precifica como sempre (CheckoutCreateSerializer.ingest_record, sem escrita no banco);
+2. recebe um id de um bloco pré-alocado na sequência de Order (uma transação a cada
+   ORDERS_INGEST_ID_BLOCK pedidos; o autoincremento normal pula os ids reservados);
+3. grava o pedido no journal (append-only, fsync em grupo: um fsync cobre todos os checkouts
+   que chegaram juntos) e responde 201 com o id definitivo;
+4. o GroupCommitWriter grava até ORDERS_INGEST_BATCH_SIZE pedidos por transação (bulk_create),
+   juntando o que chegou em ORDERS_INGEST_FLUSH_MS.
+
+Crash entre 3 e 4: o pedido está no journal. Cada processo trava (flock) os próprios segmentos;
+segmentos sem dono (processo morto) são reaplicados na partida do writer ou por
+manage.py replay_order_journal. O id vem no registro, então reaplicar é idempotente.
+
+Pedido aceito e ainda não gravado: get_order()/wait_written() esperam o writer (até
+ORDERS_INGEST_READ_WAIT) em vez de 404 (ex.: pagamento criado logo depois do checkout). Só espera
+quem tem o pedido na própria fila; id desconhecido (apagado, buraco de bloco) é 404 na hora.
+Fila cheia, promoção com limite de uso ou journal com erro: o checkout segue pelo caminho normal.
+Registro que o banco não aceita (dado inválido) vai para rejected.log e não trava a fila.
+Ids reservados e não usados (processo reiniciado) viram buracos na numeração.
+"""
+import atexit
+import fcntl
+import json
+import logging
+import os
+import queue
+import threading
+import time
+import zlib
+from collections import Counter
+from functools import lru_cache
+from pathlib import Path
+
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.db import InterfaceError, OperationalError, connection, transaction
+from django.db.models import Case, DateTimeField, F, Value, When
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+
+from apps.core.metrics import orders_ingest_batch_seconds, orders_ingest_fallback_total
+from apps.promotions.models import Promotion, PromotionRedemption
+from .models import Order, OrderItem
+from .signals import orders_ingested
+
+logger = logging.getLogger("apps.orders.ingest")
+
+
+def enabled() -> bool:
+    return getattr(settings, "ORDERS_INGEST_ENABLED", False)
+
+
+# ---------- ids ----------
+
+def reserve_ids(count: int) -> list[int]:
+    """Reserva `count` ids na sequência de Order (PostgreSQL: nextval; SQLite: sqlite_sequence)."""
+    table = Order._meta.db_table
+    with transaction.atomic(), connection.cursor() as cursor:
+        if connection.vendor == "postgresql":
+            cursor.execute("SELECT nextval(pg_get_serial_sequence(%s, 'id')) FROM generate_series(1, %s)", [table, count])
+            return [row[0] for row in cursor.fetchall()]
+        if connection.vendor == "sqlite":
+            # AUTOINCREMENT usa max(seq, maior id) + 1: subir seq reserva o intervalo
+            cursor.execute(
+                "INSERT INTO sqlite_sequence (name, seq) SELECT %s, 0 "
+                "WHERE NOT EXISTS (SELECT 1 FROM sqlite_sequence WHERE name = %s)", [table, table],
+            )
+            cursor.execute(
+                f'UPDATE sqlite_sequence SET seq = MAX(seq, (SELECT COALESCE(MAX(id), 0) FROM "{table}")) + %s '
+                "WHERE name = %s", [count, table],
+            )
+            cursor.execute("SELECT seq FROM sqlite_sequence WHERE name = %s", [table])
+            last = cursor.fetchone()[0]
+            return list(range(last - count + 1, last + 1))
+    raise ImproperlyConfigured(f"ORDERS_INGEST_ENABLED não suporta o banco {connection.vendor!r}.")
+
+
+class IdAllocator:
+    def __init__(self, block: int):
+        self.block = block
+        self._ids: list[int] = []
+        self._lock = threading.Lock()
+
+    def take(self) -> int:
+        with self._lock:
+            if not self._ids:
+                self._ids = reserve_ids(self.block)[::-1]
+            return self._ids.pop()
+
+
+# ---------- registro <-> modelos ----------
+
+def encode(record: dict) -> bytes:
+    """Uma linha do journal: crc32 + JSON (Decimal vira string)."""
+    payload = json.dumps(record, default=str, separators=(",", ":")).encode()
+    return b"%08x %s\n" % (zlib.crc32(payload), payload)
+
+
+def _fields(model, data: dict) -> dict:
+    return {name: model._meta.get_field(name).to_python(value) for name, value in data.items()}
+
+
+def decode(record: dict) -> tuple[Order, list[OrderItem]]:
+    order = Order(id=record["id"], **_fields(Order, record["order"]))
+    order.created_at = parse_datetime(record["accepted_at"])
+    items = [OrderItem(order=order, **_fields(OrderItem, item)) for item in record["items"]]
+    return order, items
+
+
+def write_batch(records: list[dict]) -> list[Order]:
+    """Grava os pedidos numa transação só (pedidos, itens, promoções e o sinal orders_ingested)."""
+    orders, items, redemptions, usage = [], [], [], Counter()
+    for record in records:
+        order, order_items = decode(record)
+        orders.append(order)
+        items.extend(order_items)
+        for promotion_id, amount in record["redemptions"]:
+            redemptions.append(PromotionRedemption(promotion_id=promotion_id, order_id=order.id, amount=amount))
+            usage[promotion_id] += 1
+
+    accepted = {order.id: order.created_at for order in orders}
+    with transaction.atomic():
+        Order.objects.bulk_create(orders)
+        # auto_now_add sobrescreve created_at no INSERT: volta para a hora do checkout
+        Order.objects.filter(id__in=accepted).update(created_at=Case(
+            *(When(id=order_id, then=Value(at)) for order_id, at in accepted.items()), output_field=DateTimeField(),
+        ))
+        for order in orders:
+            order.created_at = accepted[order.id]
+        OrderItem.objects.bulk_create(items)
+        PromotionRedemption.objects.bulk_create(redemptions)
+        for promotion_id, count in usage.items():
+            Promotion.objects.filter(id=promotion_id).update(usage_count=F("usage_count") + count)
+        orders_ingested.send(sender=Order, orders=orders)
+    return orders
+
+
+def write_missing(records: list[dict], batch_size: int = 500) -> int:
+    """Grava os registros cujo id ainda não está no banco (replay idempotente)."""
+    written = 0
+    for start in range(0, len(records), batch_size):
+        chunk = records[start:start + batch_size]
+        existing = set(Order.objects.filter(id__in=[r["id"] for r in chunk]).values_list("id", flat=True))
+        missing = [r for r in chunk if r["id"] not in existing]
+        if missing:
+            write_batch(missing)
+            written += len(missing)
+    return written
+
+
+# ---------- journal ----------
+
+class JournalError(Exception):
+    pass
+
+
+class Segment:
+    def __init__(self, path: Path):
+        self.path = path
+        self.fh = open(path, "ab")
+        fcntl.flock(self.fh, fcntl.LOCK_EX | fcntl.LOCK_NB)  # dono vivo: recover() não mexe
+        self.size = 0
+        self.outstanding = 0  # registros ainda não gravados no banco
+        self.closed = False
+
+
+def _fsync_dir(directory: Path):
+    fd = os.open(directory, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+class Journal:
+    """
+    Append-only em segmentos de até ORDERS_INGEST_SEGMENT_BYTES, fsync em grupo: o primeiro thread
+    escreve e faz fsync do lote; quem chega enquanto isso espera e entra no lote seguinte.
+    Segmento fechado e sem registros pendentes é apagado.
+    """
+
+    def __init__(self, directory, segment_bytes: int = 16 * 1024 * 1024):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.segment_bytes = segment_bytes
+        self._cond = threading.Condition()
+        self._buffer: list[tuple[int, bytes]] = []
+        self._tickets = 0   # registros aceitos
+        self._durable = 0   # registros com fsync feito
+        self._flushing = False
+        self._error = None
+        self._segment_of: dict[int, Segment] = {}
+        self._current = self._new_segment()
+
+    def _new_segment(self) -> Segment:
+        segment = Segment(self.directory / f"orders-{os.getpid()}-{time.time_ns()}.log")
+        _fsync_dir(self.directory)
+        return segment
+
+    def append(self, line: bytes) -> Segment:
+        """Volta só depois do fsync. Devolve o segmento (para release() após o commit no banco)."""
+        with self._cond:
+            self._tickets += 1
+            ticket = self._tickets
+            self._buffer.append((ticket, line))
+            while self._durable < ticket:
+                if self._error is not None:
+                    raise JournalError("journal de pedidos indisponível") from self._error
+                if self._flushing:
+                    self._cond.wait()
+                    continue
+                batch, self._buffer = self._buffer, []
+                segment, error = self._current, None
+                self._flushing = True
+                self._cond.release()
+                try:
+                    data = b"".join(line for _, line in batch)
+                    segment.fh.write(data)
+                    segment.fh.flush()
+                    os.fsync(segment.fh.fileno())
+                except OSError as exc:
+                    error = exc
+                finally:
+                    self._cond.acquire()
+                    self._flushing = False
+                if error is None:
+                    segment.size += len(data)
+                    segment.outstanding += len(batch)
+                    self._segment_of.update((t, segment) for t, _ in batch)
+                    self._durable = batch[-1][0]
+                    if segment.size >= self.segment_bytes:
+                        segment.closed = True
+                        self._current = self._new_segment()
+                else:
+                    self._error = error
+                self._cond.notify_all()
+            return self._segment_of.pop(ticket)
+
+    def release(self, segments: list[Segment]):
+        with self._cond:
+            for segment in segments:
+                segment.outstanding -= 1
+                if segment.closed and segment.outstanding == 0:
+                    self._drop(segment)
+
+    def close(self):
+        with self._cond:
+            self._current.closed = True
+            if self._current.outstanding == 0:
+                self._drop(self._current)
+
+    @staticmethod
+    def _drop(segment: Segment):
+        segment.path.unlink(missing_ok=True)  # apaga antes de soltar o lock
+        segment.fh.close()
+
+
+def read_segment(path) -> tuple[list[dict], bool]:
+    """Registros íntegros do segmento; False se o fim estava cortado (crash no meio da escrita)."""
+    records = []
+    with open(path, "rb") as fh:
+        for line in fh:
+            crc, _, payload = line.rstrip(b"\n").partition(b" ")
+            try:
+                valid = line.endswith(b"\n") and int(crc, 16) == zlib.crc32(payload)
+            except ValueError:
+                valid = False
+            if not valid:
+                return records, False
+            records.append(json.loads(payload))
+    return records, True
+
+
+def recover(directory=None, batch_size: int = 500) -> tuple[int, int]:
+    """Reaplica os segmentos sem dono (processo morto). Devolve (segmentos, pedidos gravados)."""
+    directory = Path(directory or settings.ORDERS_INGEST_JOURNAL_DIR)
+    segments = written = 0
+    for path in sorted(directory.glob("orders-*.log")):
+        try:
+            fh = open(path, "rb")
+        except FileNotFoundError:
+            continue
+        with fh:
+            try:
+                fcntl.flock(fh, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except BlockingIOError:
+                continue  # segmento de um processo vivo
+            records, complete = read_segment(path)
+            if not complete:
+                logger.warning("journal %s: fim cortado, %d registro(s) íntegros reaplicados", path.name, len(records))
+            written += write_missing(records, batch_size)
+            path.unlink(missing_ok=True)
+            segments += 1
+    return segments, written
+
+
+# ---------- writer ----------
+
+# falhas do banco em si (não do registro): o lote é tentado de novo em vez de rejeitado
+TRANSIENT_ERRORS = (OperationalError, InterfaceError)
+
+
+class GroupCommitWriter:
+    def __init__(self, journal: Journal, batch_size: int = 500, flush_seconds: float = 0.02, max_queue: int = 20_000):
+        self.journal = journal
+        self.batch_size = batch_size
+        self.flush_seconds = flush_seconds
+        self.queue: queue.Queue = queue.Queue(maxsize=max_queue)
+        self._pending: dict[int, threading.Event] = {}
+        self._lock = threading.Lock()
+        self._thread = None
+
+    def start(self):
+        self._thread = threading.Thread(target=self._run, name="orders-ingest", daemon=True)
+        self._thread.start()
+
+    def has_room(self) -> bool:
+        return self.queue.qsize() < self.queue.maxsize
+
+    def put(self, record: dict, segment: Segment):
+        with self._lock:
+            self._pending[record["id"]] = threading.Event()
+        self.queue.put((record, segment))
+
+    def pending_event(self, order_id: int) -> threading.Event | None:
+        with self._lock:
+            return self._pending.get(order_id)
+
+    def _run(self):
+        try:
+            recovered = recover(self.journal.directory, self.batch_size)
+            if recovered[0]:
+                logger.warning("journal: %d segmento(s) órfão(s) reaplicados, %d pedido(s) gravados", *recovered)
+        except Exception:
+            logger.exception("falha ao reaplicar o journal de pedidos")
+        while True:
+            batch = [self.queue.get()]
+            deadline = time.monotonic() + self.flush_seconds
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self.queue.get(timeout=max(0.0, deadline - time.monotonic())))
+                except queue.Empty:
+                    break
+            self.commit(batch)
+
+    def drain(self):
+        """No encerramento do processo: grava o que sobrou na fila (o resto fica para o replay)."""
+        batch = []
+        while True:
+            try:
+                batch.append(self.queue.get_nowait())
+            except queue.Empty:
+                break
+        if batch:
+            self.commit(batch, retries=1)
+
+    def commit(self, batch: list, retries: int | None = None):
+        records = [record for record, _ in batch]
+        delay, attempt = 0.05, 0
+        while True:
+            started = time.perf_counter()
+            try:
+                try:
+                    # nova tentativa: parte do lote pode ter entrado antes da falha
+                    write_missing(records, len(records)) if attempt else write_batch(records)
+                except TRANSIENT_ERRORS:
+                    raise
+                except Exception:
+                    # algum registro o banco não aceita (integridade, dado inválido): um a um
+                    self._commit_one_by_one(records)
+                orders_ingest_batch_seconds.observe(time.perf_counter() - started)
+                break
+            except TRANSIENT_ERRORS:
+                # banco fora / conexão caiu: o mesmo lote de novo, com backoff
+                attempt += 1
+                logger.exception("falha ao gravar lote de %d pedido(s) (tentativa %d)", len(records), attempt)
+                connection.close()
+                if retries is not None and attempt >= retries:
+                    return  # continua no journal
+                time.sleep(delay)
+                delay = min(delay * 2, 5.0)
+        self.journal.release([segment for _, segment in batch])
+        with self._lock:
+            for record in records:
+                event = self._pending.pop(record["id"], None)
+                if event:
+                    event.set()
+
+    def _commit_one_by_one(self, records: list[dict]):
+        for record in records:
+            try:
+                write_missing([record])
+            except TRANSIENT_ERRORS:
+                raise
+            except Exception:
+                # não tem como gravar: guarda para análise e segue (não trava a fila)
+                logger.exception("pedido %s rejeitado na gravação", record.get("id"))
+                with open(self.journal.directory / "rejected.log", "ab") as fh:
+                    fh.write(encode(record))
+
+
+class Ingestor:
+    def __init__(self):
+        self.allocator = IdAllocator(settings.ORDERS_INGEST_ID_BLOCK)
+        self.journal = Journal(settings.ORDERS_INGEST_JOURNAL_DIR, settings.ORDERS_INGEST_SEGMENT_BYTES)
+        self.writer = GroupCommitWriter(
+            self.journal,
+            batch_size=settings.ORDERS_INGEST_BATCH_SIZE,
+            flush_seconds=settings.ORDERS_INGEST_FLUSH_MS / 1000,
+            max_queue=settings.ORDERS_INGEST_QUEUE,
+        )
+
+    def accept(self, record: dict) -> Segment:
+        record["id"] = self.allocator.take()
+        record["accepted_at"] = timezone.now().isoformat()
+        return self.journal.append(encode(record))
+
+    def shutdown(self):
+        self.writer.drain()
+        self.journal.close()
+
+
+@lru_cache(maxsize=None)
+def get_ingestor() -> Ingestor:
+    ingestor = Ingestor()
+    ingestor.writer.start()
+    atexit.register(ingestor.shutdown)
+    return ingestor
+
+
+def submit(serializer, *, ingestor: Ingestor | None = None) -> Order | None:
+    """Checkout pela ingestão em lote. None = seguir pelo caminho normal (serializer.save())."""
+    ingestor = ingestor or get_ingestor()
+    if not ingestor.writer.has_room():
+        orders_ingest_fallback_total.inc(reason="queue_full")
+        return None
+    record = serializer.ingest_record()
+    if record is None:
+        orders_ingest_fallback_total.inc(reason="promotion_limit")
+        return None
+    try:
+        segment = ingestor.accept(record)
+    except JournalError:
+        logger.exception("journal indisponível; checkout pelo caminho normal")
+        orders_ingest_fallback_total.inc(reason="journal")
+        return None
+    ingestor.writer.put(record, segment)
+
+    order, items = decode(record)
+    order._prefetched_objects_cache = {"items": items}  # resposta do checkout sem query
+    return order
+
+
+# ---------- leitura logo após o checkout ----------
+
+def wait_written(order_id: int, timeout: float | None = None) -> bool:
+    """
+    Espera um pedido aceito por este processo e ainda na fila do writer. True se ele existe agora.
+    Sem pedido pendente aqui, False na hora (nada de polling no banco para ids quaisquer).
+    """
+    if not enabled():
+        return False
+    event = get_ingestor().writer.pending_event(order_id)
+    if event is None:
+        return False
+    return event.wait(settings.ORDERS_INGEST_READ_WAIT if timeout is None else timeout)
+
+
+def get_order(queryset=None, **lookup) -> Order:
+    """queryset.get(**lookup) que espera a ingestão se o pedido ainda está na fila."""
+    queryset = Order.objects.all() if queryset is None else queryset
+    try:
+        return queryset.get(**lookup)
+    except Order.DoesNotExist:
+        order_id = lookup.get("id", lookup.get("pk"))
+        if order_id is None or not wait_written(int(order_id)):
+            raise
+    return queryset.get(**lookup)
@@ -0,0 +1,182 @@
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.test.utils import override_settings
+from django.utils.dateparse import parse_datetime
+
+from apps.orders import ingest
+from apps.orders.models import CustomerSummary, Order
+from apps.orders.serializers import CheckoutCreateSerializer
+
+EMAIL_DOMAIN = "bench.invalid"
+
+
+def payload(n: int) -> dict:
+    return {
+        "full_name": f"Cliente Bench {n}",
+        "email": f"bench-{n % 500}@{EMAIL_DOMAIN}",
+        "phone": "11999990000",
+        "items": [
+            {"productId": 900001, "name": "Camiseta bench", "price": "59.90", "qty": 1 + n % 3},
+            {"productId": 900002, "name": "Meia bench", "price": "19.90", "qty": 2},
+        ],
+        "shipping": {
+            "zip": "01001-000", "street": "Praça da Sé", "number": str(n), "district": "Sé",
+            "city": "São Paulo", "state": "sp", "method": "pac", "price": "19.90", "days": 5,
+        },
+    }
+
+
+def cleanup():
+    Order.objects.filter(email__endswith=f"@{EMAIL_DOMAIN}").delete()
+    CustomerSummary.objects.filter(email__endswith=f"@{EMAIL_DOMAIN}").delete()
+
+
+class Command(BaseCommand):
+    help = (
+        "Benchmark de checkout: pedidos/s pelo caminho normal (uma transação por pedido) e pela "
+        "ingestão em lote (aceitos e já gravados no banco). --crash-check: um processo aceita pedidos "
+        "e morre antes do writer; confere que o replay do journal grava todos."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--orders", type=int, default=2000, help="Pedidos por modo.")
+        parser.add_argument(
+            "--threads", type=int, default=None,
+            help="Checkouts simultâneos. Padrão: 8 (SQLite: 1, escritas concorrentes dão 'database is locked').",
+        )
+        parser.add_argument("--crash-check", type=int, default=0, metavar="N", help="Só o teste de crash, com N pedidos.")
+        parser.add_argument("--crash-child", type=int, default=0, help=argparse.SUPPRESS)
+        parser.add_argument("--journal-dir", default=None, help=argparse.SUPPRESS)
+
+    def handle(self, *args, orders, threads, crash_check, crash_child, journal_dir, **options):
+        if crash_child:
+            return self.crash_child(crash_child, journal_dir)
+        if crash_check:
+            return self.crash_check(crash_check)
+
+        threads = threads or (1 if connection.vendor == "sqlite" else 8)
+        cleanup()
+        try:
+            elapsed, _ = self.run(orders, threads)
+            self.stdout.write(f"normal: {orders / elapsed:.0f} pedidos/s ({threads} threads)")
+
+            with tempfile.TemporaryDirectory() as directory, override_settings(ORDERS_INGEST_JOURNAL_DIR=directory):
+                ingestor = ingest.Ingestor()
+                ingestor.writer.start()
+                accepted, ids = self.run(orders, threads, ingestor)
+                started = time.perf_counter() - accepted
+                for order_id in ids:
+                    event = ingestor.writer.pending_event(order_id)
+                    if event is not None:
+                        event.wait()
+                durable = time.perf_counter() - started
+                ingestor.journal.close()
+            written = Order.objects.filter(id__in=ids).count()
+            self.stdout.write(
+                f"ingestão: {orders / accepted:.0f} pedidos/s aceitos, {orders / durable:.0f} pedidos/s gravados "
+                f"({written}/{orders} no banco; lote {settings.ORDERS_INGEST_BATCH_SIZE}, "
+                f"flush {settings.ORDERS_INGEST_FLUSH_MS}ms)"
+            )
+        finally:
+            cleanup()
+
+    def run(self, orders: int, threads: int, ingestor=None) -> tuple[float, list[int]]:
+        ids, errors = [], []
+        lock = threading.Lock()
+
+        def client(numbers):
+            try:
+                for n in numbers:
+                    serializer = CheckoutCreateSerializer(data=payload(n))
+                    serializer.is_valid(raise_exception=True)
+                    order = ingestor and ingest.submit(serializer, ingestor=ingestor)
+                    order = order or serializer.save()
+                    with lock:
+                        ids.append(order.id)
+            except Exception as exc:
+                errors.append(exc)
+            finally:
+                connection.close()
+
+        workers = [threading.Thread(target=client, args=(range(i, orders, threads),)) for i in range(threads)]
+        started = time.perf_counter()
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+        elapsed = time.perf_counter() - started
+        if errors:
+            raise CommandError(f"{len(errors)} thread(s) falharam: {errors[0]!r}")
+        return elapsed, ids
+
+    def crash_child(self, orders: int, directory: str):
+        """Aceita os pedidos (journal com fsync), não grava nada no banco e morre sem encerrar."""
+        with override_settings(ORDERS_INGEST_JOURNAL_DIR=directory):
+            ingestor = ingest.Ingestor()  # writer não é iniciado
+            ids = []
+            for n in range(orders):
+                serializer = CheckoutCreateSerializer(data=payload(n))
+                serializer.is_valid(raise_exception=True)
+                ids.append(ingest.submit(serializer, ingestor=ingestor).id)
+            # registro cortado no meio da escrita
+            ingestor.journal._current.fh.write(b'0badc0de {"id": ')
+            ingestor.journal._current.fh.flush()
+        sys.stdout.write(json.dumps(ids) + "\n")
+        sys.stdout.flush()
+        os._exit(0)
+
+    def crash_check(self, orders: int):
+        cleanup()
+        try:
+            with tempfile.TemporaryDirectory() as directory:
+                child = subprocess.run(
+                    [sys.executable, str(Path(settings.BASE_DIR) / "manage.py"), "bench_order_ingest",
+                     "--crash-child", str(orders), "--journal-dir", directory],
+                    capture_output=True, text=True,
+                )
+                if child.returncode:
+                    raise CommandError(f"processo filho falhou:\n{child.stderr}")
+                ids = json.loads(child.stdout.strip().splitlines()[-1])
+                records = {
+                    record["id"]: record
+                    for path in Path(directory).glob("orders-*.log") for record in ingest.read_segment(path)[0]
+                }
+                before = Order.objects.filter(id__in=ids).count()
+                segments, written = ingest.recover(directory)
+                again = ingest.recover(directory)[1]
+                leftover = list(Path(directory).glob("orders-*.log"))
+
+            problems = []
+            if before:
+                problems.append(f"{before} pedido(s) já no banco antes do replay")
+            if sorted(records) != sorted(ids):
+                problems.append(f"journal tem {len(records)} registro(s) para {len(ids)} id(s) aceitos")
+            saved = {order.id: order for order in Order.objects.filter(id__in=ids).prefetch_related("items")}
+            for order_id in ids:
+                order, record = saved.get(order_id), records.get(order_id)
+                if order is None or record is None:
+                    problems.append(f"pedido {order_id} não gravado")
+                elif (len(order.items.all()) != len(record["items"]) or str(order.total) != record["order"]["total"]
+                      or order.created_at != parse_datetime(record["accepted_at"])):
+                    problems.append(f"pedido {order_id} diferente do journal")
+            if again or leftover:
+                problems.append("replay não é idempotente / segmento não apagado")
+            if problems:
+                raise CommandError("; ".join(problems[:10]))
+            self.stdout.write(
+                f"crash-check ok: {len(ids)} pedido(s) aceitos e não gravados; replay de {segments} segmento(s) "
+                f"gravou {written}, todos conferem com o journal (registro cortado no fim ignorado)."
+            )
+        finally:
+            cleanup()
@@ -0,0 +1,24 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.orders.customers import rebuild_summaries
+
+
+class Command(BaseCommand):
+    help = "Confere CustomerSummary contra os pedidos e recria as linhas divergentes."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--check", action="store_true", help="Só confere; sai com erro se houver divergência.")
+
+    def handle(self, *args, check, **options):
+        stats = rebuild_summaries(fix=not check)
+        for key, diff in stats["samples"]:
+            changes = ", ".join(f"{name}: {old!r} -> {new!r}" for name, (old, new) in diff.items())
+            self.stdout.write(f"  {key[0]}={key[1]}: {changes}")
+        divergent = stats["wrong"] + stats["missing"] + stats["extra"]
+        summary = (
+            f"{stats['customers']} cliente(s): {stats['ok']} ok, {stats['wrong']} divergente(s), "
+            f"{stats['missing']} faltando, {stats['extra']} sobrando."
+        )
+        if check and divergent:
+            raise CommandError(summary)
+        self.stdout.write(summary + ("" if check or not divergent else " Corrigido."))
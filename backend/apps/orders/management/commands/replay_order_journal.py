@@ -0,0 +1,19 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from apps.orders.ingest import recover
+
+
+class Command(BaseCommand):
+    help = (
+        "Grava no banco os pedidos do journal de ingestão deixados por processos que morreram "
+        "(segmentos sem dono). Idempotente: pedidos já gravados são ignorados."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--dir", default=None, help="Padrão: ORDERS_INGEST_JOURNAL_DIR.")
+        parser.add_argument("--batch-size", type=int, default=None, help="Padrão: ORDERS_INGEST_BATCH_SIZE.")
+
+    def handle(self, *args, dir, batch_size, **options):
+        segments, written = recover(dir, batch_size or settings.ORDERS_INGEST_BATCH_SIZE)
+        self.stdout.write(f"{segments} segmento(s) reaplicado(s), {written} pedido(s) gravado(s).")
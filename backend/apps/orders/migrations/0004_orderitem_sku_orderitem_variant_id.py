@@ -0,0 +1,23 @@
+# Generated by Django 6.0.1 on 2026-10-19 15:02
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('orders', '0003_order_user'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='orderitem',
+            name='sku',
+            field=models.CharField(blank=True, default='', max_length=64),
+        ),
+        migrations.AddField(
+            model_name='orderitem',
+            name='variant_id',
+            field=models.IntegerField(blank=True, null=True),
+        ),
+    ]
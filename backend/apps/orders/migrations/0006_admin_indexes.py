@@ -0,0 +1,38 @@
+# Generated by Django 6.0.1 on 2026-10-19 15:30
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('orders', '0005_order_coupon_code_order_discount'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='order',
+            name='coupon_code',
+            field=models.CharField(blank=True, db_index=True, default='', max_length=40),
+        ),
+        migrations.AlterField(
+            model_name='order',
+            name='created_at',
+            field=models.DateTimeField(auto_now_add=True, db_index=True),
+        ),
+        migrations.AlterField(
+            model_name='order',
+            name='email',
+            field=models.EmailField(db_index=True, max_length=254),
+        ),
+        migrations.AlterField(
+            model_name='orderitem',
+            name='product_id',
+            field=models.IntegerField(db_index=True),
+        ),
+        migrations.AlterField(
+            model_name='orderitem',
+            name='sku',
+            field=models.CharField(blank=True, db_index=True, default='', max_length=64),
+        ),
+    ]
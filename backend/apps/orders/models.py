@@ -26,7 +26,7 @@ class Order(models.Model):
         related_name="orders",
     )
     full_name = models.CharField(max_length=120)
-    email = models.EmailField()
+    email = models.EmailField(db_index=True)
     phone = models.CharField(max_length=30, blank=True)
 
     # =========================
@@ -34,6 +34,9 @@ class Order(models.Model):
     # =========================
     subtotal = models.DecimalField(max_digits=10, decimal_places=2, default=Decimal("0.00"))
     shipping_price = models.DecimalField(max_digits=10, decimal_places=2, default=Decimal("0.00"))
+    # promoções/cupom (inclui frete grátis): total = subtotal + frete - desconto
+    discount = models.DecimalField(max_digits=10, decimal_places=2, default=Decimal("0.00"))
+    coupon_code = models.CharField(max_length=40, blank=True, default="", db_index=True)
     total = models.DecimalField(max_digits=10, decimal_places=2, default=Decimal("0.00"))
 
     # =========================
@@ -58,9 +61,15 @@ class Order(models.Model):
     # =========================
     status = models.CharField(max_length=30, choices=Status.choices, default=Status.AWAITING_PAYMENT)
 
-    created_at = models.DateTimeField(auto_now_add=True)
+    created_at = models.DateTimeField(auto_now_add=True, db_index=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    class Meta:
+        indexes = [
+            # "meus pedidos": filtro por usuário + cursor em -id
+            models.Index(fields=["user", "-id"], name="order_user_id_desc"),
+        ]
+
     def calculate_totals(self):
         """
         Recalcula subtotal e total a partir dos itens.
@@ -71,7 +80,11 @@ class Order(models.Model):
             subtotal += item.price * item.qty
 
         self.subtotal = subtotal
-        self.total = (self.subtotal or Decimal("0.00")) + (self.shipping_price or Decimal("0.00"))
+        self.total = (
+            (self.subtotal or Decimal("0.00"))
+            + (self.shipping_price or Decimal("0.00"))
+            - (self.discount or Decimal("0.00"))
+        )
 
     def mark_paid(self):
         self.status = self.Status.PAID
@@ -81,11 +94,18 @@ class Order(models.Model):
         return f"Pedido #{self.id} - {self.full_name} - {self.status}"
 
 
+# pedido que conta como venda (gasto do cliente, demanda de estoque)
+SOLD_STATUSES = (Order.Status.PAID, Order.Status.PACKING, Order.Status.SHIPPED, Order.Status.DELIVERED)
+
+
 class OrderItem(models.Model):
     order = models.ForeignKey(Order, on_delete=models.CASCADE, related_name="items")
 
     # MVP: manter product_id como Integer (você pode trocar para FK depois)
-    product_id = models.IntegerField()
+    product_id = models.IntegerField(db_index=True)
+    # variação (tamanho/cor) quando o produto tem variantes; mesmo esquema de Integer
+    variant_id = models.IntegerField(null=True, blank=True)
+    sku = models.CharField(max_length=64, blank=True, default="", db_index=True)
 
     name = models.CharField(max_length=220)
     price = models.DecimalField(max_digits=10, decimal_places=2)
@@ -95,4 +115,41 @@ class OrderItem(models.Model):
         return self.price * self.qty
 
     def __str__(self):
-        return f"{self.name} x{self.qty}"
\ No newline at end of file
+        return f"{self.name} x{self.qty}"
+
+
+class CustomerSummary(models.Model):
+    """
+    Resumo denormalizado por cliente: usuário ou, para pedidos guest, e-mail normalizado.
+    Atualizado incrementalmente (apps.orders.customers); manage.py rebuild_customer_summaries
+    confere contra os pedidos e corrige.
+    """
+    user = models.OneToOneField(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        null=True,
+        blank=True,
+        related_name="customer_summary",
+    )
+    # chave dos guests (minúsculo, sem espaços); vazio nas linhas de usuário
+    email = models.EmailField(blank=True, default="")
+
+    order_count = models.PositiveIntegerField(default=0)
+    paid_count = models.PositiveIntegerField(default=0)
+    lifetime_spend = models.DecimalField(max_digits=12, decimal_places=2, default=Decimal("0.00"))
+    first_order_at = models.DateTimeField(null=True, blank=True)
+    last_order_at = models.DateTimeField(null=True, blank=True)
+    preferred_state = models.CharField(max_length=2, blank=True, default="")
+    state_counts = models.JSONField(default=dict, blank=True)  # {"SP": 3, "RJ": 1}
+
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["email"], condition=models.Q(user__isnull=True), name="uniq_customer_guest_email",
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.user_id or self.email}: {self.order_count} pedido(s)"
@@ -1,10 +1,18 @@
+from collections import defaultdict
 from decimal import Decimal
+from django.core.exceptions import ObjectDoesNotExist
+from django.db import transaction
+from django.db.models import Q
 from rest_framework import serializers
+from apps.catalog.models import ProductVariant
+from apps.core.serializers import PlainSerializer, decimal_str
+from apps.promotions.engine import apply_promotions, get_index, promotion_lines, record_redemptions
 from .models import Order, OrderItem
 
 
 class CheckoutItemInputSerializer(serializers.Serializer):
     productId = serializers.IntegerField(min_value=1)
+    variantId = serializers.IntegerField(min_value=1, required=False, allow_null=True)
     name = serializers.CharField(max_length=220)
     price = serializers.CharField()  # vem do front
     qty = serializers.IntegerField(min_value=1, max_value=99)
@@ -32,32 +40,138 @@ class CheckoutCreateSerializer(serializers.Serializer):
     items = CheckoutItemInputSerializer(many=True)
     shipping = ShippingInputSerializer()
 
+    coupon = serializers.CharField(max_length=40, required=False, allow_blank=True)
+
     # totals é opcional: frontend manda, mas backend não confia.
     totals = serializers.DictField(required=False)
 
     def validate_items(self, items):
         if not items:
             raise serializers.ValidationError("Carrinho vazio.")
+        return self._validate_variants(items)
+
+    def _validate_variants(self, items):
+        """
+        Valida as variações de todos os itens numa query só:
+        traz as variantes pedidas + as variantes ativas dos produtos do carrinho
+        (produto com variantes exige variantId). Itens com variante recebem "_variant".
+        """
+        variant_ids = {i["variantId"] for i in items if i.get("variantId")}
+        product_ids = {i["productId"] for i in items}
+
+        rows = {
+            r["id"]: r
+            for r in ProductVariant.objects.filter(
+                Q(id__in=variant_ids) | Q(product_id__in=product_ids, active=True)
+            ).values("id", "product_id", "sku", "price", "stock", "active", "product__price", "product__active")
+        }
+        products_with_variants = {r["product_id"] for r in rows.values() if r["active"]}
+
+        errors = []
+        qty_by_variant = defaultdict(int)
+        for i in items:
+            vid = i.get("variantId")
+            if not vid:
+                if i["productId"] in products_with_variants:
+                    errors.append(f"Escolha tamanho/cor para '{i['name']}'.")
+                continue
+
+            row = rows.get(vid)
+            if row is None or row["product_id"] != i["productId"]:
+                errors.append(f"Variação inválida para '{i['name']}'.")
+                continue
+            if not (row["active"] and row["product__active"]):
+                errors.append(f"Variação {row['sku']} indisponível.")
+                continue
+
+            qty_by_variant[vid] += int(i["qty"])
+            i["_variant"] = row
+
+        for vid, qty in qty_by_variant.items():
+            row = rows[vid]
+            if row["stock"] < qty:
+                errors.append(f"Estoque insuficiente para {row['sku']} (disponível: {row['stock']}).")
+
+        if errors:
+            raise serializers.ValidationError(errors)
         return items
 
-    def create(self, validated_data):
-        items_data = validated_data["items"]
-        shipping_data = validated_data["shipping"]
+    @staticmethod
+    def _item_price(item) -> Decimal:
+        # com variante, o preço vem do catálogo (override da variante ou preço do produto)
+        variant = item.get("_variant")
+        if variant:
+            return variant["price"] if variant["price"] is not None else variant["product__price"]
+        return Decimal(item["price"])
 
+    def _subtotal(self, items_data) -> Decimal:
         subtotal = Decimal("0.00")
         for i in items_data:
-            price = Decimal(i["price"])
-            qty = int(i["qty"])
-            subtotal += price * qty
+            subtotal += self._item_price(i) * int(i["qty"])
+        return subtotal
 
-        shipping_price = Decimal(shipping_data["price"])
-        total = subtotal + shipping_price
+    def _user(self):
         request = self.context.get("request")
         user = getattr(request, "user", None)
         if user and not user.is_authenticated:
             user = None
+        return user
 
-        order = Order.objects.create(
+    def create(self, validated_data):
+        items_data = validated_data["items"]
+        shipping_data = validated_data["shipping"]
+
+        subtotal = self._subtotal(items_data)
+        shipping_price = Decimal(shipping_data["price"])
+        user = self._user()
+
+        with transaction.atomic():
+            # reserva o uso das promoções na mesma transação do pedido
+            promotions = apply_promotions(
+                promotion_lines(items_data, self._item_price),
+                shipping_price=shipping_price,
+                code=validated_data.get("coupon", ""),
+            )
+            if promotions.coupon_error:
+                raise serializers.ValidationError({"coupon": promotions.coupon_error})
+
+            order = self._create_order(validated_data, user, subtotal, shipping_price, promotions)
+            record_redemptions(order, promotions)
+
+        return order
+
+    def ingest_record(self) -> dict | None:
+        """
+        Pedido pronto para a ingestão em lote (apps.orders.ingest), sem escrever no banco.
+        None = segue pelo caminho normal (create): promoção com limite de uso precisa reservar
+        o saldo na hora, com UPDATE condicional.
+        """
+        validated_data = self.validated_data
+        items_data = validated_data["items"]
+        shipping_price = Decimal(validated_data["shipping"]["price"])
+        promotions = get_index().evaluate(
+            promotion_lines(items_data, self._item_price),
+            shipping_price=shipping_price,
+            code=validated_data.get("coupon", ""),
+        )
+        if promotions.coupon_error:
+            raise serializers.ValidationError({"coupon": promotions.coupon_error})
+        if any(rule.usage_limit is not None for rule, _ in promotions.applied):
+            return None
+
+        user = self._user()
+        fields = self._order_fields(validated_data, user, self._subtotal(items_data), shipping_price, promotions)
+        fields["user_id"] = user.pk if fields.pop("user") else None
+        return {
+            "order": fields,
+            "items": self._item_fields(items_data),
+            "redemptions": [[rule.id, amount] for rule, amount in promotions.applied],
+        }
+
+    def _order_fields(self, validated_data, user, subtotal, shipping_price, promotions) -> dict:
+        shipping_data = validated_data["shipping"]
+        discount = promotions.discount
+        return dict(
             full_name = validated_data["full_name"],
             email = validated_data["email"],
             phone = validated_data.get("phone", ""),
@@ -66,7 +180,9 @@ class CheckoutCreateSerializer(serializers.Serializer):
 
             subtotal=subtotal,
             shipping_price=shipping_price,
-            total=total,
+            discount=discount,
+            coupon_code=promotions.coupon_code,
+            total=subtotal + shipping_price - discount,
 
             shipping_method=shipping_data["method"],
             shipping_days=int(shipping_data["days"]),
@@ -80,22 +196,31 @@ class CheckoutCreateSerializer(serializers.Serializer):
             shipping_state=shipping_data["state"].upper(),
         )
 
+    def _item_fields(self, items_data) -> list[dict]:
+        items = []
         for i in items_data:
-            OrderItem.objects.create(
-                order=order,
+            variant = i.get("_variant")
+            items.append(dict(
                 product_id=i["productId"],
+                variant_id=variant["id"] if variant else None,
+                sku=variant["sku"] if variant else "",
                 name=i["name"],
-                price=Decimal(i["price"]),
+                price=self._item_price(i),
                 qty=int(i["qty"]),
-            )
+            ))
+        return items
 
+    def _create_order(self, validated_data, user, subtotal, shipping_price, promotions):
+        order = Order.objects.create(**self._order_fields(validated_data, user, subtotal, shipping_price, promotions))
+        for fields in self._item_fields(validated_data["items"]):
+            OrderItem.objects.create(order=order, **fields)
         return order
 
 
 class OrderItemSerializer(serializers.ModelSerializer):
     class Meta:
         model = OrderItem
-        fields = ("product_id", "name", "price", "qty")
+        fields = ("product_id", "variant_id", "sku", "name", "price", "qty")
 
 
 class OrderSerializer(serializers.ModelSerializer):
@@ -111,6 +236,8 @@ class OrderSerializer(serializers.ModelSerializer):
             "phone",
             "subtotal",
             "shipping_price",
+            "discount",
+            "coupon_code",
             "total",
             "shipping_method",
             "shipping_days",
@@ -126,8 +253,117 @@ class OrderSerializer(serializers.ModelSerializer):
         )
 
 
+class OrderPlainSerializer(PlainSerializer):
+    """
+    Mesma saída do OrderSerializer, sem overhead por campo do DRF.
+    Espera queryset com prefetch_related("items").
+    """
+
+    def to_representation(self, obj) -> dict:
+        return {
+            "id": obj.id,
+            "status": obj.status,
+            "full_name": obj.full_name,
+            "email": obj.email,
+            "phone": obj.phone,
+            "subtotal": decimal_str(obj.subtotal),
+            "shipping_price": decimal_str(obj.shipping_price),
+            "discount": decimal_str(obj.discount),
+            "coupon_code": obj.coupon_code,
+            "total": decimal_str(obj.total),
+            "shipping_method": obj.shipping_method,
+            "shipping_days": obj.shipping_days,
+            "shipping_zip": obj.shipping_zip,
+            "shipping_street": obj.shipping_street,
+            "shipping_number": obj.shipping_number,
+            "shipping_complement": obj.shipping_complement,
+            "shipping_district": obj.shipping_district,
+            "shipping_city": obj.shipping_city,
+            "shipping_state": obj.shipping_state,
+            "created_at": obj.created_at,
+            "items": [
+                {
+                    "product_id": i.product_id,
+                    "variant_id": i.variant_id,
+                    "sku": i.sku,
+                    "name": i.name,
+                    "price": decimal_str(i.price),
+                    "qty": i.qty,
+                }
+                for i in obj.items.all()
+            ],
+        }
+
+
+class MyOrderListPlainSerializer(PlainSerializer):
+    """
+    Linha do histórico em "minha conta" (o pedido completo fica em /my/orders/<id>/).
+    Espera o queryset anotado de MyOrdersListAPIView (item_count, first_item_name).
+    """
+
+    def to_representation(self, obj) -> dict:
+        return {
+            "id": obj.id,
+            "status": obj.status,
+            "total": decimal_str(obj.total),
+            "created_at": obj.created_at,
+            "item_count": obj.item_count,
+            "first_item_name": obj.first_item_name,
+        }
+
+
+class OrderBatchSerializer(OrderPlainSerializer):
+    """
+    Leitura em lote para separação (picking): pedido + itens + endereço + status do pagamento.
+    Espera queryset com select_related("payment") e prefetch_related("items").
+    """
+
+    def to_representation(self, obj) -> dict:
+        try:
+            payment = obj.payment
+        except ObjectDoesNotExist:
+            payment = None
+
+        data = super().to_representation(obj)
+        data["shipping_name"] = obj.shipping_name
+        data["updated_at"] = obj.updated_at
+        data["payment_status"] = payment.status if payment else None
+        data["payment_method"] = payment.method if payment else None
+        return data
+
+
 # Para o Card Brick (amount)
 class OrderPublicSerializer(serializers.ModelSerializer):
     class Meta:
         model = Order
-        fields = ("id", "subtotal", "shipping_price", "total", "status", "email", "full_name")
\ No newline at end of file
+        fields = ("id", "subtotal", "shipping_price", "discount", "total", "status", "email", "full_name")
+
+
+class OrderPublicPlainSerializer(PlainSerializer):
+    """Mesma saída do OrderPublicSerializer."""
+
+    def to_representation(self, obj) -> dict:
+        return {
+            "id": obj.id,
+            "subtotal": decimal_str(obj.subtotal),
+            "shipping_price": decimal_str(obj.shipping_price),
+            "discount": decimal_str(obj.discount),
+            "total": decimal_str(obj.total),
+            "status": obj.status,
+            "email": obj.email,
+            "full_name": obj.full_name,
+        }
+
+
+class CustomerSummaryPlainSerializer(PlainSerializer):
+    """Resumo do cliente (CustomerSummary) para a página "minha conta"."""
+
+    def to_representation(self, obj) -> dict:
+        return {
+            "order_count": obj.order_count,
+            "paid_count": obj.paid_count,
+            "lifetime_spend": decimal_str(obj.lifetime_spend),
+            "first_order_at": obj.first_order_at,
+            "last_order_at": obj.last_order_at,
+            "preferred_state": obj.preferred_state,
+        }
@@ -0,0 +1,35 @@
+"""
+Mantém CustomerSummary na criação e nas mudanças de status do pedido (mesma transação do save).
+O status carregado do banco fica em _summary_status (post_init): detectar a transição não custa query.
+
+orders_ingested: lote gravado pela ingestão em lote (apps.orders.ingest), que usa bulk_create e
+por isso não dispara post_save. Enviado dentro da transação do lote, com orders=[Order, ...].
+"""
+from django.db.models.signals import post_init, post_save
+from django.dispatch import Signal, receiver
+
+from . import customers
+from .models import Order
+
+orders_ingested = Signal()
+
+
+@receiver(post_init, sender=Order, dispatch_uid="orders_summary_init")
+def remember_status(sender, instance, **kwargs):
+    instance._summary_status = instance.__dict__.get("status")
+
+
+@receiver(post_save, sender=Order, dispatch_uid="orders_summary_saved")
+def order_saved(sender, instance, created, raw=False, **kwargs):
+    if raw:
+        return
+    if created:
+        customers.order_created(instance)
+    elif instance.status != instance._summary_status:
+        customers.order_status_changed(instance, instance._summary_status)
+    instance._summary_status = instance.status
+
+
+@receiver(orders_ingested, sender=Order, dispatch_uid="orders_summary_ingested")
+def orders_ingested_summary(sender, orders, **kwargs):
+    customers.orders_created(orders)
@@ -0,0 +1,126 @@
+import shutil
+import tempfile
+from datetime import datetime, timezone as dt_timezone
+from decimal import Decimal
+from pathlib import Path
+
+from django.test import TestCase
+
+from apps.promotions.models import Promotion, PromotionRedemption
+from . import ingest
+from .models import CustomerSummary, Order
+from .serializers import CheckoutCreateSerializer
+
+ACCEPTED_AT = datetime(2026, 3, 1, 12, 30, 15, 123456, tzinfo=dt_timezone.utc)
+
+
+def checkout_data(n: int) -> dict:
+    return {
+        "full_name": f"Cliente {n}",
+        "email": f"cliente{n}@example.com",
+        "items": [
+            {"productId": 10, "name": "Camiseta", "price": "59.90", "qty": 1 + n},
+            {"productId": 11, "name": "Meia", "price": "19.90", "qty": 2},
+        ],
+        "shipping": {
+            "zip": "01001-000", "street": "Praça da Sé", "number": str(n), "district": "Sé",
+            "city": "São Paulo", "state": "sp", "method": "pac", "price": "19.90", "days": 5,
+        },
+    }
+
+
+class JournalRecoveryTests(TestCase):
+    """Crash entre o fsync do journal e o commit no banco: o replay grava tudo, uma vez só."""
+
+    def setUp(self):
+        self.directory = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, self.directory, True)
+        self.promotion = Promotion.objects.create(name="Dez reais", kind=Promotion.Kind.FIXED, value=Decimal("10.00"))
+
+    def accepted_records(self, count: int) -> list[dict]:
+        """Registros como Ingestor.accept os grava (sem writer: nada chega ao banco)."""
+        records = []
+        for n, order_id in enumerate(ingest.reserve_ids(count)):
+            serializer = CheckoutCreateSerializer(data=checkout_data(n))
+            serializer.is_valid(raise_exception=True)
+            record = serializer.ingest_record()
+            record["id"] = order_id
+            record["accepted_at"] = ACCEPTED_AT.isoformat()
+            records.append(record)
+        return records
+
+    def write_segment(self, records: list[dict], name: str = "orders-1-1.log", tail: bytes = b"") -> Path:
+        path = self.directory / name
+        path.write_bytes(b"".join(ingest.encode(record) for record in records) + tail)
+        return path
+
+    def test_replay_writes_orders_and_skips_torn_tail(self):
+        records = self.accepted_records(3)
+        segment = self.write_segment(records, tail=b'0badc0de {"id": 99, "ord')
+
+        with self.assertLogs("apps.orders.ingest", "WARNING"):
+            self.assertEqual(ingest.recover(self.directory), (1, 3))
+
+        self.assertFalse(segment.exists())
+        orders = {order.id: order for order in Order.objects.prefetch_related("items")}
+        self.assertEqual(sorted(orders), sorted(record["id"] for record in records))
+        for n, record in enumerate(records):
+            order = orders[record["id"]]
+            self.assertEqual(order.created_at, ACCEPTED_AT)
+            self.assertEqual(order.email, f"cliente{n}@example.com")
+            self.assertEqual(order.shipping_state, "SP")
+            self.assertEqual(order.discount, Decimal("10.00"))
+            self.assertEqual(order.total, order.subtotal + order.shipping_price - order.discount)
+            self.assertEqual(
+                sorted((item.product_id, item.qty, item.price) for item in order.items.all()),
+                [(10, 1 + n, Decimal("59.90")), (11, 2, Decimal("19.90"))],
+            )
+        self.assertEqual(
+            sorted(PromotionRedemption.objects.values_list("order_id", "promotion_id", "amount")),
+            sorted((record["id"], self.promotion.id, Decimal("10.00")) for record in records),
+        )
+        self.promotion.refresh_from_db()
+        self.assertEqual(self.promotion.usage_count, 3)
+        self.assertEqual(CustomerSummary.objects.count(), 3)
+
+    def test_second_replay_is_noop(self):
+        records = self.accepted_records(2)
+        self.write_segment(records)
+        self.assertEqual(ingest.recover(self.directory), (1, 2))
+
+        self.assertEqual(ingest.recover(self.directory), (0, 0))
+        # crash depois do commit e antes de apagar o segmento: o mesmo conteúdo de novo
+        self.write_segment(records, name="orders-1-2.log")
+        self.assertEqual(ingest.recover(self.directory), (1, 0))
+
+        self.assertEqual(Order.objects.count(), 2)
+        self.assertEqual(PromotionRedemption.objects.count(), 2)
+        self.promotion.refresh_from_db()
+        self.assertEqual(self.promotion.usage_count, 2)
+
+    def test_segment_of_live_process_is_not_replayed(self):
+        journal = ingest.Journal(self.directory)
+        journal.append(ingest.encode(self.accepted_records(1)[0]))
+
+        self.assertEqual(ingest.recover(self.directory), (0, 0))
+        self.assertEqual(Order.objects.count(), 0)
+        journal.close()
+
+    def test_writer_quarantines_bad_record_and_keeps_going(self):
+        good, bad = self.accepted_records(2)
+        bad["order"]["total"] = "não é número"
+        journal = ingest.Journal(self.directory)
+        writer = ingest.GroupCommitWriter(journal)
+        for record in (good, bad):
+            writer.put(record, journal.append(ingest.encode(record)))
+        batch = [writer.queue.get_nowait() for _ in range(2)]
+
+        with self.assertLogs("apps.orders.ingest", "ERROR"):
+            writer.commit(batch)
+
+        self.assertEqual(list(Order.objects.values_list("id", flat=True)), [good["id"]])
+        rejected = ingest.read_segment(self.directory / "rejected.log")[0]
+        self.assertEqual([record["id"] for record in rejected], [bad["id"]])
+        self.assertIsNone(writer.pending_event(good["id"]))
+        self.assertIsNone(writer.pending_event(bad["id"]))
+        journal.close()
@@ -1,10 +1,12 @@
 from django.urls import path
-from .views import CheckoutAPIView, ClaimGuestOrdersAPIView, OrderDetailAPIView, MyOrderDetailAPIView, MyOrdersListAPIView
+from .views import CheckoutAPIView, ClaimGuestOrdersAPIView, OrderDetailAPIView, OrderBatchAPIView, MyOrderDetailAPIView, MyOrdersListAPIView, MyCustomerSummaryAPIView
 
 urlpatterns = [
     path("checkout/", CheckoutAPIView.as_view(), name="checkout"),
+    path("orders/batch/", OrderBatchAPIView.as_view(), name="order-batch"),
     path("orders/<int:pk>/", OrderDetailAPIView.as_view(), name="order-detail"),
     path("my/orders/", MyOrdersListAPIView.as_view(), name="my-orders"),
     path("my/orders/<int:id>/", MyOrderDetailAPIView.as_view(), name="my-order-detail"),
     path("my/orders/claim/", ClaimGuestOrdersAPIView.as_view(), name="my-orders-claim"),
+    path("my/summary/", MyCustomerSummaryAPIView.as_view(), name="my-summary"),
 ]
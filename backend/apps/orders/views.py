@@ -1,31 +1,185 @@
+from django.conf import settings
+from django.db import transaction
+from django.http import Http404, StreamingHttpResponse
+from django.db.models import IntegerField, OuterRef, Subquery, Sum
+from django.db.models.functions import Coalesce
+from django.utils.dateparse import parse_date
 from rest_framework import status
+from rest_framework.exceptions import ValidationError
+from rest_framework.pagination import CursorPagination
 from rest_framework.response import Response
 from rest_framework.views import APIView
 from rest_framework.generics import ListAPIView, RetrieveAPIView
-from .serializers import CheckoutCreateSerializer, OrderSerializer
-from .models import Order
-from .serializers import OrderPublicSerializer
-from rest_framework.permissions import IsAuthenticated
+from rest_framework.settings import api_settings
+from .serializers import CheckoutCreateSerializer, OrderSerializer, OrderPlainSerializer, OrderBatchSerializer
+from apps.core.renderers import NDJSONRenderer
+from apps.core.throttling import PUBLIC_WRITE_THROTTLES
+from apps.core.views import AsyncJSONView
+from apps.risk.scoring import observe_checkout
+from . import ingest
+from .customers import merge_guest_summary
+from .models import CustomerSummary, Order, OrderItem
+from .serializers import CustomerSummaryPlainSerializer, MyOrderListPlainSerializer, OrderPublicSerializer, OrderPublicPlainSerializer
+from rest_framework.permissions import IsAuthenticated, IsAdminUser
 
 class CheckoutAPIView(APIView):
+    throttle_classes = PUBLIC_WRITE_THROTTLES
+    throttle_scope = "checkout"
+
     def post(self, request):
         serializer = CheckoutCreateSerializer(data=request.data, context={"request": request})
         serializer.is_valid(raise_exception=True)
 
-        order = serializer.save()
+        # ingestão em lote (opt-in): id na hora, gravação no banco em lote pelo writer
+        order = ingest.submit(serializer) if ingest.enabled() else None
+        if order is None:
+            order = serializer.save()
+        observe_checkout(order, request)
 
         return Response(OrderSerializer(order).data, status=status.HTTP_201_CREATED)
 
-class OrderDetailAPIView(RetrieveAPIView):
+class IngestedOrderMixin:
+    """Pedido recém-aceito pela ingestão em lote pode ainda não estar no banco: espera o writer."""
+
+    def get_object(self):
+        try:
+            return super().get_object()
+        except Http404:
+            if not ingest.wait_written(int(self.kwargs[self.lookup_url_kwarg or self.lookup_field])):
+                raise
+        return super().get_object()
+
+
+class OrderDetailAPIView(IngestedOrderMixin, RetrieveAPIView):
     queryset = Order.objects.all()
     serializer_class = OrderPublicSerializer
 
+
+class OrderDetailAsyncView(AsyncJSONView):
+    """
+    GET /api/v1/async/orders/<id>/  (mesma saída de OrderDetailAPIView)
+    """
+
+    async def get(self, request, pk):
+        order = await Order.objects.only(
+            "id", "subtotal", "shipping_price", "discount", "total", "status", "email", "full_name"
+        ).filter(pk=pk).afirst()
+        if order is None:
+            return self.not_found()
+        return self.json(OrderPublicPlainSerializer(order).data)
+
+class OrderBatchAPIView(APIView):
+    """
+    GET /api/v1/orders/batch/?ids=1,2,3
+    GET /api/v1/orders/batch/?status=packing
+
+    Leitura em lote para a estação de separação (staff).
+    Número fixo de queries: pedidos + payment (JOIN) e itens (prefetch).
+    Com Accept: application/x-ndjson (ou ?format=ndjson) transmite um pedido por linha,
+    em blocos de ORDERS_BATCH_CHUNK_SIZE, sem limite de quantidade. Em JSON, mais de
+    ORDERS_BATCH_MAX_IDS pedidos no filtro = 400 (nunca uma lista cortada).
+    """
+    permission_classes = [IsAdminUser]
+    renderer_classes = [*api_settings.DEFAULT_RENDERER_CLASSES, NDJSONRenderer]
+
+    def get_queryset(self, ids, order_status):
+        qs = Order.objects.select_related("payment").prefetch_related("items").order_by("id")
+        if ids:
+            qs = qs.filter(id__in=ids)
+        if order_status:
+            qs = qs.filter(status=order_status)
+        return qs
+
+    def get(self, request):
+        max_ids = settings.ORDERS_BATCH_MAX_IDS
+        raw_ids = request.query_params.get("ids", "")
+        order_status = request.query_params.get("status", "")
+
+        try:
+            ids = [int(x) for x in raw_ids.split(",") if x.strip()]
+        except ValueError:
+            return Response({"detail": "ids deve ser uma lista de inteiros separados por vírgula."}, status=400)
+
+        if not ids and not order_status:
+            return Response({"detail": "Informe ids ou status."}, status=400)
+        if len(ids) > max_ids:
+            return Response({"detail": f"Máximo de {max_ids} ids por requisição."}, status=400)
+        if order_status and order_status not in Order.Status.values:
+            return Response({"detail": "Status inválido."}, status=400)
+
+        qs = self.get_queryset(ids, order_status)
+
+        if request.accepted_renderer.format == NDJSONRenderer.format:
+            return StreamingHttpResponse(
+                self.stream_ndjson(qs),
+                content_type=NDJSONRenderer.media_type,
+            )
+
+        # lê um a mais só para saber se passou do limite: cortar calado perderia pedidos da onda
+        orders = list(qs[:max_ids + 1])
+        if len(orders) > max_ids:
+            return Response(
+                {"detail": f"Mais de {max_ids} pedidos com esse filtro. Use ?format=ndjson ou filtre por ids."},
+                status=400,
+            )
+        return Response(OrderBatchSerializer(orders, many=True).data)
+
+    def stream_ndjson(self, qs):
+        # iterator + prefetch: 2 queries por bloco, memória constante
+        for order in qs.iterator(chunk_size=settings.ORDERS_BATCH_CHUNK_SIZE):
+            yield NDJSONRenderer.render_line(OrderBatchSerializer(order).data)
+
+
+class MyOrdersPagination(CursorPagination):
+    ordering = "-id"
+    page_size = settings.MY_ORDERS_PAGE_SIZE
+    page_size_query_param = "page_size"
+    max_page_size = 100
+
+
 class MyOrdersListAPIView(ListAPIView):
+    """
+    GET /api/v1/my/orders/?status=paid,shipped&created_after=2026-01-01&created_before=2026-03-31&cursor=...
+
+    Histórico paginado por cursor (id decrescente: sem OFFSET, estável com pedidos novos chegando).
+    Linha enxuta: contagem de itens e nome do primeiro item vêm de subqueries, 1 query por página.
+    """
     permission_classes = [IsAuthenticated]
-    serializer_class = OrderSerializer
+    serializer_class = MyOrderListPlainSerializer
+    pagination_class = MyOrdersPagination
 
     def get_queryset(self):
-        return Order.objects.filter(user=self.request.user).order_by("-id")
+        items = OrderItem.objects.filter(order=OuterRef("pk"))
+        qs = Order.objects.filter(user=self.request.user).only("id", "status", "total", "created_at").annotate(
+            item_count=Coalesce(
+                Subquery(items.values("order").annotate(units=Sum("qty")).values("units"), output_field=IntegerField()),
+                0,
+            ),
+            first_item_name=Subquery(items.order_by("id").values("name")[:1]),
+        )
+        return self.filter_queryset_params(qs)
+
+    def filter_queryset_params(self, qs):
+        params = self.request.query_params
+        statuses = [x.strip() for x in params.get("status", "").split(",") if x.strip()]
+        if statuses:
+            invalid = sorted(set(statuses) - set(Order.Status.values))
+            if invalid:
+                raise ValidationError({"status": f"Status inválido: {', '.join(invalid)}."})
+            qs = qs.filter(status__in=statuses)
+
+        for param, lookup in (("created_after", "created_at__date__gte"), ("created_before", "created_at__date__lte")):
+            raw = params.get(param)
+            if not raw:
+                continue
+            try:
+                day = parse_date(raw)
+            except ValueError:
+                day = None
+            if day is None:
+                raise ValidationError({param: "Use o formato AAAA-MM-DD."})
+            qs = qs.filter(**{lookup: day})
+        return qs
 
 class ClaimGuestOrdersAPIView(APIView):
     permission_classes = [IsAuthenticated]
@@ -50,13 +204,28 @@ class ClaimGuestOrdersAPIView(APIView):
         # opcional: não mexer em cancelados
         # qs = qs.exclude(status=Order.Status.CANCELED)
 
-        claimed = qs.update(user=user)
+        with transaction.atomic():
+            claimed = qs.update(user=user)
+            if claimed:
+                merge_guest_summary(user, email)
         return Response({"claimed": claimed})
 
-class MyOrderDetailAPIView(RetrieveAPIView):
+
+class MyCustomerSummaryAPIView(APIView):
+    """
+    GET /api/v1/my/summary/
+    Totais do cliente vindos de CustomerSummary (uma linha), sem varrer os pedidos.
+    """
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request):
+        summary = CustomerSummary.objects.filter(user=request.user).first() or CustomerSummary(user=request.user)
+        return Response(CustomerSummaryPlainSerializer(summary).data)
+
+class MyOrderDetailAPIView(IngestedOrderMixin, RetrieveAPIView):
     permission_classes = [IsAuthenticated]
-    serializer_class = OrderSerializer
+    serializer_class = OrderPlainSerializer
     lookup_field = "id"
 
     def get_queryset(self):
-        return Order.objects.filter(user=self.request.user)
\ No newline at end of file
+        return Order.objects.filter(user=self.request.user).prefetch_related("items")
\ No newline at end of file
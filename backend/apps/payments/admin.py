@@ -1,15 +1,49 @@
+import json
+
 from django.contrib import admin
-from .models import Payment, PaymentEvent
+
+from apps.core.admin import LargeTableAdmin
+from .models import Payment, PaymentEvent, PaymentEventPayload
 
 
 @admin.register(Payment)
-class PaymentAdmin(admin.ModelAdmin):
+class PaymentAdmin(LargeTableAdmin):
     list_display = ("id", "order", "provider", "method", "status", "amount", "created_at")
     list_filter = ("provider", "method", "status")
-    search_fields = ("provider_payment_id", "order__id", "idempotency_key")
+    list_select_related = ("order",)
+    date_hierarchy = "created_at"
+    ordering = ("-id",)
+    search_fields = ("provider_payment_id", "order_id", "idempotency_key")
+    search_help_text = "Busca exata por nº do pedido, id no provedor ou chave de idempotência."
+    raw_id_fields = ("order",)
 
 
 @admin.register(PaymentEvent)
-class PaymentEventAdmin(admin.ModelAdmin):
+class PaymentEventAdmin(LargeTableAdmin):
     list_display = ("id", "payment", "event_type", "provider_event_id", "received_at")
     list_filter = ("event_type",)
+    list_select_related = ("payment",)
+    date_hierarchy = "received_at"
+    ordering = ("-id",)
+    search_fields = ("payment_id", "provider_event_id")
+    search_help_text = "Busca exata por id do pagamento ou id do evento no provedor."
+    raw_id_fields = ("payment", "payload")
+    readonly_fields = ("payload_json",)
+
+    @admin.display(description="Payload")
+    def payload_json(self, obj):
+        return json.dumps(obj.raw_payload, indent=2, ensure_ascii=False)
+
+
+@admin.register(PaymentEventPayload)
+class PaymentEventPayloadAdmin(LargeTableAdmin):
+    list_display = ("id", "digest", "size", "created_at")
+    ordering = ("-id",)
+    search_fields = ("digest",)
+    search_help_text = "Busca exata pelo sha256 do payload."
+    exclude = ("data",)
+    readonly_fields = ("digest", "size", "created_at", "payload_json")
+
+    @admin.display(description="Payload")
+    def payload_json(self, obj):
+        return json.dumps(obj.decoded(), indent=2, ensure_ascii=False)
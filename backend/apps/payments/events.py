@@ -0,0 +1,146 @@
+"""
+Log de eventos de pagamento (webhooks).
+
+- Payloads: JSON canônico (chaves ordenadas) -> sha256 -> zlib; uma linha por payload distinto.
+- Eventos: uma linha pequena por (payment, payload); reenvio idêntico não duplica.
+- Rotação mensal: archive_month() exporta os eventos de um mês para JSONL.gz
+  (payload inline) e apaga as linhas em lotes; payloads órfãos são removidos em seguida.
+"""
+import gzip
+import hashlib
+import json
+import os
+import zlib
+from datetime import datetime, timezone as dt_timezone
+from pathlib import Path
+
+from django.conf import settings
+from django.db import IntegrityError, transaction
+from django.utils import timezone
+
+from .models import PaymentEvent, PaymentEventPayload
+
+
+def canonical_json(data) -> bytes:
+    return json.dumps(data, sort_keys=True, separators=(",", ":"), ensure_ascii=False, default=str).encode("utf-8")
+
+
+def encode_payload(data) -> tuple[str, bytes, int]:
+    raw = canonical_json(data)
+    return hashlib.sha256(raw).hexdigest(), zlib.compress(raw, 6), len(raw)
+
+
+def decode_payload(blob) -> dict:
+    return json.loads(zlib.decompress(bytes(blob)))
+
+
+def store_payload(data) -> PaymentEventPayload:
+    digest, blob, size = encode_payload(data)
+    payload, _ = PaymentEventPayload.objects.get_or_create(digest=digest, defaults={"data": blob, "size": size})
+    return payload
+
+
+def store_payloads(items) -> list[int]:
+    """Versão em lote (carga/seed): devolve o id do payload de cada item, na mesma ordem."""
+    encoded = [encode_payload(data) for data in items]
+    by_digest = {digest: (blob, size) for digest, blob, size in encoded}
+    PaymentEventPayload.objects.bulk_create(
+        [PaymentEventPayload(digest=d, data=b, size=s) for d, (b, s) in by_digest.items()],
+        ignore_conflicts=True,
+    )
+    ids = dict(PaymentEventPayload.objects.filter(digest__in=by_digest).values_list("digest", "id"))
+    return [ids[digest] for digest, _, _ in encoded]
+
+
+def record_event(payment, *, event_type: str, provider_event_id: str = "", raw=None) -> tuple[PaymentEvent, bool]:
+    """Grava o evento do webhook; (evento, False) quando o mesmo payload já foi registrado."""
+    payload = store_payload(raw if raw is not None else {})
+    try:
+        with transaction.atomic():
+            event = PaymentEvent.objects.create(
+                payment=payment, event_type=event_type, provider_event_id=provider_event_id, payload=payload,
+            )
+        return event, True
+    except IntegrityError:
+        return PaymentEvent.objects.get(payment=payment, payload=payload), False
+
+
+# ---------- rotação / arquivamento ----------
+
+def month_bounds(year: int, month: int) -> tuple[datetime, datetime]:
+    start = datetime(year, month, 1, tzinfo=dt_timezone.utc)
+    end = datetime(year + (month == 12), month % 12 + 1, 1, tzinfo=dt_timezone.utc)
+    return start, end
+
+
+def months_to_archive(keep_months: int) -> list[tuple[int, int]]:
+    """Meses com eventos mais antigos que os keep_months mais recentes (mês corrente conta)."""
+    now = timezone.now()
+    index = now.year * 12 + now.month - 1 - keep_months
+    cutoff = datetime(index // 12, index % 12 + 1, 1, tzinfo=dt_timezone.utc)
+    first = PaymentEvent.objects.filter(received_at__lt=cutoff).order_by("received_at").values_list("received_at", flat=True).first()
+    if first is None:
+        return []
+    months = []
+    y, m = first.year, first.month
+    while datetime(y, m, 1, tzinfo=dt_timezone.utc) < cutoff:
+        months.append((y, m))
+        y, m = (y + 1, 1) if m == 12 else (y, m + 1)
+    return months
+
+
+def _archive_path(root: Path, year: int, month: int) -> Path:
+    base = root / f"payment-events-{year:04d}-{month:02d}.jsonl.gz"
+    part = 1
+    path = base
+    while path.exists():  # reexecução (eventos atrasados) não sobrescreve o arquivo anterior
+        part += 1
+        path = base.with_name(f"payment-events-{year:04d}-{month:02d}.{part}.jsonl.gz")
+    return path
+
+
+def archive_month(year: int, month: int, *, root=None, batch_size: int = 5000, dry_run: bool = False) -> int:
+    start, end = month_bounds(year, month)
+    qs = PaymentEvent.objects.filter(received_at__gte=start, received_at__lt=end)
+    if dry_run:
+        return qs.count()
+
+    root = Path(root or settings.PAYMENT_EVENTS_ARCHIVE_ROOT)
+    root.mkdir(parents=True, exist_ok=True)
+    path = _archive_path(root, year, month)
+    tmp = path.with_name(path.name + ".tmp")
+
+    total = 0
+    last_id = 0
+    with gzip.open(tmp, "wt", encoding="utf-8") as out:
+        while True:
+            chunk = list(qs.filter(id__gt=last_id).select_related("payload").order_by("id")[:batch_size])
+            if not chunk:
+                break
+            for e in chunk:
+                out.write(json.dumps({
+                    "id": e.id, "payment_id": e.payment_id, "event_type": e.event_type,
+                    "provider_event_id": e.provider_event_id, "received_at": e.received_at.isoformat(),
+                    "payload": e.raw_payload,
+                }, ensure_ascii=False) + "\n")
+            last_id = chunk[-1].id
+            total += len(chunk)
+    if not total:
+        tmp.unlink()
+        return 0
+    os.replace(tmp, path)
+
+    # só apaga depois que o arquivo está completo no disco; em lotes para não travar a tabela
+    ids = list(qs.filter(id__lte=last_id).values_list("id", flat=True))
+    for i in range(0, len(ids), batch_size):
+        PaymentEvent.objects.filter(id__in=ids[i:i + batch_size]).delete()
+    return total
+
+
+def delete_orphan_payloads(batch_size: int = 5000) -> int:
+    deleted = 0
+    while True:
+        ids = list(PaymentEventPayload.objects.filter(events__isnull=True).values_list("id", flat=True)[:batch_size])
+        if not ids:
+            return deleted
+        deleted += PaymentEventPayload.objects.filter(id__in=ids).delete()[0]
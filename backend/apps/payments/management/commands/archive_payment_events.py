@@ -0,0 +1,41 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.payments.events import archive_month, delete_orphan_payloads, months_to_archive
+
+
+class Command(BaseCommand):
+    help = (
+        "Rotação mensal de PaymentEvent: exporta meses antigos para JSONL.gz "
+        "(payload inline) e remove as linhas do banco. Rodar via cron."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--keep-months", type=int, default=None, help="Padrão: PAYMENT_EVENTS_KEEP_MONTHS.")
+        parser.add_argument("--month", help="Arquiva só este mês (YYYY-MM).")
+        parser.add_argument("--root", help="Destino (padrão: PAYMENT_EVENTS_ARCHIVE_ROOT).")
+        parser.add_argument("--batch-size", type=int, default=5000)
+        parser.add_argument("--dry-run", action="store_true")
+
+    def handle(self, *args, keep_months, month, root, batch_size, dry_run, **options):
+        if month:
+            try:
+                year, mon = (int(part) for part in month.split("-"))
+                if not 1 <= mon <= 12:
+                    raise ValueError
+            except ValueError:
+                raise CommandError("--month deve ser YYYY-MM.")
+            months = [(year, mon)]
+        else:
+            keep = settings.PAYMENT_EVENTS_KEEP_MONTHS if keep_months is None else keep_months
+            months = months_to_archive(keep)
+
+        total = 0
+        for year, mon in months:
+            n = archive_month(year, mon, root=root, batch_size=batch_size, dry_run=dry_run)
+            total += n
+            if n:
+                self.stdout.write(f"{year:04d}-{mon:02d}: {n} evento(s){' (dry-run)' if dry_run else ''}")
+
+        orphans = 0 if dry_run else delete_orphan_payloads(batch_size)
+        self.stdout.write(f"{total} evento(s) arquivado(s), {orphans} payload(s) órfão(s) removido(s).")
@@ -0,0 +1,34 @@
+# Generated by Django 6.0.1 on 2026-10-19 15:30
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('payments', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='payment',
+            name='created_at',
+            field=models.DateTimeField(auto_now_add=True, db_index=True),
+        ),
+        migrations.AlterField(
+            model_name='payment',
+            name='provider_payment_id',
+            field=models.CharField(blank=True, db_index=True, default='', max_length=120),
+        ),
+        migrations.AlterField(
+            model_name='paymentevent',
+            name='provider_event_id',
+            field=models.CharField(blank=True, db_index=True, default='', max_length=120),
+        ),
+        migrations.AlterField(
+            model_name='paymentevent',
+            name='received_at',
+            field=models.DateTimeField(db_index=True, default=django.utils.timezone.now),
+        ),
+    ]
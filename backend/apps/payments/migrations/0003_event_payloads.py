@@ -0,0 +1,32 @@
+# Generated by Django 6.0.1 on 2026-10-19 15:50
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+# Payload dos eventos em tabela própria, em três migrações (esquema novo, 0004 copia os dados,
+# 0005 remove o antigo): no PostgreSQL, ALTER TABLE na mesma transação do RunPython falha com
+# "pending trigger events".
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('payments', '0002_admin_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PaymentEventPayload',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('digest', models.CharField(max_length=64, unique=True)),
+                ('data', models.BinaryField()),
+                ('size', models.PositiveIntegerField(default=0)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+            ],
+        ),
+        migrations.AddField(
+            model_name='paymentevent',
+            name='payload',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.PROTECT, related_name='events', to='payments.paymenteventpayload'),
+        ),
+    ]
@@ -0,0 +1,43 @@
+# Generated by Django 6.0.1 on 2026-10-19 15:50
+
+import hashlib
+import json
+import zlib
+
+from django.db import migrations
+
+
+def move_payloads(apps, schema_editor):
+    """raw_payload (JSON) -> PaymentEventPayload comprimido; eventos repetidos do mesmo payment são descartados."""
+    PaymentEvent = apps.get_model("payments", "PaymentEvent")
+    PaymentEventPayload = apps.get_model("payments", "PaymentEventPayload")
+    payload_ids = {}
+    seen = set()
+    duplicates = []
+    for event in PaymentEvent.objects.order_by("id").iterator(chunk_size=2000):
+        raw = json.dumps(event.raw_payload, sort_keys=True, separators=(",", ":"), ensure_ascii=False, default=str).encode("utf-8")
+        digest = hashlib.sha256(raw).hexdigest()
+        if digest not in payload_ids:
+            payload, _ = PaymentEventPayload.objects.get_or_create(
+                digest=digest, defaults={"data": zlib.compress(raw, 6), "size": len(raw)},
+            )
+            payload_ids[digest] = payload.id
+        key = (event.payment_id, payload_ids[digest])
+        if key in seen:
+            duplicates.append(event.id)
+            continue
+        seen.add(key)
+        PaymentEvent.objects.filter(id=event.id).update(payload_id=payload_ids[digest])
+    for i in range(0, len(duplicates), 1000):
+        PaymentEvent.objects.filter(id__in=duplicates[i:i + 1000]).delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('payments', '0003_event_payloads'),
+    ]
+
+    operations = [
+        migrations.RunPython(move_payloads, migrations.RunPython.noop),
+    ]
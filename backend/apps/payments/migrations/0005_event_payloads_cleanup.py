@@ -0,0 +1,32 @@
+# Generated by Django 6.0.1 on 2026-10-19 15:50
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('payments', '0004_move_event_payloads'),
+    ]
+
+    operations = [
+        migrations.RemoveField(
+            model_name='paymentevent',
+            name='raw_payload',
+        ),
+        migrations.AddIndex(
+            model_name='paymentevent',
+            index=models.Index(fields=['payment', 'received_at'], name='paymentevent_timeline_idx'),
+        ),
+        migrations.AddConstraint(
+            model_name='paymentevent',
+            constraint=models.UniqueConstraint(fields=('payment', 'payload'), name='uniq_paymentevent_payload'),
+        ),
+        # o índice composto acima substitui o índice simples de payment
+        migrations.AlterField(
+            model_name='paymentevent',
+            name='payment',
+            field=models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='events', to='payments.payment'),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 6.0.1 on 2026-10-19 16:30
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('payments', '0005_event_payloads_cleanup'),
+    ]
+
+    operations = [
+        migrations.RemoveField(
+            model_name='payment',
+            name='pix_qr_code_base64',
+        ),
+    ]
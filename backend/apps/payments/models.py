@@ -33,15 +33,14 @@ class Payment(models.Model):
     currency = models.CharField(max_length=10, default="BRL")
 
     # IDs/refs do provedor
-    provider_payment_id = models.CharField(max_length=120, blank=True, default="")
+    provider_payment_id = models.CharField(max_length=120, blank=True, default="", db_index=True)
     idempotency_key = models.CharField(max_length=80, unique=True)
 
-    # Dados úteis (Pix QR, link, etc.)
+    # Pix: só o copia e cola (EMV); a imagem do QR é gerada sob demanda (apps.payments.qr)
     pix_qr_code = models.TextField(blank=True, default="")
-    pix_qr_code_base64 = models.TextField(blank=True, default="")
     pix_expires_at = models.DateTimeField(null=True, blank=True)
 
-    created_at = models.DateTimeField(auto_now_add=True)
+    created_at = models.DateTimeField(auto_now_add=True, db_index=True)
     updated_at = models.DateTimeField(auto_now=True)
 
     def mark_paid(self):
@@ -54,12 +53,46 @@ class Payment(models.Model):
         return f"Payment order={self.order_id} {self.method} {self.status}"
 
 
+class PaymentEventPayload(models.Model):
+    """
+    Payload de webhook deduplicado: JSON canônico comprimido com zlib, chave = sha256.
+    Notificações repetidas (o Mercado Pago manda várias) apontam para a mesma linha.
+    """
+    digest = models.CharField(max_length=64, unique=True)
+    data = models.BinaryField()
+    size = models.PositiveIntegerField(default=0)  # bytes do JSON sem compressão
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    def decoded(self):
+        from .events import decode_payload
+        return decode_payload(self.data)
+
+    def __str__(self) -> str:
+        return self.digest[:12]
+
+
 class PaymentEvent(models.Model):
-    payment = models.ForeignKey(Payment, on_delete=models.CASCADE, related_name="events")
+    # índice composto (payment, received_at) abaixo cobre o filtro por payment
+    payment = models.ForeignKey(Payment, on_delete=models.CASCADE, related_name="events", db_index=False)
     event_type = models.CharField(max_length=80)
-    provider_event_id = models.CharField(max_length=120, blank=True, default="")
-    raw_payload = models.JSONField(default=dict)
-    received_at = models.DateTimeField(default=timezone.now)
+    provider_event_id = models.CharField(max_length=120, blank=True, default="", db_index=True)
+    payload = models.ForeignKey(
+        PaymentEventPayload, on_delete=models.PROTECT, related_name="events", null=True, blank=True,
+    )
+    received_at = models.DateTimeField(default=timezone.now, db_index=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["payment", "received_at"], name="paymentevent_timeline_idx"),
+        ]
+        constraints = [
+            # mesma notificação repetida para o mesmo pagamento = um evento só
+            models.UniqueConstraint(fields=["payment", "payload"], name="uniq_paymentevent_payload"),
+        ]
+
+    @property
+    def raw_payload(self):
+        return self.payload.decoded() if self.payload_id else {}
 
     def __str__(self) -> str:
         return f"{self.event_type} payment={self.payment_id}"
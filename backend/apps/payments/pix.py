@@ -0,0 +1,42 @@
+"""
+BR Code (EMV QRCPS-MPM) do Pix: usado pelo provider dummy para gerar um "copia e cola"
+no mesmo formato que o Mercado Pago devolve (o QR em si é desenhado por apps.payments.qr).
+"""
+import unicodedata
+from decimal import Decimal
+
+
+def _field(tag: str, value: str) -> str:
+    return f"{tag}{len(value):02d}{value}"
+
+
+def _ascii(value: str, limit: int) -> str:
+    text = unicodedata.normalize("NFKD", value).encode("ascii", "ignore").decode("ascii")
+    return text.upper()[:limit] or "NA"
+
+
+def crc16_ccitt(data: str) -> str:
+    crc = 0xFFFF
+    for byte in data.encode("utf-8"):
+        crc ^= byte << 8
+        for _ in range(8):
+            crc = ((crc << 1) ^ 0x1021) if crc & 0x8000 else crc << 1
+            crc &= 0xFFFF
+    return f"{crc:04X}"
+
+
+def build_emv(*, key: str, amount: Decimal, txid: str, merchant_name: str, merchant_city: str) -> str:
+    account = _field("00", "br.gov.bcb.pix") + _field("01", key)
+    payload = (
+        _field("00", "01")
+        + _field("26", account)
+        + _field("52", "0000")
+        + _field("53", "986")
+        + _field("54", f"{amount:.2f}")
+        + _field("58", "BR")
+        + _field("59", _ascii(merchant_name, 25))
+        + _field("60", _ascii(merchant_city, 15))
+        + _field("62", _field("05", "".join(ch for ch in txid if ch.isalnum())[:25] or "***"))
+        + "6304"
+    )
+    return payload + crc16_ccitt(payload)
@@ -19,6 +19,11 @@ class PaymentProvider(Protocol):
     name: str
 
     def create_payment(self, payment: Payment, *, payer_email: str, card_data: dict | None = None) -> Payment:
+        """Cartão: preenche payment.card_bin (não persistido) com o BIN da resposta do gateway, "" se não veio."""
+        ...
+
+    def cancel_payment(self, payment: Payment) -> Payment:
+        """Desfaz no gateway um pagamento já criado (negado pela análise de risco depois do BIN)."""
         ...
 
     def parse_webhook(self, request) -> WebhookEvent:
@@ -1,29 +1,41 @@
-import base64
 import uuid
 from datetime import timedelta
+from django.conf import settings
 from django.utils import timezone
 
 from apps.payments.models import Payment
+from apps.payments.pix import build_emv
 from .base import WebhookEvent
 
 
 class DummyProvider:
     name = "dummy"
 
-    def create_payment(self, payment: Payment) -> Payment:
+    def create_payment(self, payment: Payment, *, payer_email: str = "", card_data: dict | None = None) -> Payment:
         if payment.method == Payment.Method.PIX:
-            qr_text = f"PIX-DUMMY-{uuid.uuid4()}"
-            payment.pix_qr_code = qr_text
-            payment.pix_qr_code_base64 = base64.b64encode(qr_text.encode("utf-8")).decode("utf-8")
+            # BR Code no mesmo formato do MP (QR escaneável; o pagamento em si é simulado)
+            payment.pix_qr_code = build_emv(
+                key=settings.PIX_DUMMY_KEY,
+                amount=payment.amount,
+                txid=f"DUMMY{payment.order_id}",
+                merchant_name=settings.PIX_MERCHANT_NAME,
+                merchant_city=settings.PIX_MERCHANT_CITY,
+            )
             payment.pix_expires_at = timezone.now() + timedelta(minutes=30)
             payment.status = Payment.Status.PENDING
         else:
             payment.status = Payment.Status.PENDING
+            payment.card_bin = ""  # sem gateway: BIN desconhecido
 
         payment.provider_payment_id = f"dummy_{uuid.uuid4()}"
         payment.save()
         return payment
 
+    def cancel_payment(self, payment: Payment) -> Payment:
+        payment.status = Payment.Status.CANCELED
+        payment.save(update_fields=["status", "updated_at"])
+        return payment
+
     def parse_webhook(self, request) -> WebhookEvent:
         payload = request.data or {}
         payment_id = str(payload.get("payment_id", ""))
@@ -7,6 +7,7 @@ from typing import Optional
 import requests
 from django.conf import settings
 
+from apps.core.tracing import span
 from apps.payments.models import Payment
 from .base import WebhookEvent
 
@@ -89,12 +90,13 @@ class MercadoPagoProvider:
                 "payer": {"email": payer_email},
             }
 
-            r = requests.post(
-                f"{MP_API}/v1/payments",
-                headers=_auth_headers(payment.idempotency_key),
-                data=json.dumps(payload),
-                timeout=25,
-            )
+            with span("http"):
+                r = requests.post(
+                    f"{MP_API}/v1/payments",
+                    headers=_auth_headers(payment.idempotency_key),
+                    data=json.dumps(payload),
+                    timeout=25,
+                )
             if r.status_code >= 400:
                 raise RuntimeError(f"MP {r.status_code}: {r.text}")
 
@@ -106,8 +108,8 @@ class MercadoPagoProvider:
 
             poi = data.get("point_of_interaction") or {}
             tx = poi.get("transaction_data") or {}
+            # qr_code_base64 do MP é ignorado: a imagem é desenhada localmente a partir do qr_code
             payment.pix_qr_code = tx.get("qr_code") or ""
-            payment.pix_qr_code_base64 = tx.get("qr_code_base64") or ""
 
             payment.save()
             return payment
@@ -129,12 +131,13 @@ class MercadoPagoProvider:
             if issuer_id:
                 payload["issuer_id"] = issuer_id
 
-            r = requests.post(
-                f"{MP_API}/v1/payments",
-                headers=_auth_headers(payment.idempotency_key),
-                data=json.dumps(payload),
-                timeout=25,
-            )
+            with span("http"):
+                r = requests.post(
+                    f"{MP_API}/v1/payments",
+                    headers=_auth_headers(payment.idempotency_key),
+                    data=json.dumps(payload),
+                    timeout=25,
+                )
             if r.status_code >= 400:
                 raise RuntimeError(f"MP {r.status_code}: {r.text}")
 
@@ -143,12 +146,33 @@ class MercadoPagoProvider:
             payment.provider = self.name
             payment.provider_payment_id = str(data.get("id", ""))
             payment.status = _map_mp_status_to_internal(str(data.get("status", "")))
+            # BIN vem do próprio gateway na resposta (card.first_six_digits): sem chamada extra
+            payment.card_bin = str((data.get("card") or {}).get("first_six_digits") or "")
 
             payment.save()
             return payment
 
         raise RuntimeError(f"Método não suportado: {payment.method}")
 
+    def cancel_payment(self, payment: Payment) -> Payment:
+        """Aprovado: estorno total (POST /refunds). Pendente: PUT status=cancelled. Recusado: nada a desfazer."""
+        if not payment.provider_payment_id or payment.status in (Payment.Status.FAILED, Payment.Status.CANCELED):
+            return payment
+
+        headers = _auth_headers(f"{payment.idempotency_key}-cancel")
+        url = f"{MP_API}/v1/payments/{payment.provider_payment_id}"
+        with span("http"):
+            if payment.status == Payment.Status.PAID:
+                r = requests.post(f"{url}/refunds", headers=headers, data="{}", timeout=25)
+            else:
+                r = requests.put(url, headers=headers, data=json.dumps({"status": "cancelled"}), timeout=25)
+        if r.status_code >= 400:
+            raise RuntimeError(f"MP {r.status_code}: {r.text}")
+
+        payment.status = Payment.Status.REFUNDED if payment.status == Payment.Status.PAID else Payment.Status.CANCELED
+        payment.save(update_fields=["status", "updated_at"])
+        return payment
+
     def parse_webhook(self, request) -> WebhookEvent:
         payload = request.data or {}
         data = payload.get("data") or {}
@@ -181,11 +205,12 @@ class MercadoPagoProvider:
         if not token:
             raise RuntimeError("MERCADOPAGO_ACCESS_TOKEN não configurado.")
 
-        r = requests.get(
-            f"{MP_API}/v1/payments/{payment.provider_payment_id}",
-            headers={"Authorization": f"Bearer {token}"},
-            timeout=25,
-        )
+        with span("http"):
+            r = requests.get(
+                f"{MP_API}/v1/payments/{payment.provider_payment_id}",
+                headers={"Authorization": f"Bearer {token}"},
+                timeout=25,
+            )
         if r.status_code >= 400:
             raise RuntimeError(f"MP {r.status_code}: {r.text}")
 
@@ -195,11 +220,8 @@ class MercadoPagoProvider:
         poi = data.get("point_of_interaction") or {}
         tx = poi.get("transaction_data") or {}
         qr = tx.get("qr_code") or ""
-        qr64 = tx.get("qr_code_base64") or ""
         if qr:
             payment.pix_qr_code = qr
-        if qr64:
-            payment.pix_qr_code_base64 = qr64
 
-        payment.save(update_fields=["status", "pix_qr_code", "pix_qr_code_base64", "updated_at"])
+        payment.save(update_fields=["status", "pix_qr_code", "updated_at"])
         return payment
@@ -1,9 +1,43 @@
+import time
+
+from apps.core.metrics import payment_provider_call_duration_seconds
 from .dummy import DummyProvider
 from .mercado_pago import MercadoPagoProvider
 
+
+class InstrumentedProvider:
+    """
+    Proxy que mede cada chamada de método do provider
+    (histograma payment_provider_call_duration_seconds em /metrics).
+    """
+
+    def __init__(self, provider):
+        self._provider = provider
+        self.name = provider.name
+
+    def __getattr__(self, attr):
+        value = getattr(self._provider, attr)
+        if not callable(value):
+            return value
+
+        def timed(*args, **kwargs):
+            start = time.perf_counter()
+            outcome = "error"
+            try:
+                result = value(*args, **kwargs)
+                outcome = "ok"
+                return result
+            finally:
+                payment_provider_call_duration_seconds.observe(
+                    time.perf_counter() - start, provider=self.name, operation=attr, outcome=outcome,
+                )
+
+        return timed
+
+
 _PROVIDERS = {
-    "dummy": DummyProvider(),
-    "mercado_pago": MercadoPagoProvider(),
+    "dummy": InstrumentedProvider(DummyProvider()),
+    "mercado_pago": InstrumentedProvider(MercadoPagoProvider()),
 }
 
 def get_provider(name: str):
@@ -0,0 +1,75 @@
+"""
+QR Code do Pix desenhado no servidor a partir do "copia e cola" (pix_qr_code).
+
+Mesmo texto -> mesmos bytes, qualquer que seja o provider (parâmetros fixos: ECC M, sem boost).
+Cache por hash do conteúdo em dois níveis: LRU em memória (limitado em bytes, por processo)
+e disco (PIX_QR_CACHE_DIR, compartilhado entre workers). A URL leva o hash, então é imutável
+e pode ficar em cache no navegador/CDN para sempre.
+"""
+import hashlib
+import io
+import os
+import threading
+from pathlib import Path
+
+import segno
+from django.conf import settings
+from django.urls import reverse
+
+from apps.core.lru import ByteLRU
+
+FORMATS = {"png": "image/png", "svg": "image/svg+xml"}
+SCALE = 8
+BORDER = 4
+
+
+def qr_digest(emv: str) -> str:
+    return hashlib.sha256(emv.encode("utf-8")).hexdigest()[:32]
+
+
+def render_qr(emv: str, fmt: str) -> bytes:
+    qr = segno.make(emv, error="m", boost_error=False, micro=False)
+    buffer = io.BytesIO()
+    if fmt == "svg":
+        # documento SVG completo (com xmlns) para funcionar em <img src>
+        qr.save(buffer, kind="svg", scale=SCALE, border=BORDER, xmldecl=False)
+    else:
+        qr.save(buffer, kind="png", scale=SCALE, border=BORDER)
+    return buffer.getvalue()
+
+
+_memory = ByteLRU(getattr(settings, "PIX_QR_MEMORY_CACHE_BYTES", 8 * 1024 * 1024))
+
+
+def _disk_path(digest: str, fmt: str) -> Path:
+    return Path(settings.PIX_QR_CACHE_DIR) / digest[:2] / f"{digest}.{fmt}"
+
+
+def get_qr(emv: str, fmt: str) -> bytes:
+    """memória -> disco -> renderiza (e preenche os dois níveis)."""
+    key = f"{qr_digest(emv)}.{fmt}"
+    data = _memory.get(key)
+    if data is not None:
+        return data
+
+    path = _disk_path(qr_digest(emv), fmt)
+    try:
+        data = path.read_bytes()
+    except OSError:
+        data = render_qr(emv, fmt)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+            tmp.write_bytes(data)
+            os.replace(tmp, path)
+        except OSError:
+            pass  # disco é só cache: sem ele, segue com memória
+    _memory.put(key, data)
+    return data
+
+
+def qr_url(payment, fmt: str = "png", request=None) -> str | None:
+    if not payment.pix_qr_code:
+        return None
+    url = reverse("payment-qr", kwargs={"pk": payment.pk, "digest": qr_digest(payment.pix_qr_code), "fmt": fmt})
+    return request.build_absolute_uri(url) if request is not None else url
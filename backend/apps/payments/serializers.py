@@ -1,7 +1,10 @@
 # backend/apps/payments/serializers.py
 from rest_framework import serializers
+from apps.core.serializers import PlainSerializer, decimal_str
+from apps.orders import ingest
 from apps.orders.models import Order
 from .models import Payment
+from .qr import qr_url
 
 class CardDataSerializer(serializers.Serializer):
     token = serializers.CharField()
@@ -20,7 +23,8 @@ class PaymentCreateSerializer(serializers.Serializer):
     card = CardDataSerializer(required=False)
 
     def validate_order_id(self, order_id: int) -> int:
-        if not Order.objects.filter(id=order_id).exists():
+        # pedido recém-aceito pela ingestão em lote pode ainda estar na fila do writer
+        if not Order.objects.filter(id=order_id).exists() and not ingest.wait_written(order_id):
             raise serializers.ValidationError("Pedido não encontrado.")
         return order_id
 
@@ -34,6 +38,10 @@ class PaymentCreateSerializer(serializers.Serializer):
         return attrs
 
 class PaymentSerializer(serializers.ModelSerializer):
+    # QR desenhado no servidor a partir do copia e cola (URL imutável, com hash do conteúdo)
+    pix_qr_png_url = serializers.SerializerMethodField()
+    pix_qr_svg_url = serializers.SerializerMethodField()
+
     class Meta:
         model = Payment
         fields = (
@@ -44,7 +52,33 @@ class PaymentSerializer(serializers.ModelSerializer):
             "status",
             "amount",
             "pix_qr_code",
-            "pix_qr_code_base64",
+            "pix_qr_png_url",
+            "pix_qr_svg_url",
             "pix_expires_at",
             "created_at",
         )
+
+    def get_pix_qr_png_url(self, obj):
+        return qr_url(obj, "png", self.context.get("request"))
+
+    def get_pix_qr_svg_url(self, obj):
+        return qr_url(obj, "svg", self.context.get("request"))
+
+
+class PaymentPlainSerializer(PlainSerializer):
+    """Mesma saída do PaymentSerializer."""
+
+    def to_representation(self, obj) -> dict:
+        return {
+            "id": obj.id,
+            "order": obj.order_id,
+            "provider": obj.provider,
+            "method": obj.method,
+            "status": obj.status,
+            "amount": decimal_str(obj.amount),
+            "pix_qr_code": obj.pix_qr_code,
+            "pix_qr_png_url": qr_url(obj, "png", self.request),
+            "pix_qr_svg_url": qr_url(obj, "svg", self.request),
+            "pix_expires_at": obj.pix_expires_at,
+            "created_at": obj.created_at,
+        }
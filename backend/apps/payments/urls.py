@@ -1,9 +1,16 @@
-from django.urls import path
-from .views import PaymentCreateAPIView, PaymentDetailAPIView, PaymentWebhookAPIView, PayNowForMyOrderAPIView
+from django.urls import path, re_path
+from .views import (
+    PaymentCreateAPIView, PaymentDetailAPIView, PaymentQRCodeView, PaymentWebhookAPIView, PayNowForMyOrderAPIView,
+)
 
 urlpatterns = [
     path("payments/create/", PaymentCreateAPIView.as_view(), name="payment-create"),
     path("payments/<int:pk>/", PaymentDetailAPIView.as_view(), name="payment-detail"),
+    re_path(
+        r"^payments/(?P<pk>\d+)/qr/(?P<digest>[0-9a-f]{32})\.(?P<fmt>png|svg)$",
+        PaymentQRCodeView.as_view(),
+        name="payment-qr",
+    ),
     path("payments/webhook/<str:provider>/", PaymentWebhookAPIView.as_view(), name="payment-webhook"),
     path("my/orders/<int:order_id>/pay/", PayNowForMyOrderAPIView.as_view(), name="my-order-pay"),
 ]
\ No newline at end of file
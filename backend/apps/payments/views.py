@@ -1,7 +1,10 @@
+import logging
 import uuid
 from typing import Any, Dict, Optional
 
 from django.conf import settings
+from django.http import Http404, HttpResponse
+from django.views import View
 from rest_framework import status
 from rest_framework.generics import RetrieveAPIView
 from rest_framework.permissions import AllowAny, IsAuthenticated
@@ -9,11 +12,51 @@ from rest_framework.response import Response
 from rest_framework.views import APIView
 from rest_framework.exceptions import ValidationError, PermissionDenied
 
+from apps.core.throttling import PUBLIC_WRITE_THROTTLES
+from apps.core.views import AsyncJSONView
+from apps.orders import ingest
 from apps.orders.models import Order
-from .models import Payment, PaymentEvent
-from .serializers import PaymentCreateSerializer, PaymentSerializer
+from apps.risk.scoring import evaluate as evaluate_risk, recheck_card_bin, record_decision
+from .events import record_event
+from .models import Payment
+from .qr import FORMATS, get_qr, qr_digest
+from .serializers import PaymentCreateSerializer, PaymentSerializer, PaymentPlainSerializer
 from .providers.registry import get_provider
 
+RISK_DENIED = {"detail": "Pagamento com cartão recusado pela análise de risco. Tente pagar com Pix.", "code": "risk_denied"}
+
+logger = logging.getLogger("apps.payments")
+
+
+def score_before_gateway(order, request, method: str):
+    """Só contadores em memória. Cartão registra a decisão só no recheck (uma linha por pagamento)."""
+    card = method == Payment.Method.CARD
+    decision = evaluate_risk(order, request, method=method, record=not card)
+    if decision and decision.denied and card:
+        record_decision(decision)
+    return decision
+
+
+def recheck_after_gateway(provider, payment: Payment, decision) -> bool:
+    """
+    Cartão: repontua com o BIN que veio na resposta do create_payment (nada de HTTP para pontuar).
+    Negado: desfaz no gateway (cancela ou estorna) e apaga o Payment local, como na negação antes do
+    gateway, para o cliente poder pagar com Pix. True = desfeito, responder RISK_DENIED.
+    """
+    if decision is None or payment.method != Payment.Method.CARD:
+        return False
+    decision = recheck_card_bin(decision, getattr(payment, "card_bin", ""))
+    if not decision.denied:
+        return False
+    try:
+        provider.cancel_payment(payment)
+    except Exception:
+        # fica como está; a decisão (deny) está registrada para revisão manual
+        logger.exception("pagamento %s negado pela análise de risco, mas não foi desfeito no gateway", payment.pk)
+        return False
+    payment.delete()
+    return True
+
 
 class PaymentDetailAPIView(RetrieveAPIView):
     """
@@ -24,6 +67,40 @@ class PaymentDetailAPIView(RetrieveAPIView):
     permission_classes = [AllowAny]
 
 
+class PaymentDetailAsyncView(AsyncJSONView):
+    """
+    GET /api/v1/async/payments/<id>/  (mesma saída de PaymentDetailAPIView; usado no polling do status)
+    """
+
+    async def get(self, request, pk):
+        payment = await Payment.objects.filter(pk=pk).afirst()
+        if payment is None:
+            return self.not_found()
+        return self.json(PaymentPlainSerializer(payment, context={"request": request}).data)
+
+
+class PaymentQRCodeView(View):
+    """
+    GET /api/v1/payments/<id>/qr/<hash>.png|svg
+
+    O hash é do conteúdo (copia e cola): resposta imutável, cache eterno no navegador/CDN.
+    Hash diferente do atual (QR trocado) = 404.
+    """
+    http_method_names = ["get", "head"]
+
+    def get(self, request, pk: int, digest: str, fmt: str):
+        emv = Payment.objects.filter(pk=pk).values_list("pix_qr_code", flat=True).first()
+        if not emv or fmt not in FORMATS or qr_digest(emv) != digest:
+            raise Http404
+        if request.headers.get("If-None-Match") == f'"{digest}"':
+            response = HttpResponse(status=304)
+        else:
+            response = HttpResponse(get_qr(emv, fmt), content_type=FORMATS[fmt])
+        response["ETag"] = f'"{digest}"'
+        response["Cache-Control"] = "public, max-age=31536000, immutable"
+        return response
+
+
 class PaymentCreateAPIView(APIView):
     """
     POST /api/v1/payments/create/
@@ -36,10 +113,12 @@ class PaymentCreateAPIView(APIView):
       "card": { ... }   # obrigatório se method == card e provider == mercado_pago
     }
 
-    - Para Pix: cria na hora e retorna qr_code / base64 (se provider retornar)
+    - Para Pix: cria na hora e retorna o copia e cola + URLs do QR (desenhado no servidor)
     - Para Card (MP): exige tokenização no frontend e envia card payload
     """
     permission_classes = [AllowAny]
+    throttle_classes = PUBLIC_WRITE_THROTTLES
+    throttle_scope = "payment_create"
 
     def post(self, request):
         s = PaymentCreateSerializer(data=request.data)
@@ -50,7 +129,7 @@ class PaymentCreateAPIView(APIView):
         provider_name = s.validated_data.get("provider") or "dummy"
         card_data = s.validated_data.get("card")
 
-        order = Order.objects.get(id=order_id)
+        order = ingest.get_order(id=order_id)
         provider = get_provider(provider_name)
 
         # idempotency: se o front mandar header, usamos; senão geramos
@@ -70,7 +149,12 @@ class PaymentCreateAPIView(APIView):
         )
 
         if not created:
-            return Response(PaymentSerializer(payment).data, status=status.HTTP_200_OK)
+            return Response(PaymentSerializer(payment, context={"request": request}).data, status=status.HTTP_200_OK)
+
+        decision = score_before_gateway(order, request, method)
+        if decision and decision.denied:
+            payment.delete()
+            return Response(RISK_DENIED, status=status.HTTP_403_FORBIDDEN)
 
         # chama provider para criar o pagamento no gateway
         try:
@@ -84,7 +168,10 @@ class PaymentCreateAPIView(APIView):
             payment.delete()
             raise ValidationError({"detail": f"Falha ao criar pagamento: {str(e)}"})
 
-        return Response(PaymentSerializer(payment).data, status=status.HTTP_201_CREATED)
+        if recheck_after_gateway(provider, payment, decision):
+            return Response(RISK_DENIED, status=status.HTTP_403_FORBIDDEN)
+
+        return Response(PaymentSerializer(payment, context={"request": request}).data, status=status.HTTP_201_CREATED)
 
 
 class PayNowForMyOrderAPIView(APIView):
@@ -107,7 +194,7 @@ class PayNowForMyOrderAPIView(APIView):
         user = request.user
 
         try:
-            order = Order.objects.get(id=order_id)
+            order = ingest.get_order(id=order_id)
         except Order.DoesNotExist:
             return Response({"detail": "Pedido não encontrado."}, status=404)
 
@@ -128,7 +215,11 @@ class PayNowForMyOrderAPIView(APIView):
         # se já existe payment para este order, devolve
         existing = Payment.objects.filter(order=order).first()
         if existing:
-            return Response(PaymentSerializer(existing).data, status=200)
+            return Response(PaymentSerializer(existing, context={"request": request}).data, status=200)
+
+        decision = score_before_gateway(order, request, method)
+        if decision and decision.denied:
+            return Response(RISK_DENIED, status=status.HTTP_403_FORBIDDEN)
 
         idempotency_key = request.headers.get("Idempotency-Key") or str(uuid.uuid4())
 
@@ -152,7 +243,10 @@ class PayNowForMyOrderAPIView(APIView):
             payment.delete()
             raise ValidationError({"detail": f"Falha ao criar pagamento: {str(e)}"})
 
-        return Response(PaymentSerializer(payment).data, status=status.HTTP_201_CREATED)
+        if recheck_after_gateway(provider, payment, decision):
+            return Response(RISK_DENIED, status=status.HTTP_403_FORBIDDEN)
+
+        return Response(PaymentSerializer(payment, context={"request": request}).data, status=status.HTTP_201_CREATED)
 
 
 class PaymentWebhookAPIView(APIView):
@@ -181,11 +275,12 @@ class PaymentWebhookAPIView(APIView):
             # webhook pode chegar antes do seu sistema persistir; responde 200 para evitar retry infinito
             return Response({"ok": True, "detail": "payment não encontrado localmente"}, status=200)
 
-        PaymentEvent.objects.create(
-            payment=payment,
+        # payload deduplicado/comprimido; reenvio idêntico do provedor não cria outra linha
+        record_event(
+            payment,
             event_type=event.event_type,
             provider_event_id=event.provider_event_id,
-            raw_payload=event.raw,
+            raw=event.raw,
         )
 
         # sempre preferir buscar status real no gateway (quando disponível)
@@ -0,0 +1,18 @@
+from django.contrib import admin
+from .models import Promotion, PromotionRedemption
+
+
+@admin.register(Promotion)
+class PromotionAdmin(admin.ModelAdmin):
+    list_display = ("name", "code", "kind", "value", "category", "brand", "active", "usage_count", "usage_limit", "ends_at")
+    list_filter = ("active", "kind")
+    list_select_related = ("category", "brand")
+    search_fields = ("name", "code")
+    readonly_fields = ("usage_count",)
+
+
+@admin.register(PromotionRedemption)
+class PromotionRedemptionAdmin(admin.ModelAdmin):
+    list_display = ("id", "promotion", "order_id", "amount", "created_at")
+    list_select_related = ("promotion",)
+    raw_id_fields = ("order",)
@@ -0,0 +1,266 @@
+"""
+Motor de promoções: as regras ativas são compiladas num índice em memória
+(por código de cupom, por categoria, por marca e globais), reconstruído quando uma
+Promotion muda. Avaliar um carrinho só olha as regras das categorias/marcas presentes,
+sem varrer todas as promoções.
+
+Invalidação: post_save/post_delete incrementam uma versão no cache do Django
+(com cache compartilhado vale entre processos) e o índice local também expira por TTL.
+"""
+import threading
+import time
+from collections import defaultdict
+from dataclasses import dataclass, field
+from datetime import datetime
+from decimal import ROUND_HALF_UP, Decimal
+from typing import NamedTuple
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import F, Q
+from django.utils import timezone
+
+from apps.catalog.models import Product
+from .models import Promotion, PromotionRedemption
+
+ZERO = Decimal("0.00")
+CENT = Decimal("0.01")
+VERSION_KEY = "promotions:index_version"
+
+
+class CartLine(NamedTuple):
+    product_id: int
+    category_id: int | None
+    brand_id: int | None
+    total: Decimal
+
+
+@dataclass(frozen=True, slots=True)
+class Rule:
+    id: int
+    code: str | None
+    kind: str
+    value: Decimal
+    category_id: int | None
+    brand_id: int | None
+    min_subtotal: Decimal
+    starts_at: datetime | None
+    ends_at: datetime | None
+    usage_limit: int | None
+
+    def is_live(self, now) -> bool:
+        return (self.starts_at is None or self.starts_at <= now) and (self.ends_at is None or now < self.ends_at)
+
+    def eligible_total(self, lines) -> Decimal:
+        total = ZERO
+        for line in lines:
+            if self.category_id is not None and line.category_id != self.category_id:
+                continue
+            if self.brand_id is not None and line.brand_id != self.brand_id:
+                continue
+            total += line.total
+        return total
+
+    def discount(self, lines, shipping_price: Decimal) -> Decimal:
+        eligible = self.eligible_total(lines)
+        if eligible <= ZERO:
+            return ZERO
+        if self.kind == Promotion.Kind.PERCENTAGE:
+            return (eligible * self.value / 100).quantize(CENT, rounding=ROUND_HALF_UP)
+        if self.kind == Promotion.Kind.FIXED:
+            return min(self.value, eligible)
+        if self.kind == Promotion.Kind.FREE_SHIPPING:
+            return shipping_price
+        return ZERO
+
+
+@dataclass
+class Evaluation:
+    discount: Decimal = ZERO
+    applied: list = field(default_factory=list)  # [(Rule, valor)]
+    coupon_error: str = ""
+
+    @property
+    def coupon_code(self) -> str:
+        return next((rule.code for rule, _ in self.applied if rule.code), "")
+
+
+class PromotionIndex:
+    def __init__(self, rules):
+        self.by_code: dict[str, Rule] = {}
+        self.global_rules: list[Rule] = []
+        self.by_category: dict[int, list[Rule]] = defaultdict(list)
+        self.by_brand: dict[int, list[Rule]] = defaultdict(list)
+        self.size = 0
+
+        for rule in rules:
+            self.size += 1
+            if rule.code:
+                self.by_code[rule.code] = rule
+            elif rule.category_id is not None:
+                # categoria+marca: indexada pela categoria, a marca é checada no eligible_total
+                self.by_category[rule.category_id].append(rule)
+            elif rule.brand_id is not None:
+                self.by_brand[rule.brand_id].append(rule)
+            else:
+                self.global_rules.append(rule)
+
+    def candidates(self, lines) -> list[Rule]:
+        rules = list(self.global_rules)
+        for category_id in {line.category_id for line in lines}:
+            rules.extend(self.by_category.get(category_id, ()))
+        for brand_id in {line.brand_id for line in lines}:
+            rules.extend(self.by_brand.get(brand_id, ()))
+        return rules
+
+    def evaluate(self, lines, *, shipping_price: Decimal = ZERO, code: str = "", now=None, exclude=()) -> Evaluation:
+        """
+        Política: aplica o MAIOR desconto em dinheiro (automáticas + cupom, sem acumular)
+        e, separadamente, o melhor frete grátis. Desconto total nunca passa de subtotal + frete.
+        """
+        now = now or timezone.now()
+        subtotal = sum((line.total for line in lines), ZERO)
+        result = Evaluation()
+
+        rules = [r for r in self.candidates(lines) if r.id not in exclude]
+        code = (code or "").strip().upper()
+        if code:
+            coupon = self.by_code.get(code)
+            if coupon is None or coupon.id in exclude or not coupon.is_live(now):
+                result.coupon_error = "Cupom inválido ou expirado."
+            elif subtotal < coupon.min_subtotal:
+                result.coupon_error = f"Cupom válido para compras acima de {coupon.min_subtotal}."
+            elif coupon.eligible_total(lines) <= ZERO:
+                result.coupon_error = "Cupom não se aplica aos itens do carrinho."
+            else:
+                rules.append(coupon)
+
+        best_money = best_shipping = None
+        for rule in rules:
+            if not rule.is_live(now) or subtotal < rule.min_subtotal:
+                continue
+            amount = rule.discount(lines, shipping_price)
+            if amount <= ZERO:
+                continue
+            if rule.kind == Promotion.Kind.FREE_SHIPPING:
+                if best_shipping is None or (best_shipping[0].code and not rule.code):
+                    best_shipping = (rule, amount)
+            elif best_money is None or amount > best_money[1]:
+                best_money = (rule, amount)
+
+        for chosen in (best_money, best_shipping):
+            if chosen:
+                result.applied.append(chosen)
+        result.discount = min(sum((amount for _, amount in result.applied), ZERO), subtotal + shipping_price)
+        return result
+
+
+def promotion_lines(items, price_of) -> list[CartLine]:
+    """
+    Itens do checkout -> CartLine (categoria/marca numa query só).
+    price_of(item) -> preço unitário já validado.
+    """
+    taxonomy = {
+        pid: (category_id, brand_id)
+        for pid, category_id, brand_id in Product.objects.filter(
+            id__in={i["productId"] for i in items}
+        ).values_list("id", "category_id", "brand_id")
+    }
+    return [
+        CartLine(i["productId"], *taxonomy.get(i["productId"], (None, None)), price_of(i) * int(i["qty"]))
+        for i in items
+    ]
+
+
+def rules_from_rows(rows):
+    return [Rule(*row) for row in rows]
+
+
+RULE_FIELDS = (
+    "id", "code", "kind", "value", "category_id", "brand_id",
+    "min_subtotal", "starts_at", "ends_at", "usage_limit",
+)
+
+
+def build_index(now=None) -> PromotionIndex:
+    now = now or timezone.now()
+    rows = (
+        Promotion.objects.filter(active=True)
+        .filter(Q(ends_at__isnull=True) | Q(ends_at__gt=now))
+        .filter(Q(usage_limit__isnull=True) | Q(usage_count__lt=F("usage_limit")))
+        .values_list(*RULE_FIELDS)
+    )
+    return PromotionIndex(rules_from_rows(rows))
+
+
+_lock = threading.Lock()
+_state = {"index": None, "version": None, "built_at": 0.0}
+
+
+def get_index() -> PromotionIndex:
+    ttl = getattr(settings, "PROMOTIONS_INDEX_TTL", 60)
+    version = cache.get(VERSION_KEY, 0)
+    index = _state["index"]
+    if index is not None and _state["version"] == version and time.monotonic() - _state["built_at"] < ttl:
+        return index
+
+    with _lock:
+        if _state["index"] is index:
+            _state["index"] = build_index()
+            _state["version"] = version
+            _state["built_at"] = time.monotonic()
+        return _state["index"]
+
+
+def invalidate_index():
+    try:
+        cache.incr(VERSION_KEY)
+    except ValueError:
+        cache.set(VERSION_KEY, 1, None)
+    _state["index"] = None
+
+
+class PromotionExhausted(Exception):
+    def __init__(self, rule: Rule):
+        super().__init__(f"Promoção {rule.id} esgotada.")
+        self.rule = rule
+
+
+def _claim_usage(rule: Rule):
+    """UPDATE condicional: incrementa usage_count só se ainda houver saldo (atômico no banco)."""
+    qs = Promotion.objects.filter(id=rule.id, active=True)
+    if rule.usage_limit is not None:
+        qs = qs.filter(usage_count__lt=F("usage_limit"))
+    if not qs.update(usage_count=F("usage_count") + 1):
+        raise PromotionExhausted(rule)
+
+
+def apply_promotions(lines, *, shipping_price: Decimal, code: str = "") -> Evaluation:
+    """
+    Avalia o carrinho e reserva o uso das promoções escolhidas.
+    Se alguma esgotou no meio do caminho (concorrência), desfaz a reserva e reavalia sem ela.
+    Chamar dentro de transaction.atomic() junto com a criação do pedido.
+    """
+    index = get_index()
+    exclude = set()
+    while True:
+        evaluation = index.evaluate(lines, shipping_price=shipping_price, code=code, exclude=exclude)
+        try:
+            with transaction.atomic():
+                for rule, _ in evaluation.applied:
+                    _claim_usage(rule)
+            return evaluation
+        except PromotionExhausted as exc:
+            if exc.rule.code:
+                # cupom pedido explicitamente: o checkout falha com a mensagem
+                return Evaluation(coupon_error="Cupom esgotado.")
+            exclude.add(exc.rule.id)
+
+
+def record_redemptions(order, evaluation: Evaluation):
+    if evaluation.applied:
+        PromotionRedemption.objects.bulk_create([
+            PromotionRedemption(promotion_id=rule.id, order=order, amount=amount)
+            for rule, amount in evaluation.applied
+        ])
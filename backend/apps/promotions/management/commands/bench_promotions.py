@@ -0,0 +1,79 @@
+import random
+import time
+from decimal import Decimal
+
+from django.core.management.base import BaseCommand
+
+from apps.promotions.engine import CartLine, PromotionIndex, Rule
+from apps.promotions.models import Promotion
+
+
+def _synthetic_rules(coupons: int, automatic: int, categories: int, brands: int, rnd: random.Random):
+    kinds = [Promotion.Kind.PERCENTAGE, Promotion.Kind.FIXED, Promotion.Kind.FREE_SHIPPING]
+    rules = []
+    for i in range(coupons + automatic):
+        is_coupon = i < coupons
+        scope = rnd.random()
+        rules.append(Rule(
+            id=i + 1,
+            code=f"CUPOM{i:06d}" if is_coupon else None,
+            kind=rnd.choice(kinds),
+            value=Decimal(rnd.randint(5, 30)),
+            category_id=rnd.randint(1, categories) if scope < 0.4 else None,
+            brand_id=rnd.randint(1, brands) if 0.4 <= scope < 0.8 else None,
+            min_subtotal=Decimal(rnd.choice([0, 0, 100, 300])),
+            starts_at=None,
+            ends_at=None,
+            usage_limit=None,
+        ))
+    return rules
+
+
+def _naive_evaluate(rules, lines, shipping_price, code):
+    """Referência: varre todas as regras a cada carrinho."""
+    index = PromotionIndex([])
+    index.global_rules = [r for r in rules if not r.code or r.code == code]
+    return index.evaluate(lines, shipping_price=shipping_price)
+
+
+class Command(BaseCommand):
+    help = "Benchmark do índice de promoções (10k cupons ativos por padrão), em memória, sem banco."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--coupons", type=int, default=10_000)
+        parser.add_argument("--automatic", type=int, default=500)
+        parser.add_argument("--carts", type=int, default=5_000)
+        parser.add_argument("--seed", type=int, default=42)
+
+    def handle(self, *args, coupons, automatic, carts, seed, **options):
+        rnd = random.Random(seed)
+        categories, brands = 50, 40
+        rules = _synthetic_rules(coupons, automatic, categories, brands, rnd)
+
+        start = time.perf_counter()
+        index = PromotionIndex(rules)
+        build_ms = (time.perf_counter() - start) * 1000
+
+        workload = []
+        for _ in range(carts):
+            lines = [
+                CartLine(rnd.randint(1, 10_000), rnd.randint(1, categories), rnd.randint(1, brands), Decimal(rnd.randint(50, 900)))
+                for _ in range(rnd.randint(1, 5))
+            ]
+            code = f"CUPOM{rnd.randrange(coupons):06d}" if coupons and rnd.random() < 0.3 else ""
+            workload.append((lines, code))
+
+        start = time.perf_counter()
+        for lines, code in workload:
+            index.evaluate(lines, shipping_price=Decimal("29.90"), code=code)
+        indexed = time.perf_counter() - start
+
+        naive_n = max(1, carts // 20)
+        start = time.perf_counter()
+        for lines, code in workload[:naive_n]:
+            _naive_evaluate(rules, lines, Decimal("29.90"), code)
+        naive = (time.perf_counter() - start) / naive_n * carts
+
+        self.stdout.write(f"{len(rules):,} regras ({coupons:,} cupons), índice montado em {build_ms:.1f} ms")
+        self.stdout.write(f"  indexado:  {indexed / carts * 1e6:8.1f} µs/carrinho  ({carts / indexed:,.0f} carrinhos/s)")
+        self.stdout.write(f"  varredura: {naive / carts * 1e6:8.1f} µs/carrinho  ({carts / naive:,.0f} carrinhos/s)")
@@ -0,0 +1,58 @@
+from decimal import Decimal
+
+from django.db import models
+
+from apps.catalog.models import Brand, Category
+from apps.orders.models import Order
+
+
+class Promotion(models.Model):
+    """
+    Promoção automática (code vazio) ou cupom (code preenchido).
+    Escopo: category e/ou brand; ambos vazios = carrinho inteiro.
+    """
+    class Kind(models.TextChoices):
+        PERCENTAGE = "percentage", "Percentual"
+        FIXED = "fixed", "Valor fixo"
+        FREE_SHIPPING = "free_shipping", "Frete grátis"
+
+    name = models.CharField(max_length=120)
+    code = models.CharField(max_length=40, unique=True, null=True, blank=True)
+
+    kind = models.CharField(max_length=20, choices=Kind.choices)
+    value = models.DecimalField(max_digits=10, decimal_places=2, default=Decimal("0.00"))
+
+    category = models.ForeignKey(Category, on_delete=models.CASCADE, null=True, blank=True, related_name="promotions")
+    brand = models.ForeignKey(Brand, on_delete=models.CASCADE, null=True, blank=True, related_name="promotions")
+    min_subtotal = models.DecimalField(max_digits=10, decimal_places=2, default=Decimal("0.00"))
+
+    starts_at = models.DateTimeField(null=True, blank=True)
+    ends_at = models.DateTimeField(null=True, blank=True)
+    active = models.BooleanField(default=True)
+
+    # usage_count só muda via UPDATE condicional (engine.redeem), nunca pelo save()
+    usage_limit = models.PositiveIntegerField(null=True, blank=True)
+    usage_count = models.PositiveIntegerField(default=0)
+
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def save(self, *args, **kwargs):
+        if self.code:
+            self.code = self.code.strip().upper()
+        else:
+            self.code = None
+        super().save(*args, **kwargs)
+
+    def __str__(self) -> str:
+        return self.code or self.name
+
+
+class PromotionRedemption(models.Model):
+    promotion = models.ForeignKey(Promotion, on_delete=models.PROTECT, related_name="redemptions")
+    order = models.ForeignKey(Order, on_delete=models.CASCADE, related_name="promotion_redemptions")
+    amount = models.DecimalField(max_digits=10, decimal_places=2)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    def __str__(self) -> str:
+        return f"{self.promotion} order={self.order_id}"
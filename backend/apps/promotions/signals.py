@@ -0,0 +1,11 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .engine import invalidate_index
+from .models import Promotion
+
+
+@receiver(post_save, sender=Promotion, dispatch_uid="promotions_invalidate_on_save")
+@receiver(post_delete, sender=Promotion, dispatch_uid="promotions_invalidate_on_delete")
+def promotion_changed(sender, **kwargs):
+    invalidate_index()
@@ -0,0 +1,21 @@
+from django.contrib import admin
+
+from apps.core.admin import LargeTableAdmin
+from .models import RiskDecision
+
+
+@admin.register(RiskDecision)
+class RiskDecisionAdmin(LargeTableAdmin):
+    """Somente leitura: decisões gravadas pela análise de risco no pagamento."""
+    list_display = ("id", "order_id", "method", "score", "action", "enforced", "scorer", "duration_us", "created_at")
+    list_filter = ("action", "method", "enforced")
+    date_hierarchy = "created_at"
+    ordering = ("-id",)
+    search_fields = ("order_id",)
+    search_help_text = "Busca exata por nº do pedido."
+
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
@@ -0,0 +1,10 @@
+from django.apps import AppConfig
+
+class RiskConfig(AppConfig):
+    default_auto_field = "django.db.models.BigAutoField"
+    name = "apps.risk"
+
+    def ready(self):
+        # regras/pesos carregados (e validados) uma vez, no startup do processo
+        from .scoring import get_scorer
+        get_scorer()
@@ -0,0 +1,105 @@
+"""
+Contadores de velocidade em janela deslizante (pedidos por e-mail/IP/CEP, pagamentos por BIN).
+
+Cada janela é dividida em `slots` baldes (janela/slots segundos cada); a contagem é a soma dos
+últimos `slots` baldes, então o erro máximo é de um balde. Nada de agregação no banco.
+
+- LocalWindowStore: memória do processo (lock + LRU limitado), microssegundos por operação.
+  Cada worker conta só o próprio tráfego.
+- CacheWindowStore: cache do Django (Redis/Memcached em produção), compartilhado entre workers;
+  um incr por balde e um get_many por leitura.
+"""
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+
+from django.core.cache import caches
+
+
+def counter_key(dimension: str, value: str) -> str:
+    """Chave curta e sem dado pessoal em claro (e-mail, IP)."""
+    digest = hashlib.blake2b(value.encode(), digest_size=10).hexdigest()
+    return f"{dimension}:{digest}"
+
+
+class LocalWindowStore:
+    def __init__(self, slots: int = 10, max_keys: int = 200_000, timer=time.time):
+        self.slots = slots
+        self.max_keys = max_keys
+        self.timer = timer
+        self._lock = threading.Lock()
+        self._rings: OrderedDict[tuple, list] = OrderedDict()  # (key, janela) -> [último balde, contagens...]
+
+    def _advance(self, ring: list, bucket: int):
+        last = ring[0]
+        if bucket - last >= self.slots:
+            ring[1:] = [0] * self.slots
+        else:
+            for b in range(last + 1, bucket + 1):
+                ring[1 + b % self.slots] = 0
+        ring[0] = max(last, bucket)
+
+    def _ring(self, key: str, window: int, bucket: int, create: bool):
+        ring = self._rings.get((key, window))
+        if ring is None:
+            if not create:
+                return None
+            ring = [bucket] + [0] * self.slots
+            self._rings[(key, window)] = ring
+            if len(self._rings) > self.max_keys:
+                self._rings.popitem(last=False)
+        else:
+            self._rings.move_to_end((key, window))
+            self._advance(ring, bucket)
+        return ring
+
+    def incr(self, key: str, window: int, amount: int = 1) -> int:
+        """Soma `amount` na janela e devolve a contagem atual."""
+        bucket = int(self.timer() * self.slots // window)
+        with self._lock:
+            ring = self._ring(key, window, bucket, create=True)
+            ring[1 + bucket % self.slots] += amount
+            return sum(ring) - ring[0]
+
+    def count(self, key: str, window: int) -> int:
+        bucket = int(self.timer() * self.slots // window)
+        with self._lock:
+            ring = self._ring(key, window, bucket, create=False)
+            return 0 if ring is None else sum(ring) - ring[0]
+
+    def clear(self):
+        with self._lock:
+            self._rings.clear()
+
+
+class CacheWindowStore:
+    def __init__(self, slots: int = 10, alias: str = "default", timer=time.time):
+        self.slots = slots
+        self.alias = alias
+        self.timer = timer
+
+    @property
+    def cache(self):
+        return caches[self.alias]
+
+    def _keys(self, key: str, window: int, bucket: int) -> list[str]:
+        return [f"risk:{key}:{window}:{b}" for b in range(bucket - self.slots + 1, bucket + 1)]
+
+    def incr(self, key: str, window: int, amount: int = 1) -> int:
+        bucket = int(self.timer() * self.slots // window)
+        current = f"risk:{key}:{window}:{bucket}"
+        # expira quando o balde sai da janela
+        self.cache.add(current, 0, timeout=window + window // self.slots + 1)
+        try:
+            self.cache.incr(current, amount)
+        except ValueError:  # expirou entre o add e o incr
+            self.cache.set(current, amount, timeout=window + window // self.slots + 1)
+        return sum(self.cache.get_many(self._keys(key, window, bucket)).values())
+
+    def count(self, key: str, window: int) -> int:
+        bucket = int(self.timer() * self.slots // window)
+        return sum(self.cache.get_many(self._keys(key, window, bucket)).values())
+
+    def clear(self):
+        pass  # baldes expiram sozinhos
@@ -0,0 +1,53 @@
+import random
+import time
+from decimal import Decimal
+
+from django.core.management.base import BaseCommand
+from django.test import RequestFactory
+
+from apps.orders.models import Order
+from apps.risk import scoring
+from apps.risk.counters import CacheWindowStore, LocalWindowStore
+
+
+class Command(BaseCommand):
+    help = "Benchmark da análise de risco (sem banco): latência por avaliação, p50/p99, por backend de contador."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--iterations", type=int, default=50_000)
+        parser.add_argument("--customers", type=int, default=5_000, help="E-mails/IPs/CEPs/BINs distintos.")
+        parser.add_argument("--backend", choices=["local", "cache", "both"], default="both")
+        parser.add_argument("--seed", type=int, default=42)
+
+    def handle(self, *args, iterations, customers, backend, seed, **options):
+        rng = random.Random(seed)
+        factory = RequestFactory()
+        requests = [factory.post("/", REMOTE_ADDR=f"10.{i // 65536 % 256}.{i // 256 % 256}.{i % 256}") for i in range(customers)]
+        orders = [
+            Order(
+                id=i + 1, email=f"cliente{i}@example.com", shipping_zip=f"{rng.randrange(1_000_000, 99_999_999):08d}",
+                total=Decimal(rng.randrange(50, 3000)), user_id=None if i % 3 else i,
+            )
+            for i in range(customers)
+        ]
+        bins = [f"{rng.randrange(400000, 560000)}" for _ in range(200)]
+
+        stores = {"local": LocalWindowStore(), "cache": CacheWindowStore()}
+        names = ["local", "cache"] if backend == "both" else [backend]
+        for name in names:
+            store = stores[name]
+            samples = []
+            for _ in range(iterations):
+                index = min(int(rng.paretovariate(1.2)) - 1, customers - 1)  # poucos clientes muito ativos
+                order, request = orders[index], requests[index]
+                start = time.perf_counter()
+                scoring.observe_checkout(order, request, store=store)
+                decision = scoring.evaluate(order, request, method="card", store=store, record=False)
+                scoring.recheck_card_bin(decision, rng.choice(bins), store=store, record=False)
+                samples.append(time.perf_counter() - start)
+            samples.sort()
+            pct = lambda p: samples[min(len(samples) - 1, int(len(samples) * p))] * 1000
+            self.stdout.write(
+                f"{name}: {iterations} checkout+avaliação, p50 {pct(0.5):.3f}ms, p99 {pct(0.99):.3f}ms, "
+                f"máx {samples[-1] * 1000:.3f}ms"
+            )
@@ -0,0 +1,30 @@
+# Generated by Django 6.0.1 on 2026-10-19 17:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='RiskDecision',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('order_id', models.BigIntegerField(db_index=True)),
+                ('method', models.CharField(max_length=10)),
+                ('score', models.PositiveSmallIntegerField()),
+                ('action', models.CharField(choices=[('allow', 'Aprovar'), ('review', 'Revisar'), ('deny', 'Negar')], max_length=10)),
+                ('enforced', models.BooleanField(default=False)),
+                ('features', models.JSONField(default=dict)),
+                ('rules', models.JSONField(default=list)),
+                ('scorer', models.CharField(max_length=60)),
+                ('duration_us', models.PositiveIntegerField(default=0)),
+                ('created_at', models.DateTimeField(db_index=True)),
+            ],
+        ),
+    ]
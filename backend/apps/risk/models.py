@@ -0,0 +1,26 @@
+from django.db import models
+
+
+class RiskDecision(models.Model):
+    """
+    Decisão da análise de risco no pagamento, para análise offline (calibrar regras/pesos).
+    Gravada em lote fora do request (apps.risk.recorder): pode perder as últimas em um crash.
+    """
+    class Action(models.TextChoices):
+        ALLOW = "allow", "Aprovar"
+        REVIEW = "review", "Revisar"
+        DENY = "deny", "Negar"
+
+    order_id = models.BigIntegerField(db_index=True)   # sem FK: gravação em lote, sem JOIN na análise
+    method = models.CharField(max_length=10)
+    score = models.PositiveSmallIntegerField()
+    action = models.CharField(max_length=10, choices=Action.choices)
+    enforced = models.BooleanField(default=False)       # False = só registrada (ex.: Pix)
+    features = models.JSONField(default=dict)
+    rules = models.JSONField(default=list)              # nomes das regras que dispararam
+    scorer = models.CharField(max_length=60)
+    duration_us = models.PositiveIntegerField(default=0)
+    created_at = models.DateTimeField(db_index=True)
+
+    def __str__(self) -> str:
+        return f"pedido {self.order_id}: {self.action} ({self.score})"
@@ -0,0 +1,61 @@
+"""
+Gravação das decisões de risco fora do request: buffer em memória + thread que faz bulk_create
+a cada RISK_RECORD_FLUSH_SECONDS. O request só faz um append (sem INSERT/fsync no caminho crítico).
+Buffer cheio descarta (e conta em risk_decisions_dropped_total); crash perde o último intervalo.
+"""
+import atexit
+import logging
+import threading
+import time
+
+from django.conf import settings
+from django.db import connection
+
+from apps.core.metrics import risk_decisions_dropped_total
+from .models import RiskDecision
+
+logger = logging.getLogger("apps.risk")
+
+
+class DecisionRecorder:
+    def __init__(self, flush_seconds: float = 2.0, max_buffer: int = 10_000, batch_size: int = 500):
+        self.flush_seconds = flush_seconds
+        self.max_buffer = max_buffer
+        self.batch_size = batch_size
+        self._lock = threading.Lock()
+        self._buffer: list[RiskDecision] = []
+        self._thread = None
+
+    def record(self, decision: RiskDecision):
+        with self._lock:
+            if len(self._buffer) >= self.max_buffer:
+                risk_decisions_dropped_total.inc()
+                return
+            self._buffer.append(decision)
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="risk-recorder", daemon=True)
+                self._thread.start()
+                atexit.register(self.flush)
+
+    def flush(self) -> int:
+        with self._lock:
+            batch, self._buffer = self._buffer, []
+        if batch:
+            RiskDecision.objects.bulk_create(batch, batch_size=self.batch_size)
+        return len(batch)
+
+    def _run(self):
+        while True:
+            time.sleep(self.flush_seconds)
+            try:
+                self.flush()
+            except Exception:
+                logger.exception("falha ao gravar decisões de risco")
+            finally:
+                connection.close()  # conexão própria desta thread
+
+
+recorder = DecisionRecorder(
+    flush_seconds=getattr(settings, "RISK_RECORD_FLUSH_SECONDS", 2.0),
+    max_buffer=getattr(settings, "RISK_RECORD_MAX_BUFFER", 10_000),
+)
@@ -0,0 +1,233 @@
+"""
+Análise de risco entre o checkout e a criação do pagamento.
+
+- observe_checkout(order, request): no checkout, soma o pedido nos contadores de e-mail/IP/CEP.
+- evaluate(order, request, method=...): antes do gateway, lê os contadores e aplica o scorer.
+  Só memória: nenhuma query nem chamada HTTP no caminho.
+- recheck_card_bin(decision, card_bin): cartão, depois do create_payment. Soma o BIN que veio na
+  resposta do gateway nos contadores e repontua com as features de BIN.
+- record_decision(decision): registra em lote (recorder). evaluate/recheck_card_bin já registram
+  com record=True.
+
+Só entram sinais que o cliente não escolhe: IP pelo get_ident do DRF (X-Forwarded-For só com
+NUM_PROXIES) e BIN da resposta do gateway, nunca do payload. Cartão cujo gateway não informou o BIN
+vira a feature card_without_bin.
+
+Scorer plugável (RISK_SCORER): classe construída com a lista de regras e com
+score(features) -> (pontos, [regras disparadas]). O padrão, RuleScorer, soma os pesos das regras de
+RISK_RULES (ou do JSON em RISK_RULES_FILE); regras e pesos são carregados uma vez, no startup.
+"""
+import json
+import operator
+import re
+import time
+from dataclasses import dataclass, field
+from functools import lru_cache
+
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.utils import timezone
+from django.utils.module_loading import import_string
+from rest_framework.throttling import BaseThrottle
+
+from apps.core.metrics import risk_evaluation_duration_seconds
+from .counters import CacheWindowStore, LocalWindowStore, counter_key
+from .models import RiskDecision
+from .recorder import recorder
+
+# feature -> (dimensão do contador, janela em segundos)
+VELOCITY_FEATURES = {
+    "email_orders_1h": ("email", 3600),
+    "email_orders_24h": ("email", 86400),
+    "ip_orders_10m": ("ip", 600),
+    "ip_orders_1h": ("ip", 3600),
+    "ip_orders_24h": ("ip", 86400),
+    "cep_orders_24h": ("cep", 86400),
+    "bin_payments_1h": ("bin", 3600),
+    "bin_payments_24h": ("bin", 86400),
+}
+ORDER_FEATURES = ("amount", "guest_amount", "card_without_bin")
+FEATURES = (*VELOCITY_FEATURES, *ORDER_FEATURES)
+
+WINDOWS: dict[str, tuple[int, ...]] = {}
+for _dimension, _window in VELOCITY_FEATURES.values():
+    WINDOWS[_dimension] = tuple(sorted({*WINDOWS.get(_dimension, ()), _window}))
+
+DEFAULT_RULES = [
+    {"name": "ip_burst", "feature": "ip_orders_10m", "op": ">=", "value": 5, "weight": 40},
+    {"name": "ip_daily", "feature": "ip_orders_24h", "op": ">=", "value": 20, "weight": 30},
+    {"name": "email_burst", "feature": "email_orders_1h", "op": ">=", "value": 4, "weight": 30},
+    {"name": "email_daily", "feature": "email_orders_24h", "op": ">=", "value": 10, "weight": 20},
+    {"name": "cep_daily", "feature": "cep_orders_24h", "op": ">=", "value": 15, "weight": 20},
+    {"name": "bin_burst", "feature": "bin_payments_1h", "op": ">=", "value": 10, "weight": 40},
+    {"name": "bin_daily", "feature": "bin_payments_24h", "op": ">=", "value": 50, "weight": 20},
+    {"name": "card_bin_unknown", "feature": "card_without_bin", "op": ">=", "value": 1, "weight": 20},
+    {"name": "guest_high_amount", "feature": "guest_amount", "op": ">=", "value": 2000, "weight": 25},
+]
+
+OPERATORS = {">=": operator.ge, ">": operator.gt, "<=": operator.le, "<": operator.lt, "==": operator.eq}
+
+
+@dataclass
+class Decision:
+    order_id: int
+    method: str
+    score: int
+    action: str
+    enforced: bool
+    rules: list = field(default_factory=list)
+    features: dict = field(default_factory=dict)
+    duration_us: int = 0
+
+    @property
+    def denied(self) -> bool:
+        return self.enforced and self.action == RiskDecision.Action.DENY
+
+
+class RuleScorer:
+    name = "rules"
+
+    def __init__(self, rules: list[dict]):
+        self.rules = [self._compile(rule) for rule in rules]
+
+    @staticmethod
+    def _compile(rule: dict) -> tuple:
+        try:
+            compiled = (
+                str(rule["name"]), rule["feature"], OPERATORS[rule.get("op", ">=")],
+                float(rule["value"]), int(rule["weight"]),
+            )
+        except (KeyError, TypeError, ValueError) as exc:
+            raise ImproperlyConfigured(f"Regra de risco inválida: {rule!r}") from exc
+        if compiled[1] not in FEATURES:
+            raise ImproperlyConfigured(f"Regra de risco {compiled[0]!r}: feature desconhecida {compiled[1]!r}")
+        return compiled
+
+    def score(self, features: dict) -> tuple[int, list[str]]:
+        total, fired = 0, []
+        for name, feature, op, value, weight in self.rules:
+            if op(features.get(feature, 0), value):
+                total += weight
+                fired.append(name)
+        return total, fired
+
+
+def load_rules() -> list[dict]:
+    path = getattr(settings, "RISK_RULES_FILE", "")
+    if path:
+        with open(path, encoding="utf-8") as fh:
+            return json.load(fh)
+    return getattr(settings, "RISK_RULES", None) or DEFAULT_RULES
+
+
+@lru_cache(maxsize=None)
+def get_scorer():
+    scorer_class = import_string(getattr(settings, "RISK_SCORER", "apps.risk.scoring.RuleScorer"))
+    return scorer_class(load_rules())
+
+
+@lru_cache(maxsize=None)
+def get_store():
+    backend = getattr(settings, "RISK_COUNTER_BACKEND", "local")
+    slots = getattr(settings, "RISK_WINDOW_SLOTS", 10)
+    if backend == "cache":
+        return CacheWindowStore(slots=slots, alias=getattr(settings, "RISK_CACHE_ALIAS", "default"))
+    if backend == "local":
+        return LocalWindowStore(slots=slots)
+    raise ImproperlyConfigured(f"RISK_COUNTER_BACKEND inválido: {backend!r}")
+
+
+_ident = BaseThrottle()
+
+
+def _dimensions(order, request) -> dict:
+    return {
+        "email": (order.email or "").strip().lower(),
+        "ip": _ident.get_ident(request) if request is not None else "",
+        "cep": re.sub(r"\D", "", order.shipping_zip or ""),
+    }
+
+
+def observe_checkout(order, request, *, store=None):
+    """Soma o pedido nos contadores de e-mail/IP/CEP (o BIN só aparece no pagamento)."""
+    if not getattr(settings, "RISK_ENABLED", True):
+        return
+    store = store or get_store()
+    for dimension, value in _dimensions(order, request).items():
+        if value:
+            key = counter_key(dimension, value)
+            for window in WINDOWS[dimension]:
+                store.incr(key, window)
+
+
+def _decide(order_id: int, method: str, features: dict, started: float) -> Decision:
+    score, fired = get_scorer().score(features)
+    score = max(0, min(100, score))
+    if score >= getattr(settings, "RISK_DENY_SCORE", 80):
+        action = RiskDecision.Action.DENY
+    elif score >= getattr(settings, "RISK_REVIEW_SCORE", 50):
+        action = RiskDecision.Action.REVIEW
+    else:
+        action = RiskDecision.Action.ALLOW
+    elapsed = time.perf_counter() - started
+    risk_evaluation_duration_seconds.observe(elapsed, action=action)
+    return Decision(
+        order_id=order_id, method=method, score=score, action=action,
+        enforced=method in getattr(settings, "RISK_ENFORCE_METHODS", ["card"]),
+        rules=fired, features=features, duration_us=int(elapsed * 1_000_000),
+    )
+
+
+def record_decision(decision: Decision):
+    scorer = get_scorer()
+    recorder.record(RiskDecision(
+        order_id=decision.order_id, method=decision.method, score=decision.score, action=decision.action,
+        enforced=decision.enforced, features=decision.features, rules=decision.rules,
+        scorer=getattr(scorer, "name", type(scorer).__name__), duration_us=decision.duration_us,
+        created_at=timezone.now(),
+    ))
+
+
+def evaluate(order, request, *, method: str, store=None, record: bool = True) -> Decision | None:
+    """Antes do gateway: e-mail/IP/CEP e valor. As features de BIN ficam zeradas até o recheck_card_bin."""
+    if not getattr(settings, "RISK_ENABLED", True):
+        return None
+    started = time.perf_counter()
+    store = store or get_store()
+    keys = {
+        dimension: counter_key(dimension, value)
+        for dimension, value in _dimensions(order, request).items() if value
+    }
+
+    features = {}
+    for name, (dimension, window) in VELOCITY_FEATURES.items():
+        key = keys.get(dimension)
+        features[name] = store.count(key, window) if key is not None else 0
+    amount = float(order.total)
+    features["amount"] = amount
+    features["guest_amount"] = 0 if order.user_id else amount
+    features["card_without_bin"] = 0
+
+    decision = _decide(order.id, method, features, started)
+    if record:
+        record_decision(decision)
+    return decision
+
+
+def recheck_card_bin(decision: Decision, card_bin: str, *, store=None, record: bool = True) -> Decision:
+    """Depois do gateway: a tentativa conta no BIN (mesmo recusada) e a decisão é refeita com ele."""
+    started = time.perf_counter()
+    store = store or get_store()
+    card_bin = re.sub(r"\D", "", card_bin or "")[:8]
+    features = dict(decision.features)
+    key = counter_key("bin", card_bin) if card_bin else None
+    for name, (dimension, window) in VELOCITY_FEATURES.items():
+        if dimension == "bin":
+            features[name] = store.incr(key, window) if key is not None else 0
+    features["card_without_bin"] = int(not card_bin)
+
+    rechecked = _decide(decision.order_id, decision.method, features, started)
+    rechecked.duration_us += decision.duration_us
+    if record:
+        record_decision(rechecked)
+    return rechecked
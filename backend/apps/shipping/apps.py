@@ -2,4 +2,5 @@ from django.apps import AppConfig
 
 
 class ShippingConfig(AppConfig):
-    name = 'shipping'
+    default_auto_field = "django.db.models.BigAutoField"
+    name = "apps.shipping"
@@ -0,0 +1,269 @@
+"""
+Etiquetas (100x150 mm) e romaneios (A4) em lote para a onda de separação.
+
+- O pedido vira um payload de tipos simples (montado uma vez, no processo principal, a partir de
+  pedidos já carregados: a onda inteira custa 2 queries, pedidos + itens).
+- Cada payload é desenhado em um pool de processos (SHIPPING_LABEL_WORKERS); o worker devolve as
+  páginas com o content stream já comprimido, e o processo principal só as concatena no PDF.
+- Cache: a moldura fixa de cada layout é gerada uma vez por processo, e as páginas prontas ficam em
+  um LRU por hash do payload (reimpressão da mesma onda não redesenha nada).
+- O PDF sai em streaming na ordem dos pedidos, conforme as páginas ficam prontas.
+"""
+import hashlib
+import json
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import lru_cache
+
+import segno
+from django.conf import settings
+
+from apps.core.lru import ByteLRU
+from .pdf import Canvas, PDFStreamWriter
+
+LAYOUT_VERSION = 1
+MM = 72 / 25.4
+LABEL_SIZE = (100 * MM, 150 * MM)
+A4 = (595.28, 841.89)
+SLIP_ROWS_FIRST = 28
+SLIP_ROWS_NEXT = 40
+KINDS = ("both", "labels", "slips")
+
+
+def sender() -> dict:
+    return {
+        "name": settings.SHIPPING_SENDER_NAME,
+        "lines": list(settings.SHIPPING_SENDER_ADDRESS),
+    }
+
+
+def order_payload(order) -> dict:
+    """Dados do pedido para desenhar (espera prefetch_related("items"))."""
+    return {
+        "id": order.id,
+        "created": order.created_at.strftime("%d/%m/%Y %H:%M") if order.created_at else "",
+        "name": order.shipping_name or order.full_name,
+        "phone": order.phone,
+        "email": order.email,
+        "street": f"{order.shipping_street}, {order.shipping_number}",
+        "complement": order.shipping_complement,
+        "district": order.shipping_district,
+        "city": f"{order.shipping_city} / {order.shipping_state}",
+        "zip": order.shipping_zip,
+        "method": (order.shipping_method or "").upper(),
+        "days": order.shipping_days,
+        "items": [(i.sku, i.name, i.qty, f"{i.price:.2f}") for i in order.items.all()],
+        "subtotal": f"{order.subtotal:.2f}",
+        "shipping": f"{order.shipping_price:.2f}",
+        "discount": f"{order.discount:.2f}",
+        "total": f"{order.total:.2f}",
+    }
+
+
+def _clip(text: str, limit: int) -> str:
+    text = str(text or "")
+    return text if len(text) <= limit else text[: limit - 1] + "…"
+
+
+# ---------- desenho (roda nos workers: nada de ORM aqui) ----------
+
+@lru_cache(maxsize=None)
+def _label_frame(sender_name: str, sender_lines: tuple) -> bytes:
+    """Parte fixa da etiqueta (molduras, títulos, remetente): igual para todos os pedidos."""
+    width, height = LABEL_SIZE
+    c = Canvas(width, height)
+    c.rect(8, 8, width - 16, height - 16, width=1.5)
+    c.text(16, height - 26, "REMETENTE", size=7, bold=True)
+    c.text(16, height - 38, _clip(sender_name, 48), size=9, bold=True)
+    for index, line in enumerate(sender_lines[:3]):
+        c.text(16, height - 50 - index * 10, _clip(line, 56), size=8)
+    c.line(8, height - 88, width - 8, height - 88)
+    c.text(16, height - 104, "DESTINATÁRIO", size=8, bold=True)
+    c.line(8, 150, width - 8, 150)
+    return c.getvalue()
+
+
+def render_label(payload: dict, sender_info: dict) -> list:
+    width, height = LABEL_SIZE
+    c = Canvas(width, height)
+    c.raw(_label_frame(sender_info["name"], tuple(sender_info["lines"])))
+
+    y = height - 124
+    c.text(16, y, _clip(payload["name"], 34), size=13, bold=True)
+    for line in (payload["street"], payload["complement"], payload["district"], payload["city"]):
+        if line:
+            y -= 16
+            c.text(16, y, _clip(line, 44), size=11)
+    y -= 30
+    c.text(16, y, f"CEP {payload['zip']}", size=20, bold=True)
+    if payload["phone"]:
+        c.text(16, y - 18, f"Tel. {payload['phone']}", size=9)
+
+    c.text(16, 124, payload["method"] or "ENVIO", size=22, bold=True)
+    c.text(16, 104, f"Pedido #{payload['id']}", size=12, bold=True)
+    units = sum(qty for _, _, qty, _ in payload["items"])
+    c.text(16, 88, f"{units} item(ns) - {payload['created']}", size=8)
+
+    qr = segno.make(f"PEDIDO:{payload['id']}", error="m", boost_error=False)
+    module = 3.2
+    size = len(qr.matrix) * module
+    c.modules(width - 16 - size, 18, qr.matrix, module)
+    return [c.page()]
+
+
+def render_slip(payload: dict, sender_info: dict) -> list:
+    """Romaneio: cabeçalho + tabela de itens (continua em páginas seguintes se precisar)."""
+    width, height = A4
+    items = payload["items"]
+    chunks = [items[:SLIP_ROWS_FIRST]] + [
+        items[i:i + SLIP_ROWS_NEXT] for i in range(SLIP_ROWS_FIRST, len(items), SLIP_ROWS_NEXT)
+    ]
+    pages = []
+    for page_index, chunk in enumerate(chunks):
+        c = Canvas(width, height)
+        c.text(40, height - 50, _clip(sender_info["name"], 50), size=14, bold=True)
+        c.text(width - 200, height - 50, f"ROMANEIO - Pedido #{payload['id']}", size=11, bold=True)
+        c.line(40, height - 60, width - 40, height - 60)
+        y = height - 80
+        if page_index == 0:
+            c.text(40, y, f"Data: {payload['created']}", size=9)
+            c.text(300, y, f"Envio: {payload['method']} ({payload['days']} dia(s))", size=9)
+            y -= 20
+            c.text(40, y, _clip(payload["name"], 60), size=11, bold=True)
+            for line in (payload["street"], payload["complement"], payload["district"],
+                         f"{payload['city']} - CEP {payload['zip']}", payload["email"]):
+                if line:
+                    y -= 13
+                    c.text(40, y, _clip(line, 80), size=9)
+            y -= 24
+        else:
+            c.text(40, y, f"(continuação, página {page_index + 1})", size=9)
+            y -= 24
+
+        c.text(40, y, "OK", size=8, bold=True)
+        c.text(66, y, "SKU", size=8, bold=True)
+        c.text(170, y, "PRODUTO", size=8, bold=True)
+        c.text(450, y, "QTD", size=8, bold=True)
+        c.text(490, y, "PREÇO", size=8, bold=True)
+        c.line(40, y - 4, width - 40, y - 4, width=0.5)
+        for sku, name, qty, price in chunk:
+            y -= 16
+            c.rect(42, y - 1, 8, 8, width=0.6)
+            c.text(66, y, _clip(sku, 18), size=9)
+            c.text(170, y, _clip(name, 52), size=9)
+            c.text(450, y, str(qty), size=9, bold=True)
+            c.text(490, y, price, size=9)
+
+        if page_index == len(chunks) - 1:
+            y -= 30
+            for label, value in (("Subtotal", payload["subtotal"]), ("Frete", payload["shipping"]),
+                                 ("Desconto", payload["discount"]), ("Total", payload["total"])):
+                c.text(400, y, label, size=9, bold=label == "Total")
+                c.text(490, y, f"R$ {value}", size=9, bold=label == "Total")
+                y -= 13
+        pages.append(c.page())
+    return pages
+
+
+def render_order(args) -> list:
+    """(kind, payload, sender) -> páginas. Ponto de entrada dos workers."""
+    kind, payload, sender_info = args
+    pages = []
+    if kind in ("both", "labels"):
+        pages += render_label(payload, sender_info)
+    if kind in ("both", "slips"):
+        pages += render_slip(payload, sender_info)
+    return pages
+
+
+# ---------- pool, cache e montagem ----------
+
+_pool = None
+_pages = ByteLRU(settings.SHIPPING_LABEL_CACHE_BYTES)
+
+
+def _get_pool(workers: int) -> ProcessPoolExecutor:
+    global _pool
+    if _pool is None:
+        # forkserver: o worker web já tem threads (recorder de risco, hashing, writer da ingestão);
+        # fork() de processo com threads pode herdar locks presos e travar o filho
+        _pool = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("forkserver"))
+    return _pool
+
+
+def _cache_key(kind: str, payload: dict, sender_info: dict) -> str:
+    raw = json.dumps([LAYOUT_VERSION, kind, payload, sender_info], sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+def _pack(pages: list) -> bytes:
+    # páginas no LRU (que guarda bytes): "largura altura tamanho\n" + stream, em sequência
+    return b"".join(b"%.2f %.2f %d\n%s" % (w, h, len(stream), stream) for w, h, stream in pages)
+
+
+def _unpack(data: bytes) -> list:
+    pages, pos = [], 0
+    while pos < len(data):
+        end = data.index(b"\n", pos)
+        w, h, size = data[pos:end].split()
+        start = end + 1
+        pages.append((float(w), float(h), data[start:start + int(size)]))
+        pos = start + int(size)
+    return pages
+
+
+def _render_all(jobs: list, workers: int):
+    """Páginas de cada job, na ordem. Pool para ondas grandes; se o pool quebrar, termina inline."""
+    if workers <= 1 or len(jobs) < settings.SHIPPING_LABEL_POOL_MIN:
+        yield from map(render_order, jobs)
+        return
+    done = 0
+    try:
+        chunksize = max(1, len(jobs) // (workers * 4))
+        for pages in _get_pool(workers).map(render_order, jobs, chunksize=chunksize):
+            done += 1
+            yield pages
+    except BrokenProcessPool:
+        _reset_pool()
+        yield from map(render_order, jobs[done:])
+
+
+def iter_pages(payloads: list[dict], kind: str = "both", *, workers: int | None = None):
+    """Páginas de todos os pedidos, na ordem; cache primeiro, o resto desenhado no pool."""
+    sender_info = sender()
+    if workers is None:
+        workers = settings.SHIPPING_LABEL_WORKERS or os.cpu_count() or 1
+    keys = [_cache_key(kind, payload, sender_info) for payload in payloads]
+    cached = [_pages.get(key) for key in keys]
+    jobs = [(kind, payload, sender_info) for payload, data in zip(payloads, cached) if data is None]
+    rendered = _render_all(jobs, workers)
+
+    for key, data in zip(keys, cached):
+        if data is None:
+            pages = next(rendered)
+            _pages.put(key, _pack(pages))
+            yield from pages
+        else:
+            yield from _unpack(data)
+
+
+def clear_cache():
+    _pages.clear()
+
+
+def _reset_pool():
+    global _pool
+    if _pool is not None:
+        _pool.shutdown(wait=False, cancel_futures=True)
+    _pool = None
+
+
+def stream_pdf(payloads: list[dict], kind: str = "both", *, workers: int | None = None):
+    """Gera o PDF da onda em pedaços (para StreamingHttpResponse ou arquivo)."""
+    writer = PDFStreamWriter()
+    yield writer.header()
+    for width, height, stream in iter_pages(payloads, kind, workers=workers):
+        yield writer.page(width, height, stream)
+    yield writer.close()
@@ -0,0 +1,57 @@
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from apps.orders.models import Order
+from apps.shipping import labels
+
+
+class Command(BaseCommand):
+    help = (
+        "Gera o PDF da onda de separação (etiquetas + romaneios) em arquivo e mede páginas/s. "
+        "Com --compare desenha a mesma onda inline e no pool (cache frio) e depois de novo (cache quente)."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--status", default=Order.Status.PACKING)
+        parser.add_argument("--ids", default="", help="Lista de ids separados por vírgula (ignora --status).")
+        parser.add_argument("--kind", choices=labels.KINDS, default="both")
+        parser.add_argument("--limit", type=int, default=None, help="Padrão: SHIPPING_LABEL_MAX_ORDERS.")
+        parser.add_argument("--workers", type=int, default=None, help="Processos do pool; 1 = inline.")
+        parser.add_argument("--out", default="onda.pdf")
+        parser.add_argument("--compare", action="store_true")
+
+    def handle(self, *args, status, ids, kind, limit, workers, out, compare, **options):
+        qs = Order.objects.prefetch_related("items").order_by("id")
+        if ids:
+            qs = qs.filter(id__in=[int(x) for x in ids.split(",") if x.strip()])
+        else:
+            qs = qs.filter(status=status)
+        with CaptureQueriesContext(connection) as queries:
+            started = time.perf_counter()
+            payloads = [labels.order_payload(o) for o in qs[: limit or settings.SHIPPING_LABEL_MAX_ORDERS]]
+            loaded = time.perf_counter() - started
+        if not payloads:
+            raise CommandError("Nenhum pedido na onda.")
+        self.stdout.write(f"{len(payloads)} pedidos carregados em {loaded:.2f}s ({len(queries)} queries)")
+
+        runs = [("inline", 1), ("pool", workers), ("cache", workers)] if compare else [("", workers)]
+        for name, run_workers in runs:
+            if name != "cache":
+                labels.clear_cache()
+            started = time.perf_counter()
+            pages = size = 0
+            with open(out, "wb") as fh:
+                for chunk in labels.stream_pdf(payloads, kind, workers=run_workers):
+                    fh.write(chunk)
+                    size += len(chunk)
+                    pages += chunk.count(b"/Type /Page ")
+            elapsed = time.perf_counter() - started
+            self.stdout.write(
+                f"{name + ': ' if name else ''}{pages} páginas, {size / 1024:.0f} KiB em {elapsed:.2f}s "
+                f"({pages / elapsed:.0f} páginas/s)"
+            )
+        self.stdout.write(self.style.SUCCESS(f"PDF gravado em {out}"))
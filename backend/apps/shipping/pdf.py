@@ -0,0 +1,117 @@
+"""
+Escritor de PDF mínimo (sem dependência externa) para etiquetas e romaneios.
+
+Só o necessário: texto em Helvetica/Helvetica-Bold (WinAnsi, cobre os acentos do português),
+linhas e retângulos. As páginas chegam prontas (content stream já comprimido) e são escritas
+uma a uma: o documento sai em streaming, sem montar o arquivo inteiro na memória.
+"""
+import zlib
+
+FONTS = {"regular": b"/F1", "bold": b"/F2"}
+_RESOURCES = b"<< /Font << /F1 3 0 R /F2 4 0 R >> >>"
+_FIRST_PAGE_ID = 5  # 1 catálogo, 2 árvore de páginas, 3-4 fontes
+
+
+def _escape(text: str) -> bytes:
+    raw = text.encode("cp1252", errors="replace")
+    return raw.replace(b"\\", b"\\\\").replace(b"(", b"\\(").replace(b")", b"\\)")
+
+
+def _num(value: float) -> bytes:
+    return (b"%.2f" % value).rstrip(b"0").rstrip(b".")
+
+
+class Canvas:
+    """Monta o content stream de uma página. Coordenadas em pontos, origem no canto inferior esquerdo."""
+
+    def __init__(self, width: float, height: float):
+        self.width = width
+        self.height = height
+        self._ops: list[bytes] = []
+
+    def text(self, x: float, y: float, text: str, size: float = 10, bold: bool = False):
+        font = FONTS["bold" if bold else "regular"]
+        self._ops.append(b"BT %s %s Tf %s %s Td (%s) Tj ET" % (font, _num(size), _num(x), _num(y), _escape(text)))
+
+    def line(self, x1: float, y1: float, x2: float, y2: float, width: float = 1):
+        self._ops.append(b"%s w %s %s m %s %s l S" % (_num(width), _num(x1), _num(y1), _num(x2), _num(y2)))
+
+    def rect(self, x: float, y: float, w: float, h: float, fill: bool = False, width: float = 1):
+        op = b"f" if fill else b"S"
+        self._ops.append(b"%s w %s %s %s %s re %s" % (_num(width), _num(x), _num(y), _num(w), _num(h), op))
+
+    def modules(self, x: float, y: float, matrix, module: float):
+        """Matriz de módulos escuros (QR): um retângulo preenchido por módulo, linha 0 no topo."""
+        size = len(matrix)
+        rects = [
+            b"%s %s %s %s re" % (_num(x + col * module), _num(y + (size - 1 - row) * module), _num(module), _num(module))
+            for row, line in enumerate(matrix) for col, dark in enumerate(line) if dark
+        ]
+        if rects:
+            self._ops.append(b" ".join(rects) + b" f")
+
+    def raw(self, ops: bytes):
+        """Trecho de stream já pronto (ex.: moldura fixa do layout, cacheada)."""
+        self._ops.append(ops)
+
+    def getvalue(self) -> bytes:
+        return b"\n".join(self._ops)
+
+    def page(self) -> tuple[float, float, bytes]:
+        """(largura, altura, stream comprimido): formato aceito por PDFStreamWriter.page."""
+        return self.width, self.height, zlib.compress(self.getvalue(), 6)
+
+
+class PDFStreamWriter:
+    """
+    Gera o arquivo em pedaços: header(), page() por página, close() no fim (árvore de páginas + xref).
+    Cada chamada devolve os bytes a enviar; os offsets do xref são contados aqui.
+    """
+
+    def __init__(self):
+        self._offset = 0
+        self._offsets: dict[int, int] = {}
+        self._kids: list[int] = []
+        self._next_id = _FIRST_PAGE_ID
+
+    def _object(self, obj_id: int, body: bytes) -> bytes:
+        data = b"%d 0 obj\n%s\nendobj\n" % (obj_id, body)
+        self._offsets[obj_id] = self._offset
+        self._offset += len(data)
+        return data
+
+    def _bytes(self, data: bytes) -> bytes:
+        self._offset += len(data)
+        return data
+
+    def header(self) -> bytes:
+        return b"".join([
+            self._bytes(b"%PDF-1.4\n%\xe2\xe3\xcf\xd3\n"),
+            self._object(3, b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica /Encoding /WinAnsiEncoding >>"),
+            self._object(4, b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica-Bold /Encoding /WinAnsiEncoding >>"),
+        ])
+
+    def page(self, width: float, height: float, stream: bytes) -> bytes:
+        page_id, content_id = self._next_id, self._next_id + 1
+        self._next_id += 2
+        self._kids.append(page_id)
+        return b"".join([
+            self._object(content_id, b"<< /Length %d /Filter /FlateDecode >>\nstream\n%s\nendstream" % (len(stream), stream)),
+            self._object(page_id, b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 %s %s] /Resources %s /Contents %d 0 R >>" % (
+                _num(width), _num(height), _RESOURCES, content_id,
+            )),
+        ])
+
+    def close(self) -> bytes:
+        kids = b" ".join(b"%d 0 R" % kid for kid in self._kids)
+        parts = [
+            self._object(2, b"<< /Type /Pages /Kids [%s] /Count %d >>" % (kids, len(self._kids))),
+            self._object(1, b"<< /Type /Catalog /Pages 2 0 R >>"),
+        ]
+        xref_at = self._offset
+        size = self._next_id
+        entries = [b"0000000000 65535 f \n"]
+        entries += [b"%010d 00000 n \n" % self._offsets[obj_id] for obj_id in range(1, size)]
+        parts.append(b"xref\n0 %d\n%s" % (size, b"".join(entries)))
+        parts.append(b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (size, xref_at))
+        return b"".join(parts)
@@ -1,6 +1,7 @@
 from django.urls import path
-from .views import ShippingQuoteAPIView
+from .views import ShippingLabelsAPIView, ShippingQuoteAPIView
 
 urlpatterns = [
     path("quote/", ShippingQuoteAPIView.as_view(), name="shipping-quote"),
+    path("labels/", ShippingLabelsAPIView.as_view(), name="shipping-labels"),
 ]
\ No newline at end of file
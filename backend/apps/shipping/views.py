@@ -1,6 +1,13 @@
+from django.conf import settings
+from django.http import StreamingHttpResponse
+from django.utils import timezone
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework import status
+from rest_framework.permissions import IsAdminUser
+
+from apps.orders.models import Order
+from . import labels
 
 class ShippingQuoteAPIView(APIView):
     def post(self, request):
@@ -26,4 +33,57 @@ class ShippingQuoteAPIView(APIView):
                 {"id": "sedex", "label": "SEDEX", "price": "69.90", "days": 3},
             ]
 
-        return Response({"quotes": quotes})
\ No newline at end of file
+        return Response({"quotes": quotes})
+
+class ShippingLabelsAPIView(APIView):
+    """
+    GET /api/v1/shipping/labels/?status=packing
+    GET /api/v1/shipping/labels/?ids=1,2,3&kind=labels
+
+    PDF único da onda (staff): etiqueta 100x150 mm e/ou romaneio A4 por pedido (kind=both|labels|slips).
+    2 queries (pedidos + itens), desenho em pool de processos, resposta em streaming.
+    Mais de SHIPPING_LABEL_MAX_ORDERS pedidos no filtro = 400 (nunca uma onda cortada).
+    """
+    permission_classes = [IsAdminUser]
+
+    def get(self, request):
+        max_orders = settings.SHIPPING_LABEL_MAX_ORDERS
+        raw_ids = request.query_params.get("ids", "")
+        order_status = request.query_params.get("status", "")
+        kind = request.query_params.get("kind", "both")
+
+        try:
+            ids = [int(x) for x in raw_ids.split(",") if x.strip()]
+        except ValueError:
+            return Response({"detail": "ids deve ser uma lista de inteiros separados por vírgula."}, status=400)
+
+        if not ids and not order_status:
+            return Response({"detail": "Informe ids ou status."}, status=400)
+        if len(ids) > max_orders:
+            return Response({"detail": f"Máximo de {max_orders} pedidos por onda."}, status=400)
+        if order_status and order_status not in Order.Status.values:
+            return Response({"detail": "Status inválido."}, status=400)
+        if kind not in labels.KINDS:
+            return Response({"detail": "kind deve ser both, labels ou slips."}, status=400)
+
+        qs = Order.objects.prefetch_related("items").order_by("id")
+        if ids:
+            qs = qs.filter(id__in=ids)
+        if order_status:
+            qs = qs.filter(status=order_status)
+        # um a mais só para saber se passou do limite: pedido cortado da onda ficaria sem etiqueta
+        orders = list(qs[:max_orders + 1])
+        if len(orders) > max_orders:
+            return Response(
+                {"detail": f"Mais de {max_orders} pedidos com esse filtro. Gere a onda em partes, por ids."},
+                status=400,
+            )
+        # payloads montados antes do streaming: o ORM não roda dentro do gerador
+        payloads = [labels.order_payload(order) for order in orders]
+        if not payloads:
+            return Response({"detail": "Nenhum pedido encontrado."}, status=404)
+
+        response = StreamingHttpResponse(labels.stream_pdf(payloads, kind), content_type="application/pdf")
+        name = f"onda-{order_status or 'pedidos'}-{timezone.localtime():%Y%m%d-%H%M}.pdf"
+        response["Content-Disposition"] = f'inline; filename="{name}"'
+        return response
@@ -0,0 +1,36 @@
+from django.contrib import admin
+from .models import Supplier, SupplierImport, SupplierItem
+
+
+@admin.register(Supplier)
+class SupplierAdmin(admin.ModelAdmin):
+    list_display = ("name", "slug", "contact_email", "lead_time_days", "active", "created_at")
+    list_filter = ("active",)
+    search_fields = ("name", "slug")
+    prepopulated_fields = {"slug": ("name",)}
+
+
+@admin.register(SupplierItem)
+class SupplierItemAdmin(admin.ModelAdmin):
+    list_display = ("variant", "supplier", "supplier_sku", "cost", "lead_time_days", "pack_size", "min_order_qty")
+    list_filter = ("supplier",)
+    list_select_related = ("variant__product", "supplier")
+    search_fields = ("variant__sku", "supplier_sku")
+    raw_id_fields = ("variant",)
+
+
+@admin.register(SupplierImport)
+class SupplierImportAdmin(admin.ModelAdmin):
+    """Somente leitura: importações rodam pelo comando import_supplier_file (arquivos grandes não cabem num request)."""
+    list_display = (
+        "id", "supplier", "filename", "dry_run", "status", "rows",
+        "products_created", "products_updated", "variants_created", "variants_updated", "errors", "created_at",
+    )
+    list_filter = ("status", "dry_run", "supplier")
+    list_select_related = ("supplier",)
+
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
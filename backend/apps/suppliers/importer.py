@@ -0,0 +1,355 @@
+"""
+Pipeline de importação de preço/estoque de fornecedor.
+
+Colunas (cabeçalho, sem diferenciar maiúsculas): slug, sku, name, price, stock, active,
+category, brand (slugs), size, color. Célula vazia = não altera o campo.
+
+- Linha com sku  -> ProductVariant (price/stock/active); cria a variante (e o produto, se preciso)
+                    quando o sku ainda não existe.
+- Linha sem sku  -> Product por slug (name/price/active); cria quando o slug não existe.
+
+As linhas são lidas em streaming e processadas em lotes: por lote, 2-3 SELECTs por chave
+(slug__in / sku__in), diff em memória e bulk_create/bulk_update dentro de uma transação.
+Memória = tamanho do lote + amostras limitadas do relatório.
+"""
+from dataclasses import dataclass, field
+from decimal import Decimal, InvalidOperation
+from itertools import islice
+from typing import Iterable
+
+from django.db import transaction
+from django.utils import timezone
+
+from apps.catalog.models import Brand, Category, Product, ProductVariant
+from .models import SupplierImport, SupplierItem
+from .readers import Row
+
+REPORT_SAMPLE = 200
+TRUE_VALUES = {"1", "true", "sim", "s", "yes", "y", "x"}
+FALSE_VALUES = {"0", "false", "nao", "não", "n", "no"}
+
+
+class RowError(ValueError):
+    pass
+
+
+def parse_decimal(value: str) -> Decimal | None:
+    if not value:
+        return None
+    raw = value.replace("R$", "").replace(" ", "")
+    if "," in raw:  # formato brasileiro: 1.234,56
+        raw = raw.replace(".", "").replace(",", ".")
+    try:
+        number = Decimal(raw).quantize(Decimal("0.01"))
+    except InvalidOperation:
+        raise RowError(f"preço inválido: {value!r}")
+    if number < 0:
+        raise RowError(f"preço negativo: {value!r}")
+    return number
+
+
+def parse_int(value: str) -> int | None:
+    if not value:
+        return None
+    try:
+        number = Decimal(value.replace(",", "."))
+    except InvalidOperation:
+        raise RowError(f"estoque inválido: {value!r}")
+    if number < 0 or number != number.to_integral_value():
+        raise RowError(f"estoque inválido: {value!r}")
+    return int(number)
+
+
+def parse_bool(value: str) -> bool | None:
+    if not value:
+        return None
+    lowered = value.strip().lower()
+    if lowered in TRUE_VALUES:
+        return True
+    if lowered in FALSE_VALUES:
+        return False
+    raise RowError(f"active inválido: {value!r}")
+
+
+@dataclass(slots=True)
+class ImportRow:
+    line: int
+    slug: str
+    sku: str
+    name: str
+    price: Decimal | None
+    stock: int | None
+    active: bool | None
+    category: str
+    brand: str
+    size: str
+    color: str
+
+    @classmethod
+    def parse(cls, line: int, data: dict[str, str]) -> "ImportRow":
+        row = cls(
+            line=line,
+            slug=data.get("slug", ""),
+            sku=data.get("sku", ""),
+            name=data.get("name", "") or data.get("nome", ""),
+            price=parse_decimal(data.get("price", "") or data.get("preco", "")),
+            stock=parse_int(data.get("stock", "") or data.get("estoque", "")),
+            active=parse_bool(data.get("active", "")),
+            category=data.get("category", ""),
+            brand=data.get("brand", ""),
+            size=data.get("size", ""),
+            color=data.get("color", ""),
+        )
+        if not row.slug and not row.sku:
+            raise RowError("linha sem slug e sem sku")
+        return row
+
+
+def _changes(obj, values: dict) -> dict:
+    """Campos que mudam de fato -> (antes, depois). None = célula vazia, ignora."""
+    return {
+        name: (getattr(obj, name), value)
+        for name, value in values.items()
+        if value is not None and getattr(obj, name) != value
+    }
+
+
+@dataclass
+class ImportReport:
+    rows: int = 0
+    products_created: int = 0
+    products_updated: int = 0
+    variants_created: int = 0
+    variants_updated: int = 0
+    unchanged: int = 0
+    errors: int = 0
+    error_samples: list = field(default_factory=list)
+    diff_samples: list = field(default_factory=list)
+
+    def error(self, line: int, message: str):
+        self.errors += 1
+        if len(self.error_samples) < REPORT_SAMPLE:
+            self.error_samples.append({"line": line, "error": message})
+
+    def diff(self, line: int, action: str, target: str, key: str, changes: dict | None = None):
+        if len(self.diff_samples) < REPORT_SAMPLE:
+            entry = {"line": line, "action": action, "target": target, "key": key}
+            if changes:
+                entry["changes"] = {k: [str(a), str(b)] for k, (a, b) in changes.items()}
+            self.diff_samples.append(entry)
+
+    def counters(self) -> dict:
+        return {
+            "rows": self.rows,
+            "products_created": self.products_created,
+            "products_updated": self.products_updated,
+            "variants_created": self.variants_created,
+            "variants_updated": self.variants_updated,
+            "unchanged": self.unchanged,
+            "errors": self.errors,
+        }
+
+
+class SupplierImporter:
+    PRODUCT_FIELDS = ("id", "slug", "name", "price", "active", "category_id", "brand_id")
+    VARIANT_FIELDS = ("id", "sku", "product_id", "size", "color", "price", "stock", "active")
+
+    def __init__(self, *, supplier=None, dry_run: bool = False, batch_size: int = 2000):
+        self.supplier = supplier
+        self.dry_run = dry_run
+        self.batch_size = batch_size
+        self.report = ImportReport()
+        # tabelas pequenas: carregadas uma vez
+        self.categories = dict(Category.objects.values_list("slug", "id"))
+        self.brands = dict(Brand.objects.values_list("slug", "id"))
+        # dry-run: slugs que "seriam criados" em lotes anteriores (sem id real)
+        self._pending_slugs: set[str] = set()
+
+    def run(self, rows: Iterable[Row]) -> ImportReport:
+        iterator = iter(rows)
+        while batch := list(islice(iterator, self.batch_size)):
+            self.process_batch(batch)
+        return self.report
+
+    # ---------- lote ----------
+
+    def _parse(self, batch: list[Row]) -> list[ImportRow]:
+        parsed = []
+        for line, data in batch:
+            self.report.rows += 1
+            try:
+                parsed.append(ImportRow.parse(line, data))
+            except RowError as exc:
+                self.report.error(line, str(exc))
+        return parsed
+
+    def process_batch(self, batch: list[Row]):
+        rows = self._parse(batch)
+        if not rows:
+            return
+
+        # linhas repetidas no mesmo lote: a última vence
+        product_rows = {r.slug: r for r in rows if not r.sku}
+        variant_rows = {r.sku: r for r in rows if r.sku}
+        self.report.unchanged += len(rows) - len(product_rows) - len(variant_rows)
+
+        slugs = set(product_rows) | {r.slug for r in variant_rows.values() if r.slug}
+        products = {p.slug: p for p in Product.objects.filter(slug__in=slugs).only(*self.PRODUCT_FIELDS)}
+        variants = {
+            v.sku: v for v in ProductVariant.objects.filter(sku__in=variant_rows).only(*self.VARIANT_FIELDS)
+        }
+
+        now = timezone.now()
+        new_products: dict[str, Product] = {}
+        updated_products: list[Product] = []
+        touched_product_ids: set[int] = set()
+
+        for slug, row in product_rows.items():
+            product = products.get(slug)
+            if product is None:
+                self._plan_product(row, new_products)
+                continue
+            changes = _changes(product, {"name": row.name or None, "price": row.price, "active": row.active})
+            if changes:
+                for name, (_, value) in changes.items():
+                    setattr(product, name, value)
+                product.updated_at = now  # bulk_update não aplica auto_now
+                updated_products.append(product)
+                self.report.products_updated += 1
+                self.report.diff(row.line, "update", "product", slug, changes)
+            else:
+                self.report.unchanged += 1
+
+        updated_variants: list[ProductVariant] = []
+        new_variants: list[tuple[ImportRow, ProductVariant]] = []
+        for sku, row in variant_rows.items():
+            variant = variants.get(sku)
+            if variant is not None:
+                changes = _changes(variant, {"price": row.price, "stock": row.stock, "active": row.active})
+                if changes:
+                    for name, (_, value) in changes.items():
+                        setattr(variant, name, value)
+                    updated_variants.append(variant)
+                    touched_product_ids.add(variant.product_id)
+                    self.report.variants_updated += 1
+                    self.report.diff(row.line, "update", "variant", sku, changes)
+                else:
+                    self.report.unchanged += 1
+                continue
+
+            if not row.slug:
+                self.report.error(row.line, f"sku {sku!r} não existe e a linha não tem slug do produto")
+                continue
+            if row.slug not in products and row.slug not in new_products and row.slug not in self._pending_slugs:
+                if not self._plan_product(row, new_products):
+                    continue
+            new_variants.append((row, ProductVariant(
+                sku=sku, size=row.size, color=row.color, price=row.price,
+                stock=row.stock or 0, active=row.active if row.active is not None else True,
+            )))
+
+        new_variants = self._drop_option_conflicts(new_variants, products)
+        for row, _ in new_variants:
+            self.report.variants_created += 1
+            self.report.diff(row.line, "create", "variant", row.sku)
+
+        if self.dry_run:
+            self._pending_slugs.update(new_products)
+            return
+
+        with transaction.atomic():
+            if new_products:
+                Product.objects.bulk_create(new_products.values(), batch_size=self.batch_size)
+            if updated_products:
+                Product.objects.bulk_update(
+                    updated_products, ["name", "price", "active", "updated_at"], batch_size=self.batch_size,
+                )
+            if new_variants:
+                for row, variant in new_variants:
+                    product = products.get(row.slug) or new_products[row.slug]
+                    variant.product_id = product.id
+                    touched_product_ids.add(product.id)
+                ProductVariant.objects.bulk_create([v for _, v in new_variants], batch_size=self.batch_size)
+            if updated_variants:
+                ProductVariant.objects.bulk_update(
+                    updated_variants, ["price", "stock", "active"], batch_size=self.batch_size,
+                )
+            if self.supplier is not None:
+                # todo SKU da planilha passa a ser comprado deste fornecedor (reposição)
+                variant_ids = [v.id for v in variants.values()] + [v.id for _, v in new_variants]
+                SupplierItem.objects.bulk_create(
+                    [SupplierItem(variant_id=vid, supplier=self.supplier) for vid in variant_ids],
+                    batch_size=self.batch_size, update_conflicts=True, unique_fields=["variant"],
+                    update_fields=["supplier"],
+                )
+            # variante mudou = produto mudou para snapshot/feeds incrementais
+            touched_product_ids.difference_update(p.id for p in updated_products)
+            if touched_product_ids:
+                Product.objects.filter(id__in=touched_product_ids).update(updated_at=now)
+
+    def _plan_product(self, row: ImportRow, new_products: dict) -> bool:
+        missing = [name for name in ("name", "price", "category") if getattr(row, name) in ("", None)]
+        if missing:
+            self.report.error(row.line, f"produto {row.slug!r} não existe; faltam colunas para criar: {', '.join(missing)}")
+            return False
+        category_id = self.categories.get(row.category)
+        if category_id is None:
+            self.report.error(row.line, f"categoria {row.category!r} não existe")
+            return False
+        brand_id = None
+        if row.brand:
+            brand_id = self.brands.get(row.brand)
+            if brand_id is None:
+                self.report.error(row.line, f"marca {row.brand!r} não existe")
+                return False
+
+        if row.slug in new_products or row.slug in self._pending_slugs:
+            return True
+        new_products[row.slug] = Product(
+            slug=row.slug, name=row.name, price=row.price, category_id=category_id, brand_id=brand_id,
+            active=row.active if row.active is not None else True,
+        )
+        self.report.products_created += 1
+        self.report.diff(row.line, "create", "product", row.slug)
+        return True
+
+    def _drop_option_conflicts(self, new_variants, products):
+        """Respeita uniq_variant_options (produto, tamanho, cor) antes do bulk_create."""
+        if not new_variants:
+            return new_variants
+        product_ids = {products[r.slug].id for r, _ in new_variants if r.slug in products}
+        taken = set(
+            ProductVariant.objects.filter(product_id__in=product_ids).values_list("product__slug", "size", "color")
+        )
+        kept = []
+        for row, variant in new_variants:
+            key = (row.slug, variant.size, variant.color)
+            if key in taken:
+                self.report.error(
+                    row.line, f"produto {row.slug!r} já tem variante tamanho={variant.size!r} cor={variant.color!r}",
+                )
+                continue
+            taken.add(key)
+            kept.append((row, variant))
+        return kept
+
+
+def run_import(supplier, path, rows: Iterable[Row], *, dry_run=False, batch_size=2000) -> SupplierImport:
+    """Executa a importação registrando um SupplierImport com totais e amostras do diff."""
+    record = SupplierImport.objects.create(supplier=supplier, filename=str(path)[-255:], dry_run=dry_run)
+    importer = SupplierImporter(supplier=supplier, dry_run=dry_run, batch_size=batch_size)
+    try:
+        report = importer.run(rows)
+    except Exception as exc:
+        report = importer.report
+        record.status = SupplierImport.Status.FAILED
+        report.error(0, f"falha: {exc}")
+    else:
+        record.status = SupplierImport.Status.DONE
+
+    for name, value in report.counters().items():
+        setattr(record, name, value)
+    record.report = {"errors": report.error_samples, "diff": report.diff_samples}
+    record.finished_at = timezone.now()
+    record.save()
+    return record
@@ -0,0 +1,42 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.suppliers.importer import run_import
+from apps.suppliers.models import Supplier
+from apps.suppliers.readers import iter_rows
+
+
+class Command(BaseCommand):
+    help = "Importa planilha CSV/XLSX de preço/estoque de um fornecedor (em lotes, com diff)."
+
+    def add_arguments(self, parser):
+        parser.add_argument("supplier", help="Slug do fornecedor.")
+        parser.add_argument("path", help="Arquivo .csv ou .xlsx.")
+        parser.add_argument("--dry-run", action="store_true", help="Só calcula e mostra o diff, sem gravar.")
+        parser.add_argument("--batch-size", type=int, default=2000)
+        parser.add_argument("--show", type=int, default=20, help="Quantas linhas do diff/erros exibir.")
+
+    def handle(self, *args, supplier, path, dry_run, batch_size, show, **options):
+        try:
+            supplier_obj = Supplier.objects.get(slug=supplier)
+        except Supplier.DoesNotExist:
+            raise CommandError(f"Fornecedor {supplier!r} não encontrado.")
+        try:
+            rows = iter_rows(path)
+        except ValueError as exc:
+            raise CommandError(str(exc))
+
+        record = run_import(supplier_obj, path, rows, dry_run=dry_run, batch_size=batch_size)
+
+        for entry in record.report["diff"][:show]:
+            changes = ", ".join(f"{k}: {a} -> {b}" for k, (a, b) in entry.get("changes", {}).items())
+            self.stdout.write(f"  L{entry['line']} {entry['action']} {entry['target']} {entry['key']} {changes}".rstrip())
+        for entry in record.report["errors"][:show]:
+            self.stderr.write(f"  L{entry['line']} erro: {entry['error']}")
+
+        prefix = "[dry-run] " if dry_run else ""
+        self.stdout.write(
+            f"{prefix}Importação #{record.id} ({record.get_status_display()}): {record.rows} linha(s), "
+            f"produtos +{record.products_created} ~{record.products_updated}, "
+            f"variantes +{record.variants_created} ~{record.variants_updated}, "
+            f"{record.unchanged} sem mudança, {record.errors} erro(s)."
+        )
@@ -0,0 +1,32 @@
+# Generated by Django 6.0.1 on 2026-10-19 16:20
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('catalog', '0004_productrecommendation'),
+        ('suppliers', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='supplier',
+            name='lead_time_days',
+            field=models.PositiveSmallIntegerField(default=7),
+        ),
+        migrations.CreateModel(
+            name='SupplierItem',
+            fields=[
+                ('variant', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='supplier_item', serialize=False, to='catalog.productvariant')),
+                ('supplier_sku', models.CharField(blank=True, default='', max_length=64)),
+                ('cost', models.DecimalField(blank=True, decimal_places=2, max_digits=10, null=True)),
+                ('lead_time_days', models.PositiveSmallIntegerField(blank=True, null=True)),
+                ('pack_size', models.PositiveIntegerField(default=1)),
+                ('min_order_qty', models.PositiveIntegerField(default=1)),
+                ('supplier', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='items', to='suppliers.supplier')),
+            ],
+        ),
+    ]
@@ -0,0 +1,67 @@
+from django.db import models
+
+
+class Supplier(models.Model):
+    name = models.CharField(max_length=120)
+    slug = models.SlugField(max_length=140, unique=True)
+    contact_email = models.EmailField(blank=True)
+    # prazo padrão de entrega (dias), usado no ponto de pedido (apps.inventory)
+    lead_time_days = models.PositiveSmallIntegerField(default=7)
+    active = models.BooleanField(default=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    def __str__(self) -> str:
+        return self.name
+
+
+class SupplierItem(models.Model):
+    """
+    De qual fornecedor a variante é comprada (uma por SKU; a última importação vence).
+    Campos vazios = usa o padrão do fornecedor / 1 unidade.
+    """
+    variant = models.OneToOneField(
+        "catalog.ProductVariant", on_delete=models.CASCADE, primary_key=True, related_name="supplier_item",
+    )
+    supplier = models.ForeignKey(Supplier, on_delete=models.CASCADE, related_name="items")
+    supplier_sku = models.CharField(max_length=64, blank=True, default="")
+    cost = models.DecimalField(max_digits=10, decimal_places=2, null=True, blank=True)
+    lead_time_days = models.PositiveSmallIntegerField(null=True, blank=True)
+    pack_size = models.PositiveIntegerField(default=1)       # compra em múltiplos de
+    min_order_qty = models.PositiveIntegerField(default=1)
+
+    def __str__(self) -> str:
+        return f"{self.supplier} - {self.variant_id}"
+
+
+class SupplierImport(models.Model):
+    """
+    Uma execução de importação de planilha (CSV/XLSX) de preço/estoque.
+    report guarda só amostras limitadas (diff e erros); os totais ficam nos contadores.
+    """
+    class Status(models.TextChoices):
+        RUNNING = "running", "Em execução"
+        DONE = "done", "Concluída"
+        FAILED = "failed", "Falhou"
+
+    supplier = models.ForeignKey(Supplier, on_delete=models.PROTECT, related_name="imports")
+    filename = models.CharField(max_length=255)
+    dry_run = models.BooleanField(default=False)
+    status = models.CharField(max_length=20, choices=Status.choices, default=Status.RUNNING)
+
+    rows = models.PositiveIntegerField(default=0)
+    products_created = models.PositiveIntegerField(default=0)
+    products_updated = models.PositiveIntegerField(default=0)
+    variants_created = models.PositiveIntegerField(default=0)
+    variants_updated = models.PositiveIntegerField(default=0)
+    unchanged = models.PositiveIntegerField(default=0)
+    errors = models.PositiveIntegerField(default=0)
+    report = models.JSONField(default=dict, blank=True)
+
+    created_at = models.DateTimeField(auto_now_add=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        ordering = ["-created_at"]
+
+    def __str__(self) -> str:
+        return f"{self.supplier} - {self.filename}"
@@ -0,0 +1,114 @@
+"""
+Leitura em streaming de planilhas de fornecedor: CSV (',' ou ';') e XLSX.
+O XLSX é lido direto do zip com iterparse (sem openpyxl), liberando cada <row> depois de lida.
+Cada linha sai como (número da linha, {coluna normalizada: texto}).
+"""
+import csv
+import posixpath
+import re
+import zipfile
+from pathlib import Path
+from typing import Iterator
+from xml.etree.ElementTree import iterparse
+
+NS_MAIN = "{http://schemas.openxmlformats.org/spreadsheetml/2006/main}"
+NS_REL = "{http://schemas.openxmlformats.org/officeDocument/2006/relationships}"
+NS_PKG_REL = "{http://schemas.openxmlformats.org/package/2006/relationships}"
+
+Row = tuple[int, dict[str, str]]
+
+
+def normalize_header(value: str) -> str:
+    return re.sub(r"\s+", "_", (value or "").strip().lower())
+
+
+def iter_rows(path) -> Iterator[Row]:
+    path = Path(path)
+    if path.suffix.lower() == ".xlsx":
+        return iter_xlsx_rows(path)
+    if path.suffix.lower() in (".csv", ".txt"):
+        return iter_csv_rows(path)
+    raise ValueError(f"Formato não suportado: {path.suffix or path.name} (use .csv ou .xlsx).")
+
+
+def iter_csv_rows(path) -> Iterator[Row]:
+    with open(path, newline="", encoding="utf-8-sig") as fh:
+        first = fh.readline()
+        delimiter = ";" if first.count(";") > first.count(",") else ","
+        header = [normalize_header(h) for h in next(csv.reader([first], delimiter=delimiter))]
+        for line, values in enumerate(csv.reader(fh, delimiter=delimiter), start=2):
+            if not any(v.strip() for v in values):
+                continue
+            yield line, {h: v.strip() for h, v in zip(header, values) if h}
+
+
+def _col_index(ref: str) -> int:
+    idx = 0
+    for ch in ref:
+        if not ch.isalpha():
+            break
+        idx = idx * 26 + (ord(ch.upper()) - 64)
+    return idx - 1
+
+
+def _first_sheet_path(zf: zipfile.ZipFile) -> str:
+    with zf.open("xl/workbook.xml") as fh:
+        sheet = next(el for _, el in iterparse(fh) if el.tag == f"{NS_MAIN}sheet")
+    rid = sheet.get(f"{NS_REL}id")
+    with zf.open("xl/_rels/workbook.xml.rels") as fh:
+        for _, el in iterparse(fh):
+            if el.tag == f"{NS_PKG_REL}Relationship" and el.get("Id") == rid:
+                target = el.get("Target")
+                return target.lstrip("/") if target.startswith("/") else posixpath.join("xl", target)
+    raise ValueError("XLSX sem planilha.")
+
+
+def _shared_strings(zf: zipfile.ZipFile) -> list[str]:
+    if "xl/sharedStrings.xml" not in zf.namelist():
+        return []
+    strings = []
+    with zf.open("xl/sharedStrings.xml") as fh:
+        root = None
+        for event, el in iterparse(fh, events=("start", "end")):
+            if root is None:
+                root = el
+            elif event == "end" and el.tag == f"{NS_MAIN}si":
+                strings.append("".join(t.text or "" for t in el.iter(f"{NS_MAIN}t")))
+                root.remove(el)
+    return strings
+
+
+def iter_xlsx_rows(path) -> Iterator[Row]:
+    with zipfile.ZipFile(path) as zf:
+        shared = _shared_strings(zf)
+        header = None
+        with zf.open(_first_sheet_path(zf)) as fh:
+            sheet_data = None
+            for event, row in iterparse(fh, events=("start", "end")):
+                if event == "start":
+                    if row.tag == f"{NS_MAIN}sheetData":
+                        sheet_data = row
+                    continue
+                if row.tag != f"{NS_MAIN}row":
+                    continue
+                cells = {}
+                for c in row.iter(f"{NS_MAIN}c"):
+                    kind = c.get("t")
+                    if kind == "inlineStr":
+                        value = "".join(t.text or "" for t in c.iter(f"{NS_MAIN}t"))
+                    else:
+                        v = c.find(f"{NS_MAIN}v")
+                        value = v.text if v is not None and v.text is not None else ""
+                        if kind == "s" and value:
+                            value = shared[int(value)]
+                    cells[_col_index(c.get("r", ""))] = value.strip()
+                line = int(row.get("r", 0))
+                # tira a linha da árvore: só clear() deixa um <row> vazio por linha preso em sheetData
+                sheet_data.remove(row)
+
+                if header is None:
+                    header = {i: normalize_header(v) for i, v in cells.items()}
+                    continue
+                if not any(cells.values()):
+                    continue
+                yield line, {header[i]: v for i, v in cells.items() if header.get(i)}
@@ -13,6 +13,7 @@ https://docs.djangoproject.com/en/6.0/ref/settings/
 from pathlib import Path
 import os
 import environ
+from corsheaders.defaults import default_headers
 
 BASE_DIR = Path(__file__).resolve().parent.parent
 env = environ.Env(
@@ -45,13 +46,22 @@ INSTALLED_APPS = [
     "rest_framework",
     "rest_framework_simplejwt",
     "corsheaders",
+    "apps.core.apps.CoreConfig",
     "apps.accounts",
     "apps.catalog.apps.CatalogConfig",
     "apps.orders.apps.OrdersConfig",
     "apps.payments.apps.PaymentsConfig",
+    "apps.cart.apps.CartConfig",
+    "apps.promotions.apps.PromotionsConfig",
+    "apps.suppliers.apps.SuppliersConfig",
+    "apps.notifications.apps.NotificationsConfig",
+    "apps.inventory.apps.InventoryConfig",
+    "apps.risk.apps.RiskConfig",
+    "apps.shipping.apps.ShippingConfig",
 ]
 
 MIDDLEWARE = [
+    "apps.core.middleware.RequestTimingMiddleware",
     "corsheaders.middleware.CorsMiddleware",
     "django.middleware.security.SecurityMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
@@ -81,12 +91,42 @@ TEMPLATES = [
 
 WSGI_APPLICATION = 'config.wsgi.application'
 
+# orjson é opcional: sem ele os renderers/parsers caem no json do DRF
+API_FAST_JSON = env.bool("API_FAST_JSON", default=True)
+
 REST_FRAMEWORK = {
     "DEFAULT_AUTHENTICATION_CLASSES": (
         "rest_framework_simplejwt.authentication.JWTAuthentication",
     ),
+    "DEFAULT_RENDERER_CLASSES": (
+        "apps.core.renderers.ORJSONRenderer" if API_FAST_JSON else "rest_framework.renderers.JSONRenderer",
+        "rest_framework.renderers.BrowsableAPIRenderer",
+    ),
+    "DEFAULT_PARSER_CLASSES": (
+        "apps.core.parsers.ORJSONParser" if API_FAST_JSON else "rest_framework.parsers.JSONParser",
+        "rest_framework.parsers.FormParser",
+        "rest_framework.parsers.MultiPartParser",
+    ),
+    # proxies confiáveis na frente da aplicação (IP do cliente para throttling e risco): 0 = usa
+    # REMOTE_ADDR e ignora X-Forwarded-For (forjável); 1 = atrás de um nginx/load balancer, etc.
+    "NUM_PROXIES": env.int("NUM_PROXIES", default=0),
+    # token bucket (apps.core.throttling): "<scope>_ip" / "<scope>_user" / "<scope>_endpoint"
+    "DEFAULT_THROTTLE_RATES": {
+        "checkout_ip": env("THROTTLE_CHECKOUT_IP", default="10/min"),
+        "checkout_user": env("THROTTLE_CHECKOUT_USER", default="20/min"),
+        "checkout_endpoint": env("THROTTLE_CHECKOUT_ENDPOINT", default="600/min"),
+        "payment_create_ip": env("THROTTLE_PAYMENT_CREATE_IP", default="20/min"),
+        "payment_create_user": env("THROTTLE_PAYMENT_CREATE_USER", default="30/min"),
+        "payment_create_endpoint": env("THROTTLE_PAYMENT_CREATE_ENDPOINT", default="600/min"),
+        "register_ip": env("THROTTLE_REGISTER_IP", default="5/min"),
+        "register_endpoint": env("THROTTLE_REGISTER_ENDPOINT", default="120/min"),
+        "cart_ip": env("THROTTLE_CART_IP", default="120/min"),
+    },
 }
 
+# Máximo de buckets em memória por processo (LRU)
+THROTTLE_MAX_KEYS = env.int("THROTTLE_MAX_KEYS", default=100_000)
+
 # Database
 # https://docs.djangoproject.com/en/6.0/ref/settings/#databases
 
@@ -138,7 +178,153 @@ CORS_ALLOWED_ORIGINS = [
     "http://localhost:5173",
     "http://127.0.0.1:5173",
 ]
+CORS_ALLOW_HEADERS = (*default_headers, "x-cart-token")
 
 PAYMENTS_PROVIDER = env("PAYMENTS_PROVIDER", default="dummy")
 PAYMENTS_WEBHOOK_SECRET = env("PAYMENTS_WEBHOOK_SECRET", default="")
-MERCADOPAGO_ACCESS_TOKEN = env("MERCADOPAGO_ACCESS_TOKEN", default="")
\ No newline at end of file
+MERCADOPAGO_ACCESS_TOKEN = env("MERCADOPAGO_ACCESS_TOKEN", default="")
+# Pix: dados do BR Code do provider dummy e cache do QR desenhado no servidor (apps.payments.qr)
+PIX_DUMMY_KEY = env("PIX_DUMMY_KEY", default="pix-dummy@example.com")
+PIX_MERCHANT_NAME = env("PIX_MERCHANT_NAME", default="LOJA")
+PIX_MERCHANT_CITY = env("PIX_MERCHANT_CITY", default="SAO PAULO")
+PIX_QR_CACHE_DIR = env("PIX_QR_CACHE_DIR", default=str(BASE_DIR / "cache" / "pix_qr"))
+PIX_QR_MEMORY_CACHE_BYTES = env.int("PIX_QR_MEMORY_CACHE_BYTES", default=8 * 1024 * 1024)
+# Rotação de PaymentEvent (manage.py archive_payment_events): meses mantidos no banco e destino do arquivo
+PAYMENT_EVENTS_KEEP_MONTHS = env.int("PAYMENT_EVENTS_KEEP_MONTHS", default=6)
+PAYMENT_EVENTS_ARCHIVE_ROOT = env("PAYMENT_EVENTS_ARCHIVE_ROOT", default=str(BASE_DIR / "archive" / "payment_events"))
+
+# Leitura em lote de pedidos (separação)
+ORDERS_BATCH_MAX_IDS = env.int("ORDERS_BATCH_MAX_IDS", default=500)
+ORDERS_BATCH_CHUNK_SIZE = env.int("ORDERS_BATCH_CHUNK_SIZE", default=200)
+# "Meus pedidos": itens por página (cursor); o cliente pode pedir até 100 com ?page_size=
+MY_ORDERS_PAGE_SIZE = env.int("MY_ORDERS_PAGE_SIZE", default=20)
+
+# Instrumentação (apps.core.middleware / /metrics). Expõem tempos e contagem de queries: desligados
+# por padrão. Server-Timing só com SERVER_TIMING_HEADER=True; /metrics responde 404 sem METRICS_TOKEN.
+SERVER_TIMING_HEADER = env.bool("SERVER_TIMING_HEADER", default=False)
+METRICS_TOKEN = env("METRICS_TOKEN", default="")
+
+LOGGING = {
+    "version": 1,
+    "disable_existing_loggers": False,
+    "handlers": {
+        "console": {"class": "logging.StreamHandler"},
+    },
+    "loggers": {
+        # uma linha JSON por request (RequestTimingMiddleware)
+        "apps.request": {
+            "handlers": ["console"],
+            "level": env("REQUEST_LOG_LEVEL", default="INFO"),
+            "propagate": False,
+        },
+    },
+}
+
+# Carrinho anônimo expira após N dias sem alteração (cleanup_carts remove)
+CART_TTL_DAYS = env.int("CART_TTL_DAYS", default=30)
+
+# Índice de promoções em memória: reconstruído quando uma Promotion muda ou após N segundos
+PROMOTIONS_INDEX_TTL = env.int("PROMOTIONS_INDEX_TTL", default=60)
+
+# Snapshot estático do catálogo (manage.py publish_catalog)
+CATALOG_SNAPSHOT_ROOT = env("CATALOG_SNAPSHOT_ROOT", default=str(BASE_DIR / "snapshots" / "catalog"))
+CATALOG_SNAPSHOT_PAGE_SIZE = env.int("CATALOG_SNAPSHOT_PAGE_SIZE", default=48)
+# host público das imagens nos JSON estáticos (ex.: https://api.loja.com.br); vazio = URL relativa
+CATALOG_SNAPSHOT_MEDIA_BASE = env("CATALOG_SNAPSHOT_MEDIA_BASE", default="")
+
+# Sitemap / feed de produtos (manage.py generate_feeds)
+SITE_URL = env("SITE_URL", default="http://localhost:5173")
+FEEDS_ROOT = env("FEEDS_ROOT", default=str(BASE_DIR / "snapshots" / "feeds"))
+
+# Recomendações (manage.py build_recommendations): TTL do cache da resposta de /products/<slug>/related/
+RECOMMENDATIONS_CACHE_TTL = env.int("RECOMMENDATIONS_CACHE_TTL", default=300)
+
+# Reposição de estoque (manage.py compute_replenishment)
+REPLENISHMENT_HISTORY_WEEKS = env.int("REPLENISHMENT_HISTORY_WEEKS", default=104)
+REPLENISHMENT_HALF_LIFE_WEEKS = env.float("REPLENISHMENT_HALF_LIFE_WEEKS", default=8.0)
+REPLENISHMENT_SERVICE_LEVEL = env.float("REPLENISHMENT_SERVICE_LEVEL", default=0.95)
+REPLENISHMENT_REVIEW_DAYS = env.int("REPLENISHMENT_REVIEW_DAYS", default=7)
+REPLENISHMENT_DEFAULT_LEAD_TIME = env.int("REPLENISHMENT_DEFAULT_LEAD_TIME", default=7)   # SKU sem fornecedor
+
+# Análise de risco no pagamento (apps.risk): contadores de velocidade + regras com peso
+RISK_ENABLED = env.bool("RISK_ENABLED", default=True)
+# "local" (memória do worker) ou "cache" (CACHES[RISK_CACHE_ALIAS], compartilhado entre workers)
+RISK_COUNTER_BACKEND = env("RISK_COUNTER_BACKEND", default="local")
+RISK_CACHE_ALIAS = env("RISK_CACHE_ALIAS", default="default")
+RISK_WINDOW_SLOTS = env.int("RISK_WINDOW_SLOTS", default=10)
+RISK_SCORER = env("RISK_SCORER", default="apps.risk.scoring.RuleScorer")
+RISK_RULES_FILE = env("RISK_RULES_FILE", default="")   # JSON; vazio = regras padrão de apps.risk.scoring
+RISK_REVIEW_SCORE = env.int("RISK_REVIEW_SCORE", default=50)
+RISK_DENY_SCORE = env.int("RISK_DENY_SCORE", default=80)
+RISK_ENFORCE_METHODS = env.list("RISK_ENFORCE_METHODS", default=["card"])   # Pix: só registra
+RISK_RECORD_FLUSH_SECONDS = env.float("RISK_RECORD_FLUSH_SECONDS", default=2.0)
+
+# Mídia em produção (apps.core.media.MediaView)
+# MEDIA_SENDFILE_BACKEND: "" (Python serve com FileResponse), "nginx" (X-Accel-Redirect) ou "apache" (X-Sendfile)
+MEDIA_SENDFILE_BACKEND = env("MEDIA_SENDFILE_BACKEND", default="")
+# location internal do nginx apontando para MEDIA_ROOT
+MEDIA_ACCEL_PREFIX = env("MEDIA_ACCEL_PREFIX", default="/protected-media/")
+# prefixos (relativos a MEDIA_ROOT) que exigem usuário staff, ex.: "private/"
+MEDIA_PRIVATE_PREFIXES = env.list("MEDIA_PRIVATE_PREFIXES", default=[])
+MEDIA_CACHE_MAX_AGE = env.int("MEDIA_CACHE_MAX_AGE", default=3600)
+
+# E-mail transacional (fila em apps.notifications; envio pelo worker send_notifications)
+# Teste local: EMAIL_HOST=localhost EMAIL_PORT=1025 com um sink SMTP (mailpit, aiosmtpd...)
+EMAIL_BACKEND = env("EMAIL_BACKEND", default="django.core.mail.backends.smtp.EmailBackend")
+EMAIL_HOST = env("EMAIL_HOST", default="localhost")
+EMAIL_PORT = env.int("EMAIL_PORT", default=1025)
+EMAIL_HOST_USER = env("EMAIL_HOST_USER", default="")
+EMAIL_HOST_PASSWORD = env("EMAIL_HOST_PASSWORD", default="")
+EMAIL_USE_TLS = env.bool("EMAIL_USE_TLS", default=False)
+EMAIL_TIMEOUT = env.int("EMAIL_TIMEOUT", default=10)
+DEFAULT_FROM_EMAIL = env("DEFAULT_FROM_EMAIL", default="Loja <no-reply@localhost>")
+NOTIFICATIONS_MAX_ATTEMPTS = env.int("NOTIFICATIONS_MAX_ATTEMPTS", default=6)
+NOTIFICATIONS_BACKOFF_BASE = env.int("NOTIFICATIONS_BACKOFF_BASE", default=30)     # segundos
+NOTIFICATIONS_BACKOFF_MAX = env.int("NOTIFICATIONS_BACKOFF_MAX", default=3600)
+NOTIFICATIONS_LOCK_SECONDS = env.int("NOTIFICATIONS_LOCK_SECONDS", default=300)
+
+# Etiquetas e romaneios em lote (apps.shipping.labels)
+SHIPPING_SENDER_NAME = env("SHIPPING_SENDER_NAME", default="Loja")
+SHIPPING_SENDER_ADDRESS = env.list("SHIPPING_SENDER_ADDRESS", default=[])   # linhas do remetente, ex.: "Rua X, 100","São Paulo / SP","01000-000"
+SHIPPING_LABEL_WORKERS = env.int("SHIPPING_LABEL_WORKERS", default=0)     # processos do pool; 0 = nº de CPUs
+SHIPPING_LABEL_POOL_MIN = env.int("SHIPPING_LABEL_POOL_MIN", default=40)  # ondas menores desenham no próprio processo
+SHIPPING_LABEL_MAX_ORDERS = env.int("SHIPPING_LABEL_MAX_ORDERS", default=2000)
+SHIPPING_LABEL_CACHE_BYTES = env.int("SHIPPING_LABEL_CACHE_BYTES", default=32 * 1024 * 1024)
+
+# Senhas: hasher memory-hard com custo ajustável (apps.accounts.hashers) e executor limitado
+# (apps.accounts.hashing). O primeiro de PASSWORD_HASHERS grava; os demais só verificam e o hash é
+# regravado no próximo login (também quando o custo muda).
+PASSWORD_HASHER = env("PASSWORD_HASHER", default="scrypt")   # scrypt | argon2 (requer argon2-cffi)
+# padrão = mínimo do OWASP para scrypt (N=2^17, r=8, p=1): 128 MiB e ~0,4 s por hash (por worker).
+# Baixar o custo é decisão explícita do operador (env), não padrão.
+PASSWORD_SCRYPT_N = env.int("PASSWORD_SCRYPT_N", default=2**17)   # memória = 128 * N * r
+PASSWORD_SCRYPT_R = env.int("PASSWORD_SCRYPT_R", default=8)
+PASSWORD_SCRYPT_P = env.int("PASSWORD_SCRYPT_P", default=1)
+PASSWORD_ARGON2_TIME_COST = env.int("PASSWORD_ARGON2_TIME_COST", default=2)
+PASSWORD_ARGON2_MEMORY_COST = env.int("PASSWORD_ARGON2_MEMORY_COST", default=65536)   # KiB
+PASSWORD_ARGON2_PARALLELISM = env.int("PASSWORD_ARGON2_PARALLELISM", default=1)
+_PASSWORD_HASHERS = {
+    "scrypt": "apps.accounts.hashers.ScryptPasswordHasher",
+    "argon2": "apps.accounts.hashers.Argon2PasswordHasher",
+}
+PASSWORD_HASHERS = [
+    _PASSWORD_HASHERS[PASSWORD_HASHER],
+    *(path for name, path in _PASSWORD_HASHERS.items() if name != PASSWORD_HASHER),
+    "django.contrib.auth.hashers.PBKDF2PasswordHasher",
+    "django.contrib.auth.hashers.PBKDF2SHA1PasswordHasher",
+]
+AUTHENTICATION_BACKENDS = ["apps.accounts.backends.ModelBackend"]
+PASSWORD_HASH_WORKERS = env.int("PASSWORD_HASH_WORKERS", default=2)   # hashes simultâneos por processo
+PASSWORD_HASH_QUEUE = env.int("PASSWORD_HASH_QUEUE", default=16)      # esperando vaga; além disso, 503
+PASSWORD_HASH_WAIT = env.float("PASSWORD_HASH_WAIT", default=2.0)     # segundos esperando vaga na fila cheia
+
+# Ingestão de pedidos em alto volume (apps.orders.ingest), opt-in para picos (flash sale):
+# id na hora + journal com fsync em grupo; o banco recebe os pedidos em lotes
+ORDERS_INGEST_ENABLED = env.bool("ORDERS_INGEST_ENABLED", default=False)
+ORDERS_INGEST_JOURNAL_DIR = env("ORDERS_INGEST_JOURNAL_DIR", default=str(BASE_DIR / "journal" / "orders"))
+ORDERS_INGEST_BATCH_SIZE = env.int("ORDERS_INGEST_BATCH_SIZE", default=500)    # pedidos por transação
+ORDERS_INGEST_FLUSH_MS = env.int("ORDERS_INGEST_FLUSH_MS", default=20)         # espera para juntar um lote
+ORDERS_INGEST_ID_BLOCK = env.int("ORDERS_INGEST_ID_BLOCK", default=200)        # ids reservados por vez
+ORDERS_INGEST_QUEUE = env.int("ORDERS_INGEST_QUEUE", default=20_000)           # fila cheia = caminho normal
+ORDERS_INGEST_SEGMENT_BYTES = env.int("ORDERS_INGEST_SEGMENT_BYTES", default=16 * 1024 * 1024)
+ORDERS_INGEST_READ_WAIT = env.float("ORDERS_INGEST_READ_WAIT", default=2.0)   # leitura de pedido ainda na fila
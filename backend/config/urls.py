@@ -17,16 +17,19 @@ Including another URLconf
 from django.contrib import admin
 from django.urls import path, include
 from django.conf import settings
-from django.conf.urls.static import static
+
+from apps.core.media import MediaView
+from apps.core.views import MetricsView
 
 urlpatterns = [
     path("admin/", admin.site.urls),
+    path("metrics", MetricsView.as_view(), name="metrics"),
     path("api/v1/", include("apps.catalog.urls")),
     path("api/v1/", include("apps.orders.urls")),
     path("api/v1/", include("apps.payments.urls")),
     path("api/v1/shipping/", include("apps.shipping.urls")),
     path("api/v1/", include("apps.accounts.urls")),
+    path("api/v1/", include("apps.cart.urls")),
+    path("api/v1/async/", include("apps.core.async_urls")),
+    path(f"{settings.MEDIA_URL.lstrip('/')}<path:path>", MediaView.as_view(), name="media"),
 ]
-
-if settings.DEBUG:
-    urlpatterns += static(settings.MEDIA_URL, document_root=settings.MEDIA_ROOT)
@@ -0,0 +1,67 @@
+import { api } from "./client";
+
+const TOKEN_KEY = "cart_token";
+
+export type ServerCartItem = {
+    id: number;
+    productId: number;
+    variantId: number | null;
+    slug: string;
+    name: string;
+    sku: string;
+    size: string;
+    color: string;
+    price: string;
+    previous_price: string | null;
+    price_changed: boolean;
+    qty: number;
+    available: boolean;
+};
+
+export type ServerCart = {
+    token: string | null;
+    items: ServerCartItem[];
+    count: number;
+    subtotal: string;
+    expires_at: string | null;
+    merged?: number;
+};
+
+function cartHeaders() {
+    const token = localStorage.getItem(TOKEN_KEY);
+    return token ? { "X-Cart-Token": token } : {};
+}
+
+function keepToken(cart: ServerCart) {
+    // carrinho de usuário não expira: token só importa para o anônimo
+    if (cart.token && cart.expires_at) localStorage.setItem(TOKEN_KEY, cart.token);
+    return cart;
+}
+
+export async function fetchServerCart(): Promise<ServerCart> {
+    const { data } = await api.get<ServerCart>("/cart/", { headers: cartHeaders() });
+    return data;
+}
+
+export async function addServerCartItem(productId: number, qty = 1, variantId?: number | null): Promise<ServerCart> {
+    const { data } = await api.post<ServerCart>("/cart/items/", { productId, variantId, qty }, { headers: cartHeaders() });
+    return keepToken(data);
+}
+
+export async function setServerCartQty(itemId: number, qty: number): Promise<ServerCart> {
+    const { data } = await api.patch<ServerCart>(`/cart/items/${itemId}/`, { qty }, { headers: cartHeaders() });
+    return data;
+}
+
+export async function removeServerCartItem(itemId: number): Promise<ServerCart> {
+    const { data } = await api.delete<ServerCart>(`/cart/items/${itemId}/`, { headers: cartHeaders() });
+    return data;
+}
+
+// chamado logo após o login/cadastro (como claimGuestOrders); sem carrinho anônimo, não faz nada
+export async function mergeServerCart(): Promise<ServerCart | null> {
+    if (!localStorage.getItem(TOKEN_KEY)) return null;
+    const { data } = await api.post<ServerCart>("/cart/merge/", null, { headers: cartHeaders() });
+    localStorage.removeItem(TOKEN_KEY);
+    return data;
+}
@@ -6,6 +6,25 @@ export type ProductImage = {
     alt_text: string;
 };
 
+export type ProductVariant = {
+    id: number;
+    sku: string;
+    size: string;
+    color: string;
+    price: string;
+    stock: number;
+    available: boolean;
+};
+
+export type VariantMatrix = {
+    sizes: string[];
+    colors: string[];
+    variants: ProductVariant[];
+    in_stock: boolean;
+    price_min: string;
+    price_max: string;
+};
+
 export type Product = {
     description: any;
     id: number;
@@ -15,14 +34,69 @@ export type Product = {
     category: { id: number; name: string; slug: string };
     brand: { id: number; name: string; slug: string } | null;
     images: ProductImage[];
+    variant_matrix: VariantMatrix | null;   // null = produto sem variações
 };
 
+// Snapshot estático publicado por `manage.py publish_catalog` (CDN). Sem a env, vai direto na API.
+const SNAPSHOT_URL: string | undefined = import.meta.env.VITE_CATALOG_SNAPSHOT_URL;
+
+let snapshotBase: Promise<string | null> | null = null;
+
+function getSnapshotBase(): Promise<string | null> {
+    if (!SNAPSHOT_URL) return Promise.resolve(null);
+    if (!snapshotBase) {
+        snapshotBase = fetch(`${SNAPSHOT_URL}/current.json`, { cache: "no-cache" })
+            .then((r) => (r.ok ? r.json() : null))
+            .then((p) => (p?.base ? `${SNAPSHOT_URL}/${p.base}` : null))
+            .catch(() => null);
+    }
+    return snapshotBase;
+}
+
+async function fetchSnapshot<T>(path: string): Promise<T | null> {
+    const base = await getSnapshotBase();
+    if (!base) return null;
+    try {
+        const r = await fetch(`${base}${path}`);
+        return r.ok ? ((await r.json()) as T) : null;
+    } catch {
+        return null;
+    }
+}
+
+type SnapshotPage = { results: Product[]; next: string | null; count: number };
+
+async function fetchProductsFromSnapshot(): Promise<Product[] | null> {
+    const products: Product[] = [];
+    let page: string | null = "page-0001.json";
+    while (page) {
+        const data: SnapshotPage | null = await fetchSnapshot<SnapshotPage>(`index/${page}`);
+        if (!data) return null;
+        products.push(...data.results);
+        page = data.next;
+    }
+    return products;
+}
+
 export async function fetchProducts(): Promise<Product[]> {
+    const cached = await fetchProductsFromSnapshot();
+    if (cached) return cached;
+
     const { data } = await api.get<Product[]>("/products/");
     return data;
 }
 
 export async function fetchProductBySlug(slug: string): Promise<Product> {
+    const cached = await fetchSnapshot<Product>(`products/${slug}.json`);
+    if (cached) return cached;
+
     const { data } = await api.get<Product>(`/products/${slug}/`);
     return data;
 }
+
+export type RelatedProducts = { bought_together: Product[]; similar: Product[] };
+
+export async function fetchRelatedProducts(slug: string): Promise<RelatedProducts> {
+    const { data } = await api.get<RelatedProducts>(`/products/${slug}/related/`);
+    return data;
+}
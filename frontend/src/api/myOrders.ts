@@ -1,7 +1,42 @@
 import { api } from "./client";
 
-export async function fetchMyOrders() {
-    const { data } = await api.get("/my/orders/");
+export type MyOrderRow = {
+    id: number;
+    status: string;
+    total: string;
+    created_at: string;
+    item_count: number;
+    first_item_name: string | null;
+};
+
+export type MyOrdersPage = {
+    next: string | null;
+    previous: string | null;
+    results: MyOrderRow[];
+};
+
+export type MyOrdersQuery = {
+    cursor?: string | null;
+    status?: string[];
+    createdAfter?: string; // AAAA-MM-DD
+    createdBefore?: string;
+    pageSize?: number;
+};
+
+// o "next" do backend é uma URL completa; só o cursor interessa
+export function cursorFrom(url: string | null): string | null {
+    if (!url) return null;
+    return new URL(url, window.location.origin).searchParams.get("cursor");
+}
+
+export async function fetchMyOrders(query: MyOrdersQuery = {}): Promise<MyOrdersPage> {
+    const params: Record<string, string | number> = {};
+    if (query.cursor) params.cursor = query.cursor;
+    if (query.status?.length) params.status = query.status.join(",");
+    if (query.createdAfter) params.created_after = query.createdAfter;
+    if (query.createdBefore) params.created_before = query.createdBefore;
+    if (query.pageSize) params.page_size = query.pageSize;
+    const { data } = await api.get<MyOrdersPage>("/my/orders/", { params });
     return data;
 }
 
@@ -13,4 +48,18 @@ export async function fetchMyOrder(id: number) {
 export async function claimGuestOrders(): Promise<{ claimed: number }> {
     const { data } = await api.post("/my/orders/claim/");
     return data;
-}
\ No newline at end of file
+}
+
+export type CustomerSummary = {
+    order_count: number;
+    paid_count: number;
+    lifetime_spend: string;
+    first_order_at: string | null;
+    last_order_at: string | null;
+    preferred_state: string;
+};
+
+export async function fetchMySummary(): Promise<CustomerSummary> {
+    const { data } = await api.get("/my/summary/");
+    return data;
+}
@@ -7,6 +7,7 @@ export type CheckoutPayload = {
     phone?: string;
     items: Array<{
         productId: number;
+        variantId?: number | null;
         name: string;
         price: string;
         qty: number;
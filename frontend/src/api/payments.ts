@@ -13,7 +13,9 @@ export type Payment = {
     amount: string;
 
     pix_qr_code: string;
-    pix_qr_code_base64: string;
+    // QR desenhado no backend a partir do pix_qr_code (URL imutável)
+    pix_qr_png_url: string | null;
+    pix_qr_svg_url: string | null;
     pix_expires_at: string | null;
 
     created_at: string;
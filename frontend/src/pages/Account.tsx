@@ -2,7 +2,8 @@ import { useEffect, useMemo, useState } from "react";
 import { Link, useNavigate } from "react-router-dom";
 import TopBar from "../components/TopBar";
 import { me, logout } from "../api/auth";
-import { fetchMyOrders } from "../api/myOrders";
+import { cursorFrom, fetchMyOrders, fetchMySummary } from "../api/myOrders";
+import type { CustomerSummary, MyOrderRow } from "../api/myOrders";
 
 type ApiErrorLike = {
     response?: { data?: unknown };
@@ -23,13 +24,6 @@ type MeUser = {
     email: string;
 };
 
-type Order = {
-    id: number;
-    status: string;
-    total: string;
-    created_at: string;
-};
-
 function formatDateBR(iso: string) {
     const d = new Date(iso);
     if (Number.isNaN(d.getTime())) return iso;
@@ -89,12 +83,20 @@ export default function AccountPage() {
     const navigate = useNavigate();
 
     const [user, setUser] = useState<MeUser | null>(null);
-    const [orders, setOrders] = useState<Order[]>([]);
+    const [orders, setOrders] = useState<MyOrderRow[]>([]);
+    const [nextCursor, setNextCursor] = useState<string | null>(null);
+    const [loadingMore, setLoadingMore] = useState(false);
     const [loadingUser, setLoadingUser] = useState(true);
     const [loadingOrders, setLoadingOrders] = useState(true);
     const [error, setError] = useState<string | null>(null);
+    const [summary, setSummary] = useState<CustomerSummary | null>(null);
 
-    const ordersCount = useMemo(() => orders.length, [orders]);
+    const ordersCount = useMemo(() => summary?.order_count ?? orders.length, [summary, orders]);
+
+    useEffect(() => {
+        // resumo é complementar: sem ele a página usa a lista de pedidos
+        fetchMySummary().then(setSummary).catch(() => setSummary(null));
+    }, []);
 
     useEffect(() => {
         (async () => {
@@ -117,8 +119,9 @@ export default function AccountPage() {
     useEffect(() => {
         (async () => {
             try {
-                const list = await fetchMyOrders();
-                setOrders(list);
+                const page = await fetchMyOrders();
+                setOrders(page.results);
+                setNextCursor(cursorFrom(page.next));
             } catch (err) {
                 const e = err as ApiErrorLike;
                 const msg =
@@ -132,6 +135,25 @@ export default function AccountPage() {
         })();
     }, []);
 
+    async function loadMoreOrders() {
+        if (!nextCursor || loadingMore) return;
+        setLoadingMore(true);
+        try {
+            const page = await fetchMyOrders({ cursor: nextCursor });
+            setOrders((prev) => [...prev, ...page.results]);
+            setNextCursor(cursorFrom(page.next));
+        } catch (err) {
+            const e = err as ApiErrorLike;
+            const msg =
+                (e.response?.data && safeJson(e.response.data)) ||
+                e.message ||
+                "Erro desconhecido";
+            setError(`Falha ao carregar pedidos: ${msg}`);
+        } finally {
+            setLoadingMore(false);
+        }
+    }
+
     function handleLogout() {
         logout();
         navigate("/");
@@ -170,6 +192,15 @@ export default function AccountPage() {
                             <Line label="ID" value={String(user.id)} />
                             <Line label="Usuário" value={user.username || "—"} />
                             <Line label="E-mail" value={user.email || "—"} />
+                            {summary && summary.order_count > 0 && (
+                                <>
+                                    <Line label="Pedidos pagos" value={`${summary.paid_count} de ${summary.order_count}`} />
+                                    <Line label="Total em compras" value={`R$ ${summary.lifetime_spend}`} />
+                                    {summary.first_order_at && (
+                                        <Line label="Cliente desde" value={formatDateBR(summary.first_order_at)} />
+                                    )}
+                                </>
+                            )}
                         </div>
                     ) : (
                         <div style={{ marginTop: 12, color: "rgba(255,255,255,.75)" }}>
@@ -224,9 +255,26 @@ export default function AccountPage() {
 
                                     <div style={{ marginTop: 6, color: "rgba(255,255,255,.75)", fontSize: 12, fontWeight: 800 }}>
                                         {formatDateBR(o.created_at)}
+                                        {o.first_item_name && (
+                                            <>
+                                                {" · "}
+                                                {o.first_item_name}
+                                                {` (${o.item_count} ${o.item_count === 1 ? "item" : "itens"})`}
+                                            </>
+                                        )}
                                     </div>
                                 </Link>
                             ))}
+
+                            {nextCursor && (
+                                <button
+                                    onClick={loadMoreOrders}
+                                    disabled={loadingMore}
+                                    style={{ ...btnStyle, ...btnGhostStyle, justifySelf: "center" }}
+                                >
+                                    {loadingMore ? "Carregando…" : "Ver mais pedidos"}
+                                </button>
+                            )}
                         </div>
                     )}
                 </div>
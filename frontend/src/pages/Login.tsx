@@ -3,6 +3,7 @@ import { Link, useNavigate } from "react-router-dom";
 import TopBar from "../components/TopBar";
 import { login } from "../api/auth";
 import { claimGuestOrders } from "../api/myOrders";
+import { mergeServerCart } from "../api/cart";
 
 export default function LoginPage() {
     const navigate = useNavigate();
@@ -23,6 +24,11 @@ export default function LoginPage() {
             } catch {
                 // não bloqueia login se falhar
             }
+            try {
+                await mergeServerCart();
+            } catch {
+                // carrinho anônimo continua com o token; tenta de novo no próximo login
+            }
             navigate("/conta");
         } catch {
             setError("Usuário ou senha inválidos.");
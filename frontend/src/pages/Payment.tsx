@@ -62,7 +62,7 @@ export default function PaymentPage() {
     const isPix = payment?.method === "pix";
     const canSimulate = payment?.provider === "dummy";
 
-    const qrBase64 = payment?.pix_qr_code_base64?.trim() || "";
+    const qrImageUrl = payment?.pix_qr_svg_url || payment?.pix_qr_png_url || "";
     const qrText = payment?.pix_qr_code?.trim() || "";
 
     const headerSubtitle = useMemo(() => {
@@ -212,10 +212,10 @@ export default function PaymentPage() {
                                                 Escaneie o QR Code ou use o “copia e cola”.
                                             </div>
 
-                                            {qrBase64 ? (
+                                            {qrImageUrl ? (
                                                 <img
                                                     alt="QR Code Pix"
-                                                    src={`data:image/png;base64,${qrBase64}`}
+                                                    src={qrImageUrl}
                                                     style={qrStyle}
                                                 />
                                             ) : (
@@ -1,8 +1,8 @@
 import { useEffect, useState } from "react";
 import { Link, useNavigate, useParams } from "react-router-dom";
 import TopBar from "../components/TopBar";
-import { fetchProductBySlug } from "../api/catalog";
-import type { Product } from "../api/catalog";
+import { fetchProductBySlug, fetchRelatedProducts } from "../api/catalog";
+import type { Product, RelatedProducts } from "../api/catalog";
 import { addToCart } from "../cart/cartStore";
 import "../styles/product.css";
 
@@ -13,6 +13,7 @@ export default function ProductPage() {
     const [product, setProduct] = useState<Product | null>(null);
     const [loading, setLoading] = useState(true);
     const [err, setErr] = useState<string | null>(null);
+    const [related, setRelated] = useState<RelatedProducts | null>(null);
 
     useEffect(() => {
         if (!slug) return;
@@ -21,6 +22,10 @@ export default function ProductPage() {
             .then(setProduct)
             .catch(() => setErr("Produto não encontrado."))
             .finally(() => setLoading(false));
+
+        // recomendações são opcionais: falha não afeta a página
+        setRelated(null);
+        fetchRelatedProducts(slug).then(setRelated).catch(() => setRelated(null));
     }, [slug]);
 
     return (
@@ -94,6 +99,9 @@ export default function ProductPage() {
                             </div>
                         </div>
 
+                        <RelatedRow title="Comprados juntos" products={related?.bought_together} />
+                        <RelatedRow title="Similares" products={related?.similar} />
+
                         {/* MOBILE sticky CTA */}
                         <div className="product-sticky">
                             <div className="price">R$ {product.price}</div>
@@ -123,6 +131,28 @@ export default function ProductPage() {
     );
 }
 
+function RelatedRow({ title, products }: { title: string; products?: Product[] }) {
+    if (!products?.length) return null;
+    return (
+        <div style={relatedStyle}>
+            <div style={kickerStyle}>{title}</div>
+            <div style={relatedRowStyle}>
+                {products.map((p) => (
+                    <Link key={p.id} to={`/produto/${p.slug}`} style={relatedCardStyle}>
+                        {p.images?.[0]?.image ? (
+                            <img src={p.images[0].image} alt={p.name} style={relatedImgStyle} />
+                        ) : (
+                            <div style={{ ...relatedImgStyle, background: "#0e111a" }} />
+                        )}
+                        <div style={{ fontWeight: 900, fontSize: 13, marginTop: 8 }}>{p.name}</div>
+                        <div style={{ color: "rgba(255,255,255,.7)", fontSize: 12, marginTop: 4 }}>R$ {p.price}</div>
+                    </Link>
+                ))}
+            </div>
+        </div>
+    );
+}
+
 const pageStyle: React.CSSProperties = { background: "#0f1115", minHeight: "100vh", color: "#e8eaf0" };
 const wrapStyle: React.CSSProperties = { maxWidth: 1180, margin: "0 auto", padding: "26px 20px 50px" };
 const ghostLinkStyle: React.CSSProperties = { color: "rgba(255,255,255,.85)", fontWeight: 900, textDecoration: "none" };
@@ -147,6 +177,11 @@ const btnStyle: React.CSSProperties = { borderRadius: 12, border: "1px solid rgb
 const btnPrimaryStyle: React.CSSProperties = { background: "#ffffff", color: "#111" };
 const btnGhostStyle: React.CSSProperties = { background: "transparent", color: "rgba(255,255,255,.9)" };
 
+const relatedStyle: React.CSSProperties = { marginTop: 26 };
+const relatedRowStyle: React.CSSProperties = { marginTop: 10, display: "flex", gap: 12, overflowX: "auto", paddingBottom: 6 };
+const relatedCardStyle: React.CSSProperties = { flex: "0 0 170px", background: "#141824", border: "1px solid #252a3a", borderRadius: 12, padding: 10, color: "#e8eaf0", textDecoration: "none" };
+const relatedImgStyle: React.CSSProperties = { width: "100%", aspectRatio: "4 / 3", objectFit: "cover", borderRadius: 10 };
+
 const noteStyle: React.CSSProperties = { marginTop: 14, color: "rgba(255,255,255,.6)", fontSize: 12, fontWeight: 700 };
 
 const errorStyle: React.CSSProperties = {
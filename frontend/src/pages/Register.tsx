@@ -3,6 +3,7 @@ import { Link, useNavigate } from "react-router-dom";
 import TopBar from "../components/TopBar";
 import { register, login } from "../api/auth";
 import { claimGuestOrders } from "../api/myOrders";
+import { mergeServerCart } from "../api/cart";
 type ApiErrorLike = {
     response?: { data?: unknown };
     message?: string;
@@ -27,6 +28,11 @@ export default function RegisterPage() {
             } catch {
                 // ignore
             }
+            try {
+                await mergeServerCart();
+            } catch {
+                // carrinho anônimo continua com o token; tenta de novo no próximo login
+            }
             navigate("/conta");
         } catch (err) {
             const e = err as ApiErrorLike;